@@ -0,0 +1,179 @@
+"""
+Benchmark: HTTP/1.1 vs HTTP/2 for many concurrent task polls and SSE streams.
+
+Starts a local TLS server (hypercorn) that serves task status and task
+event streams, then waits for many tasks at once through
+AsyncNexusAIClient with and without `http2=True`. Reports how many TCP
+connections the server saw and the p50/p99 latency per task.
+
+Requirements:
+    pip install keystone-ai[http2] hypercorn trustme
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_http2.py [--tasks 300] [--latency 0.02]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+
+try:
+    import trustme
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config as HypercornConfig
+except ImportError as e:  # pragma: no cover - benchmark only
+    raise SystemExit(f"Missing benchmark dependency: {e.name}. See the module docstring.")
+
+from nexusai import AsyncNexusAIClient
+from nexusai._internal._poll_strategy import FixedPollStrategy
+
+
+class TaskServer:
+    """ASGI app: each task completes on its second status check or event."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.connections = set()
+        self.checks = {}
+
+    def reset(self):
+        self.connections.clear()
+        self.checks.clear()
+
+    def _status(self, task_id):
+        self.checks[task_id] = self.checks.get(task_id, 0) + 1
+        if self.checks[task_id] >= 2:
+            return {"task_id": task_id, "status": "completed", "output": {"text": "ok"}}
+        return {"task_id": task_id, "status": "running", "progress": 50}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        self.connections.add(tuple(scope["client"]))
+        parts = scope["path"].rstrip("/").split("/")
+
+        if parts[-1] == "events":
+            # Push "running", then "completed" once the task is done
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-type", b"text/event-stream")],
+                }
+            )
+            for _ in range(2):
+                await asyncio.sleep(self.latency)
+                event = f"data: {json.dumps(self._status(parts[-2]))}\n\n".encode()
+                await send({"type": "http.response.body", "body": event, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await asyncio.sleep(self.latency)
+        body = json.dumps(self._status(parts[-1])).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def start_server(app, cert_file, key_file):
+    """Run hypercorn on a free port in a background thread."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    config = HypercornConfig()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.certfile = cert_file
+    config.keyfile = key_file
+    config.alpn_protocols = ["h2", "http/1.1"]
+    config.accesslog = None
+    config.errorlog = None
+
+    loop = asyncio.new_event_loop()
+    stop = asyncio.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(serve(app, config, shutdown_trigger=stop.wait))
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    time.sleep(0.5)
+    return port, lambda: loop.call_soon_threadsafe(stop.set)
+
+
+async def run_case(base_url, server, tasks, http2, task_updates):
+    """Wait for `tasks` tasks concurrently and collect per-task latency."""
+    server.reset()
+    async with AsyncNexusAIClient(
+        api_key="bench", base_url=base_url, http2=http2, task_updates=task_updates
+    ) as client:
+        poller = client.text._poller
+        poller.strategy = FixedPollStrategy(server.latency)
+
+        async def wait_one(i):
+            start = time.perf_counter()
+            await poller.poll(f"task_{i}")
+            return time.perf_counter() - start
+
+        started = time.perf_counter()
+        latencies = sorted(await asyncio.gather(*(wait_one(i) for i in range(tasks))))
+        wall = time.perf_counter() - started
+
+    return {
+        "protocol": "HTTP/2" if http2 else "HTTP/1.1",
+        "mode": task_updates,
+        "connections": len(server.connections),
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "wall_s": wall,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tasks", type=int, default=300, help="Concurrent tasks")
+    parser.add_argument("--latency", type=float, default=0.02, help="Server latency (s)")
+    args = parser.parse_args()
+
+    ca = trustme.CA()
+    server_cert = ca.issue_cert("127.0.0.1")
+    workdir = tempfile.mkdtemp()
+    cert_file = os.path.join(workdir, "server.pem")
+    key_file = os.path.join(workdir, "server.key")
+    ca_file = os.path.join(workdir, "ca.pem")
+    server_cert.cert_chain_pems[0].write_to_path(cert_file)
+    server_cert.private_key_pem.write_to_path(key_file)
+    ca.cert_pem.write_to_path(ca_file)
+    # httpx trusts SSL_CERT_FILE when building its TLS context
+    os.environ["SSL_CERT_FILE"] = ca_file
+
+    server = TaskServer(args.latency)
+    port, stop = start_server(server, cert_file, key_file)
+    base_url = f"https://127.0.0.1:{port}/api/v1"
+
+    print(f"{args.tasks} concurrent tasks, {args.latency * 1000:.0f} ms server latency\n")
+    print(f"{'protocol':<10}{'mode':<7}{'connections':>12}{'p50 ms':>10}{'p99 ms':>10}{'wall s':>9}")
+    for task_updates in ("poll", "sse"):
+        for http2 in (False, True):
+            result = asyncio.run(run_case(base_url, server, args.tasks, http2, task_updates))
+            print(
+                f"{result['protocol']:<10}{result['mode']:<7}{result['connections']:>12}"
+                f"{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}{result['wall_s']:>9.2f}"
+            )
+    stop()
+
+
+if __name__ == "__main__":
+    main()
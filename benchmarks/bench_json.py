@@ -0,0 +1,103 @@
+"""
+Benchmark: JSON codecs on large SDK payloads.
+
+Encodes and decodes payloads shaped like the responses that spend the
+most time in JSON: a knowledge base search with many results and a
+long session history. Compares every installed codec (the standard
+library, orjson, msgspec) with the standard library as baseline.
+
+Requirements (optional, each codec is skipped if missing):
+    pip install keystone-ai[orjson] keystone-ai[msgspec]
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_json.py [--results 500] [--messages 2000]
+"""
+
+import argparse
+import time
+
+from nexusai._internal._json import MsgspecCodec, OrjsonCodec, StdlibJSONCodec
+
+
+def search_response(results: int) -> dict:
+    """A knowledge base search response with long chunks and metadata."""
+    return {
+        "query": "What is the vacation policy?",
+        "total_results": results,
+        "results": [
+            {
+                "document_id": f"doc_{i}",
+                "chunk_id": f"chunk_{i}",
+                "content": "Employees accrue paid leave monthly. " * 20,
+                "score": 0.9 - i / (results * 10),
+                "metadata": {"page": i % 40, "source": f"handbook_{i % 5}.pdf", "tags": ["hr"]},
+            }
+            for i in range(results)
+        ],
+    }
+
+
+def session_history(messages: int) -> dict:
+    """A session history response with alternating user and assistant turns."""
+    return {
+        "session_id": "sess_1",
+        "messages": [
+            {
+                "role": "user" if i % 2 == 0 else "assistant",
+                "content": f"Message {i}: " + "lorem ipsum dolor sit amet, 你好 " * 8,
+                "created_at": "2024-01-01T00:00:00Z",
+                "usage": {"prompt_tokens": 12, "completion_tokens": 48},
+            }
+            for i in range(messages)
+        ],
+    }
+
+
+def installed_codecs():
+    codecs = [StdlibJSONCodec()]
+    for cls in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(cls())
+        except ImportError:
+            print(f"{cls.name}: not installed, skipped")
+    return codecs
+
+
+def best_time(func, arg, repeat: int) -> float:
+    """Fastest of several runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--results", type=int, default=500)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    codecs = installed_codecs()
+    payloads = {
+        "search": search_response(args.results),
+        "history": session_history(args.messages),
+    }
+    print(f"{'payload':<8} {'codec':<8} {'MB':>5} {'dumps ms':>9} {'loads ms':>9} {'speedup':>8}")
+    for name, payload in payloads.items():
+        encoded = StdlibJSONCodec().dumps(payload)
+        baseline = None
+        for codec in codecs:
+            dumps = best_time(codec.dumps, payload, args.repeat)
+            loads = best_time(codec.loads, encoded, args.repeat)
+            baseline = baseline or dumps + loads
+            print(
+                f"{name:<8} {codec.name:<8} {len(encoded) / 1e6:>5.1f} {dumps * 1e3:>9.2f} "
+                f"{loads * 1e3:>9.2f} {baseline / (dumps + loads):>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark: per-response cost of building SDK models.
+
+Builds the models the SDK creates for every response from payloads
+shaped like real ones:
+
+- task:   Task from a task status response (every poll of a task)
+- text:   TextResponse with Usage from an /invoke response
+- search: SearchResponse with its SearchResult list
+- history: the Message list of a 200-message session history
+
+Compares:
+
+- kwargs:    Model(**data), with Usage built separately for text and one
+             call per item for lists (the SDK before this benchmark)
+- validate:  Model.model_validate(data), nested models validated by
+             pydantic-core in the same call; lists through a TypeAdapter
+             (what the SDK does)
+- construct: Model.model_construct(...), with nested models constructed
+             too; no validation at all (what a "trusted responses" mode
+             would do)
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_models.py [--number 20000]
+"""
+
+import argparse
+import time
+from typing import List
+
+from pydantic import TypeAdapter
+
+from nexusai.models import Message, SearchResponse, SearchResult, Task, TextResponse, Usage
+
+TASK = {
+    "task_id": "task_123",
+    "status": "running",
+    "task_type": "text_generation",
+    "created_at": "2024-01-01T00:00:00Z",
+    "started_at": "2024-01-01T00:00:01Z",
+    "progress": 50,
+}
+
+TEXT = {
+    "text": "Hello! " * 50,
+    "usage": {"prompt_tokens": 12, "completion_tokens": 48, "total_tokens": 60},
+    "model": "gpt-4o-mini",
+    "finish_reason": "stop",
+}
+
+SEARCH = {
+    "query": "What is the vacation policy?",
+    "total_results": 20,
+    "results": [
+        {
+            "chunk_id": f"chunk_{i}",
+            "doc_id": f"doc_{i % 4}",
+            "kb_id": "kb_1",
+            "content": "Employees accrue paid leave monthly. " * 10,
+            "similarity_score": 0.9 - i / 100,
+            "metadata": {"page": i},
+        }
+        for i in range(20)
+    ],
+}
+
+HISTORY = [
+    {
+        "role": "user" if i % 2 == 0 else "assistant",
+        "content": f"Message {i}: " + "lorem ipsum dolor sit amet " * 8,
+        "timestamp": "2024-01-01T00:00:00Z",
+    }
+    for i in range(200)
+]
+MESSAGES = TypeAdapter(List[Message])
+
+
+def kwargs_builders():
+    return {
+        "task": lambda: Task(**TASK),
+        "text": lambda: TextResponse(**{**TEXT, "usage": Usage(**TEXT["usage"])}),
+        "search": lambda: SearchResponse(**SEARCH),
+        "history": lambda: [Message(**m) for m in HISTORY],
+    }
+
+
+def validate_builders():
+    return {
+        "task": lambda: Task.model_validate(TASK),
+        "text": lambda: TextResponse.model_validate(TEXT),
+        "search": lambda: SearchResponse.model_validate(SEARCH),
+        "history": lambda: MESSAGES.validate_python(HISTORY),
+    }
+
+
+def construct_builders():
+    return {
+        "task": lambda: Task.model_construct(**TASK),
+        "text": lambda: TextResponse.model_construct(
+            **{**TEXT, "usage": Usage.model_construct(**TEXT["usage"])}
+        ),
+        "search": lambda: SearchResponse.model_construct(
+            **{**SEARCH, "results": [SearchResult.model_construct(**r) for r in SEARCH["results"]]}
+        ),
+        "history": lambda: [Message.model_construct(**m) for m in HISTORY],
+    }
+
+
+def per_call_us(func, number: int, repeat: int) -> float:
+    """Fastest mean time per call over several runs, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    variants = {
+        "kwargs": kwargs_builders(),
+        "validate": validate_builders(),
+        "construct": construct_builders(),
+    }
+    print(f"{'model':<8} {'variant':<10} {'us/call':>9} {'vs kwargs':>10}")
+    for model in ("task", "text", "search", "history"):
+        number = args.number // 20 if model in ("search", "history") else args.number
+        baseline = None
+        for name, builders in variants.items():
+            cost = per_call_us(builders[model], number, args.repeat)
+            baseline = baseline or cost
+            print(f"{model:<8} {name:<10} {cost:>9.2f} {baseline / cost:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
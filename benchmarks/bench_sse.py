@@ -0,0 +1,110 @@
+"""
+Benchmark: events/s of the SSE stream parsers.
+
+Decodes a synthetic token stream (one small JSON delta per event, as
+sent by text.stream()) from an in-memory httpx response, so only
+parsing is measured. Compares:
+
+- lines:       response.iter_lines(), strip, "data: " prefix check and
+               slice per line (the parser used before the byte decoder)
+- incremental: response.iter_bytes() through SSEDecoder, data only (as the
+               client uses it)
+
+Each is run with and without json.loads of the event data, to separate
+framing cost from JSON decoding.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_sse.py [--events 200000] [--chunk-size 1024]
+"""
+
+import argparse
+import json
+import time
+
+import httpx
+
+from nexusai._internal._sse import iter_events
+
+DONE = "[DONE]"
+
+
+def build_stream(events: int) -> bytes:
+    """A token stream with a comment every 100 events, ending in [DONE]."""
+    parts = []
+    for i in range(events):
+        if i % 100 == 0:
+            parts.append(b": keep-alive\n\n")
+        delta = json.dumps({"delta": {"content": f"tok{i % 50}"}, "index": i})
+        parts.append(b"data: " + delta.encode() + b"\n\n")
+    parts.append(b"data: [DONE]\n\n")
+    return b"".join(parts)
+
+
+def response_for(body: bytes, chunk_size: int) -> httpx.Response:
+    """A streaming response delivering body in fixed-size chunks."""
+    chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+    return httpx.Response(200, content=iter(chunks))
+
+
+def parse_lines(response: httpx.Response, decode_json: bool) -> int:
+    count = 0
+    for line in response.iter_lines():
+        line = line.strip()
+        if not line.startswith("data: "):
+            continue
+        data = line[6:]
+        if data == DONE:
+            break
+        if decode_json:
+            json.loads(data)
+        count += 1
+    return count
+
+
+def parse_incremental(response: httpx.Response, decode_json: bool) -> int:
+    count = 0
+    for data in iter_events(response.iter_bytes(), data_only=True):
+        if not data:
+            continue
+        if data == DONE:
+            break
+        if decode_json:
+            json.loads(data)
+        count += 1
+    return count
+
+
+PARSERS = {"lines": parse_lines, "incremental": parse_incremental}
+
+
+def run(parser, body: bytes, chunk_size: int, decode_json: bool, repeat: int) -> float:
+    """Best events/s over several runs."""
+    best = 0.0
+    for _ in range(repeat):
+        response = response_for(body, chunk_size)
+        started = time.perf_counter()
+        count = parser(response, decode_json)
+        best = max(best, count / (time.perf_counter() - started))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = build_stream(args.events)
+    print(f"{args.events} events, {len(body) / 1e6:.1f} MB, {args.chunk_size}-byte chunks")
+    print(f"{'parser':<12} {'json':>5} {'events/s':>12} {'speedup':>8}")
+    for decode_json in (False, True):
+        baseline = None
+        for name, func in PARSERS.items():
+            rate = run(func, body, args.chunk_size, decode_json, args.repeat)
+            baseline = baseline or rate
+            print(f"{name:<12} {str(decode_json):>5} {rate:>12,.0f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
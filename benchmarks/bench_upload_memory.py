@@ -0,0 +1,133 @@
+"""
+Benchmark: peak memory of files.upload() for growing file sizes.
+
+Each case runs in a fresh subprocess that uploads one file to a local
+HTTP server (which discards the body) and reports the process's peak
+resident set size. Modes:
+
+- buffered: the whole file is read into a BytesIO first (reference)
+- stream:   files.upload(path), chunked reads from disk
+- mmap:     files.upload(path, use_mmap=True)
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_upload_memory.py [--sizes 64 256 1024]
+"""
+
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MODES = ("buffered", "stream", "mmap")
+
+
+class SinkHandler(BaseHTTPRequestHandler):
+    """Reads and discards the upload body, then returns file metadata."""
+
+    def do_POST(self):
+        remaining = int(self.headers.get("Content-Length", 0))
+        received = 0
+        while remaining:
+            data = self.rfile.read(min(remaining, 1 << 16))
+            if not data:
+                break
+            remaining -= len(data)
+            received += len(data)
+
+        body = json.dumps(
+            {
+                "file_id": "file_bench",
+                "filename": "bench.bin",
+                "content_type": "application/octet-stream",
+                "size": received,
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(path: str, mode: str) -> None:
+    """Upload one file and print the peak RSS and throughput as JSON."""
+    from nexusai import NexusAIClient
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SinkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/api/v1"
+
+    with NexusAIClient(api_key="bench", base_url=base_url, timeout=600) as client:
+        baseline = peak_rss_mb()
+        start = time.perf_counter()
+        if mode == "buffered":
+            with open(path, "rb") as f:
+                meta = client.files.upload(io.BytesIO(f.read()), filename="bench.bin")
+        else:
+            meta = client.files.upload(path, use_mmap=(mode == "mmap"))
+        elapsed = time.perf_counter() - start
+
+    server.shutdown()
+    print(
+        json.dumps(
+            {
+                "uploaded": meta.size,
+                "baseline_mb": baseline,
+                "peak_mb": peak_rss_mb(),
+                "mb_per_s": meta.size / 1024 / 1024 / elapsed,
+            }
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 1024], help="MiB")
+    parser.add_argument("--child", nargs=2, metavar=("PATH", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    print(f"{'size MiB':>9}{'mode':>10}{'peak RSS MiB':>14}{'above start':>13}{'MiB/s':>9}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            path = os.path.join(workdir, f"upload_{size}.bin")
+            with open(path, "wb") as f:
+                f.truncate(size * 1024 * 1024)  # Sparse file: no disk space needed
+
+            for mode in MODES:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", path, mode],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                result = json.loads(output)
+                print(
+                    f"{size:>9}{mode:>10}{result['peak_mb']:>14.1f}"
+                    f"{result['peak_mb'] - result['baseline_mb']:>13.1f}{result['mb_per_s']:>9.0f}"
+                )
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
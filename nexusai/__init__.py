@@ -5,9 +5,26 @@ A Python client library for the Nexus AI platform.
 """
 
 from nexusai.__version__ import __version__
-from nexusai.client import NexusAIClient
+from nexusai.client import NexusAIClient, AsyncNexusAIClient
 from nexusai.config import config
 from nexusai import error
+from nexusai._internal._poller import AsyncTaskHandle
+from nexusai._internal._upload_cache import UploadCache
+from nexusai._internal._response_cache import ResponseCache
+from nexusai._internal._search_cache import SearchCache, SimilarityIndex, EmbeddingIndex
+from nexusai._internal._cache import MemoryCacheStore, SQLiteCacheStore
+from nexusai._internal._retry import RetryConfig
+from nexusai._internal._rate_limit import (
+    RateLimiter,
+    RateLimitBackend,
+    MemoryRateLimitBackend,
+    FileRateLimitBackend,
+)
+from nexusai._internal._concurrency import AdaptiveConcurrencyLimiter
+from nexusai._internal._circuit import CircuitBreaker
+from nexusai._internal._hedge import HedgePolicy
+from nexusai._internal._routing import Router
+from nexusai._internal._json import JSONCodec
 
 # Export commonly used error classes for convenience
 from nexusai.error import (
@@ -23,11 +40,31 @@ from nexusai.error import (
     PermissionError,
     StreamError,
     FileUploadError,
+    CircuitOpenError,
 )
 
 __all__ = [
     "__version__",
     "NexusAIClient",
+    "AsyncNexusAIClient",
+    "AsyncTaskHandle",
+    "UploadCache",
+    "ResponseCache",
+    "SearchCache",
+    "SimilarityIndex",
+    "EmbeddingIndex",
+    "MemoryCacheStore",
+    "SQLiteCacheStore",
+    "RetryConfig",
+    "RateLimiter",
+    "RateLimitBackend",
+    "MemoryRateLimitBackend",
+    "FileRateLimitBackend",
+    "AdaptiveConcurrencyLimiter",
+    "CircuitBreaker",
+    "HedgePolicy",
+    "Router",
+    "JSONCodec",
     "config",
     "error",
     # Error classes
@@ -43,4 +80,5 @@ __all__ = [
     "PermissionError",
     "StreamError",
     "FileUploadError",
+    "CircuitOpenError",
 ]
@@ -0,0 +1,180 @@
+"""Bounded concurrent fan-out of one call over many inputs."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Tuple
+from nexusai.models import BatchResult
+
+# Inputs started or finished but not yet yielded, per unit of concurrency.
+# Bounds memory when one slow item holds back ordered output.
+_BUFFER_FACTOR = 4
+
+
+def _check_concurrency(concurrency: int) -> None:
+    """Validate a concurrency argument."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def run_concurrently(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    concurrency: int,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    """
+    Call a function on every input using a pool of threads.
+
+    Inputs are consumed lazily, so the iterable may be very large. Errors
+    are captured per item and never stop the batch.
+
+    Args:
+        func: Function called with one input item
+        items: Input items
+        concurrency: Maximum number of calls in flight
+        ordered: Yield results in input order (True) or as they complete (False)
+
+    Returns:
+        Iterator of BatchResult, one per input item
+
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    _check_concurrency(concurrency)
+    return _run_threads(func, items, concurrency, ordered)
+
+
+def _run_threads(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    concurrency: int,
+    ordered: bool,
+) -> Iterator[BatchResult]:
+    """Generator behind run_concurrently()."""
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="nexusai-batch")
+    inputs = enumerate(items)
+    window = concurrency * _BUFFER_FACTOR
+    pending: Dict[Future, Tuple[int, Any]] = {}
+    ready: Dict[int, BatchResult] = {}
+    next_index = 0
+    exhausted = False
+
+    try:
+        while True:
+            # Top up the pool without running too far ahead of the output
+            while (
+                not exhausted
+                and len(pending) < concurrency
+                and len(pending) + len(ready) < window
+            ):
+                try:
+                    index, item = next(inputs)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[executor.submit(func, item)] = (index, item)
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = pending.pop(future)
+                result = _to_result(index, item, future)
+                if ordered:
+                    ready[index] = result
+                else:
+                    yield result
+
+            # Release every result whose predecessors are all out
+            while next_index in ready:
+                yield ready.pop(next_index)
+                next_index += 1
+    finally:
+        # Stop queued calls if the caller stopped iterating early
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def arun_concurrently(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    concurrency: int,
+    ordered: bool = True,
+) -> AsyncIterator[BatchResult]:
+    """
+    Await a coroutine function on every input with bounded concurrency.
+
+    Async counterpart of run_concurrently().
+
+    Args:
+        func: Coroutine function called with one input item
+        items: Input items
+        concurrency: Maximum number of calls in flight
+        ordered: Yield results in input order (True) or as they complete (False)
+
+    Returns:
+        Async iterator of BatchResult, one per input item
+
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    _check_concurrency(concurrency)
+    return _run_tasks(func, items, concurrency, ordered)
+
+
+async def _run_tasks(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    concurrency: int,
+    ordered: bool,
+) -> AsyncIterator[BatchResult]:
+    """Async generator behind arun_concurrently()."""
+    inputs = enumerate(items)
+    window = concurrency * _BUFFER_FACTOR
+    pending: Dict["asyncio.Future", Tuple[int, Any]] = {}
+    ready: Dict[int, BatchResult] = {}
+    next_index = 0
+    exhausted = False
+
+    try:
+        while True:
+            while (
+                not exhausted
+                and len(pending) < concurrency
+                and len(pending) + len(ready) < window
+            ):
+                try:
+                    index, item = next(inputs)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[asyncio.ensure_future(func(item))] = (index, item)
+
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                index, item = pending.pop(future)
+                result = _to_result(index, item, future)
+                if ordered:
+                    ready[index] = result
+                else:
+                    yield result
+
+            while next_index in ready:
+                yield ready.pop(next_index)
+                next_index += 1
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _to_result(index: int, item: Any, future) -> BatchResult:
+    """Convert a finished future into a BatchResult."""
+    error = future.exception()
+    if error is not None:
+        return BatchResult(index=index, input=item, error=error)
+    return BatchResult(index=index, input=item, result=future.result())
@@ -0,0 +1,174 @@
+"""Key-value stores with least-recently-used eviction for local caches."""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+
+class CacheStore:
+    """
+    Base class for cache stores.
+
+    A store keeps JSON-serializable values together with the time they were
+    stored, and evicts the least recently used entries on request. Expiry
+    policy is left to the cache using the store. Implementations must be
+    thread-safe.
+    """
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Look up an entry and mark it as recently used.
+
+        Returns:
+            Tuple of (value, stored_at timestamp), or None if missing
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, replacing any existing entry."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        raise NotImplementedError
+
+    def evict(self, max_entries: int) -> None:
+        """Remove least recently used entries until at most max_entries remain."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryCacheStore(CacheStore):
+    """In-process store backed by an ordered dict."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Look up an entry and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, replacing any existing entry."""
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def evict(self, max_entries: int) -> None:
+        """Remove least recently used entries beyond max_entries."""
+        with self._lock:
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheStore(CacheStore):
+    """
+    On-disk store in a SQLite database, shared across processes.
+
+    Values are stored as JSON. Usable from several threads and processes
+    at once; SQLite serializes the writes.
+    """
+
+    def __init__(self, path: Union[str, Path], table: str = "cache"):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: Database file path; parent directories are created
+            table: Table name, so several caches can share one database file
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._table = table
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            self._db.execute(f"CREATE INDEX IF NOT EXISTS {table}_used ON {table} (used_at)")
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Look up an entry and mark it as recently used."""
+        with self._lock, self._db:
+            row = self._db.execute(
+                f"SELECT value, stored_at FROM {self._table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                f"UPDATE {self._table} SET used_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, replacing any existing entry."""
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO {self._table} VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock, self._db:
+            self._db.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+
+    def evict(self, max_entries: int) -> None:
+        """Remove least recently used entries beyond max_entries."""
+        with self._lock, self._db:
+            self._db.execute(
+                f"DELETE FROM {self._table} WHERE key IN ("
+                f"SELECT key FROM {self._table} ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (max_entries,),
+            )
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self._db:
+            self._db.execute(f"DELETE FROM {self._table}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
+
+
+def is_expired(stored_at: float, ttl: Optional[float]) -> bool:
+    """Whether an entry stored at stored_at has outlived ttl seconds."""
+    return ttl is not None and time.time() - stored_at > ttl
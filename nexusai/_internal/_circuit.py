@@ -0,0 +1,255 @@
+"""Circuit breaking per endpoint, provider and model."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from nexusai.error import (
+    APIError,
+    APITimeoutError,
+    CircuitOpenError,
+    NetworkError,
+    RateLimitError,
+    ServerError,
+)
+from nexusai.constants import (
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_RECOVERY_TIMEOUT,
+    DEFAULT_CIRCUIT_HALF_OPEN_PROBES,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# (endpoint, provider, model)
+CircuitKey = Tuple[str, Optional[str], Optional[str]]
+
+# Called with (key, old_state, new_state) whenever a circuit changes state
+StateCallback = Callable[[CircuitKey, str, str], None]
+
+
+def circuit_key(endpoint: str, json_data: Optional[Dict[str, Any]]) -> CircuitKey:
+    """Circuit a request belongs to: its endpoint, provider and model."""
+    body = json_data or {}
+    return (endpoint, body.get("provider"), body.get("model"))
+
+
+class _Circuit:
+    """State of one circuit."""
+
+    __slots__ = ("state", "failures", "opened_at", "probes", "generation")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        # Bumped on every state change, so results of requests admitted
+        # under an earlier state are ignored
+        self.generation = 0
+
+
+class CircuitBreaker:
+    """
+    Fails requests fast while their upstream is failing.
+
+    Keeps one circuit per (endpoint, provider, model). A circuit opens
+    after failure_threshold consecutive failures (server errors, timeouts
+    and network errors); while open, requests raise CircuitOpenError
+    immediately instead of waiting for the timeout. After
+    recovery_timeout the circuit half-opens and lets half_open_probes
+    requests through: a successful probe closes it, a failed one opens it
+    again.
+
+    Other errors (4xx, rate limits) do not count as failures: the upstream
+    answered. Subclass and override is_failure() to change that.
+
+    Example:
+        ```python
+        from nexusai import NexusAIClient, CircuitBreaker
+
+        def report(key, old, new):
+            endpoint, provider, model = key
+            metrics.gauge("circuit_open", new == "open", tags=[provider, model])
+
+        client = NexusAIClient(circuit_breaker=CircuitBreaker(on_state_change=report))
+        ```
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_CIRCUIT_RECOVERY_TIMEOUT,
+        half_open_probes: int = DEFAULT_CIRCUIT_HALF_OPEN_PROBES,
+        on_state_change: Optional[StateCallback] = None,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            recovery_timeout: Seconds an open circuit rejects requests before
+                             letting probes through
+            half_open_probes: Probe requests allowed at once while half-open
+            on_state_change: Optional callback(key, old_state, new_state),
+                            e.g. to alert or export circuit states
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_probes < 1:
+            raise ValueError("half_open_probes must be at least 1")
+        if recovery_timeout < 0:
+            raise ValueError("recovery_timeout must not be negative")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+        self.on_state_change = on_state_change
+        # Healthy circuits are not kept, so only failing keys use memory
+        self._circuits: Dict[CircuitKey, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def is_failure(self, error: BaseException) -> bool:
+        """Whether an error counts against the circuit."""
+        return isinstance(error, (ServerError, APITimeoutError, NetworkError))
+
+    def state(self, key: CircuitKey) -> str:
+        """Current state of a circuit: "closed", "open" or "half_open"."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit is not None else CLOSED
+
+    def states(self) -> Dict[CircuitKey, str]:
+        """States of all circuits that are not fully healthy."""
+        with self._lock:
+            return {key: circuit.state for key, circuit in self._circuits.items()}
+
+    def reset(self, key: Optional[CircuitKey] = None) -> None:
+        """Close one circuit, or all of them."""
+        with self._lock:
+            keys = [key] if key is not None else list(self._circuits)
+            changes = [
+                (k, self._circuits.pop(k).state, CLOSED) for k in keys if k in self._circuits
+            ]
+        self._notify(changes)
+
+    def _set_state(self, key: CircuitKey, circuit: _Circuit, state: str, changes: List) -> None:
+        """Move a circuit to a new state; caller holds the lock."""
+        changes.append((key, circuit.state, state))
+        circuit.state = state
+        circuit.generation += 1
+        circuit.probes = 0
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+        elif state == CLOSED:
+            del self._circuits[key]
+
+    def _notify(self, changes: List) -> None:
+        """Report state changes to the callback."""
+        if self.on_state_change is None:
+            return
+        for key, old, new in changes:
+            if old != new:
+                self.on_state_change(key, old, new)
+
+    def before(self, key: CircuitKey) -> int:
+        """
+        Admit a request or reject it.
+
+        Returns:
+            Token to pass to record() once the request is done
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                             probes in flight
+        """
+        changes: List = []
+        try:
+            with self._lock:
+                circuit = self._circuits.get(key)
+                if circuit is None or circuit.state == CLOSED:
+                    return circuit.generation if circuit is not None else 0
+
+                if circuit.state == OPEN:
+                    remaining = circuit.opened_at + self.recovery_timeout - time.monotonic()
+                    if remaining > 0:
+                        raise self._open_error(key, remaining)
+                    self._set_state(key, circuit, HALF_OPEN, changes)
+
+                if circuit.probes >= self.half_open_probes:
+                    raise self._open_error(key, None)
+                circuit.probes += 1
+                return circuit.generation
+        finally:
+            self._notify(changes)
+
+    def _open_error(self, key: CircuitKey, retry_after: Optional[float]) -> CircuitOpenError:
+        """Build the error raised for a rejected request."""
+        endpoint, provider, model = key
+        return CircuitOpenError(
+            f"Circuit open for {endpoint} (provider={provider}, model={model}); "
+            "recent requests failed",
+            key=key,
+            retry_after=retry_after,
+        )
+
+    def record(self, key: CircuitKey, token: int, error: Optional[BaseException] = None) -> None:
+        """
+        Record how an admitted request went.
+
+        Args:
+            key: Circuit of the request
+            token: Value returned by before()
+            error: Exception the request failed with, if any
+        """
+        failed = error is not None and self.is_failure(error)
+        # Neither success nor failure: throttling, cancellation, closed streams
+        neutral = not failed and error is not None and (
+            isinstance(error, RateLimitError) or not isinstance(error, APIError)
+        )
+
+        changes: List = []
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                if not failed:
+                    return
+                circuit = self._circuits[key] = _Circuit()
+            elif circuit.generation != token:
+                return  # Admitted under an earlier state
+
+            if circuit.state == HALF_OPEN:
+                circuit.probes -= 1
+                if failed:
+                    self._set_state(key, circuit, OPEN, changes)
+                elif not neutral:
+                    self._set_state(key, circuit, CLOSED, changes)
+            elif failed:
+                circuit.failures += 1
+                if circuit.failures >= self.failure_threshold:
+                    self._set_state(key, circuit, OPEN, changes)
+            elif not neutral:
+                del self._circuits[key]
+        self._notify(changes)
+
+    @contextmanager
+    def guard(self, key: CircuitKey) -> Iterator[None]:
+        """Admit a request and record its outcome for the duration of a with block."""
+        token = self.before(key)
+        try:
+            yield
+        except BaseException as e:
+            self.record(key, token, e)
+            raise
+        self.record(key, token)
+
+    def __repr__(self) -> str:
+        """Return string representation of the circuit breaker."""
+        return (
+            f"CircuitBreaker(failure_threshold={self.failure_threshold}, "
+            f"recovery_timeout={self.recovery_timeout}, circuits={len(self._circuits)})"
+        )
@@ -1,8 +1,12 @@
 """Internal HTTP client for API communication."""
 
+import asyncio
+import hashlib
 import httpx
-import json
-from typing import Dict, Any, Optional, Iterator
+import time
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Iterator, AsyncIterator, ContextManager, Union
 from nexusai.__version__ import __version__
 from nexusai.error import (
     APIError,
@@ -18,17 +22,72 @@ from nexusai.error import (
     StreamError,
 )
 from nexusai.config import config
+from nexusai.constants import STREAM_END_MARKER
+from nexusai._internal._scheduler import PollScheduler, AsyncPollScheduler
+from nexusai._internal._sse import iter_events, aiter_events
+from nexusai._internal._json import JSONCodec, get_codec
+from nexusai._internal._upload_cache import UploadCache
+from nexusai._internal._response_cache import ResponseCache
+from nexusai._internal._search_cache import SearchCache
+from nexusai._internal._rate_limit import RateLimiter, response_tokens
+from nexusai._internal._concurrency import AdaptiveConcurrencyLimiter, Permit
+from nexusai._internal._circuit import CircuitBreaker, circuit_key
+from nexusai._internal._hedge import HedgePolicy
+from nexusai._internal._routing import Router
+from nexusai._internal._singleflight import (
+    SingleFlight,
+    AsyncSingleFlight,
+    is_coalescible,
+    request_key,
+)
+from nexusai._internal._retry import (
+    RetryConfig,
+    should_retry,
+    is_retry_safe,
+    retry_delay,
+    call_with_retry,
+    acall_with_retry,
+)
 
 
-class InternalClient:
+def _parse_retry_after(headers: httpx.Headers) -> Optional[int]:
     """
-    Internal HTTP client for all API interactions.
+    Read how many seconds to wait from a rate limit response.
 
-    This class handles:
-    - HTTP request/response lifecycle
-    - Authentication headers
-    - Error handling and retries
-    - Streaming responses
+    Uses Retry-After (seconds or an HTTP date), falling back to
+    X-RateLimit-Reset (seconds, or a Unix timestamp).
+    """
+    value = headers.get("Retry-After")
+    if value:
+        try:
+            return max(0, int(float(value)))
+        except ValueError:
+            try:
+                return max(0, int(parsedate_to_datetime(value).timestamp() - time.time()))
+            except (TypeError, ValueError):
+                pass
+
+    value = headers.get("X-RateLimit-Reset")
+    if value:
+        try:
+            reset = int(float(value))
+        except ValueError:
+            return None
+        # Large values are absolute timestamps rather than delays
+        return max(0, reset - int(time.time())) if reset > 1_000_000_000 else reset
+    return None
+
+
+class BaseInternalClient:
+    """
+    Transport-independent base for the sync and async internal clients.
+
+    This class handles everything that does not perform I/O, so that
+    both clients build requests and map errors in exactly the same way:
+    - Configuration resolution and authentication headers
+    - URL and header construction
+    - SSE event parsing
+    - HTTP status and transport error mapping
     """
 
     def __init__(
@@ -37,15 +96,64 @@ class InternalClient:
         base_url: Optional[str] = None,
         timeout: Optional[float] = None,
         max_retries: Optional[int] = None,
+        batch_polling: Optional[bool] = None,
+        task_updates: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        http2: Optional[bool] = None,
+        upload_cache: Optional[UploadCache] = None,
+        retry: Optional[RetryConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        router: Optional[Router] = None,
+        response_cache: Optional[ResponseCache] = None,
+        search_cache: Optional[SearchCache] = None,
+        coalesce_requests: Optional[bool] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
     ):
         """
-        Initialize the internal HTTP client.
+        Resolve client configuration.
 
         Args:
             api_key: API key for authentication (overrides config)
             base_url: Base URL for API (overrides config)
             timeout: Request timeout in seconds (overrides config)
             max_retries: Maximum number of retries (overrides config)
+            batch_polling: Poll all pending tasks through one shared scheduler
+                          (overrides config)
+            task_updates: How task completion is awaited: "poll", "long_poll"
+                         or "sse" (overrides config)
+            max_connections: Maximum open connections (overrides config)
+            max_keepalive_connections: Maximum idle connections kept for
+                                      reuse (overrides config)
+            keepalive_expiry: Seconds an idle connection is kept (overrides config)
+            pool_timeout: Seconds to wait for a free connection (overrides config)
+            http2: Multiplex requests over HTTP/2 (overrides config)
+            upload_cache: Cache used to skip uploading files already uploaded
+            retry: Backoff for retrying rate-limited, failed (5xx), timed out
+                  and dropped requests. Defaults to max_retries attempts with
+                  jittered exponential backoff.
+            rate_limiter: Limiter every request waits for. Defaults to one
+                         built from config requests/tokens per minute, if set.
+            concurrency_limiter: Adaptive limit on requests in flight. Defaults
+                                to a new limiter if config adaptive_concurrency
+                                is enabled.
+            circuit_breaker: Breaker failing requests fast while their endpoint,
+                            provider and model keep failing. Defaults to a new
+                            breaker if config circuit_breaker is enabled.
+            hedge_policy: Policy for duplicating slow text generation requests
+            router: Router choosing between provider/model candidates. Defaults
+                   to a new router for this client.
+            response_cache: Cache of deterministic text generation responses
+            search_cache: Cache of knowledge base search results
+            coalesce_requests: Share one call among identical concurrent
+                              GETs, searches and temperature=0 generations
+                              (overrides config, off by default)
+            json_codec: JSON codec or codec name (overrides config)
 
         Raises:
             AuthenticationError: If API key is not provided
@@ -54,167 +162,271 @@ class InternalClient:
         self.base_url = base_url or config.base_url
         self.timeout = timeout if timeout is not None else config.timeout
         self.max_retries = max_retries if max_retries is not None else config.max_retries
+        self.batch_polling = batch_polling if batch_polling is not None else config.batch_polling
+        self.task_updates = task_updates or config.task_updates
+        self.max_connections = (
+            max_connections if max_connections is not None else config.max_connections
+        )
+        self.max_keepalive_connections = (
+            max_keepalive_connections
+            if max_keepalive_connections is not None
+            else config.max_keepalive_connections
+        )
+        self.keepalive_expiry = (
+            keepalive_expiry if keepalive_expiry is not None else config.keepalive_expiry
+        )
+        self.pool_timeout = pool_timeout if pool_timeout is not None else config.pool_timeout
+        if self.pool_timeout is None:
+            self.pool_timeout = self.timeout
+        self.http2 = http2 if http2 is not None else config.http2
+        self.upload_cache = upload_cache
+        self.retry = retry if retry is not None else RetryConfig(max_retries=self.max_retries)
+        if rate_limiter is None and (config.requests_per_minute or config.tokens_per_minute):
+            rate_limiter = RateLimiter(config.requests_per_minute, config.tokens_per_minute)
+        self.rate_limiter = rate_limiter
+        if concurrency_limiter is None and config.adaptive_concurrency:
+            concurrency_limiter = AdaptiveConcurrencyLimiter()
+        self.concurrency_limiter = concurrency_limiter
+        if circuit_breaker is None and config.circuit_breaker:
+            circuit_breaker = CircuitBreaker()
+        self.circuit_breaker = circuit_breaker
+        self.hedge_policy = hedge_policy
+        self.router = router if router is not None else Router()
+        self.response_cache = response_cache
+        self.search_cache = search_cache
+        self.coalesce_requests = (
+            coalesce_requests if coalesce_requests is not None else config.coalesce_requests
+        )
+        self.json_codec = get_codec(json_codec if json_codec is not None else config.json_codec)
 
         if not self.api_key:
             raise AuthenticationError(
                 "API key is required. Set NEXUS_API_KEY environment variable or pass api_key parameter."
             )
 
-        # Create httpx client with retry transport and connection limits
-        transport = httpx.HTTPTransport(retries=self.max_retries)
-        limits = httpx.Limits(max_connections=10, max_keepalive_connections=5)
-        self.client = httpx.Client(
-            timeout=self.timeout,
-            headers=self._default_headers(),
-            transport=transport,
-            limits=limits,
-        )
+        if self.http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "HTTP/2 support requires the 'h2' package. "
+                    "Install it with: pip install keystone-ai[http2]"
+                ) from None
 
     def _default_headers(self) -> Dict[str, str]:
-        """Generate default request headers."""
+        """
+        Generate default request headers.
+
+        Content-Type is set with the body: by _build_body() for JSON, and by
+        httpx, with its boundary, for multipart file uploads.
+        """
         return {
             "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
             "User-Agent": f"nexus-ai-python/{__version__}",
         }
 
-    def request(
+    @property
+    def cache_namespace(self) -> str:
+        """Scope for local cache keys, so accounts and servers never share entries."""
+        return hashlib.sha256(f"{self.base_url}|{self.api_key}".encode()).hexdigest()[:16]
+
+    def _estimate_tokens(self, json_data: Optional[Dict[str, Any]]) -> int:
+        """Estimate the tokens a request uses, for the rate limiter."""
+        if self.rate_limiter is None:
+            return 0
+        return self.rate_limiter.estimate_tokens(json_data)
+
+    def _settle_tokens(self, estimated: int, response: Any) -> bool:
+        """
+        Charge the rate limiter the actual tokens a response reports.
+
+        Returns:
+            True if the response reported its usage
+        """
+        if not estimated:
+            return False
+        actual = response_tokens(response)
+        if actual is None:
+            return False
+        self.rate_limiter.settle(estimated, actual)
+        return True
+
+    def _coalesce_key(
         self,
         method: str,
         endpoint: str,
-        json_data: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
-        params: Optional[Dict[str, Any]] = None,
-        **kwargs,
-    ) -> Dict[str, Any]:
+        json_data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
         """
-        Make a synchronous HTTP request.
+        Key under which identical concurrent requests share one call.
 
-        Args:
-            method: HTTP method (GET, POST, PUT, DELETE, etc.)
-            endpoint: API endpoint path (e.g., "/invoke")
-            json_data: JSON request body
-            headers: Additional headers to merge with defaults
-            params: URL query parameters
-            **kwargs: Additional arguments passed to httpx
+        None if coalescing is off, the request is not idempotent, or it
+        passes extra httpx arguments (such as file contents).
+        """
+        if not self.coalesce_requests or kwargs:
+            return None
+        if not is_coalescible(method, endpoint, json_data, headers):
+            return None
+        return request_key(method, endpoint, json_data, headers, params)
 
-        Returns:
-            Response data as dictionary
+    def _limits_concurrency(self, method: str) -> bool:
+        """
+        Whether a request takes a permit from the concurrency limiter.
 
-        Raises:
-            APIError: For various API errors
-            APITimeoutError: If request times out
-            NetworkError: If network error occurs
+        GET requests (status polls, long polls, listings) are exempt: they
+        are cheap or deliberately held open, and would otherwise take
+        permits from the work they are waiting on.
         """
-        url = f"{self.base_url}{endpoint}"
+        return self.concurrency_limiter is not None and method != "GET"
 
-        # Merge headers
+    def _circuit(
+        self, method: str, endpoint: str, json_data: Optional[Dict[str, Any]]
+    ) -> ContextManager[None]:
+        """
+        Guard a request with its circuit, unless it is exempt.
+
+        Wraps a whole call including its retries, so a call records one
+        outcome however many attempts it took. GET requests are exempt for
+        the same reason as from the concurrency limiter; their paths also
+        carry IDs, which would make a circuit each.
+        """
+        if self.circuit_breaker is None or method == "GET":
+            return nullcontext()
+        return self.circuit_breaker.guard(circuit_key(endpoint, json_data))
+
+    @contextmanager
+    def _admit(self, method: str, tokens: int) -> Iterator[Optional[Permit]]:
+        """
+        Admit a request for the duration of a with block.
+
+        Waits for the rate limiter and holds a concurrency permit (None if
+        exempt). The circuit is checked once per call, not per attempt.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(tokens)
+        if not self._limits_concurrency(method):
+            yield None
+            return
+        with self.concurrency_limiter.permit() as permit:
+            yield permit
+
+    @asynccontextmanager
+    async def _aadmit(self, method: str, tokens: int) -> AsyncIterator[Optional[Permit]]:
+        """Admit an async request for the duration of an async with block."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire(tokens)
+        if not self._limits_concurrency(method):
+            yield None
+            return
+        async with self.concurrency_limiter.apermit() as permit:
+            yield permit
+
+    def _build_url(self, endpoint: str) -> str:
+        """Build the absolute URL for an API endpoint."""
+        return f"{self.base_url}{endpoint}"
+
+    def _build_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Merge additional headers into the default headers."""
         request_headers = self._default_headers()
         if headers:
             request_headers.update(headers)
+        return request_headers
 
-        try:
-            response = self.client.request(
-                method=method,
-                url=url,
-                json=json_data,
-                headers=request_headers,
-                params=params,
-                **kwargs,
-            )
-            return self._handle_response(response)
+    def _build_body(
+        self, json_data: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """
+        Build the body and headers arguments of a request.
 
-        except httpx.TimeoutException as e:
-            raise APITimeoutError(f"Request timed out after {self.timeout}s") from e
-        except httpx.NetworkError as e:
-            raise NetworkError(f"Network error: {str(e)}") from e
-        except httpx.HTTPError as e:
-            raise APIError(f"HTTP error: {str(e)}") from e
+        JSON bodies are serialized with the client's codec instead of by
+        httpx, so their Content-Type is set here.
+        """
+        if json_data is None:
+            return {"headers": self._build_headers(headers)}
+        request_headers = self._build_headers({"Content-Type": "application/json"})
+        if headers:
+            request_headers.update(headers)
+        return {"content": self.json_codec.dumps(json_data), "headers": request_headers}
 
-    def stream(
-        self,
-        method: str,
-        endpoint: str,
-        json_data: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
-        **kwargs,
-    ) -> Iterator[Dict[str, Any]]:
+    def _parse_sse_data(self, data: str, chunk_count: int) -> Any:
         """
-        Make a streaming HTTP request (Server-Sent Events).
+        Parse the data of one SSE event.
 
         Args:
-            method: HTTP method
-            endpoint: API endpoint path
-            json_data: JSON request body
-            headers: Additional headers
-            **kwargs: Additional arguments passed to httpx
+            data: Event data, with the lines of multi-line data joined
+            chunk_count: Number of chunks parsed so far (for error messages)
 
-        Yields:
-            Parsed JSON chunks from SSE stream
+        Returns:
+            Parsed JSON chunk, STREAM_END_MARKER at end of stream, or None
+            if the event carries no data
 
         Raises:
-            APIError: For various API errors
+            StreamError: If the data is not valid JSON
         """
-        url = f"{self.base_url}{endpoint}"
+        if not data:
+            return None
 
-        # Merge headers
-        request_headers = self._default_headers()
-        if headers:
-            request_headers.update(headers)
+        # Check for stream end marker
+        if data == STREAM_END_MARKER:
+            return STREAM_END_MARKER
 
         try:
-            with self.client.stream(
-                method=method,
-                url=url,
-                json=json_data,
-                headers=request_headers,
-                **kwargs,
-            ) as response:
-                # Check response status before streaming
-                self._check_response_status(response)
-
-                # Parse SSE stream
-                chunk_count = 0
-                for line in response.iter_lines():
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    # SSE format: "data: <json>"
-                    if line.startswith("data: "):
-                        data = line[6:]  # Remove "data: " prefix
-
-                        # Check for stream end marker
-                        if data == "[DONE]":
-                            break
+            return self.json_codec.loads(data)
+        except ValueError as e:
+            # Raise error for malformed SSE data
+            raise StreamError(
+                f"Invalid JSON in SSE stream at chunk {chunk_count + 1}: {data[:100]}"
+            ) from e
+
+    def _build_limits(self) -> httpx.Limits:
+        """Build the connection pool limits."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
 
-                        try:
-                            chunk_count += 1
-                            yield json.loads(data)
-                        except json.JSONDecodeError as e:
-                            # Raise error for malformed SSE data
-                            raise StreamError(
-                                f"Invalid JSON in SSE stream at chunk {chunk_count}: {data[:100]}"
-                            ) from e
-
-                # Check if we received any chunks
-                if chunk_count == 0:
-                    raise StreamError(
-                        "No data received from stream. Server may not support SSE streaming."
-                    )
-
-        except httpx.TimeoutException as e:
-            raise APITimeoutError(f"Stream timed out after {self.timeout}s") from e
-        except httpx.NetworkError as e:
-            raise NetworkError(
-                f"Network error during streaming: {str(e)}",
+    def _build_timeout(self) -> httpx.Timeout:
+        """Build the request timeout, with its own limit for acquiring a connection."""
+        return httpx.Timeout(self.timeout, pool=self.pool_timeout)
+
+    def _map_request_error(self, error: Exception) -> APIError:
+        """Map an httpx exception raised by a regular request to an SDK error."""
+        if isinstance(error, httpx.PoolTimeout):
+            return APITimeoutError(
+                f"No free connection after {self.pool_timeout}s "
+                f"(max_connections={self.max_connections})",
+                request_sent=False,
+            )
+        if isinstance(error, httpx.TimeoutException):
+            return APITimeoutError(
+                f"Request timed out after {self.timeout}s",
+                request_sent=not isinstance(error, httpx.ConnectTimeout),
+            )
+        if isinstance(error, httpx.NetworkError):
+            return NetworkError(
+                f"Network error: {str(error)}",
+                request_sent=not isinstance(error, httpx.ConnectError),
+            )
+        return APIError(f"HTTP error: {str(error)}")
+
+    def _map_stream_error(self, error: Exception) -> APIError:
+        """Map an exception raised while streaming to an SDK error."""
+        if isinstance(error, httpx.TimeoutException):
+            return APITimeoutError(
+                f"Stream timed out after {self.timeout}s",
+                request_sent=not isinstance(error, (httpx.ConnectTimeout, httpx.PoolTimeout)),
+            )
+        if isinstance(error, httpx.NetworkError):
+            return NetworkError(
+                f"Network error during streaming: {str(error)}",
                 is_retryable=True,
-            ) from e
-        except StreamError:
-            # Re-raise StreamError without wrapping
-            raise
-        except Exception as e:
-            raise StreamError(f"Unexpected error during streaming: {str(e)}") from e
+                request_sent=not isinstance(error, httpx.ConnectError),
+            )
+        return StreamError(f"Unexpected error during streaming: {str(error)}")
 
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """
@@ -232,8 +444,8 @@ class InternalClient:
         self._check_response_status(response)
 
         try:
-            return response.json()
-        except json.JSONDecodeError:
+            return self.json_codec.loads(response.content)
+        except ValueError:
             # If response is not JSON, wrap text in dict
             return {"content": response.text}
 
@@ -258,10 +470,10 @@ class InternalClient:
 
         # Try to parse error response
         try:
-            error_data = response.json()
+            error_data = self.json_codec.loads(response.content)
             message = error_data.get("detail", response.text)
             error_code = error_data.get("error_code")
-        except (json.JSONDecodeError, AttributeError):
+        except (ValueError, AttributeError):
             message = response.text or f"HTTP {response.status_code}"
             error_code = None
             error_data = None
@@ -298,10 +510,9 @@ class InternalClient:
                 response_body=error_data,
             )
         elif status_code == 429:
-            retry_after = response.headers.get("X-RateLimit-Reset")
             raise RateLimitError(
                 message,
-                retry_after=int(retry_after) if retry_after else None,
+                retry_after=_parse_retry_after(response.headers),
                 status_code=status_code,
                 error_code=error_code,
                 response_body=error_data,
@@ -313,8 +524,247 @@ class InternalClient:
         else:
             raise APIError(message, status_code, error_code, error_data)
 
+
+class InternalClient(BaseInternalClient):
+    """
+    Internal HTTP client for all API interactions.
+
+    This class handles:
+    - HTTP request/response lifecycle
+    - Authentication headers
+    - Error handling and retries
+    - Streaming responses
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize the internal HTTP client.
+
+        Takes the keyword arguments of BaseInternalClient.__init__().
+        """
+        super().__init__(**kwargs)
+        self.poll_scheduler = PollScheduler(self) if self.batch_polling else None
+        self.single_flight = SingleFlight()
+
+        # Create httpx client with retry transport and connection limits
+        transport = httpx.HTTPTransport(
+            retries=self.max_retries, limits=self._build_limits(), http2=self.http2
+        )
+        self.client = httpx.Client(
+            timeout=self._build_timeout(),
+            headers=self._default_headers(),
+            transport=transport,
+        )
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        retry: Optional[RetryConfig] = None,
+        coalesce: bool = True,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Make a synchronous HTTP request.
+
+        Rate limit (429), server (5xx), timeout and network errors are
+        retried with backoff, waiting as long as a 429 response asks.
+        Requests that are not safe to repeat (POSTs other than searches)
+        are only retried on 429 and on errors before the request was
+        sent, unless retry.retry_non_idempotent is set.
+
+        Identical idempotent requests made while one is in flight (from
+        other threads) wait for it and share its response.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint: API endpoint path (e.g., "/invoke")
+            json_data: JSON request body
+            headers: Additional headers to merge with defaults
+            params: URL query parameters
+            retry: Retry configuration for this call (overrides the client's)
+            coalesce: Whether this request may share an identical one in
+                     flight; False always sends it (e.g. for a hedge)
+            **kwargs: Additional arguments passed to httpx
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            APIError: For various API errors
+            APITimeoutError: If request times out
+            NetworkError: If network error occurs
+        """
+        retry = retry if retry is not None else self.retry
+        args = (method, endpoint, json_data, headers, params, retry)
+        key = None
+        if coalesce:
+            key = self._coalesce_key(method, endpoint, json_data, headers, params, kwargs)
+        if key is None:
+            return self._call(*args, **kwargs)
+        return self.single_flight.call(key, self._call, *args)
+
+    def _call(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        retry: RetryConfig,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Make a request with retries, guarded by its circuit as one call."""
+        idempotent = retry.retry_non_idempotent or is_retry_safe(method, endpoint)
+        with self._circuit(method, endpoint, json_data):
+            return call_with_retry(
+                self._send,
+                retry,
+                method,
+                endpoint,
+                json_data,
+                headers,
+                params,
+                idempotent=idempotent,
+                **kwargs,
+            )
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Make one HTTP request attempt."""
+        tokens = self._estimate_tokens(json_data)
+        with self._admit(method, tokens):
+            try:
+                response = self.client.request(
+                    method=method,
+                    url=self._build_url(endpoint),
+                    **self._build_body(json_data, headers),
+                    params=params,
+                    **kwargs,
+                )
+                data = self._handle_response(response)
+
+            except httpx.HTTPError as e:
+                raise self._map_request_error(e) from e
+
+        self._settle_tokens(tokens, data)
+        return data
+
+    def stream(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry: Optional[RetryConfig] = None,
+        **kwargs,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Make a streaming HTTP request (Server-Sent Events).
+
+        Errors before the first chunk arrives are retried like request(),
+        including its limits for requests that are not safe to repeat;
+        once data has been yielded the stream is never restarted.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            json_data: JSON request body
+            headers: Additional headers
+            retry: Retry configuration for this call (overrides the client's)
+            **kwargs: Additional arguments passed to httpx
+
+        Yields:
+            Parsed JSON chunks from SSE stream
+
+        Raises:
+            APIError: For various API errors
+        """
+        retry = retry if retry is not None else self.retry
+        idempotent = retry.retry_non_idempotent or is_retry_safe(method, endpoint)
+        with self._circuit(method, endpoint, json_data):
+            attempt = 0
+            while True:
+                received = False
+                stream = self._stream_once(method, endpoint, json_data, headers, **kwargs)
+                try:
+                    for chunk in stream:
+                        received = True
+                        yield chunk
+                    return
+                except APIError as e:
+                    if received or not should_retry(e, attempt, retry.max_retries, idempotent):
+                        raise
+                    time.sleep(retry_delay(e, attempt, retry))
+                    attempt += 1
+                finally:
+                    stream.close()
+
+    def _stream_once(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        **kwargs,
+    ) -> Iterator[Dict[str, Any]]:
+        """Make one streaming request attempt."""
+        tokens = self._estimate_tokens(json_data)
+        with self._admit(method, tokens) as permit:
+            try:
+                with self.client.stream(
+                    method=method,
+                    url=self._build_url(endpoint),
+                    **self._build_body(json_data, headers),
+                    **kwargs,
+                ) as response:
+                    # Check response status before streaming
+                    if response.status_code >= 400:
+                        response.read()
+                    self._check_response_status(response)
+
+                    # Parse SSE stream
+                    chunk_count = 0
+                    for data in iter_events(response.iter_bytes(), data_only=True):
+                        chunk = self._parse_sse_data(data, chunk_count)
+                        if chunk is None:
+                            continue
+                        if chunk == STREAM_END_MARKER:
+                            break
+                        chunk_count += 1
+                        if self._settle_tokens(tokens, chunk):
+                            tokens = 0  # Usage is settled once per stream
+                        if permit is not None:
+                            permit.mark()  # Time to first chunk, not stream length
+                        yield chunk
+
+                    # Check if we received any chunks
+                    if chunk_count == 0:
+                        raise StreamError(
+                            "No data received from stream. "
+                            "Server may not support SSE streaming."
+                        )
+
+            except APIError:
+                # StreamError and HTTP status errors are raised without wrapping
+                raise
+            except Exception as e:
+                raise self._map_stream_error(e) from e
+
     def close(self) -> None:
         """Close the HTTP client and release resources."""
+        if self.poll_scheduler is not None:
+            self.poll_scheduler.close()
         self.client.close()
 
     def __enter__(self):
@@ -324,3 +774,246 @@ class InternalClient:
     def __exit__(self, *args):
         """Context manager exit - close client."""
         self.close()
+
+
+class AsyncInternalClient(BaseInternalClient):
+    """
+    Asynchronous internal HTTP client for all API interactions.
+
+    Mirrors InternalClient on top of httpx.AsyncClient, so that many
+    requests can be in flight on a single event loop without holding
+    a thread each.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize the async internal HTTP client.
+
+        Takes the keyword arguments of BaseInternalClient.__init__().
+        """
+        super().__init__(**kwargs)
+        self.poll_scheduler = AsyncPollScheduler(self) if self.batch_polling else None
+        self.single_flight = AsyncSingleFlight()
+
+        # Create httpx client with retry transport and connection limits
+        transport = httpx.AsyncHTTPTransport(
+            retries=self.max_retries, limits=self._build_limits(), http2=self.http2
+        )
+        self.client = httpx.AsyncClient(
+            timeout=self._build_timeout(),
+            headers=self._default_headers(),
+            transport=transport,
+        )
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        retry: Optional[RetryConfig] = None,
+        coalesce: bool = True,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Make an asynchronous HTTP request.
+
+        Retries like InternalClient.request(), waiting with asyncio.sleep,
+        and shares responses of identical idempotent requests in flight.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint: API endpoint path (e.g., "/invoke")
+            json_data: JSON request body
+            headers: Additional headers to merge with defaults
+            params: URL query parameters
+            retry: Retry configuration for this call (overrides the client's)
+            coalesce: Whether this request may share an identical one in
+                     flight; False always sends it (e.g. for a hedge)
+            **kwargs: Additional arguments passed to httpx
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            APIError: For various API errors
+            APITimeoutError: If request times out
+            NetworkError: If network error occurs
+        """
+        retry = retry if retry is not None else self.retry
+        args = (method, endpoint, json_data, headers, params, retry)
+        key = None
+        if coalesce:
+            key = self._coalesce_key(method, endpoint, json_data, headers, params, kwargs)
+        if key is None:
+            return await self._call(*args, **kwargs)
+        return await self.single_flight.call(key, self._call, *args)
+
+    async def _call(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        retry: RetryConfig,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Make a request with retries, guarded by its circuit as one call."""
+        idempotent = retry.retry_non_idempotent or is_retry_safe(method, endpoint)
+        with self._circuit(method, endpoint, json_data):
+            return await acall_with_retry(
+                self._send,
+                retry,
+                method,
+                endpoint,
+                json_data,
+                headers,
+                params,
+                idempotent=idempotent,
+                **kwargs,
+            )
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Make one HTTP request attempt."""
+        tokens = self._estimate_tokens(json_data)
+        async with self._aadmit(method, tokens):
+            try:
+                response = await self.client.request(
+                    method=method,
+                    url=self._build_url(endpoint),
+                    **self._build_body(json_data, headers),
+                    params=params,
+                    **kwargs,
+                )
+                data = self._handle_response(response)
+
+            except httpx.HTTPError as e:
+                raise self._map_request_error(e) from e
+
+        self._settle_tokens(tokens, data)
+        return data
+
+    async def stream(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry: Optional[RetryConfig] = None,
+        **kwargs,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Make an asynchronous streaming HTTP request (Server-Sent Events).
+
+        Errors before the first chunk arrives are retried like request(),
+        including its limits for requests that are not safe to repeat;
+        once data has been yielded the stream is never restarted.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            json_data: JSON request body
+            headers: Additional headers
+            retry: Retry configuration for this call (overrides the client's)
+            **kwargs: Additional arguments passed to httpx
+
+        Yields:
+            Parsed JSON chunks from SSE stream
+
+        Raises:
+            APIError: For various API errors
+        """
+        retry = retry if retry is not None else self.retry
+        idempotent = retry.retry_non_idempotent or is_retry_safe(method, endpoint)
+        with self._circuit(method, endpoint, json_data):
+            attempt = 0
+            while True:
+                received = False
+                stream = self._stream_once(method, endpoint, json_data, headers, **kwargs)
+                try:
+                    async for chunk in stream:
+                        received = True
+                        yield chunk
+                    return
+                except APIError as e:
+                    if received or not should_retry(e, attempt, retry.max_retries, idempotent):
+                        raise
+                    await asyncio.sleep(retry_delay(e, attempt, retry))
+                    attempt += 1
+                finally:
+                    await stream.aclose()
+
+    async def _stream_once(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        **kwargs,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Make one streaming request attempt."""
+        tokens = self._estimate_tokens(json_data)
+        async with self._aadmit(method, tokens) as permit:
+            try:
+                async with self.client.stream(
+                    method=method,
+                    url=self._build_url(endpoint),
+                    **self._build_body(json_data, headers),
+                    **kwargs,
+                ) as response:
+                    # Check response status before streaming
+                    if response.status_code >= 400:
+                        await response.aread()
+                    self._check_response_status(response)
+
+                    # Parse SSE stream
+                    chunk_count = 0
+                    async for data in aiter_events(response.aiter_bytes(), data_only=True):
+                        chunk = self._parse_sse_data(data, chunk_count)
+                        if chunk is None:
+                            continue
+                        if chunk == STREAM_END_MARKER:
+                            break
+                        chunk_count += 1
+                        if self._settle_tokens(tokens, chunk):
+                            tokens = 0  # Usage is settled once per stream
+                        if permit is not None:
+                            permit.mark()  # Time to first chunk, not stream length
+                        yield chunk
+
+                    # Check if we received any chunks
+                    if chunk_count == 0:
+                        raise StreamError(
+                            "No data received from stream. "
+                            "Server may not support SSE streaming."
+                        )
+
+            except APIError:
+                # StreamError and HTTP status errors are raised without wrapping
+                raise
+            except Exception as e:
+                raise self._map_stream_error(e) from e
+
+    async def close(self) -> None:
+        """Close the HTTP client and release resources."""
+        if self.poll_scheduler is not None:
+            self.poll_scheduler.close()
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Async context manager exit - close client."""
+        await self.close()
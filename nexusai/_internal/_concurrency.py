@@ -0,0 +1,285 @@
+"""Adaptive (AIMD) limit on the number of requests in flight."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, Optional
+from nexusai.error import APITimeoutError, RateLimitError, ServerError
+from nexusai.constants import (
+    DEFAULT_CONCURRENCY_INITIAL_LIMIT,
+    DEFAULT_CONCURRENCY_MIN_LIMIT,
+    DEFAULT_CONCURRENCY_MAX_LIMIT,
+    DEFAULT_CONCURRENCY_BACKOFF,
+    DEFAULT_CONCURRENCY_LATENCY_TOLERANCE,
+)
+
+# Weights of the newest sample in the short- and long-term latency averages
+_SHORT_ALPHA = 0.2
+_LONG_ALPHA = 0.02
+
+# Called with (old_limit, new_limit) whenever the limit changes
+LimitCallback = Callable[[int, int], None]
+
+
+def is_overload(error: BaseException) -> bool:
+    """Whether an error means the server is overloaded."""
+    return isinstance(error, (RateLimitError, ServerError, APITimeoutError))
+
+
+class Permit:
+    """A held permit; measures the latency reported when it is returned."""
+
+    def __init__(self):
+        """Start timing the request."""
+        self.started = time.monotonic()
+        self.latency: Optional[float] = None
+
+    def mark(self) -> None:
+        """Record the latency now, e.g. when a stream's first chunk arrives."""
+        if self.latency is None:
+            self.latency = time.monotonic() - self.started
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits concurrent requests, adapting the limit to the server's capacity.
+
+    Additive increase, multiplicative decrease (AIMD): every time a full
+    window of requests succeeds while the limit is in use and latency is
+    stable, the limit grows by one. A rate limit error, server error or
+    timeout cuts it by the backoff factor, at most once per round trip so
+    a burst of failures from one window counts once. While latency is
+    well above its long-term average the limit is held instead of raised.
+
+    Requests over the limit wait for a permit. Works for threads and for
+    coroutines (one event loop) alike.
+
+    Example:
+        ```python
+        from nexusai import NexusAIClient, AdaptiveConcurrencyLimiter
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=200)
+        client = NexusAIClient(concurrency_limiter=limiter)
+
+        for item in client.text.generate_many(prompts, concurrency=200):
+            ...
+        print(limiter.limit)  # Settles near what the gateway sustains
+        ```
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_CONCURRENCY_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_CONCURRENCY_MIN_LIMIT,
+        max_limit: int = DEFAULT_CONCURRENCY_MAX_LIMIT,
+        backoff: float = DEFAULT_CONCURRENCY_BACKOFF,
+        latency_tolerance: float = DEFAULT_CONCURRENCY_LATENCY_TOLERANCE,
+        on_limit_change: Optional[LimitCallback] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Requests allowed in flight at first
+            min_limit: Lowest the limit can drop to
+            max_limit: Highest the limit can grow to
+            backoff: Factor the limit is multiplied by on overload (0 to 1)
+            latency_tolerance: Ratio of recent to long-term latency above
+                              which the limit stops growing
+            on_limit_change: Optional callback(old_limit, new_limit), e.g. to
+                            export the limit as a metric
+
+        Raises:
+            ValueError: If the limits or backoff are out of range
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.on_limit_change = on_limit_change
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._successes = 0
+        self._short_latency: Optional[float] = None
+        self._long_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._decreases = 0
+        self._sync_waiting = 0
+        self._cond = threading.Condition()
+        self._async_waiters: Deque["asyncio.Future"] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a permit."""
+        return self._in_flight
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of the limiter's state for monitoring."""
+        with self._cond:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "waiting": self._sync_waiting + len(self._async_waiters),
+                "latency": self._short_latency,
+                "baseline_latency": self._long_latency,
+                "decreases": self._decreases,
+            }
+
+    def _try_acquire(self) -> bool:
+        """Take a permit if one is free; caller holds the lock."""
+        if self._in_flight < self.limit:
+            self._in_flight += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        """Block until a permit is free, then take it."""
+        with self._cond:
+            if self._try_acquire():
+                return
+            self._sync_waiting += 1
+            try:
+                while not self._try_acquire():
+                    self._cond.wait()
+            finally:
+                self._sync_waiting -= 1
+
+    async def aacquire(self) -> None:
+        """Wait without blocking the event loop until a permit is free, then take it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._try_acquire():
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._cond:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+                        waiters = []
+                    else:
+                        # Already woken for a free permit: pass it on
+                        waiters = self._pop_waiters(1)
+                _wake_all(waiters)
+                raise
+
+    def _pop_waiters(self, count: int) -> list:
+        """Remove up to count async waiters to wake; caller holds the lock."""
+        count = min(count, len(self._async_waiters))
+        return [self._async_waiters.popleft() for _ in range(count)]
+
+    def release(
+        self, latency: Optional[float] = None, error: Optional[BaseException] = None
+    ) -> None:
+        """
+        Return a permit and feed back how the request went.
+
+        Args:
+            latency: Seconds the request took, if it succeeded
+            error: The error it failed with, if any. Overload errors lower
+                  the limit; other errors leave it unchanged.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            old_limit = self.limit
+            if error is not None:
+                if is_overload(error):
+                    self._decrease()
+            elif latency is not None:
+                self._record_success(latency)
+            new_limit = self.limit
+
+            free = max(new_limit - self._in_flight, 0)
+            self._cond.notify(free)
+            waiters = self._pop_waiters(free)
+
+        _wake_all(waiters)
+        if new_limit != old_limit and self.on_limit_change is not None:
+            self.on_limit_change(old_limit, new_limit)
+
+    @contextmanager
+    def permit(self) -> Iterator[Permit]:
+        """Hold a permit for the duration of a with block."""
+        self.acquire()
+        permit = Permit()
+        try:
+            yield permit
+        except BaseException as e:
+            self.release(error=e)
+            raise
+        permit.mark()
+        self.release(latency=permit.latency)
+
+    @asynccontextmanager
+    async def apermit(self) -> AsyncIterator[Permit]:
+        """Hold a permit for the duration of an async with block."""
+        await self.aacquire()
+        permit = Permit()
+        try:
+            yield permit
+        except BaseException as e:
+            self.release(error=e)
+            raise
+        permit.mark()
+        self.release(latency=permit.latency)
+
+    def _record_success(self, latency: float) -> None:
+        """Update latency averages and grow the limit after a full window."""
+        if self._short_latency is None:
+            self._short_latency = self._long_latency = latency
+        else:
+            self._short_latency += _SHORT_ALPHA * (latency - self._short_latency)
+            self._long_latency += _LONG_ALPHA * (latency - self._long_latency)
+
+        # Only grow a limit that is actually being used
+        if self._in_flight + 1 < self.limit / 2:
+            return
+        if self._short_latency > self._long_latency * self.latency_tolerance:
+            return
+
+        self._successes += 1
+        if self._successes >= self.limit:
+            self._successes = 0
+            self._limit = min(self.max_limit, self._limit + 1)
+
+    def _decrease(self) -> None:
+        """Cut the limit, at most once per round trip."""
+        now = time.monotonic()
+        if now - self._last_decrease < (self._short_latency or 0.0):
+            return
+        self._last_decrease = now
+        self._successes = 0
+        self._decreases += 1
+        self._limit = max(self.min_limit, self._limit * self.backoff)
+
+    def __repr__(self) -> str:
+        """Return string representation of the limiter."""
+        return f"AdaptiveConcurrencyLimiter(limit={self.limit}, in_flight={self._in_flight})"
+
+
+def _wake(waiter: "asyncio.Future") -> None:
+    """Wake an async waiter unless it was cancelled meanwhile."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _wake_all(waiters: list) -> None:
+    """Wake async waiters from any thread."""
+    for waiter in waiters:
+        waiter.get_loop().call_soon_threadsafe(_wake, waiter)
@@ -0,0 +1,277 @@
+"""Hedged requests: a duplicate request when the first one is slow."""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+from nexusai.constants import (
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_HEDGE_MIN_DELAY,
+    DEFAULT_HEDGE_MAX_EXTRA_LOAD,
+    DEFAULT_HEDGE_WINDOW,
+    DEFAULT_HEDGE_MIN_SAMPLES,
+    DEFAULT_HEDGE_MAX_THREADS,
+)
+
+T = TypeVar("T")
+
+# Sends a request body and returns the response
+Send = Callable[[Dict[str, Any]], T]
+
+
+class HedgePolicy:
+    """
+    Sends a duplicate of a slow request and takes whichever answers first.
+
+    If a response has not arrived within the given percentile of recent
+    latencies, the same request is sent again, optionally to a fallback
+    provider and model. The first successful response wins; the other
+    request is cancelled (async client) or left to finish in the
+    background with its result discarded (sync client, where a request
+    in progress cannot be interrupted). If one request fails, the other
+    is still awaited.
+
+    Hedges are capped at max_extra_load duplicates per request on
+    average, so a general slowdown does not double the load on an
+    already struggling server.
+
+    The sync client runs hedged requests on up to max_threads threads
+    owned by the policy, so it can wait for the first request and send
+    the duplicate at the same time. A request that lost the race keeps
+    its thread until it finishes; while every thread is busy, requests
+    are sent unhedged on the caller's thread instead of starting more.
+
+    Example:
+        ```python
+        from nexusai import NexusAIClient, HedgePolicy
+
+        hedge = HedgePolicy(percentile=95, provider="anthropic", model="claude-3-haiku")
+        client = NexusAIClient(hedge_policy=hedge)
+
+        response = client.text.generate(prompt="Hello", provider="openai")
+        print(hedge.metrics())
+        ```
+    """
+
+    def __init__(
+        self,
+        percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        min_delay: float = DEFAULT_HEDGE_MIN_DELAY,
+        max_extra_load: float = DEFAULT_HEDGE_MAX_EXTRA_LOAD,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        window: int = DEFAULT_HEDGE_WINDOW,
+        min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+        max_threads: int = DEFAULT_HEDGE_MAX_THREADS,
+    ):
+        """
+        Initialize the hedging policy.
+
+        Args:
+            percentile: Percentile (0-100) of recent latencies after which a
+                       duplicate request is sent
+            min_delay: Minimum seconds to wait before hedging
+            max_extra_load: Duplicate requests allowed per request, on average
+            provider: Provider for the duplicate request (default: the same)
+            model: Model for the duplicate request (default: the same)
+            window: Number of recent latencies the percentile is taken over
+            min_samples: Latencies to collect before hedging starts
+            max_threads: Threads the sync client's requests and their
+                        duplicates may occupy at once
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= max_extra_load <= 1:
+            raise ValueError("max_extra_load must be between 0 and 1")
+        if window < 1 or min_samples < 1 or max_threads < 1:
+            raise ValueError("window, min_samples and max_threads must be at least 1")
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_extra_load = max_extra_load
+        self.provider = provider
+        self.model = model
+        self.min_samples = min_samples
+        self.max_threads = max_threads
+
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._budget = 0.0
+        self._max_budget = max(1.0, max_extra_load * window)
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._lock = threading.Lock()
+        self._threads = threading.BoundedSemaphore(max_threads)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None until enough latencies are known."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, math.ceil(len(latencies) * self.percentile / 100) - 1)
+        return max(self.min_delay, latencies[index])
+
+    def record(self, latency: float) -> None:
+        """Add the latency of a first (not hedged) request."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of the hedging counters for monitoring."""
+        with self._lock:
+            requests, hedges, wins = self._requests, self._hedges, self._hedge_wins
+        return {"requests": requests, "hedges": hedges, "hedge_wins": wins, "delay": self.delay()}
+
+    def _start(self) -> Optional[float]:
+        """Count a request, earning hedge budget; returns the hedge delay."""
+        with self._lock:
+            self._requests += 1
+            self._budget = min(self._max_budget, self._budget + self.max_extra_load)
+        return self.delay()
+
+    def _spend(self) -> bool:
+        """Take budget for one hedge, if there is enough."""
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self._hedges += 1
+            return True
+
+    def _won(self, hedge: bool) -> None:
+        """Count which request answered first."""
+        if hedge:
+            with self._lock:
+                self._hedge_wins += 1
+
+    def _submit(self, func: Callable[..., T], *args) -> "Future[T]":
+        """Run func on the policy's threads; the caller has taken a thread slot."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_threads, thread_name_prefix="nexusai-hedge"
+                )
+            executor = self._executor
+        future = executor.submit(func, *args)
+        future.add_done_callback(lambda _: self._threads.release())
+        return future
+
+    def hedge_body(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Request body of the duplicate request."""
+        body = dict(body)
+        if self.provider:
+            body["provider"] = self.provider
+        if self.model:
+            body["model"] = self.model
+        return body
+
+    def _timed(self, send: Send, body: Dict[str, Any]) -> Any:
+        """Send the first request, recording its latency if it succeeds."""
+        started = time.monotonic()
+        result = send(body)
+        self.record(time.monotonic() - started)
+        return result
+
+    def call(self, send: Send, body: Dict[str, Any], hedge_send: Optional[Send] = None) -> Any:
+        """
+        Send a request, hedging it if it is slow.
+
+        Args:
+            send: Function sending a request body and returning the response
+            body: Request body
+            hedge_send: Function sending the duplicate (default: send). It
+                       should bypass request coalescing, or a duplicate to
+                       the same target just waits for the first request.
+
+        Returns:
+            The first successful response
+
+        Raises:
+            APIError: The first request's error, if every request failed
+        """
+        delay = self._start()
+        if delay is None or not self._threads.acquire(blocking=False):
+            return self._timed(send, body)
+
+        primary = self._submit(self._timed, send, body)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        if not self._threads.acquire(blocking=False):
+            return primary.result()
+        if not self._spend():
+            self._threads.release()
+            return primary.result()
+
+        hedge = self._submit(hedge_send or send, self.hedge_body(body))
+        pending: List[Future] = [primary, hedge]
+        errors: List[BaseException] = []
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            # Prefer the first request if both are done
+            for future in sorted(done, key=pending.index):
+                if future.exception() is None:
+                    self._won(future is not primary)
+                    return future.result()
+            for future in done:
+                errors.append(future.exception())
+                pending.remove(future)
+        raise primary.exception() or errors[0]
+
+    async def acall(
+        self,
+        send: Callable[[Dict[str, Any]], Awaitable[T]],
+        body: Dict[str, Any],
+        hedge_send: Optional[Callable[[Dict[str, Any]], Awaitable[T]]] = None,
+    ) -> T:
+        """
+        Send a request without blocking the event loop, hedging it if it is slow.
+
+        Takes the same arguments as call(). The request that loses the
+        race is cancelled.
+        """
+        delay = self._start()
+        started = time.monotonic()
+        primary = asyncio.ensure_future(send(body))
+        pending = [primary]
+        try:
+            if delay is not None:
+                await asyncio.wait(pending, timeout=delay)
+                if not primary.done() and self._spend():
+                    hedge = (hedge_send or send)(self.hedge_body(body))
+                    pending.append(asyncio.ensure_future(hedge))
+
+            errors: List[BaseException] = []
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=pending.index):
+                    if task.exception() is None:
+                        self._won(task is not primary)
+                        return task.result()
+                for task in done:
+                    errors.append(task.exception())
+                    pending.remove(task)
+            raise primary.exception() or errors[0]
+        finally:
+            if primary in pending:
+                # Its latency, or a lower bound if it is cancelled unfinished
+                self.record(time.monotonic() - started)
+            for task in pending:
+                task.cancel()
+
+    def __repr__(self) -> str:
+        """Return string representation of the policy."""
+        return (
+            f"HedgePolicy(percentile={self.percentile}, provider={self.provider!r}, "
+            f"model={self.model!r})"
+        )
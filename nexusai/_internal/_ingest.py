@@ -0,0 +1,131 @@
+"""Progress checkpoints for bulk knowledge-base ingestion."""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Union
+from nexusai.models import Task
+from nexusai._internal._upload import content_digest
+
+# Stages a document passes through; each is checkpointed once reached
+STAGE_UPLOADED = "uploaded"
+STAGE_ADDED = "added"
+STAGE_COMPLETED = "completed"
+
+Document = Union[str, Path, BinaryIO]
+
+
+def iter_documents(documents: Union[str, Path, Iterable[Document]]) -> Iterator[Document]:
+    """
+    Expand an ingest() source into individual documents.
+
+    A directory yields every file below it in sorted order, a single path
+    yields itself, and any other iterable is passed through lazily.
+    """
+    if isinstance(documents, (str, Path)):
+        path = Path(documents)
+        if path.is_dir():
+            return (p for p in sorted(path.rglob("*")) if p.is_file())
+        return iter([path])
+    return iter(documents)
+
+
+class IngestCheckpoint:
+    """
+    Append-only log of how far each document of an ingestion got.
+
+    Every stage a document reaches is appended to a JSON Lines file and
+    flushed immediately, so a crash loses at most the record being
+    written; a truncated last line is ignored when the log is loaded,
+    and ended before new records are appended so none is merged into it.
+    Documents are identified by knowledge base and a SHA-256 of their
+    content, so a resumed run recognizes them whatever their path.
+
+    Without a path nothing is persisted and documents are not hashed.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Open the checkpoint, loading records of a previous run.
+
+        Args:
+            path: JSON Lines file to append to (created on first record)
+        """
+        self.path = Path(path).expanduser() if path is not None else None
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._file = None
+        # A crash left an unterminated last line that new records must not extend
+        self._torn = False
+
+        if self.path is not None and self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._torn = not line.endswith("\n")
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    # Skip partial or foreign records like malformed lines
+                    if isinstance(record, dict) and "key" in record:
+                        self._records[record["key"]] = record
+
+    def key(self, kb_id: str, file_obj: BinaryIO) -> Optional[str]:
+        """
+        Identify a document for checkpointing.
+
+        Returns:
+            Key of the document, or None if it is not checkpointed (no
+            checkpoint file, or a stream that cannot be rewound)
+        """
+        if self.path is None:
+            return None
+        digest = content_digest(file_obj)
+        if digest is None:
+            return None
+        return f"{kb_id}:{digest[0]}:{digest[1]}"
+
+    def get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the latest record of a document, or None."""
+        if key is None:
+            return None
+        with self._lock:
+            return self._records.get(key)
+
+    def record(
+        self,
+        key: Optional[str],
+        stage: str,
+        file_id: str,
+        task: Optional[Task] = None,
+        source: Optional[str] = None,
+    ) -> None:
+        """Append the stage a document reached."""
+        if key is None:
+            return
+
+        record = {"key": key, "stage": stage, "file_id": file_id, "source": source}
+        if task is not None:
+            record["task"] = task.model_dump(mode="json")
+        line = json.dumps(record) + "\n"
+
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+                if self._torn:
+                    self._file.write("\n")
+                    self._torn = False
+            self._file.write(line)
+            self._file.flush()
+            self._records[key] = record
+
+    def close(self) -> None:
+        """Close the checkpoint file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __len__(self) -> int:
+        return len(self._records)
@@ -0,0 +1,144 @@
+"""JSON encoding and decoding of request and response bodies."""
+
+import json
+from typing import Any, Union
+from nexusai.constants import (
+    JSON_CODEC_AUTO,
+    JSON_CODEC_MSGSPEC,
+    JSON_CODEC_ORJSON,
+    JSON_CODEC_STDLIB,
+)
+
+
+class JSONCodec:
+    """
+    Base class for the JSON codec used by the client.
+
+    A codec serializes request bodies and parses response bodies and
+    streamed chunks. Decoding errors must be ValueError subclasses (as
+    json.JSONDecodeError is), so the client can tell malformed bodies
+    from other failures.
+    """
+
+    name = "custom"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize a request body to UTF-8 JSON."""
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parse a JSON document."""
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        """Return string representation of the codec."""
+        return f"{type(self).__name__}()"
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Codec using the standard library json module."""
+
+    name = JSON_CODEC_STDLIB
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize compactly, as httpx does for json= bodies."""
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+        return text.encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parse with json.loads."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec using orjson; bodies orjson cannot encode fall back to the standard library."""
+
+    name = JSON_CODEC_ORJSON
+
+    def __init__(self):
+        """Initialize the codec, raising ImportError if orjson is not installed."""
+        import orjson
+
+        self._orjson = orjson
+        self._fallback = StdlibJSONCodec()
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize with orjson."""
+        try:
+            return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # E.g. integers beyond 64 bits, or subclasses orjson rejects
+            return self._fallback.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parse with orjson; its errors subclass json.JSONDecodeError."""
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec using msgspec; bodies msgspec cannot encode fall back to the standard library."""
+
+    name = JSON_CODEC_MSGSPEC
+
+    def __init__(self):
+        """Initialize the codec, raising ImportError if msgspec is not installed."""
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._errors = (TypeError, msgspec.EncodeError)
+        self._fallback = StdlibJSONCodec()
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize with msgspec."""
+        try:
+            return self._encoder.encode(obj)
+        except self._errors:
+            return self._fallback.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parse with msgspec; its DecodeError subclasses ValueError."""
+        return self._decoder.decode(data)
+
+
+_CODECS = {
+    JSON_CODEC_ORJSON: OrjsonCodec,
+    JSON_CODEC_MSGSPEC: MsgspecCodec,
+    JSON_CODEC_STDLIB: StdlibJSONCodec,
+}
+
+
+def get_codec(codec: Union[str, JSONCodec]) -> JSONCodec:
+    """
+    Resolve a codec name to a codec.
+
+    Args:
+        codec: A JSONCodec, "orjson", "msgspec", "json" (standard library),
+              or "auto" for the fastest installed one (orjson, then msgspec,
+              then the standard library)
+
+    Returns:
+        The codec
+
+    Raises:
+        ImportError: If the named library is not installed
+        ValueError: If the name is unknown
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == JSON_CODEC_AUTO:
+        for name in (JSON_CODEC_ORJSON, JSON_CODEC_MSGSPEC):
+            try:
+                return _CODECS[name]()
+            except ImportError:
+                continue
+        return StdlibJSONCodec()
+    if codec not in _CODECS:
+        raise ValueError(f"Unknown JSON codec {codec!r}; use one of: auto, {', '.join(_CODECS)}")
+    try:
+        return _CODECS[codec]()
+    except ImportError:
+        raise ImportError(
+            f"The {codec!r} JSON codec requires the '{codec}' package. "
+            f"Install it with: pip install keystone-ai[{codec}]"
+        ) from None
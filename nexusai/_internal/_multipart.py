@@ -0,0 +1,210 @@
+"""Resumable multipart uploads: part bookkeeping and local upload state."""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from nexusai._internal._upload import ProgressCallback
+from nexusai.constants import UPLOADS_ENDPOINT
+
+
+class UploadStateStore:
+    """
+    Persists the progress of multipart uploads as JSON files in a directory.
+
+    One file per upload, named after a hash of the source path, size,
+    modification time and part size, so an edited file never resumes
+    from stale parts.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding the state files (created on first save)
+        """
+        self.directory = Path(directory).expanduser()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load an upload state record, or None if there is none or it is unreadable."""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, key: str, state: Dict[str, Any]) -> None:
+        """Write an upload state record atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path(key).with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self._path(key))
+
+    def delete(self, key: str) -> None:
+        """Remove an upload state record."""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class ResumableUpload:
+    """
+    One multipart upload of a file on disk.
+
+    Tracks which parts the server has confirmed and saves that to the
+    state store after every part, so an interrupted upload continues with
+    the missing parts only. Part bookkeeping is thread-safe.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        filename: Optional[str],
+        part_size: int,
+        store: UploadStateStore,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        """
+        Initialize the upload, loading saved progress if there is any.
+
+        Args:
+            path: Path of the file to upload
+            filename: Filename to store (defaults to the file's name)
+            part_size: Bytes per part
+            store: Where upload progress is saved
+            progress_callback: Optional callback function(bytes_sent, total_bytes)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If part_size is not positive
+        """
+        if part_size < 1:
+            raise ValueError("part_size must be at least 1")
+
+        self.path = Path(path).resolve()
+        if not self.path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        stat = self.path.stat()
+        self.filename = filename or self.path.name
+        self.size = stat.st_size
+        self.part_size = part_size
+        self.part_count = max(1, -(-self.size // part_size))
+        self.progress_callback = progress_callback
+        self.store = store
+        self.key = hashlib.sha256(
+            f"{self.path}|{self.size}|{stat.st_mtime_ns}|{part_size}".encode()
+        ).hexdigest()[:32]
+
+        self._lock = threading.Lock()
+        self.upload_id: Optional[str] = None
+        self.parts: Dict[int, Optional[str]] = {}  # part number -> ETag
+
+        state = store.load(self.key)
+        if state:
+            self.upload_id = state.get("upload_id")
+            self.parts = {int(number): etag for number, etag in state.get("parts", {}).items()}
+
+    # Endpoints and request bodies
+
+    def create_body(self) -> Dict[str, Any]:
+        """Request body starting the upload on the server."""
+        return {
+            "filename": self.filename,
+            "size": self.size,
+            "part_size": self.part_size,
+            "part_count": self.part_count,
+        }
+
+    def upload_endpoint(self) -> str:
+        """Endpoint of this upload."""
+        return f"{UPLOADS_ENDPOINT}/{self.upload_id}"
+
+    def part_endpoint(self, part_number: int) -> str:
+        """Endpoint receiving one part."""
+        return f"{self.upload_endpoint()}/parts/{part_number}"
+
+    def complete_body(self) -> Dict[str, Any]:
+        """Request body assembling the parts into one file."""
+        return {
+            "parts": [
+                {"part_number": number, "etag": self.parts[number]} for number in sorted(self.parts)
+            ]
+        }
+
+    # Progress
+
+    def start(self, response: Dict[str, Any]) -> None:
+        """Record the upload ID the server assigned and save the state."""
+        with self._lock:
+            self.upload_id = response["upload_id"]
+            self.parts = {}
+            self._save()
+
+    def reset(self) -> None:
+        """Forget saved progress (e.g. the server no longer knows the upload)."""
+        with self._lock:
+            self.upload_id = None
+            self.parts = {}
+            self.store.delete(self.key)
+
+    def sync_parts(self, response: Dict[str, Any]) -> None:
+        """Keep only the saved parts the server still reports as received."""
+        received = {part["part_number"]: part.get("etag") for part in response.get("parts", [])}
+        with self._lock:
+            self.parts = {
+                number: received[number] or etag
+                for number, etag in self.parts.items()
+                if number in received
+            }
+            self._save()
+
+    def pending_parts(self) -> List[int]:
+        """Part numbers (1-based) that still need to be sent."""
+        return [number for number in range(1, self.part_count + 1) if number not in self.parts]
+
+    def read_part(self, part_number: int) -> bytes:
+        """Read one part from disk."""
+        with open(self.path, "rb") as f:
+            f.seek((part_number - 1) * self.part_size)
+            return f.read(self.part_size)
+
+    def mark_done(self, part_number: int, etag: Optional[str]) -> None:
+        """Record a part the server confirmed, save the state and report progress."""
+        with self._lock:
+            self.parts[part_number] = etag
+            self._save()
+            bytes_sent = self.bytes_sent
+        if self.progress_callback:
+            self.progress_callback(bytes_sent, self.size)
+
+    @property
+    def bytes_sent(self) -> int:
+        """Bytes of the file confirmed by the server so far."""
+        last = self.part_count
+        last_size = self.size - (last - 1) * self.part_size
+        return sum(last_size if number == last else self.part_size for number in self.parts)
+
+    def finish(self) -> None:
+        """Remove the saved state once the file is assembled."""
+        self.store.delete(self.key)
+
+    def _save(self) -> None:
+        self.store.save(
+            self.key,
+            {
+                "upload_id": self.upload_id,
+                "path": str(self.path),
+                "size": self.size,
+                "part_size": self.part_size,
+                "parts": {str(number): etag for number, etag in self.parts.items()},
+            },
+        )
@@ -0,0 +1,152 @@
+"""Pluggable strategies deciding how long to wait between task status checks."""
+
+from typing import Dict, Optional
+from nexusai.models import Task
+from nexusai.constants import (
+    TASK_TYPE_TEXT_GENERATION,
+    TASK_TYPE_IMAGE_GENERATION,
+    TASK_TYPE_SPEECH_TO_TEXT,
+    TASK_TYPE_TEXT_TO_SPEECH,
+    TASK_TYPE_DOCUMENT_PROCESSING,
+)
+
+# Cap on the exponent so long-running polls never overflow
+_MAX_EXPONENT = 64
+
+
+class PollStrategy:
+    """
+    Base class for poll strategies.
+
+    A strategy is stateless: the poller passes in everything it knows about
+    the task, so one instance can be shared by any number of concurrent polls.
+    """
+
+    def next_delay(self, attempt: int, elapsed: float, task: Optional[Task] = None) -> float:
+        """
+        Calculate the delay before the next status check.
+
+        Args:
+            attempt: Number of status checks made so far minus one (0-indexed)
+            elapsed: Seconds since polling started
+            task: Latest task status, if available
+
+        Returns:
+            Delay in seconds
+        """
+        raise NotImplementedError
+
+
+class FixedPollStrategy(PollStrategy):
+    """Waits the same interval between every status check."""
+
+    def __init__(self, interval: float):
+        """
+        Initialize the fixed strategy.
+
+        Args:
+            interval: Seconds between status checks
+        """
+        self.interval = interval
+
+    def next_delay(self, attempt: int, elapsed: float, task: Optional[Task] = None) -> float:
+        """Return the fixed interval."""
+        return self.interval
+
+    def __repr__(self) -> str:
+        """Return string representation of the strategy."""
+        return f"FixedPollStrategy(interval={self.interval})"
+
+
+class AdaptivePollStrategy(PollStrategy):
+    """
+    Checks fast tasks quickly and slow tasks rarely.
+
+    The delay starts at initial_delay and grows geometrically up to
+    max_delay. Server hints in the task status take precedence:
+    - retry_after: used as the delay directly
+    - progress: remaining time is extrapolated from elapsed time and the
+      delay is set to that estimate (bounded by initial_delay and max_delay)
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 0.25,
+        multiplier: float = 1.5,
+        max_delay: float = 2.0,
+        use_progress: bool = True,
+    ):
+        """
+        Initialize the adaptive strategy.
+
+        Args:
+            initial_delay: Delay after the first status check in seconds
+            multiplier: Growth factor applied per status check
+            max_delay: Upper bound on the delay in seconds
+            use_progress: Predict completion from the task's progress field
+        """
+        self.initial_delay = initial_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.use_progress = use_progress
+
+    def next_delay(self, attempt: int, elapsed: float, task: Optional[Task] = None) -> float:
+        """Calculate the delay from the attempt count and server hints."""
+        if task is not None and task.retry_after is not None:
+            return max(0.0, float(task.retry_after))
+
+        exponent = min(attempt, _MAX_EXPONENT)
+        delay = min(self.initial_delay * (self.multiplier**exponent), self.max_delay)
+
+        if (
+            self.use_progress
+            and task is not None
+            and task.progress is not None
+            and 0 < task.progress < 100
+            and elapsed > 0
+        ):
+            # Linear extrapolation: remaining = elapsed * (100 - p) / p
+            remaining = elapsed * (100 - task.progress) / task.progress
+            delay = min(max(remaining, self.initial_delay), self.max_delay)
+
+        return delay
+
+    def __repr__(self) -> str:
+        """Return string representation of the strategy."""
+        return (
+            f"AdaptivePollStrategy(initial_delay={self.initial_delay}, "
+            f"multiplier={self.multiplier}, max_delay={self.max_delay})"
+        )
+
+
+# Per-task-type defaults, tuned to typical task durations
+DEFAULT_POLL_STRATEGIES: Dict[str, PollStrategy] = {
+    # Usually a few seconds
+    TASK_TYPE_TEXT_GENERATION: AdaptivePollStrategy(initial_delay=0.1, max_delay=2.0),
+    TASK_TYPE_TEXT_TO_SPEECH: AdaptivePollStrategy(initial_delay=0.25, max_delay=2.0),
+    # Typically 5-30 seconds
+    TASK_TYPE_IMAGE_GENERATION: AdaptivePollStrategy(initial_delay=0.25, max_delay=3.0),
+    # Proportional to audio length, up to several minutes
+    TASK_TYPE_SPEECH_TO_TEXT: AdaptivePollStrategy(
+        initial_delay=0.5, multiplier=2.0, max_delay=10.0
+    ),
+    # Parsing, chunking and embedding whole documents
+    TASK_TYPE_DOCUMENT_PROCESSING: AdaptivePollStrategy(
+        initial_delay=1.0, multiplier=2.0, max_delay=10.0
+    ),
+}
+
+_FALLBACK_POLL_STRATEGY = AdaptivePollStrategy()
+
+
+def get_poll_strategy(task_type: Optional[str]) -> PollStrategy:
+    """
+    Get the default adaptive strategy for a task type.
+
+    Args:
+        task_type: Task type from the task status (e.g. "image_generation")
+
+    Returns:
+        PollStrategy for the task type, or a general-purpose adaptive strategy
+    """
+    return DEFAULT_POLL_STRATEGIES.get(task_type, _FALLBACK_POLL_STRATEGY)
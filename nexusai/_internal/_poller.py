@@ -1,46 +1,206 @@
 """Task polling mechanism for async operations."""
 
+import asyncio
 import time
-from typing import Dict, Any, Optional
-from nexusai.error import APITimeoutError, APIError
+from typing import Dict, Any, Optional, Callable, Generator, Iterator, AsyncIterator
+from nexusai.error import APITimeoutError, APIError, NetworkError, NotFoundError, StreamError
 from nexusai.models import Task
 from nexusai.config import config
+from nexusai._internal._poll_strategy import PollStrategy, FixedPollStrategy, get_poll_strategy
+from nexusai._internal._retry import RetryConfig
 from nexusai.constants import (
     TASK_STATUS_COMPLETED,
     TASK_STATUS_FAILED,
     TASK_STATUS_PENDING,
     TASK_STATUS_QUEUED,
     TASK_STATUS_RUNNING,
+    TASK_UPDATES_LONG_POLL,
+    TASK_UPDATES_SSE,
+    DEFAULT_LONG_POLL_WAIT,
+    TASK_EVENTS_ENDPOINT,
 )
 
 
-class TaskPoller:
+class BaseTaskPoller:
     """
-    Polls async tasks until completion or failure.
+    Shared polling logic for the sync and async task pollers.
 
     This class handles:
-    - Periodic task status checking
     - Timeout management
+    - Task response validation
     - Error handling for failed tasks
+    - Choosing between polling, long-polling and Server-Sent Events
     """
 
     def __init__(
         self,
-        client,  # Type: InternalClient (avoiding circular import)
+        client,  # Type: InternalClient or AsyncInternalClient (avoiding circular import)
         poll_interval: Optional[float] = None,
         poll_timeout: Optional[float] = None,
+        strategy: Optional[PollStrategy] = None,
+        retry: Optional[RetryConfig] = None,
     ):
         """
         Initialize the task poller.
 
         Args:
             client: Internal HTTP client instance
-            poll_interval: Seconds between polls (overrides config)
+            poll_interval: Seconds between polls (overrides config). Passing an
+                          interval selects a fixed polling schedule.
             poll_timeout: Maximum seconds to poll (overrides config)
+            strategy: Poll strategy deciding the delay between polls. Defaults
+                     to a per-task-type adaptive strategy, or a fixed interval
+                     when poll_interval is given or NEXUS_POLL_STRATEGY=fixed.
+            retry: Retry configuration for status checks and event streams
+                  (defaults to the client's)
         """
         self.client = client
         self.poll_interval = poll_interval if poll_interval is not None else config.poll_interval
         self.poll_timeout = poll_timeout if poll_timeout is not None else config.poll_timeout
+        if strategy is None and (poll_interval is not None or config.poll_strategy == "fixed"):
+            strategy = FixedPollStrategy(self.poll_interval)
+        self.strategy = strategy
+        self.retry = retry
+        # Shared batch scheduler of the client, if batch polling is enabled
+        self.scheduler = getattr(client, "poll_scheduler", None)
+        # How task completion is awaited ("poll", "long_poll" or "sse")
+        self.task_updates = getattr(client, "task_updates", None) or config.task_updates
+        # Whether the server has a task event stream (None until known)
+        self.events_supported: Optional[bool] = None
+
+    def _next_delay(
+        self,
+        task: Task,
+        attempt: int,
+        elapsed: float,
+        strategy: Optional[PollStrategy] = None,
+    ) -> float:
+        """
+        Calculate the delay before the next status check of a task.
+
+        Args:
+            task: Latest task status
+            attempt: Number of status checks made so far minus one
+            elapsed: Seconds since polling started
+            strategy: Strategy to use instead of this poller's own
+
+        Returns:
+            Delay in seconds
+        """
+        strategy = strategy or self.strategy or get_poll_strategy(task.task_type)
+        return strategy.next_delay(attempt, elapsed, task)
+
+    def _use_events(self) -> bool:
+        """Whether to wait for tasks through their Server-Sent Events stream."""
+        return self.task_updates == TASK_UPDATES_SSE and self.events_supported is not False
+
+    def _events_endpoint(self, task_id: str) -> str:
+        """Build the event stream endpoint of a task."""
+        return TASK_EVENTS_ENDPOINT.format(task_id=task_id)
+
+    def _is_unsupported(self, error: APIError) -> bool:
+        """Whether an error means the server does not implement the endpoint."""
+        return isinstance(error, NotFoundError) or error.status_code in (405, 501)
+
+    def _events_unavailable(self, error: APIError) -> bool:
+        """
+        Decide whether an event stream error should hand over to polling.
+
+        Remembers when the server has no event stream, so later tasks go
+        straight to polling.
+        """
+        if self._is_unsupported(error):
+            self.events_supported = False
+            return True
+        return isinstance(error, (StreamError, APITimeoutError, NetworkError))
+
+    def _retry_kwargs(self) -> Dict[str, Any]:
+        """Pass this poller's retry configuration, if it has one, to a request."""
+        return {"retry": self.retry} if self.retry is not None else {}
+
+    def _status_request_kwargs(self, start_time: float) -> Dict[str, Any]:
+        """
+        Build extra arguments for a task status request.
+
+        In long-poll mode the server may hold the request for up to `wait`
+        seconds until the task changes, so the HTTP timeout is extended
+        by the same amount.
+        """
+        kwargs = self._retry_kwargs()
+        if self.task_updates != TASK_UPDATES_LONG_POLL:
+            return kwargs
+        remaining = self.poll_timeout - (time.time() - start_time)
+        wait = max(1, int(min(DEFAULT_LONG_POLL_WAIT, remaining)))
+        kwargs.update(params={"wait": wait}, timeout=self.client.timeout + wait)
+        return kwargs
+
+    def _check_timeout(self, task_id: str, start_time: float) -> None:
+        """
+        Raise if polling has exceeded the configured timeout.
+
+        Raises:
+            APITimeoutError: If polling exceeds timeout
+        """
+        elapsed = time.time() - start_time
+        if elapsed > self.poll_timeout:
+            raise APITimeoutError(
+                f"Task {task_id} polling timeout after {self.poll_timeout:.1f} seconds"
+            )
+
+    def _parse_task(self, response: Dict[str, Any]) -> Task:
+        """
+        Validate a task status response with Pydantic.
+
+        Raises:
+            APIError: If the response is not a valid task
+        """
+        try:
+            return Task(**response)
+        except Exception as e:
+            raise APIError(f"Invalid task response: {str(e)}")
+
+    def _is_finished(self, task: Task) -> bool:
+        """
+        Decide whether polling should stop for the given task.
+
+        Returns:
+            True if the task completed, False if it is still in progress
+
+        Raises:
+            APIError: If the task failed or has an unknown status
+        """
+        # Handle completed task
+        if task.status == TASK_STATUS_COMPLETED:
+            return True
+
+        # Handle failed task
+        elif task.status == TASK_STATUS_FAILED:
+            error_info = task.error or {}
+            error_message = error_info.get("message", "Task failed")
+            error_code = error_info.get("code", "TASK_FAILED")
+            raise APIError(
+                message=error_message,
+                error_code=error_code,
+            )
+
+        # Continue polling for pending/queued/running tasks
+        elif task.status in [TASK_STATUS_PENDING, TASK_STATUS_QUEUED, TASK_STATUS_RUNNING]:
+            return False
+
+        # Unknown status
+        else:
+            raise APIError(f"Unknown task status: {task.status}")
+
+
+class TaskPoller(BaseTaskPoller):
+    """
+    Polls async tasks until completion or failure.
+
+    This class handles:
+    - Periodic task status checking
+    - Timeout management
+    - Error handling for failed tasks
+    """
 
     def poll(self, task_id: str) -> Dict[str, Any]:
         """
@@ -56,49 +216,133 @@ class TaskPoller:
             APITimeoutError: If polling exceeds timeout
             APIError: If task fails or encounters error
         """
+        return self.poll_with_progress(task_id)
+
+    def poll_with_progress(
+        self, task_id: str, progress_callback: Optional[callable] = None
+    ) -> Dict[str, Any]:
+        """
+        Poll a task with optional progress callback.
+
+        Args:
+            task_id: Unique task identifier
+            progress_callback: Optional callback function(progress: int)
+
+        Returns:
+            Final task data including output
+
+        Raises:
+            APITimeoutError: If polling exceeds timeout
+            APIError: If task fails
+        """
         start_time = time.time()
 
+        if self._use_events():
+            # Let the server push status changes; poll only if it cannot
+            response = self._wait_for_events(task_id, start_time, progress_callback)
+            if response is not None:
+                return response
+
+        if self.scheduler is not None:
+            # Wait for the shared scheduler to check this task with all others
+            return self.scheduler.submit(
+                task_id, self.poll_timeout, progress_callback, strategy=self.strategy
+            ).result()
+
+        attempt = 0
+
         while True:
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed > self.poll_timeout:
-                raise APITimeoutError(
-                    f"Task {task_id} polling timeout after {self.poll_timeout:.1f} seconds"
-                )
+            self._check_timeout(task_id, start_time)
 
             # Query task status
-            response = self.client.request("GET", f"/tasks/{task_id}")
+            request_start = time.time()
+            response = self.client.request(
+                "GET", f"/tasks/{task_id}", **self._status_request_kwargs(start_time)
+            )
+            task = self._parse_task(response)
 
-            # Validate response with Pydantic
-            try:
-                task = Task(**response)
-            except Exception as e:
-                raise APIError(f"Invalid task response: {str(e)}")
+            # Call progress callback if provided
+            if progress_callback and task.progress is not None:
+                progress_callback(task.progress)
 
-            # Handle completed task
-            if task.status == TASK_STATUS_COMPLETED:
+            if self._is_finished(task):
                 return response
 
-            # Handle failed task
-            elif task.status == TASK_STATUS_FAILED:
-                error_info = task.error or {}
-                error_message = error_info.get("message", "Task failed")
-                error_code = error_info.get("code", "TASK_FAILED")
-                raise APIError(
-                    message=error_message,
-                    error_code=error_code,
-                )
-
-            # Continue polling for pending/queued/running tasks
-            elif task.status in [TASK_STATUS_PENDING, TASK_STATUS_QUEUED, TASK_STATUS_RUNNING]:
-                # Wait before next poll
-                time.sleep(self.poll_interval)
-
-            # Unknown status
-            else:
-                raise APIError(f"Unknown task status: {task.status}")
+            # Wait before next poll; time a long-poll was held counts as waiting
+            delay = self._next_delay(task, attempt, time.time() - start_time)
+            if self.task_updates == TASK_UPDATES_LONG_POLL:
+                delay = max(0.0, delay - (time.time() - request_start))
+            time.sleep(delay)
+            attempt += 1
 
-    def poll_with_progress(
+    def _wait_for_events(
+        self, task_id: str, start_time: float, progress_callback: Optional[callable] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a task through its Server-Sent Events stream.
+
+        Returns:
+            Final task data, or None if the stream ended early or is not
+            supported and polling should take over
+
+        Raises:
+            APITimeoutError: If waiting exceeds timeout
+            APIError: If task fails
+        """
+        events = self._task_events(task_id)
+        try:
+            for event in events:
+                task = self._parse_task(event)
+
+                if progress_callback and task.progress is not None:
+                    progress_callback(task.progress)
+
+                if self._is_finished(task):
+                    self.events_supported = True
+                    return event
+
+                self._check_timeout(task_id, start_time)
+        finally:
+            events.close()
+
+        return None
+
+    def _task_events(self, task_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield task status events; stops quietly if the stream is unavailable."""
+        try:
+            yield from self.client.stream(
+                "GET", self._events_endpoint(task_id), **self._retry_kwargs()
+            )
+        except APIError as e:
+            if not self._events_unavailable(e):
+                raise
+
+
+class AsyncTaskPoller(BaseTaskPoller):
+    """
+    Polls async tasks from an event loop without blocking it.
+
+    Uses AsyncInternalClient for status requests and asyncio.sleep
+    between polls.
+    """
+
+    async def poll(self, task_id: str) -> Dict[str, Any]:
+        """
+        Poll a task until it completes or fails.
+
+        Args:
+            task_id: Unique task identifier
+
+        Returns:
+            Final task data including output
+
+        Raises:
+            APITimeoutError: If polling exceeds timeout
+            APIError: If task fails or encounters error
+        """
+        return await self.poll_with_progress(task_id)
+
+    async def poll_with_progress(
         self, task_id: str, progress_callback: Optional[callable] = None
     ) -> Dict[str, Any]:
         """
@@ -117,32 +361,182 @@ class TaskPoller:
         """
         start_time = time.time()
 
+        if self._use_events():
+            # Let the server push status changes; poll only if it cannot
+            response = await self._wait_for_events(task_id, start_time, progress_callback)
+            if response is not None:
+                return response
+
+        if self.scheduler is not None:
+            # Wait for the shared scheduler to check this task with all others
+            return await self.scheduler.submit(
+                task_id, self.poll_timeout, progress_callback, strategy=self.strategy
+            )
+
+        attempt = 0
+
         while True:
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed > self.poll_timeout:
-                raise APITimeoutError(
-                    f"Task {task_id} polling timeout after {self.poll_timeout:.1f} seconds"
-                )
+            self._check_timeout(task_id, start_time)
 
             # Query task status
-            response = self.client.request("GET", f"/tasks/{task_id}")
-            task = Task(**response)
+            request_start = time.time()
+            response = await self.client.request(
+                "GET", f"/tasks/{task_id}", **self._status_request_kwargs(start_time)
+            )
+            task = self._parse_task(response)
 
             # Call progress callback if provided
             if progress_callback and task.progress is not None:
                 progress_callback(task.progress)
 
-            # Check task status
-            if task.status == TASK_STATUS_COMPLETED:
+            if self._is_finished(task):
                 return response
-            elif task.status == TASK_STATUS_FAILED:
-                error_info = task.error or {}
-                raise APIError(
-                    message=error_info.get("message", "Task failed"),
-                    error_code=error_info.get("code", "TASK_FAILED"),
-                )
-            elif task.status in [TASK_STATUS_PENDING, TASK_STATUS_QUEUED, TASK_STATUS_RUNNING]:
-                time.sleep(self.poll_interval)
-            else:
-                raise APIError(f"Unknown task status: {task.status}")
+
+            # Wait before next poll without blocking the event loop
+            delay = self._next_delay(task, attempt, time.time() - start_time)
+            if self.task_updates == TASK_UPDATES_LONG_POLL:
+                delay = max(0.0, delay - (time.time() - request_start))
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _wait_for_events(
+        self, task_id: str, start_time: float, progress_callback: Optional[callable] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a task through its Server-Sent Events stream.
+
+        Returns:
+            Final task data, or None if the stream ended early or is not
+            supported and polling should take over
+
+        Raises:
+            APITimeoutError: If waiting exceeds timeout
+            APIError: If task fails
+        """
+        events = self._task_events(task_id)
+        try:
+            async for event in events:
+                task = self._parse_task(event)
+
+                if progress_callback and task.progress is not None:
+                    progress_callback(task.progress)
+
+                if self._is_finished(task):
+                    self.events_supported = True
+                    return event
+
+                self._check_timeout(task_id, start_time)
+        finally:
+            # Close the stream now rather than when the generator is collected
+            await events.aclose()
+
+        return None
+
+    async def _task_events(self, task_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield task status events; stops quietly if the stream is unavailable."""
+        try:
+            async for event in self.client.stream(
+                "GET", self._events_endpoint(task_id), **self._retry_kwargs()
+            ):
+                yield event
+        except APIError as e:
+            if not self._events_unavailable(e):
+                raise
+
+    def start(
+        self,
+        task_id: str,
+        parser: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        progress_callback: Optional[callable] = None,
+    ) -> "AsyncTaskHandle":
+        """
+        Start polling a task in the background.
+
+        Must be called from a running event loop.
+
+        Args:
+            task_id: Unique task identifier
+            parser: Optional function converting the final task data into
+                   the handle's result (e.g. an Image model)
+            progress_callback: Optional callback function(progress: int)
+
+        Returns:
+            AsyncTaskHandle that resolves once the task finishes
+        """
+        return AsyncTaskHandle(
+            task_id,
+            self.poll_with_progress(task_id, progress_callback),
+            parser=parser,
+        )
+
+
+class AsyncTaskHandle:
+    """
+    Awaitable handle to a task being polled on the event loop.
+
+    Awaiting the handle returns the task result (parsed if a parser was
+    given) or raises the polling error. Many handles can be in flight at
+    once without holding a thread each.
+
+    Example:
+        ```python
+        handles = [await client.images.submit(p) for p in prompts]
+        images = await asyncio.gather(*handles)
+        ```
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        poll_coro,
+        parser: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ):
+        """
+        Initialize the task handle and schedule polling.
+
+        Args:
+            task_id: Unique task identifier
+            poll_coro: Coroutine that polls the task to completion
+            parser: Optional function applied to the final task data
+        """
+        self.task_id = task_id
+        self._parser = parser
+        self._future = asyncio.ensure_future(self._run(poll_coro))
+
+    async def _run(self, poll_coro) -> Any:
+        """Await polling and apply the parser."""
+        result = await poll_coro
+        if self._parser is not None:
+            return self._parser(result)
+        return result
+
+    def done(self) -> bool:
+        """Return True if the task finished, failed or was cancelled."""
+        return self._future.done()
+
+    def cancel(self) -> bool:
+        """Stop polling the task (the server-side task keeps running)."""
+        return self._future.cancel()
+
+    def result(self) -> Any:
+        """
+        Return the result of a finished task.
+
+        Raises:
+            asyncio.InvalidStateError: If the task has not finished yet
+            APIError: If the task failed
+        """
+        return self._future.result()
+
+    def add_done_callback(self, callback: Callable[["AsyncTaskHandle"], None]) -> None:
+        """Register a callback invoked with this handle once polling ends."""
+        self._future.add_done_callback(lambda _: callback(self))
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        """Wait for the task and return its result."""
+        return self._future.__await__()
+
+    def __repr__(self) -> str:
+        """Return string representation of the handle."""
+        state = "done" if self.done() else "pending"
+        return f"AsyncTaskHandle(task_id='{self.task_id}', state={state})"
@@ -0,0 +1,284 @@
+"""Client-side token-bucket rate limiting of requests and tokens."""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from nexusai.constants import (
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_ESTIMATED_OUTPUT_TOKENS,
+    CHARS_PER_TOKEN,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+REQUESTS_BUCKET = "requests"
+TOKENS_BUCKET = "tokens"
+
+# Estimates the tokens a request will use from its JSON body
+TokenEstimator = Callable[[Optional[Dict[str, Any]]], int]
+
+
+def _refill(
+    state: Optional[Tuple[float, float]], amount: float, rate: float, capacity: float, now: float
+) -> Tuple[Tuple[float, float], float]:
+    """
+    Take an amount from a bucket.
+
+    The level may go negative: the amount is reserved right away and the
+    caller waits until the bucket has refilled to zero, so concurrent
+    callers are served in the order they asked.
+
+    Args:
+        state: (level, updated_at) of the bucket, or None for a full bucket
+        amount: Amount to take (negative to give back)
+        rate: Refill rate per second
+        capacity: Maximum level (burst size)
+        now: Current time
+
+    Returns:
+        Tuple of (new state, seconds to wait)
+    """
+    level, updated_at = state if state is not None else (capacity, now)
+    level = min(capacity, level + max(0.0, now - updated_at) * rate) - amount
+    level = min(capacity, level)  # Giving back never overfills the bucket
+    wait = -level / rate if level < 0 else 0.0
+    return (level, now), wait
+
+
+class RateLimitBackend:
+    """
+    Base class for where token buckets are kept.
+
+    Implementations must make reserve() atomic for every caller sharing
+    the backend.
+    """
+
+    def reserve(self, bucket: str, amount: float, rate: float, capacity: float) -> float:
+        """
+        Take an amount from a bucket.
+
+        Args:
+            bucket: Bucket name
+            amount: Amount to take (negative to give back)
+            rate: Refill rate per second
+            capacity: Maximum level (burst size)
+
+        Returns:
+            Seconds the caller must wait before going ahead
+        """
+        raise NotImplementedError
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Buckets shared by the threads of one process."""
+
+    def __init__(self):
+        """Initialize empty buckets."""
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, bucket: str, amount: float, rate: float, capacity: float) -> float:
+        """Take an amount from a bucket and return the wait in seconds."""
+        with self._lock:
+            state, wait = _refill(
+                self._buckets.get(bucket), amount, rate, capacity, time.monotonic()
+            )
+            self._buckets[bucket] = state
+        return wait
+
+
+class FileRateLimitBackend(RateLimitBackend):
+    """
+    Buckets in a small state file shared by every process on the machine.
+
+    Each reservation locks the file (flock), so processes using the same
+    path draw from the same buckets. Place the file on a tmpfs such as
+    /dev/shm to keep it in memory. Use one file per account. POSIX only.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the backend.
+
+        Args:
+            path: State file path (created on first use)
+
+        Raises:
+            NotImplementedError: On platforms without fcntl (Windows)
+        """
+        if fcntl is None:
+            raise NotImplementedError("FileRateLimitBackend requires fcntl (POSIX systems)")
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # flock does not exclude threads of this process from each other
+        self._lock = threading.Lock()
+
+    def reserve(self, bucket: str, amount: float, rate: float, capacity: float) -> float:
+        """Take an amount from a bucket and return the wait in seconds."""
+        with self._lock, open(self.path, "a+b") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            try:
+                buckets = json.loads(f.read() or b"{}")
+            except ValueError:
+                buckets = {}
+
+            state = buckets.get(bucket)
+            state, wait = _refill(
+                tuple(state) if state else None, amount, rate, capacity, time.time()
+            )
+            buckets[bucket] = state
+
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps(buckets).encode())
+            f.flush()
+        return wait
+
+
+def estimate_tokens(json_data: Optional[Dict[str, Any]]) -> int:
+    """
+    Roughly estimate the tokens a request will use.
+
+    Counts the text in the request's input at CHARS_PER_TOKEN characters
+    per token, plus max_tokens (or a default) for the output. Requests
+    without text input, such as status checks, use no tokens.
+    """
+    if not json_data:
+        return 0
+    text = json_data.get("input", json_data.get("prompt", json_data.get("messages")))
+    if text is None:
+        return 0
+
+    if not isinstance(text, str):
+        text = json.dumps(text, ensure_ascii=False)
+    config_params = json_data.get("config") or {}
+    output_tokens = config_params.get("max_tokens") or DEFAULT_ESTIMATED_OUTPUT_TOKENS
+    return len(text) // CHARS_PER_TOKEN + output_tokens
+
+
+class RateLimiter:
+    """
+    Proactive client-side rate limiter.
+
+    Keeps two token buckets, one for the number of requests and one for
+    the estimated tokens they use, and delays each request until both
+    have room. Buckets refill continuously at the per-minute limits, so
+    traffic is spread evenly instead of running into 429 errors. Once a
+    response reports its actual token usage the difference to the
+    estimate is settled.
+
+    One limiter is shared by all resources and threads of the client it
+    is attached to; with FileRateLimitBackend it is also shared with
+    other processes.
+
+    Example:
+        ```python
+        from nexusai import NexusAIClient, RateLimiter, FileRateLimitBackend
+
+        limiter = RateLimiter(
+            requests_per_minute=600,
+            tokens_per_minute=90_000,
+            backend=FileRateLimitBackend("/dev/shm/nexusai-ratelimit.json"),
+        )
+        client = NexusAIClient(rate_limiter=limiter)
+        ```
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        burst: float = DEFAULT_RATE_LIMIT_BURST,
+        backend: Optional[RateLimitBackend] = None,
+        token_estimator: Optional[TokenEstimator] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Request limit (None: unlimited)
+            tokens_per_minute: Token limit (None: unlimited)
+            burst: Seconds of traffic at the full rate that may be sent at
+                  once after a quiet period
+            backend: Where the buckets are kept. Defaults to this process only.
+            token_estimator: Function estimating a request's tokens from its
+                            JSON body. Defaults to estimate_tokens().
+
+        Raises:
+            ValueError: If a limit or burst is not positive
+        """
+        for name, value in (
+            ("requests_per_minute", requests_per_minute),
+            ("tokens_per_minute", tokens_per_minute),
+            ("burst", burst),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive")
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.burst = burst
+        self.backend = backend if backend is not None else MemoryRateLimitBackend()
+        self.estimate_tokens = token_estimator or estimate_tokens
+
+    def _take(self, bucket: str, amount: float, per_minute: Optional[float]) -> float:
+        """Take from one bucket; returns the wait in seconds."""
+        if per_minute is None or amount == 0:
+            return 0.0
+        rate = per_minute / 60
+        # A burst always admits at least one request
+        capacity = max(rate * self.burst, 1.0)
+        return self.backend.reserve(bucket, amount, rate, capacity)
+
+    def reserve(self, tokens: int = 0) -> float:
+        """
+        Reserve one request and an amount of tokens.
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        return max(
+            self._take(REQUESTS_BUCKET, 1, self.requests_per_minute),
+            self._take(TOKENS_BUCKET, tokens, self.tokens_per_minute),
+        )
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a request using the given tokens may be sent."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def settle(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket once a request's actual usage is known."""
+        self._take(TOKENS_BUCKET, actual - estimated, self.tokens_per_minute)
+
+    def __repr__(self) -> str:
+        """Return string representation of the limiter."""
+        return (
+            f"RateLimiter(requests_per_minute={self.requests_per_minute}, "
+            f"tokens_per_minute={self.tokens_per_minute})"
+        )
+
+
+def response_tokens(response: Any) -> Optional[int]:
+    """Total tokens reported in a response's usage, if any."""
+    if not isinstance(response, dict):
+        return None
+    output = response.get("output")
+    usage = (output if isinstance(output, dict) else response).get("usage")
+    if isinstance(usage, dict) and usage.get("total_tokens") is not None:
+        return int(usage["total_tokens"])
+    return None
@@ -0,0 +1,132 @@
+"""Local cache of deterministic text generation responses."""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+from nexusai._internal._cache import CacheStore, MemoryCacheStore, is_expired
+from nexusai.constants import DEFAULT_RESPONSE_CACHE_MAX_ENTRIES, DEFAULT_RESPONSE_CACHE_TTL
+
+
+def request_digest(request_body: Dict[str, Any]) -> str:
+    """
+    Hash a request body canonically.
+
+    Keys are sorted and whitespace removed, so bodies that differ only in
+    key order hash the same.
+    """
+    canonical = json.dumps(request_body, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Reuses responses of repeated, deterministic text generation requests.
+
+    The key is a hash of the full /invoke request body (prompt or
+    messages, provider, model and config), so any change to the request
+    is a miss. By default only requests with temperature=0 are cached,
+    as other requests are expected to give varying answers.
+
+    Example:
+        ```python
+        from nexusai import NexusAIClient, ResponseCache, SQLiteCacheStore
+
+        cache = ResponseCache(SQLiteCacheStore("~/.nexusai/responses.db"), ttl=86400)
+        client = NexusAIClient(response_cache=cache)
+
+        client.text.generate(prompt="Classify: great product!", temperature=0)  # Sent
+        client.text.generate(prompt="Classify: great product!", temperature=0)  # Cached
+        print(cache.metrics())
+        ```
+    """
+
+    def __init__(
+        self,
+        store: Optional[CacheStore] = None,
+        max_entries: int = DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_RESPONSE_CACHE_TTL,
+        deterministic_only: bool = True,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            store: Where entries are kept. Defaults to an in-memory store;
+                  use SQLiteCacheStore to share the cache across processes
+                  and runs.
+            max_entries: Entries kept before least recently used ones are evicted
+            ttl: Seconds an entry stays valid (None: no expiry)
+            deterministic_only: Only cache requests with temperature=0
+        """
+        self.store = store if store is not None else MemoryCacheStore()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.deterministic_only = deterministic_only
+        self.hits = 0
+        self.misses = 0
+
+    def cacheable(self, request_body: Dict[str, Any]) -> bool:
+        """Whether responses to a request body may be cached."""
+        if request_body.get("stream"):
+            return False
+        if not self.deterministic_only:
+            return True
+        return request_body.get("config", {}).get("temperature") == 0
+
+    def request_key(self, request_body: Dict[str, Any], namespace: str = "") -> Optional[str]:
+        """
+        Compute the cache key of a request body.
+
+        Args:
+            request_body: /invoke request body
+            namespace: Scope of the key (e.g. the account the request is made with)
+
+        Returns:
+            Cache key, or None if the request is not cacheable
+        """
+        if not self.cacheable(request_body):
+            return None
+        return f"{namespace}:{request_digest(request_body)}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for a key, or None if missing or expired."""
+        entry = self.store.get(key)
+        if entry is not None and is_expired(entry[1], self.ttl):
+            self.store.delete(key)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: str, response: Dict[str, Any]) -> None:
+        """Remember the response to a request."""
+        self.store.set(key, response)
+        self.store.evict(self.max_entries)
+
+    def discard(self, key: str) -> None:
+        """Forget a cached response."""
+        self.store.delete(key)
+
+    def clear(self) -> None:
+        """Forget all cached responses."""
+        self.store.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of the cache counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.store),
+        }
+
+    def __repr__(self) -> str:
+        """Return string representation of the cache."""
+        return (
+            f"ResponseCache(entries={len(self.store)}, hits={self.hits}, misses={self.misses})"
+        )
@@ -1,8 +1,10 @@
 """Retry mechanism with exponential backoff for API requests."""
 
+import asyncio
+import logging
 import time
 import random
-from typing import Callable, TypeVar, Optional, Type, Tuple
+from typing import Awaitable, Callable, TypeVar, Optional, Type, Tuple
 from nexusai.error import (
     APIError,
     NetworkError,
@@ -10,9 +12,12 @@ from nexusai.error import (
     RateLimitError,
     APITimeoutError,
 )
+from nexusai.constants import IDEMPOTENT_METHODS, RETRY_SAFE_POST_ENDPOINTS
 
 T = TypeVar("T")
 
+logger = logging.getLogger("nexusai")
+
 
 class RetryConfig:
     """
@@ -24,6 +29,10 @@ class RetryConfig:
         max_delay: Maximum delay in seconds between retries
         exponential_base: Base for exponential backoff (delay *= base ** attempt)
         jitter: Add random jitter to prevent thundering herd (0.0 to 1.0)
+        retry_non_idempotent: Also retry timeouts, 5xx and network errors of
+            requests that may not be safe to repeat (see is_retry_safe()).
+            Off by default: such a request may already have been processed,
+            and repeating it can duplicate generations, messages or resources.
     """
 
     def __init__(
@@ -33,6 +42,7 @@ class RetryConfig:
         max_delay: float = 60.0,
         exponential_base: float = 2.0,
         jitter: float = 0.1,
+        retry_non_idempotent: bool = False,
     ):
         """Initialize retry configuration."""
         self.max_retries = max_retries
@@ -40,6 +50,7 @@ class RetryConfig:
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+        self.retry_non_idempotent = retry_non_idempotent
 
     def calculate_delay(self, attempt: int) -> float:
         """
@@ -74,8 +85,26 @@ DEFAULT_RETRY_CONFIG = RetryConfig(
     jitter=0.1,
 )
 
+# Per-call override that disables retries
+NO_RETRY = RetryConfig(max_retries=0)
+
+
+def is_retry_safe(method: str, endpoint: str) -> bool:
+    """
+    Whether a request can be repeated without side effects.
+
+    Requests with idempotent HTTP methods are, as are POSTs to endpoints
+    that only read (such as knowledge base search). Other POSTs create
+    something (a generation, a message, a file) each time they are
+    processed.
+    """
+    method = method.upper()
+    if method in IDEMPOTENT_METHODS:
+        return True
+    return method == "POST" and endpoint in RETRY_SAFE_POST_ENDPOINTS
+
 
-def should_retry(error: Exception, attempt: int, max_retries: int) -> bool:
+def should_retry(error: Exception, attempt: int, max_retries: int, idempotent: bool = True) -> bool:
     """
     Determine if an error should be retried.
 
@@ -83,6 +112,9 @@ def should_retry(error: Exception, attempt: int, max_retries: int) -> bool:
         error: The exception that occurred
         attempt: Current retry attempt (0-indexed)
         max_retries: Maximum number of retries allowed
+        idempotent: Whether the request can safely be repeated. If not,
+                   only rate limit errors and errors raised before the
+                   request was sent are retried.
 
     Returns:
         True if the error should be retried, False otherwise
@@ -91,6 +123,10 @@ def should_retry(error: Exception, attempt: int, max_retries: int) -> bool:
     if attempt >= max_retries:
         return False
 
+    if not idempotent:
+        # The server may have processed a request that failed after sending
+        return isinstance(error, RateLimitError) or not getattr(error, "request_sent", True)
+
     # Always retry these error types
     if isinstance(error, (NetworkError, ServerError, APITimeoutError)):
         return True
@@ -107,6 +143,96 @@ def should_retry(error: Exception, attempt: int, max_retries: int) -> bool:
     return False
 
 
+def retry_delay(error: Exception, attempt: int, config: RetryConfig) -> float:
+    """
+    Calculate how long to wait before retrying after an error.
+
+    A rate limit error's retry_after (from the server's Retry-After header)
+    takes precedence over the exponential backoff, but is capped at
+    config.max_delay so a large or bogus hint cannot stall the caller.
+
+    Args:
+        error: The exception that occurred
+        attempt: Retry attempt number (0-indexed)
+        config: Retry configuration
+
+    Returns:
+        Delay in seconds
+    """
+    if isinstance(error, RateLimitError) and error.retry_after:
+        return min(error.retry_after, config.max_delay)
+    return config.calculate_delay(attempt)
+
+
+def _log_retry(error: Exception, attempt: int, config: RetryConfig, delay: float) -> None:
+    """Log a retry attempt."""
+    error_msg = str(error).split("\n")[0][:100]  # First line, max 100 chars
+    logger.info(
+        "[Retry %d/%d] Retrying after %.2fs due to: %s",
+        attempt + 1,
+        config.max_retries,
+        delay,
+        error_msg,
+    )
+
+
+def call_with_retry(
+    func: Callable[..., T], config: RetryConfig, *args, idempotent: bool = True, **kwargs
+) -> T:
+    """
+    Call a function, retrying retryable API errors with backoff.
+
+    Args:
+        func: Function to call
+        config: Retry configuration
+        *args: Positional arguments for func
+        idempotent: Whether the call can safely be repeated (see should_retry())
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+
+    Raises:
+        APIError: If the error is not retryable or all retries are exhausted
+    """
+    attempt = 0
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except APIError as e:
+            if not should_retry(e, attempt, config.max_retries, idempotent):
+                raise
+            delay = retry_delay(e, attempt, config)
+            _log_retry(e, attempt, config, delay)
+            time.sleep(delay)
+            attempt += 1
+
+
+async def acall_with_retry(
+    func: Callable[..., Awaitable[T]],
+    config: RetryConfig,
+    *args,
+    idempotent: bool = True,
+    **kwargs,
+) -> T:
+    """
+    Await a coroutine function, retrying retryable API errors with backoff.
+
+    Async counterpart of call_with_retry(); waits with asyncio.sleep.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await func(*args, **kwargs)
+        except APIError as e:
+            if not should_retry(e, attempt, config.max_retries, idempotent):
+                raise
+            delay = retry_delay(e, attempt, config)
+            _log_retry(e, attempt, config, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
 def retry_with_backoff(
     func: Callable[..., T],
     retry_config: Optional[RetryConfig] = None,
@@ -152,19 +278,9 @@ def retry_with_backoff(
                 if not should_retry(e, attempt, config.max_retries):
                     raise
 
-                # Calculate delay
-                if isinstance(e, RateLimitError) and e.retry_after:
-                    # Use retry_after from rate limit response
-                    delay = e.retry_after
-                else:
-                    delay = config.calculate_delay(attempt)
-
-                # Log retry attempt (can be replaced with proper logging)
-                error_msg = str(e).split("\n")[0][:100]  # First line, max 100 chars
-                print(
-                    f"[Retry {attempt + 1}/{config.max_retries}] "
-                    f"Retrying after {delay:.2f}s due to: {error_msg}"
-                )
+                # Calculate delay, honoring retry_after from rate limit responses
+                delay = retry_delay(e, attempt, config)
+                _log_retry(e, attempt, config, delay)
 
                 # Wait before retrying
                 time.sleep(delay)
@@ -234,10 +350,7 @@ class RetryableRequest:
                     raise
 
                 # Calculate delay
-                if isinstance(e, RateLimitError) and e.retry_after:
-                    delay = e.retry_after
-                else:
-                    delay = self.config.calculate_delay(attempt)
+                delay = retry_delay(e, attempt, self.config)
 
                 # Wait before retrying
                 time.sleep(delay)
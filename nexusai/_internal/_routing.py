@@ -0,0 +1,333 @@
+"""Latency-aware routing across provider/model candidates with fallback."""
+
+import threading
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from nexusai.error import (
+    APIError,
+    APITimeoutError,
+    CircuitOpenError,
+    NetworkError,
+    RateLimitError,
+    ServerError,
+)
+from nexusai.constants import (
+    DEFAULT_ROUTE_HALF_LIFE,
+    DEFAULT_ROUTE_MAX_FAILURE_RATE,
+    DEFAULT_ROUTE_PROBE_INTERVAL,
+)
+
+T = TypeVar("T")
+
+# "provider", (provider, model) or (provider, model, weight)
+CandidateSpec = Union[str, Tuple[str, Optional[str]], Tuple[str, Optional[str], float]]
+
+# (provider, model, weight)
+Candidate = Tuple[str, Optional[str], float]
+
+# (task_type, provider, model)
+StatsKey = Tuple[str, str, Optional[str]]
+
+# Weights of the newest sample in the latency and failure averages
+_LATENCY_ALPHA = 0.3
+_FAILURE_ALPHA = 0.5
+
+
+def should_fall_back(error: BaseException) -> bool:
+    """
+    Whether a failed call should be tried with the next candidate.
+
+    Unavailability (server errors, timeouts, network errors, rate limits,
+    open circuits) and failed tasks fall back; invalid requests do not,
+    as they would fail with every candidate.
+    """
+    if isinstance(error, (ServerError, APITimeoutError, NetworkError, RateLimitError)):
+        return True
+    if isinstance(error, CircuitOpenError):
+        return True
+    # A task that failed while processing is raised as a plain APIError
+    return type(error) is APIError
+
+
+def normalize_candidates(candidates: Sequence[CandidateSpec]) -> List[Candidate]:
+    """
+    Convert candidate specs to (provider, model, weight) tuples.
+
+    Raises:
+        ValueError: If the list is empty or a weight is not positive
+    """
+    if isinstance(candidates, (str, tuple)):
+        raise ValueError("candidates must be a list of providers or (provider, model) tuples")
+    normalized = []
+    for spec in candidates:
+        spec = (spec,) if isinstance(spec, str) else tuple(spec)
+        provider = spec[0]
+        model = spec[1] if len(spec) > 1 else None
+        weight = spec[2] if len(spec) > 2 else 1.0
+        if weight <= 0:
+            raise ValueError(f"Candidate weight must be positive: {spec!r}")
+        normalized.append((provider, model, float(weight)))
+    if not normalized:
+        raise ValueError("candidates must not be empty")
+    return normalized
+
+
+class _Stats:
+    """Decayed latency and failure rate of one candidate."""
+
+    __slots__ = ("latency", "failure_rate", "updated_at", "measured_at")
+
+    def __init__(self):
+        self.latency: Optional[float] = None
+        self.failure_rate = 0.0
+        self.updated_at = time.monotonic()
+        self.measured_at = self.updated_at
+
+
+class Router:
+    """
+    Routes calls to the fastest healthy provider/model candidate.
+
+    Keeps an in-process, exponentially decayed latency average and
+    failure rate per task type, provider and model. Each call goes to the
+    candidate with the lowest latency divided by its weight. Healthy
+    candidates without a measurement, or whose latency was last measured
+    more than probe_interval seconds ago, are tried first (in the given
+    order) so that every candidate gets measured and a slow one that got
+    faster is noticed. Only one call at a time probes a candidate; while
+    it runs, other calls rank the candidate by its last latency (or the
+    best known one if it has none). Candidates whose failure rate has
+    reached max_failure_rate are tried last. Failure rates halve
+    every half_life seconds, so a failed candidate is tried again once it
+    has had time to recover.
+
+    If a call fails with an availability error (see should_fall_back())
+    the next candidate is tried; the last error is raised when all fail.
+
+    One router is shared by all resources of a client.
+    """
+
+    def __init__(
+        self,
+        half_life: float = DEFAULT_ROUTE_HALF_LIFE,
+        max_failure_rate: float = DEFAULT_ROUTE_MAX_FAILURE_RATE,
+        probe_interval: float = DEFAULT_ROUTE_PROBE_INTERVAL,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            half_life: Seconds for a candidate's failure rate to halve
+            max_failure_rate: Failure rate (0 to 1) at which a candidate is
+                             moved behind the healthy ones
+            probe_interval: Seconds after which a candidate's latency counts
+                           as stale and the candidate is probed again
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if half_life <= 0:
+            raise ValueError("half_life must be positive")
+        if not 0 < max_failure_rate <= 1:
+            raise ValueError("max_failure_rate must be between 0 and 1")
+        if probe_interval <= 0:
+            raise ValueError("probe_interval must be positive")
+        self.half_life = half_life
+        self.max_failure_rate = max_failure_rate
+        self.probe_interval = probe_interval
+        self._stats: Dict[StatsKey, _Stats] = {}
+        self._probing: Set[StatsKey] = set()
+        self._lock = threading.Lock()
+
+    def _failure_rate(self, stats: _Stats, now: float) -> float:
+        """Failure rate decayed to now; caller holds the lock."""
+        return stats.failure_rate * 0.5 ** ((now - stats.updated_at) / self.half_life)
+
+    def order(self, task_type: str, candidates: Sequence[CandidateSpec]) -> List[Candidate]:
+        """
+        Candidates in the order they should be tried.
+
+        Args:
+            task_type: Kind of call (latencies differ between task types)
+            candidates: Provider names, (provider, model) or
+                       (provider, model, weight) tuples
+
+        Returns:
+            (provider, model, weight) tuples, best first
+        """
+        return self._order(task_type, candidates)[0]
+
+    def _order(
+        self, task_type: str, candidates: Sequence[CandidateSpec], claim: bool = False
+    ) -> Tuple[List[Candidate], Optional[StatsKey]]:
+        """
+        Order candidates, optionally claiming the probe of the first one.
+
+        Returns:
+            The ordered candidates, and the key of the candidate claimed
+            for probing (to pass to _release()), or None
+        """
+        normalized = normalize_candidates(candidates)
+        keys = [(task_type, p, m) for p, m, _ in normalized]
+        now = time.monotonic()
+        with self._lock:
+            stats = [self._stats.get(key) for key in keys]
+            known = [s.latency for s in stats if s is not None and s.latency is not None]
+            best = min(known) if known else 0.0
+
+            def probe(index: int) -> bool:
+                s = stats[index]
+                if keys[index] in self._probing:
+                    return False
+                return s is None or s.latency is None or now - s.measured_at >= self.probe_interval
+
+            def sort_key(index: int) -> Tuple[bool, bool, float, int]:
+                s = stats[index]
+                unhealthy = s is not None and self._failure_rate(s, now) >= self.max_failure_rate
+                latency = s.latency if s is not None and s.latency is not None else best
+                # Unmeasured or stale candidates are probed ahead of the measured ones
+                return unhealthy, not probe(index), latency / normalized[index][2], index
+
+            indexes = sorted(range(len(normalized)), key=sort_key)
+            claimed = None
+            if claim and probe(indexes[0]):
+                claimed = keys[indexes[0]]
+                self._probing.add(claimed)
+        return [normalized[i] for i in indexes], claimed
+
+    def _release(self, key: Optional[StatsKey]) -> None:
+        """Let other calls probe a candidate claimed by _order() again."""
+        if key is not None:
+            with self._lock:
+                self._probing.discard(key)
+
+    def record(
+        self,
+        task_type: str,
+        provider: str,
+        model: Optional[str],
+        latency: Optional[float] = None,
+        failed: bool = False,
+    ) -> None:
+        """Record the outcome of a call to a candidate."""
+        now = time.monotonic()
+        with self._lock:
+            stats = self._stats.setdefault((task_type, provider, model), _Stats())
+            rate = self._failure_rate(stats, now)
+            stats.failure_rate = rate + _FAILURE_ALPHA * (float(failed) - rate)
+            stats.updated_at = now
+            if latency is not None:
+                stats.measured_at = now
+                if stats.latency is None:
+                    stats.latency = latency
+                else:
+                    stats.latency += _LATENCY_ALPHA * (latency - stats.latency)
+
+    def stats(self) -> Dict[StatsKey, Dict[str, Any]]:
+        """Current latency and failure rate per (task_type, provider, model)."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                key: {"latency": s.latency, "failure_rate": self._failure_rate(s, now)}
+                for key, s in self._stats.items()
+            }
+
+    @staticmethod
+    def _check_arguments(
+        candidates: Optional[Sequence[CandidateSpec]],
+        provider: Optional[str],
+        model: Optional[str],
+    ) -> None:
+        """Reject candidates combined with a single provider or model."""
+        if candidates is not None and (provider or model):
+            raise ValueError("Cannot provide 'candidates' together with 'provider' or 'model'.")
+
+    def call(
+        self,
+        task_type: str,
+        candidates: Optional[Sequence[CandidateSpec]],
+        func: Callable[[Optional[str], Optional[str]], T],
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> T:
+        """
+        Call func(provider, model) with the best candidate, falling back on failure.
+
+        Without candidates, func is called once with provider and model.
+
+        Raises:
+            ValueError: If candidates are combined with provider or model
+            APIError: The last candidate's error if every candidate failed
+        """
+        self._check_arguments(candidates, provider, model)
+        if candidates is None:
+            return func(provider, model)
+
+        error: Optional[BaseException] = None
+        ordered, probing = self._order(task_type, candidates, claim=True)
+        try:
+            for candidate_provider, candidate_model, _ in ordered:
+                started = time.monotonic()
+                try:
+                    result = func(candidate_provider, candidate_model)
+                except APIError as e:
+                    if not should_fall_back(e):
+                        raise
+                    self.record(task_type, candidate_provider, candidate_model, failed=True)
+                    error = e
+                    continue
+                latency = time.monotonic() - started
+                self.record(task_type, candidate_provider, candidate_model, latency=latency)
+                return result
+            raise error
+        finally:
+            self._release(probing)
+
+    async def acall(
+        self,
+        task_type: str,
+        candidates: Optional[Sequence[CandidateSpec]],
+        func: Callable[[Optional[str], Optional[str]], Awaitable[T]],
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> T:
+        """Await func(provider, model) with the best candidate, falling back on failure."""
+        self._check_arguments(candidates, provider, model)
+        if candidates is None:
+            return await func(provider, model)
+
+        error: Optional[BaseException] = None
+        ordered, probing = self._order(task_type, candidates, claim=True)
+        try:
+            for candidate_provider, candidate_model, _ in ordered:
+                started = time.monotonic()
+                try:
+                    result = await func(candidate_provider, candidate_model)
+                except APIError as e:
+                    if not should_fall_back(e):
+                        raise
+                    self.record(task_type, candidate_provider, candidate_model, failed=True)
+                    error = e
+                    continue
+                latency = time.monotonic() - started
+                self.record(task_type, candidate_provider, candidate_model, latency=latency)
+                return result
+            raise error
+        finally:
+            self._release(probing)
+
+    def __repr__(self) -> str:
+        """Return string representation of the router."""
+        return f"Router(half_life={self.half_life}, candidates={len(self._stats)})"
@@ -0,0 +1,508 @@
+"""Shared scheduler that polls many pending tasks in batched round-trips."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, InvalidStateError
+from typing import Dict, Any, List, Optional, Tuple, Union
+from nexusai.error import APIError, APITimeoutError
+from nexusai._internal._poller import BaseTaskPoller
+from nexusai._internal._poll_strategy import PollStrategy
+from nexusai.constants import (
+    DEFAULT_POLL_BATCH_SIZE,
+    DEFAULT_POLL_CONCURRENCY,
+    TASKS_BATCH_ENDPOINT,
+)
+
+
+# Tasks due within this window are checked in the same round
+_COALESCE_WINDOW = 0.05
+
+
+class _Waiter:
+    """A caller waiting for one task to finish."""
+
+    __slots__ = ("future", "deadline", "timeout", "progress_callback")
+
+    def __init__(self, future, timeout: float, progress_callback: Optional[callable]):
+        self.future = future
+        self.timeout = timeout
+        self.deadline = time.time() + timeout
+        self.progress_callback = progress_callback
+
+
+class _PendingTask:
+    """Polling state of one task ID shared by all of its waiters."""
+
+    __slots__ = ("waiters", "strategy", "started", "attempt", "next_check")
+
+    def __init__(self, strategy: Optional[PollStrategy]):
+        self.waiters: List[_Waiter] = []
+        self.strategy = strategy
+        self.started = time.time()
+        self.attempt = 0
+        self.next_check = self.started  # First check is due immediately
+
+
+# What a round tells a task's waiters: (waiters, progress, finished, result, error)
+_Update = Tuple[List[_Waiter], Optional[int], bool, Any, Optional[Exception]]
+
+
+def _settle(future, result: Any = None, error: Optional[Exception] = None) -> None:
+    """Resolve a future unless the caller already cancelled it."""
+    if future.done():
+        return
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except (InvalidStateError, asyncio.InvalidStateError):
+        # Cancelled concurrently by the caller
+        pass
+
+
+class BasePollScheduler(BaseTaskPoller):
+    """
+    Shared bookkeeping for the sync and async poll schedulers.
+
+    A scheduler is owned by one internal client and shared by every
+    resource using it. Each round it collects the IDs of all pending tasks
+    and checks them together:
+    - Via the batch status endpoint (POST /tasks/batch) when the server supports it
+    - Otherwise via a bounded concurrent fan-out of GET /tasks/{task_id}
+
+    Each task is checked on its own poll strategy's schedule; tasks that
+    fall due together share a round. Each caller's future is resolved as
+    soon as its task finishes.
+    """
+
+    def __init__(
+        self,
+        client,  # Type: InternalClient or AsyncInternalClient (avoiding circular import)
+        poll_interval: Optional[float] = None,
+        poll_timeout: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ):
+        """
+        Initialize the poll scheduler.
+
+        Args:
+            client: Internal HTTP client instance
+            poll_interval: Fixed seconds between checks of a task (overrides
+                          the adaptive per-task-type strategies)
+            poll_timeout: Default maximum seconds to wait for a task (overrides config)
+            batch_size: Task IDs per batch status request
+            concurrency: Parallel status requests when batching is unsupported
+        """
+        super().__init__(client, poll_interval=poll_interval, poll_timeout=poll_timeout)
+        self.batch_size = batch_size or DEFAULT_POLL_BATCH_SIZE
+        self.concurrency = concurrency or DEFAULT_POLL_CONCURRENCY
+        # None until the first batch request tells us whether the server supports it
+        self.batch_supported: Optional[bool] = None
+        self._pending: Dict[str, _PendingTask] = {}
+
+    @property
+    def pending_count(self) -> int:
+        """Number of distinct task IDs currently being polled."""
+        return len(self._pending)
+
+    def _add_waiter(
+        self, task_id: str, waiter: _Waiter, strategy: Optional[PollStrategy] = None
+    ) -> None:
+        """Register a waiter for a task."""
+        entry = self._pending.get(task_id)
+        if entry is None:
+            entry = self._pending[task_id] = _PendingTask(strategy)
+        entry.waiters.append(waiter)
+
+    def _expire_waiters(self) -> None:
+        """Drop cancelled waiters and fail waiters whose timeout has passed."""
+        now = time.time()
+        for task_id in list(self._pending):
+            entry = self._pending[task_id]
+            remaining = []
+            for waiter in entry.waiters:
+                if waiter.future.done():
+                    continue
+                if now > waiter.deadline:
+                    _settle(
+                        waiter.future,
+                        error=APITimeoutError(
+                            f"Task {task_id} polling timeout after {waiter.timeout:.1f} seconds"
+                        ),
+                    )
+                    continue
+                remaining.append(waiter)
+            if remaining:
+                entry.waiters = remaining
+            else:
+                del self._pending[task_id]
+
+    def _due_task_ids(self, now: float) -> List[str]:
+        """IDs of the tasks whose next check is due."""
+        horizon = now + _COALESCE_WINDOW
+        return [task_id for task_id, entry in self._pending.items() if entry.next_check <= horizon]
+
+    def _seconds_until_due(self, now: float) -> float:
+        """Seconds until the next task check or waiter deadline."""
+        soonest = min(
+            min([entry.next_check] + [waiter.deadline for waiter in entry.waiters])
+            for entry in self._pending.values()
+        )
+        return max(0.0, soonest - now)
+
+    def _apply_results(
+        self, results: Dict[str, Union[Dict[str, Any], Exception]]
+    ) -> List[_Update]:
+        """
+        Stop tracking finished tasks and schedule the next check of the others.
+
+        Returns:
+            Updates for the waiters, to pass to _deliver() once the
+            scheduler's state is no longer locked
+        """
+        updates: List[_Update] = []
+        now = time.time()
+        for task_id, result in results.items():
+            entry = self._pending.get(task_id)
+            if entry is None:
+                continue
+
+            progress = None
+            if isinstance(result, Exception):
+                error = result
+                finished = True
+            else:
+                try:
+                    task = self._parse_task(result)
+                    progress = task.progress
+                    finished = self._is_finished(task)
+                    error = None
+                except APIError as e:
+                    error = e
+                    finished = True
+
+            updates.append((list(entry.waiters), progress, finished, result, error))
+            if not finished:
+                entry.next_check = now + self._next_delay(
+                    task, entry.attempt, now - entry.started, entry.strategy
+                )
+                entry.attempt += 1
+                continue
+            del self._pending[task_id]
+        return updates
+
+    @staticmethod
+    def _deliver(updates: List[_Update]) -> None:
+        """
+        Call progress callbacks and resolve the waiters of finished tasks.
+
+        Runs without the scheduler's lock, so callbacks may submit tasks.
+        A callback that raises fails only its own waiter with the error, as
+        it would without the scheduler; the task stays polled for others.
+        """
+        for waiters, progress, finished, result, error in updates:
+            for waiter in waiters:
+                if waiter.future.done():
+                    continue
+                if progress is not None and waiter.progress_callback is not None:
+                    try:
+                        waiter.progress_callback(progress)
+                    except Exception as e:
+                        _settle(waiter.future, error=e)
+                        continue
+                if finished:
+                    _settle(waiter.future, result=result, error=error)
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every waiter and stop tracking all tasks."""
+        for entry in self._pending.values():
+            for waiter in entry.waiters:
+                _settle(waiter.future, error=error)
+        self._pending.clear()
+
+    def _chunks(self, task_ids: List[str]) -> List[List[str]]:
+        """Split task IDs into batch-sized chunks."""
+        return [
+            task_ids[i : i + self.batch_size] for i in range(0, len(task_ids), self.batch_size)
+        ]
+
+    def _batch_body(self, task_ids: List[str]) -> Dict[str, Any]:
+        """Build the request body for the batch status endpoint."""
+        return {"task_ids": task_ids}
+
+    def _parse_batch(self, response: Any) -> Dict[str, Dict[str, Any]]:
+        """Index a batch status response by task ID."""
+        tasks = response if isinstance(response, list) else response.get("tasks", [])
+        return {task["task_id"]: task for task in tasks if isinstance(task, dict) and "task_id" in task}
+
+
+class PollScheduler(BasePollScheduler):
+    """
+    Thread-based poll scheduler for the synchronous client.
+
+    A single daemon thread polls while tasks are pending and exits when
+    there is nothing left to poll. Callers block on a
+    concurrent.futures.Future instead of issuing their own requests.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the scheduler (see BasePollScheduler)."""
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(
+        self,
+        task_id: str,
+        timeout: Optional[float] = None,
+        progress_callback: Optional[callable] = None,
+        strategy: Optional[PollStrategy] = None,
+    ) -> Future:
+        """
+        Start tracking a task.
+
+        Args:
+            task_id: Unique task identifier
+            timeout: Maximum seconds to wait (defaults to poll_timeout)
+            progress_callback: Optional callback function(progress: int),
+                              invoked from the scheduler thread
+            strategy: Poll strategy for this task (defaults to the scheduler's)
+
+        Returns:
+            Future resolving to the final task data
+        """
+        future: Future = Future()
+        waiter = _Waiter(future, timeout if timeout is not None else self.poll_timeout, progress_callback)
+
+        with self._lock:
+            self._add_waiter(task_id, waiter, strategy)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="nexusai-poll-scheduler", daemon=True
+                )
+                self._thread.start()
+            else:
+                # Let the running thread check the new task right away
+                self._wakeup.set()
+
+        return future
+
+    def _run(self) -> None:
+        """
+        Poll pending tasks as they fall due until none are left.
+
+        If polling fails unexpectedly, every waiter gets the error instead
+        of waiting on a thread that no longer runs, and the next submit()
+        starts a new thread.
+        """
+        try:
+            while True:
+                with self._lock:
+                    self._expire_waiters()
+                    if not self._pending:
+                        self._thread = None
+                        return
+                    now = time.time()
+                    task_ids = self._due_task_ids(now)
+                    wait = self._seconds_until_due(now) if not task_ids else 0.0
+
+                if not task_ids:
+                    self._wakeup.wait(wait)
+                    self._wakeup.clear()
+                    continue
+
+                results = self._fetch(task_ids)
+
+                with self._lock:
+                    updates = self._apply_results(results)
+                self._deliver(updates)
+        except Exception as e:
+            with self._lock:
+                self._fail_pending(e)
+                self._thread = None
+
+    def _fetch(self, task_ids: List[str]) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """Fetch the status of every task, batching when possible."""
+        results: Dict[str, Union[Dict[str, Any], Exception]] = {}
+        missing: List[str] = []
+
+        for chunk in self._chunks(task_ids):
+            if self.batch_supported is False:
+                missing.extend(chunk)
+                continue
+            try:
+                response = self.client.request(
+                    "POST", TASKS_BATCH_ENDPOINT, json_data=self._batch_body(chunk)
+                )
+            except APIError as e:
+                if self._is_unsupported(e):
+                    self.batch_supported = False
+                    missing.extend(chunk)
+                    continue
+                results.update({task_id: e for task_id in chunk})
+                continue
+
+            self.batch_supported = True
+            found = self._parse_batch(response)
+            results.update(found)
+            missing.extend(task_id for task_id in chunk if task_id not in found)
+
+        if missing:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.concurrency, thread_name_prefix="nexusai-poll"
+                )
+            for task_id, result in zip(missing, self._executor.map(self._fetch_one, missing)):
+                results[task_id] = result
+
+        return results
+
+    def _fetch_one(self, task_id: str) -> Union[Dict[str, Any], Exception]:
+        """Fetch the status of a single task."""
+        try:
+            return self.client.request("GET", f"/tasks/{task_id}")
+        except APIError as e:
+            return e
+
+    def close(self) -> None:
+        """
+        Stop polling, failing the tasks still awaited.
+
+        The polling thread exits once a round in progress returns; the
+        fan-out worker threads are released.
+        """
+        with self._lock:
+            self._fail_pending(APIError("Poll scheduler closed before the task finished"))
+        self._wakeup.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class AsyncPollScheduler(BasePollScheduler):
+    """
+    Event-loop poll scheduler for the asynchronous client.
+
+    A single background asyncio task polls while tasks are pending.
+    Callers await an asyncio.Future instead of issuing their own requests.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the scheduler (see BasePollScheduler)."""
+        super().__init__(*args, **kwargs)
+        self._runner: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def submit(
+        self,
+        task_id: str,
+        timeout: Optional[float] = None,
+        progress_callback: Optional[callable] = None,
+        strategy: Optional[PollStrategy] = None,
+    ) -> "asyncio.Future":
+        """
+        Start tracking a task. Must be called from a running event loop.
+
+        Args:
+            task_id: Unique task identifier
+            timeout: Maximum seconds to wait (defaults to poll_timeout)
+            progress_callback: Optional callback function(progress: int)
+            strategy: Poll strategy for this task (defaults to the scheduler's)
+
+        Returns:
+            asyncio.Future resolving to the final task data
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = _Waiter(future, timeout if timeout is not None else self.poll_timeout, progress_callback)
+        self._add_waiter(task_id, waiter, strategy)
+
+        if self._runner is None or self._runner.done():
+            self._wakeup = asyncio.Event()
+            self._runner = loop.create_task(self._run())
+        else:
+            # Let the running loop check the new task right away
+            self._wakeup.set()
+
+        return future
+
+    async def _run(self) -> None:
+        """
+        Poll pending tasks as they fall due until none are left.
+
+        If polling fails unexpectedly, every waiter gets the error and the
+        next submit() starts a new runner.
+        """
+        try:
+            while True:
+                self._expire_waiters()
+                if not self._pending:
+                    return
+
+                now = time.time()
+                task_ids = self._due_task_ids(now)
+                if not task_ids:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), self._seconds_until_due(now))
+                    except asyncio.TimeoutError:
+                        pass
+                    self._wakeup.clear()
+                    continue
+
+                results = await self._fetch(task_ids)
+                self._deliver(self._apply_results(results))
+        except Exception as e:
+            self._fail_pending(e)
+
+    async def _fetch(self, task_ids: List[str]) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """Fetch the status of every task, batching when possible."""
+        results: Dict[str, Union[Dict[str, Any], Exception]] = {}
+        missing: List[str] = []
+
+        for chunk in self._chunks(task_ids):
+            if self.batch_supported is False:
+                missing.extend(chunk)
+                continue
+            try:
+                response = await self.client.request(
+                    "POST", TASKS_BATCH_ENDPOINT, json_data=self._batch_body(chunk)
+                )
+            except APIError as e:
+                if self._is_unsupported(e):
+                    self.batch_supported = False
+                    missing.extend(chunk)
+                    continue
+                results.update({task_id: e for task_id in chunk})
+                continue
+
+            self.batch_supported = True
+            found = self._parse_batch(response)
+            results.update(found)
+            missing.extend(task_id for task_id in chunk if task_id not in found)
+
+        if missing:
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def fetch_one(task_id: str) -> Union[Dict[str, Any], Exception]:
+                async with semaphore:
+                    try:
+                        return await self.client.request("GET", f"/tasks/{task_id}")
+                    except APIError as e:
+                        return e
+
+            fetched = await asyncio.gather(*(fetch_one(task_id) for task_id in missing))
+            results.update(zip(missing, fetched))
+
+        return results
+
+    def close(self) -> None:
+        """Stop the background polling task, failing the tasks still awaited."""
+        if self._runner is not None and not self._runner.done():
+            self._runner.cancel()
+        self._runner = None
+        self._fail_pending(APIError("Poll scheduler closed before the task finished"))
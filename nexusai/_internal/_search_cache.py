@@ -0,0 +1,287 @@
+"""Local cache of knowledge base search results."""
+
+import hashlib
+import json
+import math
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from nexusai._internal._cache import CacheStore, MemoryCacheStore, is_expired
+from nexusai.constants import (
+    DEFAULT_SEARCH_CACHE_MAX_ENTRIES,
+    DEFAULT_SEARCH_CACHE_TTL,
+    DEFAULT_SEARCH_INDEX_MAX_ENTRIES,
+    DEFAULT_SEARCH_MIN_SIMILARITY,
+)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a search query for cache lookups.
+
+    Case, runs of whitespace and trailing punctuation are ignored, so
+    "What is the vacation policy?" and "what is the  vacation policy"
+    share an entry.
+    """
+    return " ".join(query.casefold().split()).rstrip("?!. ")
+
+
+class SimilarityIndex:
+    """
+    Base class for finding an earlier query similar enough to reuse.
+
+    SearchCache consults its index when a query has no exact entry. The
+    index returns an earlier normalized query of the same scope, whose
+    cached results are then returned instead. Implementations must be
+    thread-safe.
+    """
+
+    def add(self, scope: str, query: str) -> None:
+        """Remember a normalized query whose results were cached under scope."""
+        raise NotImplementedError
+
+    def find(self, scope: str, query: str) -> Optional[str]:
+        """Return an earlier normalized query of scope similar to query, or None."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Forget all queries."""
+        raise NotImplementedError
+
+
+class EmbeddingIndex(SimilarityIndex):
+    """
+    Matches queries by cosine similarity of their embeddings.
+
+    Embeddings come from the given function, such as a local sentence
+    embedding model. Queries are compared with every remembered query of
+    the same scope, so keep max_entries moderate.
+
+    Example:
+        ```python
+        from sentence_transformers import SentenceTransformer
+        from nexusai import NexusAIClient, SearchCache, EmbeddingIndex
+
+        model = SentenceTransformer("all-MiniLM-L6-v2")
+        index = EmbeddingIndex(model.encode, min_similarity=0.95)
+        client = NexusAIClient(search_cache=SearchCache(index=index))
+        ```
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        min_similarity: float = DEFAULT_SEARCH_MIN_SIMILARITY,
+        max_entries: int = DEFAULT_SEARCH_INDEX_MAX_ENTRIES,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            embed: Function returning the embedding vector of a text
+            min_similarity: Cosine similarity (0-1) at which queries match
+            max_entries: Queries remembered before least recently used ones
+                        are forgotten
+        """
+        self.embed = embed
+        self.min_similarity = min_similarity
+        self.max_entries = max_entries
+        self._vectors: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._last: Optional[Tuple[str, List[float]]] = None
+        self._lock = threading.Lock()
+
+    def _vector(self, query: str) -> List[float]:
+        """Unit-length embedding of a query; the last one is reused for add()."""
+        last = self._last
+        if last is not None and last[0] == query:
+            return last[1]
+        vector = [float(x) for x in self.embed(query)]
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        vector = [x / norm for x in vector]
+        self._last = (query, vector)
+        return vector
+
+    def add(self, scope: str, query: str) -> None:
+        """Remember a query's embedding."""
+        vector = self._vector(query)
+        with self._lock:
+            self._vectors[(scope, query)] = vector
+            self._vectors.move_to_end((scope, query))
+            while len(self._vectors) > self.max_entries:
+                self._vectors.popitem(last=False)
+
+    def find(self, scope: str, query: str) -> Optional[str]:
+        """Return the most similar remembered query, if similar enough."""
+        vector = self._vector(query)
+        best, best_similarity = None, self.min_similarity
+        with self._lock:
+            for (entry_scope, entry_query), entry in self._vectors.items():
+                if entry_scope != scope:
+                    continue
+                similarity = sum(a * b for a, b in zip(vector, entry))
+                if similarity >= best_similarity:
+                    best, best_similarity = entry_query, similarity
+            if best is not None:
+                self._vectors.move_to_end((scope, best))
+        return best
+
+    def clear(self) -> None:
+        """Forget all queries."""
+        with self._lock:
+            self._vectors.clear()
+
+
+class SearchCache:
+    """
+    Reuses results of repeated knowledge base searches.
+
+    Entries are keyed by the searched knowledge bases, top_k,
+    similarity_threshold and the normalized query (see normalize_query()).
+    With a SimilarityIndex, a query without an exact entry can also reuse
+    the results of an earlier, similar query.
+
+    Each knowledge base has a generation token stored alongside the
+    entries; adding a document to or deleting a knowledge base replaces
+    its token, so every cached search over it becomes a miss. As the
+    tokens live in the store, a SQLiteCacheStore shared between processes
+    sees invalidations made by any of them.
+
+    Example:
+        ```python
+        from nexusai import NexusAIClient, SearchCache
+
+        cache = SearchCache(ttl=600)
+        client = NexusAIClient(search_cache=cache)
+
+        client.knowledge_bases.search("Vacation policy?", ["kb_1"])  # Sent
+        client.knowledge_bases.search("vacation policy", ["kb_1"])  # Cached
+        print(cache.metrics())
+        ```
+    """
+
+    def __init__(
+        self,
+        store: Optional[CacheStore] = None,
+        max_entries: int = DEFAULT_SEARCH_CACHE_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_SEARCH_CACHE_TTL,
+        index: Optional[SimilarityIndex] = None,
+    ):
+        """
+        Initialize the search cache.
+
+        Args:
+            store: Where entries are kept. Defaults to an in-memory store;
+                  use SQLiteCacheStore to share the cache across processes
+                  and runs.
+            max_entries: Entries kept before least recently used ones are evicted
+            ttl: Seconds an entry stays valid (None: no expiry)
+            index: Optional index for reusing results of similar queries
+        """
+        self.store = store if store is not None else MemoryCacheStore()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.index = index
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+
+    def _generation(self, kb_id: str, namespace: str) -> str:
+        """Current generation token of a knowledge base, created if missing."""
+        key = f"{namespace}:generation:{kb_id}"
+        entry = self.store.get(key)
+        if entry is not None:
+            return entry[0]
+        # A missing token (never set, or evicted) must not revive old entries
+        token = uuid.uuid4().hex
+        self.store.set(key, token)
+        return token
+
+    def scope(
+        self,
+        knowledge_base_ids: Sequence[str],
+        top_k: int,
+        similarity_threshold: float,
+        namespace: str = "",
+    ) -> str:
+        """
+        Compute the part of the cache key shared by all queries of a search.
+
+        Args:
+            knowledge_base_ids: Knowledge bases searched
+            top_k: Number of results requested
+            similarity_threshold: Minimum similarity score requested
+            namespace: Scope of the key (e.g. the account searching)
+
+        Returns:
+            Scope string, which changes when any of the knowledge bases is
+            invalidated
+        """
+        kb_ids = sorted(set(knowledge_base_ids))
+        generations = [self._generation(kb_id, namespace) for kb_id in kb_ids]
+        canonical = json.dumps([kb_ids, generations, top_k, similarity_threshold])
+        return f"{namespace}:{hashlib.sha256(canonical.encode()).hexdigest()}"
+
+    @staticmethod
+    def _key(scope: str, query: str) -> str:
+        """Cache key of a normalized query within a scope."""
+        return f"{scope}:{hashlib.sha256(query.encode('utf-8')).hexdigest()}"
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return an unexpired entry, deleting it if expired."""
+        entry = self.store.get(key)
+        if entry is not None and is_expired(entry[1], self.ttl):
+            self.store.delete(key)
+            return None
+        return entry[0] if entry is not None else None
+
+    def get(self, scope: str, query: str) -> Optional[Dict[str, Any]]:
+        """Return the cached search response for a query, or None."""
+        normalized = normalize_query(query)
+        response = self._lookup(self._key(scope, normalized))
+        if response is None and self.index is not None:
+            similar = self.index.find(scope, normalized)
+            if similar is not None:
+                response = self._lookup(self._key(scope, similar))
+                if response is not None:
+                    self.similar_hits += 1
+
+        if response is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return response
+
+    def put(self, scope: str, query: str, response: Dict[str, Any]) -> None:
+        """Remember the search response for a query."""
+        normalized = normalize_query(query)
+        self.store.set(self._key(scope, normalized), response)
+        self.store.evict(self.max_entries)
+        if self.index is not None:
+            self.index.add(scope, normalized)
+
+    def invalidate(self, kb_id: str, namespace: str = "") -> None:
+        """Make every cached search over a knowledge base a miss."""
+        self.store.set(f"{namespace}:generation:{kb_id}", uuid.uuid4().hex)
+
+    def clear(self) -> None:
+        """Forget all cached searches."""
+        self.store.clear()
+        if self.index is not None:
+            self.index.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of the cache counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.store),
+        }
+
+    def __repr__(self) -> str:
+        """Return string representation of the cache."""
+        return f"SearchCache(entries={len(self.store)}, hits={self.hits}, misses={self.misses})"
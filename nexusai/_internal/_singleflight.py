@@ -0,0 +1,136 @@
+"""Request coalescing: identical concurrent requests share one call."""
+
+import asyncio
+import copy
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+from nexusai.constants import COALESCED_POST_ENDPOINTS
+
+T = TypeVar("T")
+
+
+def is_coalescible(
+    method: str,
+    endpoint: str,
+    json_data: Optional[Dict[str, Any]],
+    headers: Optional[Dict[str, str]],
+) -> bool:
+    """
+    Whether identical requests may share one response.
+
+    GET requests and searches only read; /invoke is included when the
+    generation is deterministic (temperature=0) and answered directly,
+    rather than submitted as a task or streamed.
+    """
+    method = method.upper()
+    if method == "GET":
+        return True
+    if method != "POST":
+        return False
+    if endpoint in COALESCED_POST_ENDPOINTS:
+        return True
+    if endpoint != "/invoke" or not json_data or headers or json_data.get("stream"):
+        return False
+    return (json_data.get("config") or {}).get("temperature") == 0
+
+
+def request_key(
+    method: str,
+    endpoint: str,
+    json_data: Optional[Dict[str, Any]],
+    headers: Optional[Dict[str, str]],
+    params: Optional[Dict[str, Any]],
+) -> str:
+    """Canonical form of a request, equal for identical requests."""
+    request = [method.upper(), endpoint, json_data, headers, params]
+    return json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class SingleFlight:
+    """
+    Shares one call among threads making the same request at once.
+
+    The first caller of a key makes the call; callers arriving while it
+    is in flight wait for it and receive its result, or its error. Every
+    caller, the first included, gets its own deep copy of the result, so
+    one caller changing it cannot affect another. Once the call completes
+    the key is forgotten, so later requests are sent again.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[str, "Future[Any]"] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def call(self, key: str, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Call func, or wait for the call already in flight under key.
+
+        Returns:
+            A deep copy of the call's result
+
+        Raises:
+            Exception: The call's error, for the caller and every waiter
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is None:
+                future = self._calls[key] = Future()
+                leader = True
+            else:
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            # Only the future keeps the original, which waiters copy
+            future.set_result(result)
+            return copy.deepcopy(result)
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Shares one call among tasks making the same request at once.
+
+    The async counterpart of SingleFlight. The shared call runs in its
+    own task, so a waiter being cancelled does not cancel the call for
+    the others.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[str, "asyncio.Future[Any]"] = {}
+        self.shared = 0
+
+    def _done(self, key: str, task: "asyncio.Future[Any]") -> None:
+        """Forget a finished call and retrieve its error, so it is never reported unhandled."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def call(self, key: str, func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """Await func, or the call already in flight under key."""
+        task = self._calls.get(key)
+        leader = task is None
+        if leader:
+            task = self._calls[key] = asyncio.ensure_future(func(*args, **kwargs))
+            task.add_done_callback(lambda done: self._done(key, done))
+        else:
+            self.shared += 1
+
+        # Like SingleFlight, every caller gets its own copy
+        return copy.deepcopy(await asyncio.shield(task))
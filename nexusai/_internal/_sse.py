@@ -0,0 +1,268 @@
+"""Incremental decoder for Server-Sent Events streams."""
+
+from itertools import repeat
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional
+
+_BOM = b"\xef\xbb\xbf"
+_DEFAULT_EVENT = "message"
+
+
+class ServerSentEvent:
+    """One dispatched Server-Sent Event."""
+
+    __slots__ = ("data", "event", "id", "retry")
+
+    def __init__(
+        self,
+        data: str,
+        event: str = _DEFAULT_EVENT,
+        id: Optional[str] = None,
+        retry: Optional[int] = None,
+    ):
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ServerSentEvent):
+            return NotImplemented
+        return (self.data, self.event, self.id, self.retry) == (
+            other.data,
+            other.event,
+            other.id,
+            other.retry,
+        )
+
+    def __repr__(self) -> str:
+        """Return string representation of the event."""
+        return f"ServerSentEvent(event={self.event!r}, data={self.data!r}, id={self.id!r})"
+
+
+class SSEDecoder:
+    """
+    Decodes a Server-Sent Events byte stream into events.
+
+    Follows the HTML event stream format: lines end in CRLF, LF or CR
+    (also when split across chunks), `data:` lines of one event are
+    joined with newlines, `event:`, `id:` and `retry:` fields are kept,
+    comment lines (starting with `:`) are skipped, and an event is
+    dispatched at the blank line ending it.
+
+    Streams are mostly runs of single-line `data: ` events. Such runs
+    are decoded and split in one pass over the bytes; only other events
+    go through the line-by-line parser. With data_only=True the decoder
+    returns just the data string of each event, so the common case
+    allocates nothing per event beyond that string.
+    """
+
+    def __init__(self, data_only: bool = False):
+        """
+        Initialize a decoder at the start of a stream.
+
+        Args:
+            data_only: Return the data of each event (str) instead of
+                      ServerSentEvent objects
+        """
+        self.data_only = data_only
+        self._pending: List[bytes] = []  # Start of an unterminated line
+        self._skip_lf = False  # The previous chunk ended in CR, maybe of a CRLF
+        self._started = False
+        self._data: List[bytes] = []
+        self._event: Optional[bytes] = None
+        self._retry: Optional[int] = None
+        self._last_id: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Decode the next chunk of the stream.
+
+        Args:
+            chunk: Bytes as received; need not end at a line or event boundary
+
+        Returns:
+            Events completed by this chunk, in order (their data with data_only)
+        """
+        if (
+            self._started
+            and not self._pending
+            and not self._data
+            and self._event is None
+            and not self._skip_lf
+            and chunk.startswith(b"data: ")
+            and chunk.endswith(b"\n\n")
+            and chunk.count(b"\n") == 2
+            and b"\r" not in chunk
+        ):
+            # Exactly one single-line data event of the default type, as a
+            # live stream sends them
+            return self._events([chunk[6:-2].decode("utf-8", "replace")])
+
+        if not self._started:
+            if self._pending:
+                chunk = self._pending.pop() + chunk
+            if len(chunk) < len(_BOM) and _BOM.startswith(chunk):
+                if chunk:
+                    self._pending.append(chunk)  # Too short to tell if it is a BOM
+                return []
+            self._started = True
+            if chunk.startswith(_BOM):
+                chunk = chunk[len(_BOM) :]
+        if self._skip_lf:
+            self._skip_lf = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+        if not chunk:
+            return []
+        has_cr = b"\r" in chunk
+        if not has_cr and b"\n" not in chunk:
+            self._pending.append(chunk)
+            return []
+
+        if self._pending:
+            self._pending.append(chunk)
+            chunk = b"".join(self._pending)
+            self._pending.clear()
+            has_cr = b"\r" in chunk
+        if not has_cr:
+            return self._feed_lf(chunk)
+
+        lines = chunk.splitlines()
+        last = chunk[-1]
+        if last == 13:  # CR
+            self._skip_lf = True
+        elif last != 10:  # LF
+            self._pending.append(lines.pop())
+        return self._process(lines)
+
+    def flush(self) -> List[Any]:
+        """
+        End the stream, returning an event left unterminated.
+
+        The format discards an event whose final blank line never came;
+        it is returned here so a server omitting it still has its last
+        event delivered. Callers wanting strict behaviour can ignore it.
+        """
+        lines = [b"".join(self._pending)] if self._pending else []
+        self._pending.clear()
+        lines.append(b"")
+        return self._process(lines)
+
+    def _feed_lf(self, chunk: bytes) -> List[Any]:
+        """Decode a chunk, starting at a line boundary, whose lines all end in LF."""
+        end = chunk.rfind(b"\n\n")
+        if end < 0 or self._data or self._event is not None:
+            # No complete event, or the first one started in an earlier chunk
+            lines = chunk.split(b"\n")
+            tail = lines.pop()
+            if tail:
+                self._pending.append(tail)
+            return self._process(lines)
+
+        events = self._decode_run(chunk[:end])
+        lines = chunk[end + 2 :].split(b"\n")
+        tail = lines.pop()
+        if tail:
+            self._pending.append(tail)
+        if lines:
+            events.extend(self._process(lines))
+        return events
+
+    def _decode_run(self, body: bytes) -> List[Any]:
+        """
+        Decode complete LF-separated events, without the final blank line.
+
+        If every event is a single `data: ` line they are decoded and split
+        in one pass. Otherwise the run is halved at an event boundary and
+        each half decoded the same way, so an unusual event (a comment,
+        another field, multi-line data) only slows down its neighbourhood.
+        """
+        if body.startswith(b"data: ") and body.count(b"\n") == 2 * body.count(b"\n\ndata: "):
+            # Every newline separates two single-line data events
+            return self._events(body[6:].decode("utf-8", "replace").split("\n\ndata: "))
+        middle = body.find(b"\n\n", len(body) // 2)
+        if middle < 0:
+            middle = body.rfind(b"\n\n")
+        if middle < 0:
+            return self._process(body.split(b"\n") + [b""])
+        # Left first: its id and retry fields apply to the right half
+        events = self._decode_run(body[:middle])
+        events.extend(self._decode_run(body[middle + 2 :]))
+        return events
+
+    def _events(self, payloads: List[str]) -> List[Any]:
+        """Wrap the data of default-type events for returning."""
+        if self.data_only:
+            return payloads
+        last_id, retry = self._last_id, self._retry
+        return list(
+            map(ServerSentEvent, payloads, repeat(_DEFAULT_EVENT), repeat(last_id), repeat(retry))
+        )
+
+    def _process(self, lines: List[bytes]) -> List[Any]:
+        """Apply complete lines, returning the events they dispatch."""
+        events: List[Any] = []
+        data = self._data
+        for line in lines:
+            if not line:
+                if data:
+                    events.append(self._dispatch())
+                    data = self._data
+                else:
+                    self._event = None
+                continue
+            colon = line.find(b":")
+            if colon == 0:
+                continue  # Comment
+            if colon < 0:
+                name, value = line, b""
+            else:
+                start = colon + 1
+                if start < len(line) and line[start] == 32:  # One leading space is dropped
+                    start += 1
+                name, value = line[:colon], line[start:]
+            if name == b"data":
+                data.append(value)
+            elif name == b"event":
+                self._event = value
+            elif name == b"id":
+                if b"\0" not in value:
+                    self._last_id = value.decode("utf-8", "replace")
+            elif name == b"retry":
+                if value.isdigit():
+                    self._retry = int(value)
+        return events
+
+    def _dispatch(self) -> Any:
+        """Build the event from the buffered fields and reset them."""
+        data = self._data
+        payload = (data[0] if len(data) == 1 else b"\n".join(data)).decode("utf-8", "replace")
+        event = self._event
+        self._data = []
+        self._event = None
+        if self.data_only:
+            return payload
+        return ServerSentEvent(
+            payload,
+            event.decode("utf-8", "replace") if event else _DEFAULT_EVENT,
+            self._last_id,
+            self._retry,
+        )
+
+
+def iter_events(chunks: Iterable[bytes], data_only: bool = False) -> Iterator[Any]:
+    """Decode an iterable of byte chunks into Server-Sent Events (or their data)."""
+    decoder = SSEDecoder(data_only)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.flush()
+
+
+async def aiter_events(chunks: AsyncIterable[bytes], data_only: bool = False) -> AsyncIterator[Any]:
+    """Decode an async iterable of byte chunks into Server-Sent Events (or their data)."""
+    decoder = SSEDecoder(data_only)
+    async for chunk in chunks:
+        for event in decoder.feed(chunk):
+            yield event
+    for event in decoder.flush():
+        yield event
@@ -0,0 +1,226 @@
+"""Streaming reader for file upload bodies."""
+
+import asyncio
+import hashlib
+import io
+import mimetypes
+import mmap
+import os
+from typing import AsyncIterator, BinaryIO, Callable, Dict, Optional, Tuple
+from nexusai.constants import DEFAULT_UPLOAD_CHUNK_SIZE
+
+# Callback receiving (bytes_sent, total_bytes); total_bytes is None if unknown
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+def _file_size(file_obj: BinaryIO) -> Optional[int]:
+    """Determine the size of a file object without reading it."""
+    try:
+        return os.fstat(file_obj.fileno()).st_size
+    except (AttributeError, OSError):
+        pass
+    try:
+        offset = file_obj.tell()
+        size = file_obj.seek(0, os.SEEK_END)
+        file_obj.seek(offset)
+        return size
+    except (AttributeError, OSError):
+        return None
+
+
+def content_digest(file_obj: BinaryIO) -> Optional[Tuple[str, int]]:
+    """
+    Hash the rest of a file with SHA-256, then rewind it.
+
+    The file is read from its current position in chunks, so memory use
+    does not depend on the file size.
+
+    Returns:
+        Tuple of (hex digest, size in bytes), or None if the file cannot be rewound
+    """
+    try:
+        start = file_obj.tell()
+    except (AttributeError, OSError):
+        return None
+
+    digest = hashlib.sha256()
+    size = 0
+    chunk = file_obj.read(DEFAULT_UPLOAD_CHUNK_SIZE)
+    while chunk:
+        digest.update(chunk)
+        size += len(chunk)
+        chunk = file_obj.read(DEFAULT_UPLOAD_CHUNK_SIZE)
+    file_obj.seek(start)
+
+    return digest.hexdigest(), size
+
+
+class UploadReader:
+    """
+    File wrapper that streams an upload body in fixed-size chunks.
+
+    httpx pulls the multipart body from read() as it writes to the socket,
+    so only one chunk of the file is held in memory at a time, whatever
+    the file size. Every chunk handed to httpx is reported to the progress
+    callback.
+
+    With use_mmap=True the file is memory-mapped and chunks are sliced from
+    the mapping; pages already sent are released again so the resident set
+    stays at about one chunk.
+    """
+
+    def __init__(
+        self,
+        file_obj: BinaryIO,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        use_mmap: bool = False,
+    ):
+        """
+        Initialize the reader.
+
+        Args:
+            file_obj: Binary file object to upload
+            chunk_size: Bytes read per chunk
+            progress_callback: Optional callback function(bytes_sent, total_bytes)
+            use_mmap: Read the file through a memory mapping
+
+        Raises:
+            ValueError: If chunk_size is not positive, or use_mmap is set for
+                       an object that is not a file on disk
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self._file = file_obj
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self.total_bytes = _file_size(file_obj)
+        self.bytes_sent = 0
+
+        self._mmap: Optional[mmap.mmap] = None
+        self._position = 0
+        self._released = 0
+        if use_mmap and self.total_bytes != 0:
+            try:
+                fileno = file_obj.fileno()
+            except (AttributeError, OSError):
+                raise ValueError("use_mmap requires a file on disk") from None
+            self._mmap = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read the next chunk.
+
+        The size hint from the caller is ignored in favour of chunk_size so
+        that chunks have a fixed, configurable size.
+        """
+        if self._mmap is not None:
+            chunk = self._mmap[self._position : self._position + self.chunk_size]
+            self._position += len(chunk)
+            self._release_sent_pages()
+        else:
+            chunk = self._file.read(self.chunk_size)
+
+        if chunk:
+            self.bytes_sent += len(chunk)
+            if self.progress_callback:
+                self.progress_callback(self.bytes_sent, self.total_bytes)
+        return chunk
+
+    def _release_sent_pages(self) -> None:
+        """Drop mapped pages that were already sent from the resident set."""
+        if not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        end = self._position - self._position % mmap.PAGESIZE
+        if end > self._released:
+            self._mmap.madvise(mmap.MADV_DONTNEED, self._released, end - self._released)
+            self._released = end
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to a position; seeking back restarts progress from there."""
+        if self._mmap is not None:
+            base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: len(self._mmap)}
+            self._position = max(0, base[whence] + offset)
+            self._released = min(self._released, self._position - self._position % mmap.PAGESIZE)
+        else:
+            self._position = self._file.seek(offset, whence)
+        self.bytes_sent = self._position
+        return self._position
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._position if self._mmap is not None else self._file.tell()
+
+    def fileno(self) -> int:
+        """Return the underlying file descriptor (lets httpx size the body)."""
+        return self._file.fileno()
+
+    def close(self) -> None:
+        """Release the memory mapping; the wrapped file is left open."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+class AsyncUploadBody:
+    """
+    Multipart upload body that reads the file off the event loop.
+
+    httpx reads files passed as files= synchronously, even for an
+    AsyncClient, which would block the event loop for every chunk. This
+    body is passed as content= instead: it encodes the same form (one
+    "file" field, Content-Type guessed from the filename) and reads each
+    chunk from an UploadReader in the default executor. Progress is
+    reported from the event loop.
+    """
+
+    def __init__(
+        self,
+        reader: UploadReader,
+        filename: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        """
+        Initialize the body.
+
+        Args:
+            reader: Reader of the file (without a progress callback of its own)
+            filename: Filename sent with the file
+            progress_callback: Optional callback function(bytes_sent, total_bytes)
+        """
+        self.reader = reader
+        self.filename = filename
+        self.progress_callback = progress_callback
+        self.boundary = os.urandom(16).hex()
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        quoted = filename.replace("\\", "\\\\").replace('"', "%22")
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{quoted}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Request headers for the body; the length is sent when the file size is known."""
+        headers = {"Content-Type": f"multipart/form-data; boundary={self.boundary}"}
+        if self.reader.total_bytes is not None:
+            length = len(self._head) + self.reader.total_bytes + len(self._tail)
+            headers["Content-Length"] = str(length)
+        return headers
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yield the body; starts from the beginning of the file each time, like httpx."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.reader.seek, 0)
+        yield self._head
+        while True:
+            chunk = await loop.run_in_executor(None, self.reader.read)
+            if not chunk:
+                break
+            if self.progress_callback:
+                self.progress_callback(self.reader.bytes_sent, self.reader.total_bytes)
+            yield chunk
+        yield self._tail
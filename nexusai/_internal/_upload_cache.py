@@ -0,0 +1,104 @@
+"""Content-hash cache that lets repeated uploads of the same file be skipped."""
+
+from typing import BinaryIO, Optional
+from nexusai.models import FileMetadata
+from nexusai._internal._cache import CacheStore, MemoryCacheStore, is_expired
+from nexusai._internal._upload import content_digest
+from nexusai.constants import DEFAULT_UPLOAD_CACHE_MAX_ENTRIES, DEFAULT_UPLOAD_CACHE_TTL
+
+
+class UploadCache:
+    """
+    Maps file contents to the file_id they were uploaded as.
+
+    Before uploading, the file is hashed (SHA-256, streamed in chunks) and
+    looked up; if the same content was uploaded before, the existing file
+    is returned instead of uploading it again. With verify=True (default)
+    the cached file_id is confirmed with files.get() first, so files
+    deleted on the server are uploaded again.
+
+    Example:
+        ```python
+        from nexusai import NexusAIClient, UploadCache, SQLiteCacheStore
+
+        cache = UploadCache(SQLiteCacheStore("~/.nexusai/upload_cache.db"), ttl=7 * 86400)
+        client = NexusAIClient(upload_cache=cache)
+
+        client.files.upload("report.pdf")  # Uploads
+        client.files.upload("report.pdf")  # Returns the cached file_id
+        ```
+    """
+
+    def __init__(
+        self,
+        store: Optional[CacheStore] = None,
+        max_entries: int = DEFAULT_UPLOAD_CACHE_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_UPLOAD_CACHE_TTL,
+        verify: bool = True,
+    ):
+        """
+        Initialize the upload cache.
+
+        Args:
+            store: Where entries are kept. Defaults to an in-memory store;
+                  use SQLiteCacheStore to share the cache across processes
+                  and runs.
+            max_entries: Entries kept before least recently used ones are evicted
+            ttl: Seconds an entry stays valid (None: no expiry)
+            verify: Confirm a cached file still exists with files.get()
+                   before reusing it
+        """
+        self.store = store if store is not None else MemoryCacheStore()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.verify = verify
+        self.hits = 0
+        self.misses = 0
+
+    def content_key(self, file_obj: BinaryIO, namespace: str = "") -> Optional[str]:
+        """
+        Compute the cache key of a file's content.
+
+        The file is read from its current position to the end and then
+        rewound, so it can be uploaded afterwards.
+
+        Args:
+            file_obj: Binary file object
+            namespace: Scope of the key (e.g. the account the file belongs to)
+
+        Returns:
+            Cache key, or None if the file cannot be rewound
+        """
+        digest = content_digest(file_obj)
+        if digest is None:
+            return None
+        return f"{namespace}:{digest[0]}:{digest[1]}"
+
+    def get(self, key: str) -> Optional[FileMetadata]:
+        """Return the cached upload for a key, or None if missing or expired."""
+        entry = self.store.get(key)
+        if entry is not None and is_expired(entry[1], self.ttl):
+            self.store.delete(key)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return FileMetadata(**entry[0])
+
+    def put(self, key: str, file_meta: FileMetadata) -> None:
+        """Remember an uploaded file under its content key."""
+        self.store.set(key, file_meta.model_dump(mode="json"))
+        self.store.evict(self.max_entries)
+
+    def discard(self, key: str) -> None:
+        """Forget a cached upload (e.g. the file no longer exists)."""
+        self.store.delete(key)
+
+    def __repr__(self) -> str:
+        """Return string representation of the cache."""
+        return (
+            f"UploadCache(entries={len(self.store)}, hits={self.hits}, misses={self.misses})"
+        )
@@ -1,7 +1,17 @@
 """Main client class for Nexus AI SDK."""
 
-from typing import Optional
-from nexusai._internal._client import InternalClient
+from typing import Optional, Union
+from nexusai._internal._client import InternalClient, AsyncInternalClient
+from nexusai._internal._upload_cache import UploadCache
+from nexusai._internal._response_cache import ResponseCache
+from nexusai._internal._search_cache import SearchCache
+from nexusai._internal._retry import RetryConfig
+from nexusai._internal._rate_limit import RateLimiter
+from nexusai._internal._concurrency import AdaptiveConcurrencyLimiter
+from nexusai._internal._circuit import CircuitBreaker
+from nexusai._internal._hedge import HedgePolicy
+from nexusai._internal._json import JSONCodec
+from nexusai._internal._routing import Router
 
 
 class NexusAIClient:
@@ -34,6 +44,24 @@ class NexusAIClient:
         base_url: Optional[str] = None,
         timeout: Optional[float] = None,
         max_retries: Optional[int] = None,
+        batch_polling: Optional[bool] = None,
+        task_updates: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        http2: Optional[bool] = None,
+        upload_cache: Optional[UploadCache] = None,
+        retry: Optional[RetryConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        router: Optional[Router] = None,
+        response_cache: Optional[ResponseCache] = None,
+        search_cache: Optional[SearchCache] = None,
+        coalesce_requests: Optional[bool] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
     ):
         """
         Initialize the Nexus AI client.
@@ -45,7 +73,83 @@ class NexusAIClient:
                      (development mode). Set NEXUS_BASE_URL environment variable
                      to switch to production.
             timeout: Request timeout in seconds. Defaults to 30.
-            max_retries: Maximum number of retries for failed requests. Defaults to 3.
+            max_retries: Maximum number of retries for failed requests (rate
+                        limited, 5xx, timed out or dropped). Defaults to 3.
+                        POSTs that create something (generations, session
+                        messages, uploads) are only retried when rate limited
+                        or when the connection failed before sending.
+            batch_polling: Check all pending async tasks (images, audio, text,
+                          knowledge base documents) together through one shared
+                          scheduler instead of one polling loop per call. Defaults
+                          to the NEXUS_BATCH_POLLING environment variable.
+            task_updates: How completion of async tasks is awaited. "poll"
+                         (default) checks task status periodically; "long_poll"
+                         lets the server hold each status request until the task
+                         changes; "sse" subscribes to the task's event stream.
+                         Falls back to polling when the server does not support
+                         the chosen mode. Defaults to NEXUS_TASK_UPDATES.
+            max_connections: Maximum open connections shared by all threads
+                            using this client. Defaults to 100.
+            max_keepalive_connections: Maximum idle connections kept open for
+                                      reuse. Defaults to 50.
+            keepalive_expiry: Seconds an idle connection is kept open. Defaults to 30.
+            pool_timeout: Seconds to wait for a free connection when all are
+                         busy. Defaults to the request timeout.
+            http2: Multiplex concurrent requests, streams and polls over a few
+                  HTTP/2 connections (including file uploads). Requires
+                  `pip install keystone-ai[http2]`. Defaults to NEXUS_HTTP2.
+            upload_cache: Optional UploadCache. Files whose content was
+                         uploaded before are not uploaded again; the existing
+                         file is returned instead.
+            retry: Optional RetryConfig for full control over retries (delays,
+                  backoff factor, jitter). Defaults to max_retries retries with
+                  jittered exponential backoff; rate-limited requests wait as
+                  long as the server's Retry-After asks. Set
+                  retry_non_idempotent=True to retry every request alike.
+            rate_limiter: Optional RateLimiter that spaces out requests (and
+                         estimated tokens) to stay under the account's
+                         limits. Shared by all resources and threads of the
+                         client. Defaults to one built from
+                         NEXUS_REQUESTS_PER_MINUTE / NEXUS_TOKENS_PER_MINUTE
+                         when either is set.
+            concurrency_limiter: Optional AdaptiveConcurrencyLimiter capping
+                                the requests in flight. The cap backs off on
+                                rate limit errors, server errors and timeouts
+                                and grows again while requests succeed. GET
+                                requests such as status polls are exempt.
+                                Defaults to a new limiter when
+                                NEXUS_ADAPTIVE_CONCURRENCY is enabled.
+            circuit_breaker: Optional CircuitBreaker that fails requests fast
+                            with CircuitOpenError while their endpoint,
+                            provider and model keep failing, instead of
+                            waiting for each to time out. Defaults to a new
+                            breaker when NEXUS_CIRCUIT_BREAKER is enabled.
+            hedge_policy: Optional HedgePolicy for text.generate(): when a
+                         response is slower than a percentile of recent
+                         latencies, a duplicate request is sent (optionally
+                         to a fallback provider/model) and the first
+                         response wins. Off by default.
+            router: Optional Router tracking latency and failures of the
+                   provider/model candidates passed as candidates= to
+                   text.generate(), images.generate() and
+                   audio.transcribe(). Defaults to a router of this client;
+                   pass one to share measurements between clients.
+            response_cache: Optional ResponseCache. Repeated text.generate()
+                           requests with temperature=0 and identical bodies
+                           are answered from the cache instead of the API.
+            search_cache: Optional SearchCache. Repeated
+                         knowledge_bases.search() queries are answered
+                         locally until a document is added to or a
+                         knowledge base deleted by this client.
+            coalesce_requests: Share one call among identical requests in
+                              flight at the same time (GETs, knowledge base
+                              searches and temperature=0 text generation).
+                              Defaults to NEXUS_COALESCE_REQUESTS (off).
+            json_codec: JSON codec for request bodies, responses and
+                       streamed chunks: "orjson", "msgspec", "json"
+                       (standard library), "auto" (orjson or msgspec when
+                       installed, else the standard library) or a
+                       JSONCodec. Defaults to NEXUS_JSON_CODEC ("auto").
 
         Raises:
             AuthenticationError: If API key is not provided
@@ -68,6 +172,24 @@ class NexusAIClient:
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            batch_polling=batch_polling,
+            task_updates=task_updates,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            pool_timeout=pool_timeout,
+            http2=http2,
+            upload_cache=upload_cache,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            circuit_breaker=circuit_breaker,
+            hedge_policy=hedge_policy,
+            router=router,
+            response_cache=response_cache,
+            search_cache=search_cache,
+            coalesce_requests=coalesce_requests,
+            json_codec=json_codec,
         )
 
         # Lazy-load resource modules to avoid circular imports
@@ -160,6 +282,116 @@ class NexusAIClient:
         self.close()
 
 
+class AsyncNexusAIClient:
+    """
+    Asynchronous client for interacting with Nexus AI Platform.
+
+    Mirrors NexusAIClient with `async def` resource methods and `async for`
+    streaming, so many requests can share a single event loop.
+
+    Example:
+        ```python
+        import asyncio
+        from nexusai import AsyncNexusAIClient
+
+        async def main():
+            async with AsyncNexusAIClient(api_key="nxs_your_api_key") as client:
+                response = await client.text.generate(prompt="Hello!")
+                print(response.text)
+
+                async for chunk in client.text.stream(prompt="Tell me a story"):
+                    print(chunk.get("delta", {}).get("content", ""), end="")
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize the async Nexus AI client.
+
+        Accepts the same keyword arguments as NexusAIClient.__init__().
+
+        Raises:
+            AuthenticationError: If API key is not provided
+        """
+        self._internal_client = AsyncInternalClient(**kwargs)
+
+        # Lazy-load resource modules to avoid circular imports
+        self._images_resource = None
+        self._text_resource = None
+        self._sessions_resource = None
+        self._audio_resource = None
+        self._files_resource = None
+        self._knowledge_bases_resource = None
+
+    @property
+    def images(self):
+        """Access image generation resources."""
+        if self._images_resource is None:
+            from nexusai.resources.images import AsyncImagesResource
+
+            self._images_resource = AsyncImagesResource(self._internal_client)
+        return self._images_resource
+
+    @property
+    def text(self):
+        """Access text generation resources."""
+        if self._text_resource is None:
+            from nexusai.resources.text import AsyncTextResource
+
+            self._text_resource = AsyncTextResource(self._internal_client)
+        return self._text_resource
+
+    @property
+    def sessions(self):
+        """Access session management resources."""
+        if self._sessions_resource is None:
+            from nexusai.resources.sessions import AsyncSessionsResource
+
+            self._sessions_resource = AsyncSessionsResource(self._internal_client)
+        return self._sessions_resource
+
+    @property
+    def audio(self):
+        """Access audio processing resources (ASR/TTS)."""
+        if self._audio_resource is None:
+            from nexusai.resources.audio import AsyncAudioResource
+
+            self._audio_resource = AsyncAudioResource(self._internal_client)
+        return self._audio_resource
+
+    @property
+    def files(self):
+        """Access file management resources."""
+        if self._files_resource is None:
+            from nexusai.resources.files import AsyncFilesResource
+
+            self._files_resource = AsyncFilesResource(self._internal_client)
+        return self._files_resource
+
+    @property
+    def knowledge_bases(self):
+        """Access knowledge base resources."""
+        if self._knowledge_bases_resource is None:
+            from nexusai.resources.knowledge_bases import AsyncKnowledgeBasesResource
+
+            self._knowledge_bases_resource = AsyncKnowledgeBasesResource(self._internal_client)
+        return self._knowledge_bases_resource
+
+    async def close(self) -> None:
+        """Close the client and release resources."""
+        await self._internal_client.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Async context manager exit - close client."""
+        await self.close()
+
+
 # Global client instance for convenience
 _default_client: Optional[NexusAIClient] = None
 
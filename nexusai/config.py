@@ -9,12 +9,43 @@ from nexusai.constants import (
     DEFAULT_MAX_RETRIES,
     DEFAULT_POLL_INTERVAL,
     DEFAULT_POLL_TIMEOUT,
+    DEFAULT_POLL_STRATEGY,
+    DEFAULT_BATCH_POLLING,
+    DEFAULT_TASK_UPDATES,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_POOL_TIMEOUT,
+    DEFAULT_HTTP2,
+    DEFAULT_UPLOAD_STATE_DIR,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    DEFAULT_TOKENS_PER_MINUTE,
+    DEFAULT_ADAPTIVE_CONCURRENCY,
+    DEFAULT_CIRCUIT_BREAKER,
+    DEFAULT_COALESCE_REQUESTS,
+    DEFAULT_JSON_CODEC,
 )
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+def _parse_bool(value: Optional[str], default: bool) -> bool:
+    """Parse a boolean environment variable value."""
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _parse_optional_float(value: Optional[str], default: Optional[float]) -> Optional[float]:
+    """Parse a float environment variable value, allowing "none" for no value."""
+    if value is None:
+        return default
+    if value.strip().lower() in ("", "none"):
+        return None
+    return float(value)
+
+
 class Config:
     """
     Global configuration manager for Nexus AI SDK.
@@ -36,6 +67,43 @@ class Config:
         self._poll_timeout: float = float(
             os.getenv("NEXUS_POLL_TIMEOUT", str(DEFAULT_POLL_TIMEOUT))
         )
+        self._poll_strategy: str = os.getenv("NEXUS_POLL_STRATEGY", DEFAULT_POLL_STRATEGY)
+        self._batch_polling: bool = _parse_bool(
+            os.getenv("NEXUS_BATCH_POLLING"), DEFAULT_BATCH_POLLING
+        )
+        self._task_updates: str = os.getenv("NEXUS_TASK_UPDATES", DEFAULT_TASK_UPDATES)
+        self._max_connections: int = int(
+            os.getenv("NEXUS_MAX_CONNECTIONS", str(DEFAULT_MAX_CONNECTIONS))
+        )
+        self._max_keepalive_connections: int = int(
+            os.getenv("NEXUS_MAX_KEEPALIVE_CONNECTIONS", str(DEFAULT_MAX_KEEPALIVE_CONNECTIONS))
+        )
+        self._keepalive_expiry: float = float(
+            os.getenv("NEXUS_KEEPALIVE_EXPIRY", str(DEFAULT_KEEPALIVE_EXPIRY))
+        )
+        self._pool_timeout: Optional[float] = _parse_optional_float(
+            os.getenv("NEXUS_POOL_TIMEOUT"), DEFAULT_POOL_TIMEOUT
+        )
+        self._http2: bool = _parse_bool(os.getenv("NEXUS_HTTP2"), DEFAULT_HTTP2)
+        self._upload_state_dir: str = os.getenv(
+            "NEXUS_UPLOAD_STATE_DIR", DEFAULT_UPLOAD_STATE_DIR
+        )
+        self._requests_per_minute: Optional[float] = _parse_optional_float(
+            os.getenv("NEXUS_REQUESTS_PER_MINUTE"), DEFAULT_REQUESTS_PER_MINUTE
+        )
+        self._tokens_per_minute: Optional[float] = _parse_optional_float(
+            os.getenv("NEXUS_TOKENS_PER_MINUTE"), DEFAULT_TOKENS_PER_MINUTE
+        )
+        self._adaptive_concurrency: bool = _parse_bool(
+            os.getenv("NEXUS_ADAPTIVE_CONCURRENCY"), DEFAULT_ADAPTIVE_CONCURRENCY
+        )
+        self._circuit_breaker: bool = _parse_bool(
+            os.getenv("NEXUS_CIRCUIT_BREAKER"), DEFAULT_CIRCUIT_BREAKER
+        )
+        self._coalesce_requests: bool = _parse_bool(
+            os.getenv("NEXUS_COALESCE_REQUESTS"), DEFAULT_COALESCE_REQUESTS
+        )
+        self._json_codec: str = os.getenv("NEXUS_JSON_CODEC", DEFAULT_JSON_CODEC)
 
     @property
     def api_key(self) -> Optional[str]:
@@ -97,6 +165,156 @@ class Config:
         """Set the task polling timeout in seconds."""
         self._poll_timeout = value
 
+    @property
+    def poll_strategy(self) -> str:
+        """Get the default task polling strategy ("adaptive" or "fixed")."""
+        return self._poll_strategy
+
+    @poll_strategy.setter
+    def poll_strategy(self, value: str) -> None:
+        """Set the default task polling strategy ("adaptive" or "fixed")."""
+        self._poll_strategy = value
+
+    @property
+    def batch_polling(self) -> bool:
+        """Get whether pending tasks are polled together by a shared scheduler."""
+        return self._batch_polling
+
+    @batch_polling.setter
+    def batch_polling(self, value: bool) -> None:
+        """Set whether pending tasks are polled together by a shared scheduler."""
+        self._batch_polling = value
+
+    @property
+    def task_updates(self) -> str:
+        """Get how task completion is awaited ("poll", "long_poll" or "sse")."""
+        return self._task_updates
+
+    @task_updates.setter
+    def task_updates(self, value: str) -> None:
+        """Set how task completion is awaited ("poll", "long_poll" or "sse")."""
+        self._task_updates = value
+
+    @property
+    def max_connections(self) -> int:
+        """Get the maximum number of open connections per client."""
+        return self._max_connections
+
+    @max_connections.setter
+    def max_connections(self, value: int) -> None:
+        """Set the maximum number of open connections per client."""
+        self._max_connections = value
+
+    @property
+    def max_keepalive_connections(self) -> int:
+        """Get the maximum number of idle connections kept for reuse."""
+        return self._max_keepalive_connections
+
+    @max_keepalive_connections.setter
+    def max_keepalive_connections(self, value: int) -> None:
+        """Set the maximum number of idle connections kept for reuse."""
+        self._max_keepalive_connections = value
+
+    @property
+    def keepalive_expiry(self) -> float:
+        """Get the seconds an idle connection is kept open."""
+        return self._keepalive_expiry
+
+    @keepalive_expiry.setter
+    def keepalive_expiry(self, value: float) -> None:
+        """Set the seconds an idle connection is kept open."""
+        self._keepalive_expiry = value
+
+    @property
+    def pool_timeout(self) -> Optional[float]:
+        """Get the seconds to wait for a free connection (None: same as timeout)."""
+        return self._pool_timeout
+
+    @pool_timeout.setter
+    def pool_timeout(self, value: Optional[float]) -> None:
+        """Set the seconds to wait for a free connection (None: same as timeout)."""
+        self._pool_timeout = value
+
+    @property
+    def http2(self) -> bool:
+        """Get whether requests are multiplexed over HTTP/2."""
+        return self._http2
+
+    @http2.setter
+    def http2(self, value: bool) -> None:
+        """Set whether requests are multiplexed over HTTP/2."""
+        self._http2 = value
+
+    @property
+    def upload_state_dir(self) -> str:
+        """Get the directory where resumable upload progress is saved."""
+        return self._upload_state_dir
+
+    @upload_state_dir.setter
+    def upload_state_dir(self, value: str) -> None:
+        """Set the directory where resumable upload progress is saved."""
+        self._upload_state_dir = value
+
+    @property
+    def requests_per_minute(self) -> Optional[float]:
+        """Get the client-side request rate limit (None: unlimited)."""
+        return self._requests_per_minute
+
+    @requests_per_minute.setter
+    def requests_per_minute(self, value: Optional[float]) -> None:
+        """Set the client-side request rate limit."""
+        self._requests_per_minute = value
+
+    @property
+    def tokens_per_minute(self) -> Optional[float]:
+        """Get the client-side token rate limit (None: unlimited)."""
+        return self._tokens_per_minute
+
+    @tokens_per_minute.setter
+    def tokens_per_minute(self, value: Optional[float]) -> None:
+        """Set the client-side token rate limit."""
+        self._tokens_per_minute = value
+
+    @property
+    def adaptive_concurrency(self) -> bool:
+        """Get whether requests in flight are limited adaptively."""
+        return self._adaptive_concurrency
+
+    @adaptive_concurrency.setter
+    def adaptive_concurrency(self, value: bool) -> None:
+        """Set whether requests in flight are limited adaptively."""
+        self._adaptive_concurrency = value
+
+    @property
+    def circuit_breaker(self) -> bool:
+        """Get whether failing endpoints, providers and models fail fast."""
+        return self._circuit_breaker
+
+    @circuit_breaker.setter
+    def circuit_breaker(self, value: bool) -> None:
+        """Set whether failing endpoints, providers and models fail fast."""
+        self._circuit_breaker = value
+
+    @property
+    def coalesce_requests(self) -> bool:
+        """Get whether identical concurrent requests share one call."""
+        return self._coalesce_requests
+
+    @coalesce_requests.setter
+    def coalesce_requests(self, value: bool) -> None:
+        """Set whether identical concurrent requests share one call."""
+        self._coalesce_requests = value
+
+    @property
+    def json_codec(self) -> str:
+        """Get the JSON codec ("auto", "orjson", "msgspec" or "json")."""
+        return self._json_codec
+
+    @json_codec.setter
+    def json_codec(self, value: str) -> None:
+        """Set the JSON codec ("auto", "orjson", "msgspec" or "json")."""
+        self._json_codec = value
+
 
 # Global configuration instance
 config = Config()
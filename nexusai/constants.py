@@ -8,9 +8,96 @@ DEVELOPMENT_BASE_URL = "http://localhost:8000/api/v1"        # Local development
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_POLL_INTERVAL = 2.0
 DEFAULT_POLL_TIMEOUT = 300.0
+DEFAULT_POLL_STRATEGY = "adaptive"  # "adaptive" or "fixed"
+
+# Connection pool settings
+DEFAULT_MAX_CONNECTIONS = 100  # Open connections per client
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50  # Idle connections kept for reuse
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # Seconds an idle connection is kept
+DEFAULT_POOL_TIMEOUT = None  # Seconds to wait for a free connection (None: same as timeout)
+DEFAULT_HTTP2 = False  # Multiplex requests over HTTP/2 (requires the "h2" package)
+
+# JSON encoding of request and response bodies
+JSON_CODEC_AUTO = "auto"  # Fastest installed of orjson, msgspec and the standard library
+JSON_CODEC_ORJSON = "orjson"
+JSON_CODEC_MSGSPEC = "msgspec"
+JSON_CODEC_STDLIB = "json"
+DEFAULT_JSON_CODEC = JSON_CODEC_AUTO
 
 # Retry settings
 DEFAULT_MAX_RETRIES = 3
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")  # Safe to repeat on any error
+RETRY_SAFE_POST_ENDPOINTS = ("/knowledge-bases/search",)  # POSTs that only read
+
+# Client-side rate limiting
+DEFAULT_REQUESTS_PER_MINUTE = None  # None: no request limit
+DEFAULT_TOKENS_PER_MINUTE = None  # None: no token limit
+DEFAULT_RATE_LIMIT_BURST = 10.0  # Seconds of traffic at the full rate sent at once
+DEFAULT_ESTIMATED_OUTPUT_TOKENS = 256  # Output tokens assumed when max_tokens is not set
+CHARS_PER_TOKEN = 4  # Characters per token when estimating prompt size
+
+# Adaptive concurrency limiting
+DEFAULT_ADAPTIVE_CONCURRENCY = False
+DEFAULT_CONCURRENCY_INITIAL_LIMIT = 8  # Requests in flight before any feedback
+DEFAULT_CONCURRENCY_MIN_LIMIT = 1
+DEFAULT_CONCURRENCY_MAX_LIMIT = DEFAULT_MAX_CONNECTIONS
+DEFAULT_CONCURRENCY_BACKOFF = 0.5  # Limit multiplier on 429, 5xx or timeout
+DEFAULT_CONCURRENCY_LATENCY_TOLERANCE = 2.0  # Latency ratio above which the limit holds
+
+# Circuit breaking
+DEFAULT_CIRCUIT_BREAKER = False
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive failures that open a circuit
+DEFAULT_CIRCUIT_RECOVERY_TIMEOUT = 30.0  # Seconds an open circuit rejects requests
+DEFAULT_CIRCUIT_HALF_OPEN_PROBES = 1  # Probe requests let through at once when half-open
+
+# Request coalescing
+DEFAULT_COALESCE_REQUESTS = False
+COALESCED_POST_ENDPOINTS = ("/knowledge-bases/search",)  # POST endpoints that only read
+
+# Hedged requests
+DEFAULT_HEDGE_PERCENTILE = 95.0  # Recent latency percentile after which a duplicate is sent
+DEFAULT_HEDGE_MIN_DELAY = 0.5  # Never hedge sooner than this many seconds
+DEFAULT_HEDGE_MAX_EXTRA_LOAD = 0.1  # Hedges allowed per request, on average
+DEFAULT_HEDGE_WINDOW = 200  # Recent latencies the percentile is taken over
+DEFAULT_HEDGE_MIN_SAMPLES = 20  # Latencies needed before hedging starts
+DEFAULT_HEDGE_MAX_THREADS = 16  # Threads a sync hedge policy runs requests on
+
+# Provider/model routing
+DEFAULT_ROUTE_HALF_LIFE = 30.0  # Seconds for a candidate's failure rate to halve
+DEFAULT_ROUTE_MAX_FAILURE_RATE = 0.5  # Failure rate at which a candidate is tried last
+DEFAULT_ROUTE_PROBE_INTERVAL = 60.0  # Seconds after which a latency is re-measured
+
+# Batch polling settings
+DEFAULT_BATCH_POLLING = False
+DEFAULT_POLL_BATCH_SIZE = 100  # Task IDs per batch status request
+DEFAULT_POLL_CONCURRENCY = 8  # Parallel status requests when batching is unsupported
+TASKS_BATCH_ENDPOINT = "/tasks/batch"
+
+# Upload settings
+DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024  # Bytes read from disk per upload chunk
+DEFAULT_UPLOAD_PART_SIZE = 8 * 1024 * 1024  # Bytes per part of a resumable upload
+DEFAULT_UPLOAD_CONCURRENCY = 4  # Parts of a resumable upload sent in parallel
+DEFAULT_UPLOAD_STATE_DIR = "~/.nexusai/uploads"  # Progress of resumable uploads
+UPLOADS_ENDPOINT = "/files/uploads"
+DEFAULT_UPLOAD_CACHE_MAX_ENTRIES = 10000  # Files remembered by an UploadCache
+DEFAULT_UPLOAD_CACHE_TTL = 7 * 24 * 3600.0  # Seconds an UploadCache entry stays valid
+DEFAULT_RESPONSE_CACHE_MAX_ENTRIES = 1000  # Responses remembered by a ResponseCache
+DEFAULT_RESPONSE_CACHE_TTL = 24 * 3600.0  # Seconds a ResponseCache entry stays valid
+DEFAULT_SEARCH_CACHE_MAX_ENTRIES = 10000  # Searches remembered by a SearchCache
+DEFAULT_SEARCH_CACHE_TTL = 3600.0  # Seconds a SearchCache entry stays valid
+DEFAULT_SEARCH_MIN_SIMILARITY = 0.95  # Cosine similarity at which an EmbeddingIndex matches
+DEFAULT_SEARCH_INDEX_MAX_ENTRIES = 1000  # Queries an EmbeddingIndex compares against
+
+# Batch call settings
+DEFAULT_BATCH_CONCURRENCY = 8  # Requests in flight for generate_many()
+
+# Task completion updates
+TASK_UPDATES_POLL = "poll"  # GET /tasks/{id} on the poll strategy's schedule
+TASK_UPDATES_LONG_POLL = "long_poll"  # GET /tasks/{id}?wait=N, held open by the server
+TASK_UPDATES_SSE = "sse"  # Server-Sent Events from GET /tasks/{id}/events
+DEFAULT_TASK_UPDATES = TASK_UPDATES_POLL
+DEFAULT_LONG_POLL_WAIT = 20.0  # Seconds the server may hold a long-poll request
+TASK_EVENTS_ENDPOINT = "/tasks/{task_id}/events"
 
 # Task status
 TASK_STATUS_PENDING = "pending"
@@ -23,6 +110,7 @@ TASK_STATUS_FAILED = "failed"
 TASK_TYPE_TEXT_GENERATION = "text_generation"
 TASK_TYPE_IMAGE_GENERATION = "image_generation"
 TASK_TYPE_SPEECH_TO_TEXT = "speech_to_text"
+TASK_TYPE_TEXT_TO_SPEECH = "text_to_speech"
 TASK_TYPE_DOCUMENT_PROCESSING = "document_processing"
 
 # Stream markers
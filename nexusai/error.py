@@ -123,7 +123,23 @@ class APITimeoutError(APIError):
     or when task polling exceeds the maximum wait time.
     """
 
-    pass
+    def __init__(
+        self,
+        message: str,
+        request_sent: bool = True,
+        **kwargs,
+    ):
+        """
+        Initialize a timeout error.
+
+        Args:
+            message: Human-readable error message
+            request_sent: False if the timeout happened before the request
+                         was sent (connecting or waiting for a connection)
+            **kwargs: Additional arguments passed to APIError
+        """
+        super().__init__(message, **kwargs)
+        self.request_sent = request_sent
 
 
 class InvalidRequestError(APIError):
@@ -202,6 +218,7 @@ class NetworkError(APIError):
         self,
         message: str,
         is_retryable: bool = True,
+        request_sent: bool = True,
         **kwargs,
     ):
         """
@@ -210,10 +227,13 @@ class NetworkError(APIError):
         Args:
             message: Human-readable error message
             is_retryable: Whether this error can be retried
+            request_sent: False if the connection failed before the request
+                         was sent
             **kwargs: Additional arguments passed to APIError
         """
         super().__init__(message, **kwargs)
         self.is_retryable = is_retryable
+        self.request_sent = request_sent
 
 
 class FileUploadError(APIError):
@@ -251,6 +271,35 @@ class FileUploadError(APIError):
         return base
 
 
+class CircuitOpenError(APIError):
+    """
+    Request rejected by an open circuit breaker.
+
+    Raised without contacting the server while the endpoint, provider
+    and model of a request have recently been failing.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        key: Optional[tuple] = None,
+        retry_after: Optional[float] = None,
+        **kwargs,
+    ):
+        """
+        Initialize a circuit open error.
+
+        Args:
+            message: Human-readable error message
+            key: The (endpoint, provider, model) circuit that is open
+            retry_after: Seconds until the circuit lets a probe request through
+            **kwargs: Additional arguments passed to APIError
+        """
+        super().__init__(message, **kwargs)
+        self.key = key
+        self.retry_after = retry_after
+
+
 class StreamError(APIError):
     """
     Streaming error.
@@ -2,7 +2,7 @@
 
 from typing import Optional, Dict, Any, List, Literal
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 # Task models
@@ -20,6 +20,9 @@ class Task(BaseModel):
     progress: Optional[int] = Field(None, description="Task progress percentage (0-100)")
     output: Optional[Dict[str, Any]] = Field(None, description="Task output data")
     error: Optional[Dict[str, Any]] = Field(None, description="Error information if failed")
+    retry_after: Optional[float] = Field(
+        None, description="Server hint: seconds to wait before checking the task again"
+    )
 
 
 # Image models
@@ -178,3 +181,20 @@ class SearchResponse(BaseModel):
     query: str = Field(..., description="Search query")
     results: List[SearchResult] = Field(..., description="Search results")
     total_results: int = Field(..., description="Total number of results")
+
+
+# Batch models
+class BatchResult(BaseModel):
+    """Outcome of one input of a batch call such as text.generate_many()."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int = Field(..., description="Position of the input in the batch")
+    input: Any = Field(None, description="The input item (prompt or messages)")
+    result: Optional[Any] = Field(None, description="Result if the call succeeded")
+    error: Optional[Exception] = Field(None, description="Error if the call failed")
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
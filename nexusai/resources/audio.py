@@ -1,9 +1,89 @@
 """Audio processing resource module (ASR/TTS)."""
 
-from typing import Optional
+from typing import Optional, Dict, Any, Sequence
 from nexusai.models import TranscriptionResponse, TTSResponse, Task
-from nexusai._internal._poller import TaskPoller
-from nexusai.constants import TASK_TYPE_SPEECH_TO_TEXT
+from nexusai._internal._poller import TaskPoller, AsyncTaskPoller, AsyncTaskHandle
+from nexusai._internal._routing import CandidateSpec
+from nexusai.constants import TASK_TYPE_SPEECH_TO_TEXT, TASK_TYPE_TEXT_TO_SPEECH
+
+
+def _build_transcribe_body(
+    file_id: str,
+    provider: Optional[str],
+    model: Optional[str],
+    language: Optional[str],
+    **kwargs,
+) -> Dict[str, Any]:
+    """Build the /invoke request body for speech-to-text."""
+    request_body = {
+        "task_type": TASK_TYPE_SPEECH_TO_TEXT,
+        "input": {"file_id": file_id},
+    }
+
+    # Add optional provider and model
+    if provider:
+        request_body["provider"] = provider
+    if model:
+        request_body["model"] = model
+
+    # Build configuration
+    config_params = {**kwargs}
+    if language:
+        config_params["language"] = language
+    if config_params:
+        request_body["config"] = config_params
+
+    return request_body
+
+
+def _parse_transcription(result: Dict[str, Any]) -> TranscriptionResponse:
+    """Convert a completed speech-to-text task into a TranscriptionResponse."""
+    output = result.get("output", {})
+
+    return TranscriptionResponse(
+        text=output.get("text", ""),
+        language=output.get("language"),
+        duration=output.get("duration"),
+        segments=output.get("segments"),
+    )
+
+
+def _build_synthesize_body(
+    text: str,
+    provider: Optional[str],
+    model: Optional[str],
+    voice: Optional[str],
+    **kwargs,
+) -> Dict[str, Any]:
+    """Build the /invoke request body for text-to-speech."""
+    request_body = {
+        "task_type": TASK_TYPE_TEXT_TO_SPEECH,
+        "input": {"text": text},
+    }
+
+    if provider:
+        request_body["provider"] = provider
+    if model:
+        request_body["model"] = model
+
+    # Build configuration
+    config_params = {**kwargs}
+    if voice:
+        config_params["voice"] = voice
+    if config_params:
+        request_body["config"] = config_params
+
+    return request_body
+
+
+def _parse_tts(result: Dict[str, Any]) -> TTSResponse:
+    """Convert a completed text-to-speech task into a TTSResponse."""
+    output = result.get("output", {})
+
+    return TTSResponse(
+        audio_url=output.get("audio_url", ""),
+        duration=output.get("duration"),
+    )
 
 
 class AudioResource:
@@ -29,6 +109,7 @@ class AudioResource:
         provider: Optional[str] = None,
         model: Optional[str] = None,
         language: Optional[str] = None,
+        candidates: Optional[Sequence[CandidateSpec]] = None,
         **kwargs,
     ) -> TranscriptionResponse:
         """
@@ -45,6 +126,11 @@ class AudioResource:
                   If not specified, uses default model.
             language: Language code (e.g., "zh", "en"). If not specified,
                      auto-detects language.
+            candidates: Provider/model candidates to route between instead of
+                       provider and model: provider names, (provider, model)
+                       or (provider, model, weight) tuples. Each call goes
+                       to the fastest healthy candidate and falls back to
+                       the next one if it fails.
             **kwargs: Additional model configuration parameters
 
         Returns:
@@ -79,45 +165,26 @@ class AudioResource:
             print(f"Duration: {transcription.duration}s")
             ```
         """
-        # Build request body
-        request_body = {
-            "task_type": TASK_TYPE_SPEECH_TO_TEXT,
-            "input": {"file_id": file_id},
-        }
-
-        # Add optional provider and model
-        if provider:
-            request_body["provider"] = provider
-        if model:
-            request_body["model"] = model
-
-        # Build configuration
-        config_params = {**kwargs}
-        if language:
-            config_params["language"] = language
-        if config_params:
-            request_body["config"] = config_params
-
-        # Submit async task (ASR is typically async)
-        response = self._client.request(
-            "POST",
-            "/invoke",
-            json_data=request_body,
-            headers={"Prefer": "respond-async"},
-        )
 
-        # Parse task and poll
-        task = Task(**response)
-        result = self._poller.poll(task.task_id)
+        def transcribe(provider: Optional[str], model: Optional[str]) -> TranscriptionResponse:
+            request_body = _build_transcribe_body(file_id, provider, model, language, **kwargs)
+
+            # Submit async task (ASR is typically async)
+            response = self._client.request(
+                "POST",
+                "/invoke",
+                json_data=request_body,
+                headers={"Prefer": "respond-async"},
+            )
+
+            # Parse task and poll
+            task = Task(**response)
+            result = self._poller.poll(task.task_id)
 
-        # Parse result
-        output = result.get("output", {})
+            return _parse_transcription(result)
 
-        return TranscriptionResponse(
-            text=output.get("text", ""),
-            language=output.get("language"),
-            duration=output.get("duration"),
-            segments=output.get("segments"),
+        return self._client.router.call(
+            TASK_TYPE_SPEECH_TO_TEXT, candidates, transcribe, provider, model
         )
 
     def synthesize(
@@ -160,23 +227,7 @@ class AudioResource:
             )
             ```
         """
-        # Build request body
-        request_body = {
-            "task_type": "text_to_speech",
-            "input": {"text": text},
-        }
-
-        if provider:
-            request_body["provider"] = provider
-        if model:
-            request_body["model"] = model
-
-        # Build configuration
-        config_params = {**kwargs}
-        if voice:
-            config_params["voice"] = voice
-        if config_params:
-            request_body["config"] = config_params
+        request_body = _build_synthesize_body(text, provider, model, voice, **kwargs)
 
         # Submit async task
         response = self._client.request(
@@ -190,10 +241,147 @@ class AudioResource:
         task = Task(**response)
         result = self._poller.poll(task.task_id)
 
-        # Parse result
-        output = result.get("output", {})
+        return _parse_tts(result)
+
+
+class AsyncAudioResource:
+    """
+    Asynchronous audio processing resource.
+
+    Mirrors AudioResource; task polling awaits instead of sleeping a thread.
+    """
+
+    def __init__(self, client):
+        """
+        Initialize async audio resource.
+
+        Args:
+            client: AsyncInternalClient instance
+        """
+        self._client = client
+        self._poller = AsyncTaskPoller(client)
+
+    async def transcribe(
+        self,
+        file_id: str,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        language: Optional[str] = None,
+        candidates: Optional[Sequence[CandidateSpec]] = None,
+        **kwargs,
+    ) -> TranscriptionResponse:
+        """
+        Transcribe audio to text (Speech-to-Text / ASR).
+
+        Accepts the same arguments as AudioResource.transcribe().
 
-        return TTSResponse(
-            audio_url=output.get("audio_url", ""),
-            duration=output.get("duration"),
+        Returns:
+            TranscriptionResponse with transcribed text
+
+        Raises:
+            InvalidRequestError: If file_id is invalid
+            NotFoundError: If file doesn't exist
+            APITimeoutError: If transcription times out
+            APIError: If transcription fails
+        """
+
+        async def transcribe(
+            provider: Optional[str], model: Optional[str]
+        ) -> TranscriptionResponse:
+            handle = await self.submit_transcription(file_id, provider, model, language, **kwargs)
+            return await handle
+
+        return await self._client.router.acall(
+            TASK_TYPE_SPEECH_TO_TEXT, candidates, transcribe, provider, model
         )
+
+    async def submit_transcription(
+        self,
+        file_id: str,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        language: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncTaskHandle:
+        """
+        Submit a transcription task without waiting for it.
+
+        Long recordings can take minutes to transcribe; the returned handle
+        polls on the event loop so thousands can be tracked by one process.
+
+        Accepts the same arguments as transcribe().
+
+        Returns:
+            AsyncTaskHandle resolving to a TranscriptionResponse
+
+        Raises:
+            InvalidRequestError: If file_id is invalid
+            APIError: If submission fails
+        """
+        request_body = _build_transcribe_body(file_id, provider, model, language, **kwargs)
+
+        response = await self._client.request(
+            "POST",
+            "/invoke",
+            json_data=request_body,
+            headers={"Prefer": "respond-async"},
+        )
+
+        task = Task(**response)
+        return self._poller.start(task.task_id, parser=_parse_transcription)
+
+    async def synthesize(
+        self,
+        text: str,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        voice: Optional[str] = None,
+        **kwargs,
+    ) -> TTSResponse:
+        """
+        Synthesize speech from text (Text-to-Speech / TTS).
+
+        Accepts the same arguments as AudioResource.synthesize().
+
+        Returns:
+            TTSResponse with audio URL
+
+        Raises:
+            InvalidRequestError: If text is invalid
+            APITimeoutError: If synthesis times out
+            APIError: If synthesis fails
+        """
+        handle = await self.submit_synthesis(text, provider, model, voice, **kwargs)
+        return await handle
+
+    async def submit_synthesis(
+        self,
+        text: str,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        voice: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncTaskHandle:
+        """
+        Submit a text-to-speech task without waiting for it.
+
+        Accepts the same arguments as synthesize().
+
+        Returns:
+            AsyncTaskHandle resolving to a TTSResponse
+
+        Raises:
+            InvalidRequestError: If text is invalid
+            APIError: If submission fails
+        """
+        request_body = _build_synthesize_body(text, provider, model, voice, **kwargs)
+
+        response = await self._client.request(
+            "POST",
+            "/invoke",
+            json_data=request_body,
+            headers={"Prefer": "respond-async"},
+        )
+
+        task = Task(**response)
+        return self._poller.start(task.task_id, parser=_parse_tts)
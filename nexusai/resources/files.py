@@ -1,8 +1,89 @@
 """File management resource module."""
 
-from typing import BinaryIO, Union, Dict, Any
+import asyncio
+from typing import BinaryIO, Union, Dict, Any, Optional, Tuple
 from pathlib import Path
 from nexusai.models import FileMetadata, FileListResponse
+from nexusai.config import config
+from nexusai.error import FileUploadError, NotFoundError
+from nexusai._internal._upload import AsyncUploadBody, UploadReader, ProgressCallback
+from nexusai._internal._multipart import ResumableUpload, UploadStateStore
+from nexusai._internal._batch import run_concurrently, arun_concurrently
+from nexusai.constants import (
+    DEFAULT_UPLOAD_CHUNK_SIZE,
+    DEFAULT_UPLOAD_PART_SIZE,
+    DEFAULT_UPLOAD_CONCURRENCY,
+    UPLOADS_ENDPOINT,
+)
+
+# Parts are sent as raw bytes
+_PART_HEADERS = {"Content-Type": "application/octet-stream"}
+
+
+def _open_upload(
+    file: Union[str, Path, BinaryIO], filename: Optional[str] = None
+) -> Tuple[BinaryIO, str, bool]:
+    """
+    Resolve an upload source into a file object.
+
+    Args:
+        file: File path (str or Path) or file-like object (BinaryIO)
+        filename: Optional filename override
+
+    Returns:
+        Tuple of (file object, filename, whether the caller must close it)
+
+    Raises:
+        FileNotFoundError: If a file path does not exist
+    """
+    # Handle different file input types
+    if isinstance(file, (str, Path)):
+        # File path
+        file_path = Path(file)
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file}")
+
+        return open(file_path, "rb"), filename or file_path.name, True
+
+    # File-like object
+    return file, filename or "upload", False
+
+
+def _content_key(client, file_obj: BinaryIO) -> Optional[str]:
+    """Hash an upload for the client's upload cache (None if caching is off)."""
+    if client.upload_cache is None:
+        return None
+    return client.upload_cache.content_key(file_obj, client.cache_namespace)
+
+
+def _path_content_key(client, path: Path) -> Optional[str]:
+    """Hash a file on disk for the client's upload cache."""
+    if client.upload_cache is None:
+        return None
+    with open(path, "rb") as f:
+        return _content_key(client, f)
+
+
+def _resumable_upload(
+    file: Union[str, Path],
+    filename: Optional[str],
+    part_size: int,
+    state_dir: Optional[Union[str, Path]],
+    progress_callback: Optional[ProgressCallback],
+) -> ResumableUpload:
+    """Create a resumable upload, picking up saved progress for the same file."""
+    store = UploadStateStore(state_dir or config.upload_state_dir)
+    return ResumableUpload(file, filename, part_size, store, progress_callback)
+
+
+def _parts_failed(upload: ResumableUpload, failures: list) -> FileUploadError:
+    """Build the error raised when some parts could not be sent."""
+    return FileUploadError(
+        f"{len(failures)} of {upload.part_count} parts failed to upload; "
+        "call upload_resumable() again with the same file to resume",
+        file_name=upload.filename,
+        file_size=upload.size,
+    )
 
 
 class FilesResource:
@@ -27,17 +108,27 @@ class FilesResource:
         self,
         file: Union[str, Path, BinaryIO],
         filename: str = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        use_mmap: bool = False,
     ) -> FileMetadata:
         """
         Upload a file to Nexus AI platform.
 
         The file receives a unique file_id that can be used for subsequent
         operations like speech-to-text, knowledge base ingestion, etc.
+        The body is streamed from disk in chunks, so memory use does not
+        grow with the file size.
 
         Args:
             file: File path (str or Path) or file-like object (BinaryIO)
             filename: Optional filename override. If not provided, uses
                      the filename from path or "upload" for file objects
+            progress_callback: Optional callback function(bytes_sent, total_bytes)
+                              called after each chunk; total_bytes is None if
+                              the size of a file object cannot be determined
+            chunk_size: Bytes read from the file per chunk (default: 1 MiB)
+            use_mmap: Read the file through a memory mapping (files on disk only)
 
         Returns:
             FileMetadata object containing file_id and metadata
@@ -62,50 +153,152 @@ class FilesResource:
             # Upload from file object
             with open("document.pdf", "rb") as f:
                 file_meta = client.files.upload(f, filename="document.pdf")
+
+            # Large file with progress reporting
+            client.files.upload(
+                "recording.wav",
+                progress_callback=lambda sent, total: print(f"{sent}/{total} bytes"),
+            )
             ```
         """
-        # Handle different file input types
-        if isinstance(file, (str, Path)):
-            # File path
-            file_path = Path(file)
-            if not file_path.exists():
-                raise FileNotFoundError(f"File not found: {file}")
-
-            file_obj = open(file_path, "rb")
-            actual_filename = filename or file_path.name
-            should_close = True
-        else:
-            # File-like object
-            file_obj = file
-            actual_filename = filename or "upload"
-            should_close = False
+        file_obj, actual_filename, should_close = _open_upload(file, filename)
+        reader = None
 
         try:
-            # Prepare multipart form data
-            files = {"file": (actual_filename, file_obj)}
+            # Skip the upload if the same content was uploaded before
+            cache_key = _content_key(self._client, file_obj)
+            if cache_key is not None:
+                cached = self._from_cache(cache_key)
+                if cached is not None:
+                    return cached
 
-            # Make request with httpx directly to avoid Content-Type: application/json
-            import httpx
+            # Prepare multipart form data, streamed chunk by chunk
+            reader = UploadReader(file_obj, chunk_size, progress_callback, use_mmap)
+            files = {"file": (actual_filename, reader)}
 
-            url = f"{self._client.base_url}/files"
-            headers = {
-                "Authorization": f"Bearer {self._client.api_key}",
-                "User-Agent": f"nexus-ai-python/0.1.0",
-                # Do NOT set Content-Type - let httpx set it automatically for multipart
-            }
+            # Send through the pooled client; httpx sets the multipart Content-Type
+            data = self._client.request("POST", "/files", files=files)
+            file_meta = FileMetadata(**data)
 
-            # Use a new httpx client instead of self._client.client to avoid default headers
-            with httpx.Client() as upload_client:
-                response = upload_client.post(url, files=files, headers=headers, timeout=self._client.timeout)
-                self._client._check_response_status(response)
-                data = response.json()
-
-            return FileMetadata(**data)
+            if cache_key is not None:
+                self._client.upload_cache.put(cache_key, file_meta)
+            return file_meta
 
         finally:
+            if reader is not None:
+                reader.close()
             if should_close:
                 file_obj.close()
 
+    def upload_resumable(
+        self,
+        file: Union[str, Path],
+        filename: Optional[str] = None,
+        part_size: int = DEFAULT_UPLOAD_PART_SIZE,
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        state_dir: Optional[Union[str, Path]] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> FileMetadata:
+        """
+        Upload a large file in parts that survive dropped connections.
+
+        The file is split into parts that are sent in parallel over the
+        pooled connection. Progress is saved to a local state file after
+        every part; calling this method again for the same, unchanged file
+        (even from a new process) sends only the missing parts. Once all
+        parts are in, the server assembles them into a single file.
+
+        Args:
+            file: Path of the file to upload
+            filename: Optional filename override (defaults to the file's name)
+            part_size: Bytes per part (default: 8 MiB). Up to `concurrency`
+                      parts are held in memory at once.
+            concurrency: Parts sent in parallel (default: 4)
+            state_dir: Directory for upload state (defaults to
+                      NEXUS_UPLOAD_STATE_DIR, ~/.nexusai/uploads)
+            progress_callback: Optional callback function(bytes_sent, total_bytes)
+                              called after each confirmed part
+
+        Returns:
+            FileMetadata of the assembled file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            FileUploadError: If some parts failed; progress is kept for resuming
+            APIError: If starting or completing the upload fails
+
+        Example:
+            ```python
+            try:
+                meta = client.files.upload_resumable("recording_2h.wav", concurrency=8)
+            except FileUploadError:
+                # Network dropped: the same call later resumes where it stopped
+                meta = client.files.upload_resumable("recording_2h.wav", concurrency=8)
+            print(meta.file_id)
+            ```
+        """
+        upload = _resumable_upload(file, filename, part_size, state_dir, progress_callback)
+
+        cache_key = _path_content_key(self._client, upload.path)
+        if cache_key is not None:
+            cached = self._from_cache(cache_key)
+            if cached is not None:
+                return cached
+
+        # Resume a saved upload if the server still has it
+        if upload.upload_id is not None:
+            try:
+                upload.sync_parts(self._client.request("GET", upload.upload_endpoint()))
+            except NotFoundError:
+                upload.reset()
+        if upload.upload_id is None:
+            upload.start(
+                self._client.request("POST", UPLOADS_ENDPOINT, json_data=upload.create_body())
+            )
+
+        def send_part(part_number: int) -> None:
+            response = self._client.request(
+                "PUT",
+                upload.part_endpoint(part_number),
+                content=upload.read_part(part_number),
+                headers=_PART_HEADERS,
+            )
+            upload.mark_done(part_number, response.get("etag"))
+
+        failures = [
+            result
+            for result in run_concurrently(
+                send_part, upload.pending_parts(), concurrency, ordered=False
+            )
+            if not result.ok
+        ]
+        if failures:
+            raise _parts_failed(upload, failures) from failures[0].error
+
+        data = self._client.request(
+            "POST", f"{upload.upload_endpoint()}/complete", json_data=upload.complete_body()
+        )
+        upload.finish()
+        file_meta = FileMetadata(**data)
+
+        if cache_key is not None:
+            self._client.upload_cache.put(cache_key, file_meta)
+        return file_meta
+
+    def _from_cache(self, cache_key: str) -> Optional[FileMetadata]:
+        """Return a previous upload of the same content, verified if configured."""
+        cache = self._client.upload_cache
+        file_meta = cache.get(cache_key)
+        if file_meta is None or not cache.verify:
+            return file_meta
+
+        try:
+            return self.get(file_meta.file_id)
+        except NotFoundError:
+            # Deleted on the server; upload again
+            cache.discard(cache_key)
+            return None
+
     def get(self, file_id: str) -> FileMetadata:
         """
         Get metadata for an uploaded file.
@@ -182,3 +375,208 @@ class FilesResource:
         """
         response = self._client.request("GET", f"/files?page={page}&per_page={per_page}")
         return FileListResponse(**response)
+
+
+class AsyncFilesResource:
+    """
+    Asynchronous file management resource.
+
+    Mirrors FilesResource with awaitable methods.
+    """
+
+    def __init__(self, client):
+        """
+        Initialize async files resource.
+
+        Args:
+            client: AsyncInternalClient instance
+        """
+        self._client = client
+
+    async def upload(
+        self,
+        file: Union[str, Path, BinaryIO],
+        filename: str = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        use_mmap: bool = False,
+    ) -> FileMetadata:
+        """
+        Upload a file to Nexus AI platform.
+
+        Accepts the same arguments as FilesResource.upload().
+
+        Returns:
+            FileMetadata object containing file_id and metadata
+
+        Raises:
+            InvalidRequestError: If file is invalid or too large
+            APIError: If upload fails
+        """
+        loop = asyncio.get_running_loop()
+        file_obj, actual_filename, should_close = await loop.run_in_executor(
+            None, _open_upload, file, filename
+        )
+        reader = None
+
+        try:
+            # Hash off the event loop; large files take a while
+            cache_key = await loop.run_in_executor(None, _content_key, self._client, file_obj)
+            if cache_key is not None:
+                cached = await self._from_cache(cache_key)
+                if cached is not None:
+                    return cached
+
+            # Map and read the file in the default executor too
+            reader = await loop.run_in_executor(
+                None, UploadReader, file_obj, chunk_size, None, use_mmap
+            )
+            body = AsyncUploadBody(reader, actual_filename, progress_callback)
+            data = await self._client.request("POST", "/files", content=body, headers=body.headers)
+            file_meta = FileMetadata(**data)
+
+            if cache_key is not None:
+                self._client.upload_cache.put(cache_key, file_meta)
+            return file_meta
+
+        finally:
+            if reader is not None:
+                reader.close()
+            if should_close:
+                file_obj.close()
+
+    async def upload_resumable(
+        self,
+        file: Union[str, Path],
+        filename: Optional[str] = None,
+        part_size: int = DEFAULT_UPLOAD_PART_SIZE,
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        state_dir: Optional[Union[str, Path]] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> FileMetadata:
+        """
+        Upload a large file in parts that survive dropped connections.
+
+        Accepts the same arguments as FilesResource.upload_resumable() and
+        shares its local upload state. Parts are read from disk in the
+        default executor so the event loop is not blocked.
+
+        Returns:
+            FileMetadata of the assembled file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            FileUploadError: If some parts failed; progress is kept for resuming
+            APIError: If starting or completing the upload fails
+        """
+        upload = _resumable_upload(file, filename, part_size, state_dir, progress_callback)
+        loop = asyncio.get_running_loop()
+
+        cache_key = await loop.run_in_executor(None, _path_content_key, self._client, upload.path)
+        if cache_key is not None:
+            cached = await self._from_cache(cache_key)
+            if cached is not None:
+                return cached
+
+        if upload.upload_id is not None:
+            try:
+                upload.sync_parts(await self._client.request("GET", upload.upload_endpoint()))
+            except NotFoundError:
+                upload.reset()
+        if upload.upload_id is None:
+            upload.start(
+                await self._client.request(
+                    "POST", UPLOADS_ENDPOINT, json_data=upload.create_body()
+                )
+            )
+
+        async def send_part(part_number: int) -> None:
+            content = await loop.run_in_executor(None, upload.read_part, part_number)
+            response = await self._client.request(
+                "PUT", upload.part_endpoint(part_number), content=content, headers=_PART_HEADERS
+            )
+            upload.mark_done(part_number, response.get("etag"))
+
+        failures = [
+            result
+            async for result in arun_concurrently(
+                send_part, upload.pending_parts(), concurrency, ordered=False
+            )
+            if not result.ok
+        ]
+        if failures:
+            raise _parts_failed(upload, failures) from failures[0].error
+
+        data = await self._client.request(
+            "POST", f"{upload.upload_endpoint()}/complete", json_data=upload.complete_body()
+        )
+        upload.finish()
+        file_meta = FileMetadata(**data)
+
+        if cache_key is not None:
+            self._client.upload_cache.put(cache_key, file_meta)
+        return file_meta
+
+    async def _from_cache(self, cache_key: str) -> Optional[FileMetadata]:
+        """Return a previous upload of the same content, verified if configured."""
+        cache = self._client.upload_cache
+        file_meta = cache.get(cache_key)
+        if file_meta is None or not cache.verify:
+            return file_meta
+
+        try:
+            return await self.get(file_meta.file_id)
+        except NotFoundError:
+            cache.discard(cache_key)
+            return None
+
+    async def get(self, file_id: str) -> FileMetadata:
+        """
+        Get metadata for an uploaded file.
+
+        Args:
+            file_id: Unique file identifier
+
+        Returns:
+            FileMetadata object
+
+        Raises:
+            NotFoundError: If file doesn't exist
+            APIError: If retrieval fails
+        """
+        response = await self._client.request("GET", f"/files/{file_id}")
+        return FileMetadata(**response)
+
+    async def delete(self, file_id: str) -> Dict[str, Any]:
+        """
+        Delete an uploaded file.
+
+        Args:
+            file_id: Unique file identifier
+
+        Returns:
+            Dictionary with deletion confirmation
+
+        Raises:
+            NotFoundError: If file doesn't exist
+            APIError: If deletion fails
+        """
+        return await self._client.request("DELETE", f"/files/{file_id}")
+
+    async def list(self, page: int = 1, per_page: int = 20) -> FileListResponse:
+        """
+        List all files uploaded by current API key.
+
+        Args:
+            page: Page number (default: 1)
+            per_page: Items per page, max 100 (default: 20)
+
+        Returns:
+            FileListResponse with files list and pagination info
+
+        Raises:
+            InvalidRequestError: If pagination parameters are invalid
+            APIError: If retrieval fails
+        """
+        response = await self._client.request("GET", f"/files?page={page}&per_page={per_page}")
+        return FileListResponse(**response)
@@ -1,11 +1,51 @@
 """Image generation resource module."""
 
-from typing import Optional
+from typing import Optional, Dict, Any, Sequence
 from nexusai.models import Image, Task
-from nexusai._internal._poller import TaskPoller
+from nexusai._internal._poller import TaskPoller, AsyncTaskPoller, AsyncTaskHandle
+from nexusai._internal._routing import CandidateSpec
 from nexusai.constants import TASK_TYPE_IMAGE_GENERATION
 
 
+def _build_request_body(
+    prompt: str,
+    provider: Optional[str],
+    model: Optional[str],
+    size: str,
+    quality: str,
+    **kwargs,
+) -> Dict[str, Any]:
+    """Build the /invoke request body for image generation."""
+    request_body = {
+        "task_type": TASK_TYPE_IMAGE_GENERATION,
+        "input": {"prompt": prompt},
+    }
+
+    # Add optional provider and model
+    if provider:
+        request_body["provider"] = provider
+    if model:
+        request_body["model"] = model
+
+    # Merge configuration parameters
+    config_params = {"size": size, "quality": quality, **kwargs}
+    request_body["config"] = config_params
+
+    return request_body
+
+
+def _parse_image(result: Dict[str, Any]) -> Image:
+    """Extract image information from a completed task payload."""
+    output = result.get("output", {})
+
+    return Image(
+        image_url=output.get("image_url", ""),
+        width=output.get("width", 0),
+        height=output.get("height", 0),
+        revised_prompt=output.get("revised_prompt"),
+    )
+
+
 class ImagesResource:
     """
     Image generation resource.
@@ -30,6 +70,7 @@ class ImagesResource:
         model: Optional[str] = None,
         size: str = "1024x1024",
         quality: str = "standard",
+        candidates: Optional[Sequence[CandidateSpec]] = None,
         **kwargs,
     ) -> Image:
         """
@@ -47,6 +88,11 @@ class ImagesResource:
             size: Image size (e.g., "512x512", "1024x1024", "1920x1080").
                  Default: "1024x1024"
             quality: Image quality ("standard" or "hd"). Default: "standard"
+            candidates: Provider/model candidates to route between instead of
+                       provider and model: provider names, (provider, model)
+                       or (provider, model, weight) tuples. Each call goes
+                       to the fastest healthy candidate and falls back to
+                       the next one if it fails.
             **kwargs: Additional model configuration parameters
 
         Returns:
@@ -79,42 +125,125 @@ class ImagesResource:
             print(f"Dimensions: {image.width}x{image.height}")
             ```
         """
-        # Build request body
-        request_body = {
-            "task_type": TASK_TYPE_IMAGE_GENERATION,
-            "input": {"prompt": prompt},
-        }
-
-        # Add optional provider and model
-        if provider:
-            request_body["provider"] = provider
-        if model:
-            request_body["model"] = model
-
-        # Merge configuration parameters
-        config_params = {"size": size, "quality": quality, **kwargs}
-        request_body["config"] = config_params
+
+        def generate(provider: Optional[str], model: Optional[str]) -> Image:
+            request_body = _build_request_body(prompt, provider, model, size, quality, **kwargs)
+
+            # Submit async task with Prefer header
+            response = self._client.request(
+                "POST",
+                "/invoke",
+                json_data=request_body,
+                headers={"Prefer": "respond-async"},
+            )
+
+            # Parse task response
+            task = Task(**response)
+
+            # Poll task until completion
+            result = self._poller.poll(task.task_id)
+
+            return _parse_image(result)
+
+        return self._client.router.call(
+            TASK_TYPE_IMAGE_GENERATION, candidates, generate, provider, model
+        )
+
+
+class AsyncImagesResource:
+    """
+    Asynchronous image generation resource.
+
+    Mirrors ImagesResource; task polling awaits instead of sleeping a thread.
+    """
+
+    def __init__(self, client):
+        """
+        Initialize async images resource.
+
+        Args:
+            client: AsyncInternalClient instance
+        """
+        self._client = client
+        self._poller = AsyncTaskPoller(client)
+
+    async def generate(
+        self,
+        prompt: str,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        size: str = "1024x1024",
+        quality: str = "standard",
+        candidates: Optional[Sequence[CandidateSpec]] = None,
+        **kwargs,
+    ) -> Image:
+        """
+        Generate an image and await its completion.
+
+        Accepts the same arguments as ImagesResource.generate().
+
+        Returns:
+            Image object containing the generated image URL and metadata
+
+        Raises:
+            InvalidRequestError: If request parameters are invalid
+            APITimeoutError: If image generation times out
+            APIError: If generation fails
+
+        Example:
+            ```python
+            image = await client.images.generate("A beautiful sunset over mountains")
+            print(f"Image URL: {image.image_url}")
+            ```
+        """
+
+        async def generate(provider: Optional[str], model: Optional[str]) -> Image:
+            handle = await self.submit(prompt, provider, model, size, quality, **kwargs)
+            return await handle
+
+        return await self._client.router.acall(
+            TASK_TYPE_IMAGE_GENERATION, candidates, generate, provider, model
+        )
+
+    async def submit(
+        self,
+        prompt: str,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        size: str = "1024x1024",
+        quality: str = "standard",
+        **kwargs,
+    ) -> AsyncTaskHandle:
+        """
+        Submit an image generation task without waiting for it.
+
+        The returned handle polls the task on the event loop and resolves
+        to an Image, so many generations can be kept in flight at once.
+
+        Accepts the same arguments as generate().
+
+        Returns:
+            AsyncTaskHandle resolving to an Image
+
+        Raises:
+            InvalidRequestError: If request parameters are invalid
+            APIError: If submission fails
+
+        Example:
+            ```python
+            handles = [await client.images.submit(p) for p in prompts]
+            images = await asyncio.gather(*handles)
+            ```
+        """
+        request_body = _build_request_body(prompt, provider, model, size, quality, **kwargs)
 
         # Submit async task with Prefer header
-        response = self._client.request(
+        response = await self._client.request(
             "POST",
             "/invoke",
             json_data=request_body,
             headers={"Prefer": "respond-async"},
         )
 
-        # Parse task response
         task = Task(**response)
-
-        # Poll task until completion
-        result = self._poller.poll(task.task_id)
-
-        # Extract image information from output
-        output = result.get("output", {})
-
-        return Image(
-            image_url=output.get("image_url", ""),
-            width=output.get("width", 0),
-            height=output.get("height", 0),
-            revised_prompt=output.get("revised_prompt"),
-        )
+        return self._poller.start(task.task_id, parser=_parse_image)
@@ -1,9 +1,139 @@
 """Knowledge base management resource module."""
 
-from typing import List, Optional, Union, BinaryIO
+import asyncio
+from typing import (
+    List,
+    Dict,
+    Optional,
+    Union,
+    BinaryIO,
+    Any,
+    Iterable,
+    Iterator,
+    AsyncIterator,
+    Tuple,
+)
 from pathlib import Path
-from nexusai.models import KnowledgeBase, DocumentMetadata, SearchResponse, Task
-from nexusai._internal._poller import TaskPoller
+from pydantic import TypeAdapter
+from nexusai.models import KnowledgeBase, DocumentMetadata, SearchResponse, Task, BatchResult
+from nexusai.error import APIError
+from nexusai._internal._poller import TaskPoller, AsyncTaskPoller
+from nexusai._internal._batch import run_concurrently, arun_concurrently
+from nexusai._internal._ingest import (
+    IngestCheckpoint,
+    Document,
+    iter_documents,
+    STAGE_UPLOADED,
+    STAGE_ADDED,
+    STAGE_COMPLETED,
+)
+from nexusai.constants import DEFAULT_BATCH_CONCURRENCY
+
+# Listings are validated in one pydantic-core call rather than one per item
+_KNOWLEDGE_BASES = TypeAdapter(List[KnowledgeBase])
+_DOCUMENTS = TypeAdapter(List[DocumentMetadata])
+
+
+def _parse_knowledge_bases(response: Any) -> List[KnowledgeBase]:
+    """Convert a knowledge base listing payload into KnowledgeBase objects."""
+    # Response is a list of knowledge bases
+    if isinstance(response, list):
+        return _KNOWLEDGE_BASES.validate_python(response)
+    else:
+        # Fallback if wrapped in object
+        return _KNOWLEDGE_BASES.validate_python(response.get("knowledge_bases", []))
+
+
+def _parse_documents(response: Any) -> List[DocumentMetadata]:
+    """Convert a document listing payload into DocumentMetadata objects."""
+    # Response is a list of documents
+    if isinstance(response, list):
+        return _DOCUMENTS.validate_python(response)
+    else:
+        return _DOCUMENTS.validate_python(response.get("documents", []))
+
+
+def _is_processing_failure(error: Exception) -> bool:
+    """Whether an error from wait_for_processing() is a failed task (not a failed request)."""
+    # The poller raises a plain APIError for a task that failed on the server
+    return type(error) is APIError
+
+
+def _resume_point(checkpoint: IngestCheckpoint, key: Optional[str], wait: bool):
+    """
+    Look up where a document left off.
+
+    Returns:
+        Tuple of (stage reached or None, checkpoint record or {})
+    """
+    record = checkpoint.get(key) or {}
+    stage = record.get("stage")
+    if stage == STAGE_ADDED and not wait:
+        # Nothing left to do without waiting for processing
+        stage = STAGE_COMPLETED
+    return stage, record
+
+
+def _closing(results: Iterator[BatchResult], checkpoint: IngestCheckpoint):
+    """Yield ingest results, closing the checkpoint file when done."""
+    try:
+        yield from results
+    finally:
+        checkpoint.close()
+
+
+async def _aclosing(results: AsyncIterator[BatchResult], checkpoint: IngestCheckpoint):
+    """Async counterpart of _closing()."""
+    try:
+        async for result in results:
+            yield result
+    finally:
+        checkpoint.close()
+
+
+def _search_scope(client: Any, request_body: Dict[str, Any]) -> Optional[str]:
+    """Scope of a search in the client's search cache, or None without a cache."""
+    cache = client.search_cache
+    if cache is None:
+        return None
+    return cache.scope(
+        request_body["knowledge_base_ids"],
+        request_body["top_k"],
+        request_body["similarity_threshold"],
+        client.cache_namespace,
+    )
+
+
+def _cached_search(client: Any, scope: Optional[str], query: str) -> Optional[SearchResponse]:
+    """Look up a search in the client's search cache."""
+    if scope is None:
+        return None
+    cached = client.search_cache.get(scope, query)
+    if cached is None:
+        return None
+    # The entry may be for a differently written query
+    return SearchResponse(**{**cached, "query": query})
+
+
+def _lookup_search(
+    client: Any, request_body: Dict[str, Any]
+) -> Tuple[Optional[str], Optional[SearchResponse]]:
+    """Scope of a search in the client's search cache and its cached response."""
+    scope = _search_scope(client, request_body)
+    return scope, _cached_search(client, scope, request_body["query"])
+
+
+def _invalidate_searches(client: Any, kb_id: Optional[str]) -> None:
+    """Make cached searches over a knowledge base misses after it changed."""
+    if kb_id is not None and client.search_cache is not None:
+        client.search_cache.invalidate(kb_id, client.cache_namespace)
+
+
+async def _ainvalidate_searches(client: Any, kb_id: Optional[str]) -> None:
+    """Invalidate searches like _invalidate_searches(), off the event loop."""
+    if kb_id is not None and client.search_cache is not None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _invalidate_searches, client, kb_id)
 
 
 class KnowledgeBasesResource:
@@ -23,6 +153,8 @@ class KnowledgeBasesResource:
         """
         self._client = client
         self._poller = TaskPoller(client)
+        # Knowledge base of each document task, to invalidate searches when it finishes
+        self._processing: Dict[str, str] = {}
 
     def create(
         self,
@@ -125,13 +257,7 @@ class KnowledgeBasesResource:
             ```
         """
         response = self._client.request("GET", "/knowledge-bases")
-
-        # Response is a list of knowledge bases
-        if isinstance(response, list):
-            return [KnowledgeBase(**kb) for kb in response]
-        else:
-            # Fallback if wrapped in object
-            return [KnowledgeBase(**kb) for kb in response.get("knowledge_bases", [])]
+        return _parse_knowledge_bases(response)
 
     def delete(self, kb_id: str) -> dict:
         """
@@ -153,7 +279,9 @@ class KnowledgeBasesResource:
             print(result["message"])
             ```
         """
-        return self._client.request("DELETE", f"/knowledge-bases/{kb_id}")
+        result = self._client.request("DELETE", f"/knowledge-bases/{kb_id}")
+        _invalidate_searches(self._client, kb_id)
+        return result
 
     def upload_document(
         self,
@@ -193,14 +321,9 @@ class KnowledgeBasesResource:
             )
             print(f"Task ID: {task.task_id}")
 
-            # Poll for completion
-            from time import sleep
-            while True:
-                result = client._internal_client.request("GET", f"/tasks/{task.task_id}")
-                if result["status"] == "completed":
-                    print("Document processed successfully!")
-                    break
-                sleep(2)
+            # Wait for processing to complete
+            client.knowledge_bases.wait_for_processing(task.task_id)
+            print("Document processed successfully!")
             ```
         """
         # Step 1: Upload file to unified file system
@@ -212,6 +335,104 @@ class KnowledgeBasesResource:
         # Step 2: Add file_id to knowledge base
         return self.add_document(kb_id=kb_id, file_id=file_meta.file_id)
 
+    def ingest(
+        self,
+        kb_id: str,
+        documents: Union[str, Path, Iterable[Document]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        checkpoint: Optional[Union[str, Path]] = None,
+        wait: bool = True,
+        ordered: bool = False,
+    ) -> Iterator[BatchResult]:
+        """
+        Add many documents to a knowledge base.
+
+        Every document is uploaded, added to the knowledge base and, with
+        wait=True, followed until processing finishes. A pool of worker
+        threads carries documents through these stages, so while one
+        document is being uploaded others are being added or processed.
+        Documents are read lazily, so the source may be very large.
+
+        With a checkpoint file, each stage a document reaches is recorded;
+        running the same ingestion again after a crash skips finished
+        documents and continues the others from their last stage instead
+        of uploading them again.
+
+        Args:
+            kb_id: Knowledge base ID
+            documents: Directory (every file below it), file path, or
+                      iterable of file paths and file-like objects
+            concurrency: Maximum number of documents in flight. Waiting for
+                        processing occupies a slot; enable batch_polling on
+                        the client to share one status poller between them.
+            checkpoint: Optional JSON Lines file recording progress
+            wait: Wait for document processing to finish (default) or stop
+                 once the document is queued for processing
+            ordered: Yield results in completion order (default) or input order
+
+        Returns:
+            Iterator of BatchResult whose result is the document's Task
+            (completed, or queued with wait=False). A failed document has
+            `error` set; it does not stop the rest of the ingestion.
+
+        Raises:
+            ValueError: If concurrency is less than 1
+
+        Example:
+            ```python
+            results = client.knowledge_bases.ingest(
+                "kb_xyz789abc123",
+                "corpus/",
+                concurrency=16,
+                checkpoint="corpus.ingest.jsonl",
+            )
+            for item in results:
+                if not item.ok:
+                    print(item.input, "failed:", item.error)
+            ```
+        """
+        from nexusai.resources.files import FilesResource, _open_upload
+
+        files_resource = FilesResource(self._client)
+        progress = IngestCheckpoint(checkpoint)
+
+        def ingest_one(document: Document) -> Task:
+            file_obj, filename, should_close = _open_upload(document)
+            try:
+                key = progress.key(kb_id, file_obj)
+                stage, record = _resume_point(progress, key, wait)
+                if stage == STAGE_COMPLETED:
+                    return Task(**record["task"])
+                if stage is None:
+                    file_id = files_resource.upload(file_obj, filename=filename).file_id
+                    progress.record(key, STAGE_UPLOADED, file_id, source=filename)
+                else:
+                    file_id = record["file_id"]
+            finally:
+                if should_close:
+                    file_obj.close()
+
+            if stage == STAGE_ADDED:
+                task = Task(**record["task"])
+            else:
+                task = self.add_document(kb_id=kb_id, file_id=file_id)
+                progress.record(key, STAGE_ADDED, file_id, task, filename)
+            if not wait:
+                return task
+
+            try:
+                task = self.wait_for_processing(task.task_id)
+            except APIError as error:
+                if _is_processing_failure(error):
+                    # Add the uploaded file again when resuming
+                    progress.record(key, STAGE_UPLOADED, file_id, source=filename)
+                raise
+            progress.record(key, STAGE_COMPLETED, file_id, task, filename)
+            return task
+
+        results = run_concurrently(ingest_one, iter_documents(documents), concurrency, ordered)
+        return _closing(results, progress)
+
     def add_document(self, kb_id: str, file_id: str) -> Task:
         """
         Add an already-uploaded file to a knowledge base.
@@ -257,7 +478,42 @@ class KnowledgeBasesResource:
             "POST", f"/knowledge-bases/{kb_id}/documents", json_data=request_body
         )
 
-        return Task(**response)
+        task = Task(**response)
+        _invalidate_searches(self._client, kb_id)
+        if self._client.search_cache is not None:
+            self._processing[task.task_id] = kb_id
+        return task
+
+    def wait_for_processing(self, task_id: str) -> Task:
+        """
+        Wait for a document processing task to finish.
+
+        With batch polling enabled on the client, the task is checked together
+        with every other pending task instead of in its own polling loop.
+
+        Args:
+            task_id: Task ID returned by upload_document() or add_document()
+
+        Returns:
+            Completed Task object
+
+        Raises:
+            APITimeoutError: If processing exceeds the polling timeout
+            APIError: If document processing fails
+
+        Example:
+            ```python
+            task = client.knowledge_bases.add_document(kb_id="kb_xyz789abc123", file_id=file_id)
+            done = client.knowledge_bases.wait_for_processing(task.task_id)
+            print(done.status)  # "completed"
+            ```
+        """
+        try:
+            result = self._poller.poll(task_id)
+        finally:
+            # Searches cached while the document was processing are outdated
+            _invalidate_searches(self._client, self._processing.pop(task_id, None))
+        return Task(**result)
 
     def list_documents(self, kb_id: str) -> List[DocumentMetadata]:
         """
@@ -281,12 +537,7 @@ class KnowledgeBasesResource:
             ```
         """
         response = self._client.request("GET", f"/knowledge-bases/{kb_id}/documents")
-
-        # Response is a list of documents
-        if isinstance(response, list):
-            return [DocumentMetadata(**doc) for doc in response]
-        else:
-            return [DocumentMetadata(**doc) for doc in response.get("documents", [])]
+        return _parse_documents(response)
 
     def search(
         self,
@@ -298,6 +549,9 @@ class KnowledgeBasesResource:
         """
         Perform semantic search across knowledge bases.
 
+        With a search cache on the client, repeated searches are answered
+        locally until a document is added to one of the knowledge bases.
+
         Args:
             query: Search query text
             knowledge_base_ids: List of knowledge base IDs to search
@@ -340,10 +594,337 @@ class KnowledgeBasesResource:
             "similarity_threshold": similarity_threshold,
         }
 
+        scope, cached = _lookup_search(self._client, request_body)
+        if cached is not None:
+            return cached
+
         response = self._client.request(
             "POST",
             "/knowledge-bases/search",
             json_data=request_body,
         )
 
+        if scope is not None:
+            self._client.search_cache.put(scope, query, response)
+        return SearchResponse(**response)
+
+
+class AsyncKnowledgeBasesResource:
+    """
+    Asynchronous knowledge base management resource.
+
+    Mirrors KnowledgeBasesResource with awaitable methods.
+    """
+
+    def __init__(self, client):
+        """
+        Initialize async knowledge bases resource.
+
+        Args:
+            client: AsyncInternalClient instance
+        """
+        self._client = client
+        self._poller = AsyncTaskPoller(client)
+        self._processing: Dict[str, str] = {}
+
+    async def create(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        embedding_model: str = "BAAI/bge-base-zh-v1.5",
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+    ) -> KnowledgeBase:
+        """
+        Create a new knowledge base.
+
+        Accepts the same arguments as KnowledgeBasesResource.create().
+
+        Returns:
+            KnowledgeBase object
+
+        Raises:
+            InvalidRequestError: If parameters are invalid
+            APIError: If creation fails
+        """
+        request_body = {
+            "name": name,
+            "embedding_model": embedding_model,
+            "chunk_size": chunk_size,
+            "chunk_overlap": chunk_overlap,
+        }
+
+        if description:
+            request_body["description"] = description
+
+        response = await self._client.request(
+            "POST",
+            "/knowledge-bases",
+            json_data=request_body,
+        )
+
+        return KnowledgeBase(**response)
+
+    async def get(self, kb_id: str) -> KnowledgeBase:
+        """
+        Get knowledge base details.
+
+        Args:
+            kb_id: Knowledge base ID
+
+        Returns:
+            KnowledgeBase object
+
+        Raises:
+            NotFoundError: If knowledge base doesn't exist
+            APIError: If retrieval fails
+        """
+        response = await self._client.request("GET", f"/knowledge-bases/{kb_id}")
+        return KnowledgeBase(**response)
+
+    async def list(self) -> List[KnowledgeBase]:
+        """
+        List all knowledge bases.
+
+        Returns:
+            List of KnowledgeBase objects
+
+        Raises:
+            APIError: If retrieval fails
+        """
+        response = await self._client.request("GET", "/knowledge-bases")
+        return _parse_knowledge_bases(response)
+
+    async def delete(self, kb_id: str) -> dict:
+        """
+        Delete a knowledge base and all its documents.
+
+        Args:
+            kb_id: Knowledge base ID
+
+        Returns:
+            Deletion confirmation dictionary
+
+        Raises:
+            NotFoundError: If knowledge base doesn't exist
+            APIError: If deletion fails
+        """
+        result = await self._client.request("DELETE", f"/knowledge-bases/{kb_id}")
+        await _ainvalidate_searches(self._client, kb_id)
+        return result
+
+    async def upload_document(
+        self,
+        kb_id: str,
+        file: Union[str, Path, BinaryIO],
+        filename: Optional[str] = None,
+    ) -> Task:
+        """
+        Upload a document to a knowledge base.
+
+        Accepts the same arguments as KnowledgeBasesResource.upload_document().
+
+        Returns:
+            Task object with queued document processing task
+
+        Raises:
+            InvalidRequestError: If file is invalid
+            NotFoundError: If knowledge base doesn't exist
+            APIError: If upload fails
+        """
+        # Step 1: Upload file to unified file system
+        from nexusai.resources.files import AsyncFilesResource
+
+        files_resource = AsyncFilesResource(self._client)
+        file_meta = await files_resource.upload(file=file, filename=filename)
+
+        # Step 2: Add file_id to knowledge base
+        return await self.add_document(kb_id=kb_id, file_id=file_meta.file_id)
+
+    def ingest(
+        self,
+        kb_id: str,
+        documents: Union[str, Path, Iterable[Document]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        checkpoint: Optional[Union[str, Path]] = None,
+        wait: bool = True,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Add many documents to a knowledge base.
+
+        Accepts the same arguments as KnowledgeBasesResource.ingest().
+        Documents are carried through the stages by tasks on the event
+        loop; files are opened and hashed in the default executor.
+
+        Returns:
+            Async iterator of BatchResult, one per document
+
+        Raises:
+            ValueError: If concurrency is less than 1
+
+        Example:
+            ```python
+            async for item in client.knowledge_bases.ingest("kb_xyz789abc123", paths):
+                print(item.input, item.ok)
+            ```
+        """
+        from nexusai.resources.files import AsyncFilesResource, _open_upload
+
+        files_resource = AsyncFilesResource(self._client)
+        progress = IngestCheckpoint(checkpoint)
+
+        def open_document(document: Document):
+            file_obj, filename, should_close = _open_upload(document)
+            return file_obj, filename, should_close, progress.key(kb_id, file_obj)
+
+        async def ingest_one(document: Document) -> Task:
+            loop = asyncio.get_running_loop()
+            file_obj, filename, should_close, key = await loop.run_in_executor(
+                None, open_document, document
+            )
+            try:
+                stage, record = _resume_point(progress, key, wait)
+                if stage == STAGE_COMPLETED:
+                    return Task(**record["task"])
+                if stage is None:
+                    file_meta = await files_resource.upload(file_obj, filename=filename)
+                    file_id = file_meta.file_id
+                    progress.record(key, STAGE_UPLOADED, file_id, source=filename)
+                else:
+                    file_id = record["file_id"]
+            finally:
+                if should_close:
+                    file_obj.close()
+
+            if stage == STAGE_ADDED:
+                task = Task(**record["task"])
+            else:
+                task = await self.add_document(kb_id=kb_id, file_id=file_id)
+                progress.record(key, STAGE_ADDED, file_id, task, filename)
+            if not wait:
+                return task
+
+            try:
+                task = await self.wait_for_processing(task.task_id)
+            except APIError as error:
+                if _is_processing_failure(error):
+                    progress.record(key, STAGE_UPLOADED, file_id, source=filename)
+                raise
+            progress.record(key, STAGE_COMPLETED, file_id, task, filename)
+            return task
+
+        results = arun_concurrently(ingest_one, iter_documents(documents), concurrency, ordered)
+        return _aclosing(results, progress)
+
+    async def add_document(self, kb_id: str, file_id: str) -> Task:
+        """
+        Add an already-uploaded file to a knowledge base.
+
+        Args:
+            kb_id: Knowledge base ID
+            file_id: File ID from previous file upload
+
+        Returns:
+            Task object with queued document processing task
+
+        Raises:
+            InvalidRequestError: If file_id is invalid
+            NotFoundError: If knowledge base or file doesn't exist
+            APIError: If operation fails
+        """
+        request_body = {"file_id": file_id}
+
+        response = await self._client.request(
+            "POST", f"/knowledge-bases/{kb_id}/documents", json_data=request_body
+        )
+
+        task = Task(**response)
+        await _ainvalidate_searches(self._client, kb_id)
+        if self._client.search_cache is not None:
+            self._processing[task.task_id] = kb_id
+        return task
+
+    async def wait_for_processing(self, task_id: str) -> Task:
+        """
+        Wait for a document processing task to finish.
+
+        Args:
+            task_id: Task ID returned by upload_document() or add_document()
+
+        Returns:
+            Completed Task object
+
+        Raises:
+            APITimeoutError: If processing exceeds the polling timeout
+            APIError: If document processing fails
+        """
+        try:
+            result = await self._poller.poll(task_id)
+        finally:
+            await _ainvalidate_searches(self._client, self._processing.pop(task_id, None))
+        return Task(**result)
+
+    async def list_documents(self, kb_id: str) -> List[DocumentMetadata]:
+        """
+        List all documents in a knowledge base.
+
+        Args:
+            kb_id: Knowledge base ID
+
+        Returns:
+            List of DocumentMetadata objects
+
+        Raises:
+            NotFoundError: If knowledge base doesn't exist
+            APIError: If retrieval fails
+        """
+        response = await self._client.request("GET", f"/knowledge-bases/{kb_id}/documents")
+        return _parse_documents(response)
+
+    async def search(
+        self,
+        query: str,
+        knowledge_base_ids: List[str],
+        top_k: int = 5,
+        similarity_threshold: float = 0.7,
+    ) -> SearchResponse:
+        """
+        Perform semantic search across knowledge bases.
+
+        Accepts the same arguments as KnowledgeBasesResource.search().
+
+        Returns:
+            SearchResponse with ranked results
+
+        Raises:
+            InvalidRequestError: If parameters are invalid
+            APIError: If search fails
+        """
+        request_body = {
+            "query": query,
+            "knowledge_base_ids": knowledge_base_ids,
+            "top_k": top_k,
+            "similarity_threshold": similarity_threshold,
+        }
+
+        cache = self._client.search_cache
+        loop = asyncio.get_running_loop()
+        scope = None
+        if cache is not None:
+            # The cache may do I/O (SQLiteCacheStore) or embed the query
+            scope, cached = await loop.run_in_executor(
+                None, _lookup_search, self._client, request_body
+            )
+            if cached is not None:
+                return cached
+
+        response = await self._client.request(
+            "POST",
+            "/knowledge-bases/search",
+            json_data=request_body,
+        )
+
+        if scope is not None:
+            await loop.run_in_executor(None, cache.put, scope, query, response)
         return SearchResponse(**response)
@@ -1,7 +1,70 @@
 """Session management resource module."""
 
-from typing import Optional, Dict, Any, List, Iterator
-from nexusai.models import SessionModel, Message, SessionResponse, Usage
+from typing import Optional, Dict, Any, List, Iterator, AsyncIterator
+from pydantic import TypeAdapter
+from nexusai.models import SessionModel, Message, SessionResponse
+
+# Lists are validated in one pydantic-core call rather than one per item
+_MESSAGES = TypeAdapter(List[Message])
+_SESSIONS = TypeAdapter(List[SessionModel])
+
+
+def _build_invoke_body(prompt: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build the request body for a session invoke call."""
+    # Backend expects: {"input": {"prompt": "..."}, "config": {...}, "stream": false}
+    request_body = {
+        "input": {"prompt": prompt},
+        "stream": False,
+    }
+
+    # Add config if provided
+    if config:
+        request_body["config"] = config
+
+    return request_body
+
+
+def _parse_invoke_response(response: Dict[str, Any], session_id: str) -> SessionResponse:
+    """Convert a session invoke payload into a SessionResponse."""
+    # Parse response - backend returns {"output": {"text": "..."}, "metadata": {...}}
+    output_data = response.get("output", {})
+    metadata = response.get("metadata", {})
+    usage_data = metadata.get("usage")
+
+    # Convert output.text to Message format
+    message_data = {
+        "role": "assistant",
+        "content": output_data.get("text", "")
+    }
+
+    # Nested models are built by the same validation call
+    return SessionResponse.model_validate(
+        {
+            "session_id": response.get("session_id", session_id),
+            "response": message_data,
+            "usage": usage_data or None,
+        }
+    )
+
+
+def _build_create_body(
+    agent_type: str,
+    agent_config: Optional[Dict[str, Any]],
+    name: Optional[str],
+    **kwargs,
+) -> Dict[str, Any]:
+    """Build the request body for session creation."""
+    request_body = {
+        "agent_type": agent_type,
+        **kwargs,
+    }
+
+    if agent_config:
+        request_body["agent_config"] = agent_config
+    if name:
+        request_body["name"] = name
+
+    return request_body
 
 
 class Session:
@@ -84,15 +147,7 @@ class Session:
             )
             ```
         """
-        # Backend expects: {"input": {"prompt": "..."}, "config": {...}, "stream": false}
-        request_body = {
-            "input": {"prompt": prompt},
-            "stream": False,
-        }
-
-        # Add config if provided
-        if config:
-            request_body["config"] = config
+        request_body = _build_invoke_body(prompt, config)
 
         response = self._client.request(
             "POST",
@@ -100,22 +155,7 @@ class Session:
             json_data=request_body,
         )
 
-        # Parse response - backend returns {"output": {"text": "..."}, "metadata": {...}}
-        output_data = response.get("output", {})
-        metadata = response.get("metadata", {})
-        usage_data = metadata.get("usage")
-
-        # Convert output.text to Message format
-        message_data = {
-            "role": "assistant",
-            "content": output_data.get("text", "")
-        }
-
-        return SessionResponse(
-            session_id=response.get("session_id", self.id),
-            response=Message(**message_data),
-            usage=Usage(**usage_data) if usage_data else None,
-        )
+        return _parse_invoke_response(response, self.id)
 
     def stream(self, prompt: str, **kwargs) -> Iterator[Dict[str, Any]]:
         """
@@ -188,7 +228,7 @@ class Session:
         )
 
         messages = response.get("messages", [])
-        return [Message(**msg) for msg in messages]
+        return _MESSAGES.validate_python(messages)
 
     def delete(self) -> None:
         """
@@ -278,15 +318,7 @@ class SessionsResource:
             print(response.response.content)
             ```
         """
-        request_body = {
-            "agent_type": agent_type,
-            **kwargs,
-        }
-
-        if agent_config:
-            request_body["agent_config"] = agent_config
-        if name:
-            request_body["name"] = name
+        request_body = _build_create_body(agent_type, agent_config, name, **kwargs)
 
         response = self._client.request("POST", "/sessions", json_data=request_body)
         return Session(response, self._client)
@@ -348,4 +380,197 @@ class SessionsResource:
         )
 
         sessions = response.get("sessions", [])
-        return [SessionModel(**s) for s in sessions]
+        return _SESSIONS.validate_python(sessions)
+
+
+class AsyncSession(Session):
+    """
+    Session object for use with AsyncNexusAIClient.
+
+    Mirrors Session with awaitable methods and `async for` streaming.
+    """
+
+    async def invoke(
+        self, prompt: str, config: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> SessionResponse:
+        """
+        Send a message in this session.
+
+        Args:
+            prompt: User message content
+            config: Optional configuration to temporarily override session settings
+            **kwargs: Additional parameters (for future compatibility)
+
+        Returns:
+            SessionResponse containing assistant's reply
+
+        Raises:
+            InvalidRequestError: If request parameters are invalid
+            NotFoundError: If session doesn't exist
+            APIError: If invocation fails
+        """
+        request_body = _build_invoke_body(prompt, config)
+
+        response = await self._client.request(
+            "POST",
+            f"/sessions/{self.id}/invoke",
+            json_data=request_body,
+        )
+
+        return _parse_invoke_response(response, self.id)
+
+    async def stream(self, prompt: str, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Send a message in this session with streaming response.
+
+        Args:
+            prompt: User message content
+            **kwargs: Additional configuration
+
+        Yields:
+            Dictionary chunks from streaming response
+
+        Raises:
+            InvalidRequestError: If request parameters are invalid
+            NotFoundError: If session doesn't exist
+            APIError: If streaming fails
+        """
+        request_body = {
+            "prompt": prompt,
+            "stream": True,
+            **kwargs,
+        }
+
+        async for chunk in self._client.stream(
+            "POST",
+            f"/sessions/{self.id}/invoke",
+            json_data=request_body,
+        ):
+            yield chunk
+
+    async def history(self, limit: int = 20, offset: int = 0) -> List[Message]:
+        """
+        Get conversation history for this session.
+
+        Args:
+            limit: Maximum number of messages to return. Default: 20
+            offset: Number of messages to skip. Default: 0
+
+        Returns:
+            List of Message objects in chronological order
+
+        Raises:
+            NotFoundError: If session doesn't exist
+            APIError: If retrieval fails
+        """
+        response = await self._client.request(
+            "GET",
+            f"/sessions/{self.id}/history",
+            params={"limit": limit, "offset": offset},
+        )
+
+        messages = response.get("messages", [])
+        return _MESSAGES.validate_python(messages)
+
+    async def delete(self) -> None:
+        """
+        Delete this session and all its history.
+
+        Raises:
+            NotFoundError: If session doesn't exist
+            APIError: If deletion fails
+        """
+        await self._client.request("DELETE", f"/sessions/{self.id}")
+        self._data["is_active"] = False
+
+    def __repr__(self) -> str:
+        """Return string representation of session."""
+        return f"AsyncSession(id='{self.id}', agent_type='{self.agent_type}', active={self.is_active})"
+
+
+class AsyncSessionsResource:
+    """
+    Asynchronous session management resource.
+
+    Mirrors SessionsResource; returned sessions are AsyncSession objects.
+    """
+
+    def __init__(self, client):
+        """
+        Initialize async sessions resource.
+
+        Args:
+            client: AsyncInternalClient instance
+        """
+        self._client = client
+
+    async def create(
+        self,
+        agent_type: str = "assistant",
+        agent_config: Optional[Dict[str, Any]] = None,
+        name: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncSession:
+        """
+        Create a new conversation session.
+
+        Accepts the same arguments as SessionsResource.create().
+
+        Returns:
+            AsyncSession object ready for conversation
+
+        Raises:
+            InvalidRequestError: If parameters are invalid
+            APIError: If creation fails
+
+        Example:
+            ```python
+            session = await client.sessions.create()
+            response = await session.invoke("Hello!")
+            print(response.response.content)
+            ```
+        """
+        request_body = _build_create_body(agent_type, agent_config, name, **kwargs)
+
+        response = await self._client.request("POST", "/sessions", json_data=request_body)
+        return AsyncSession(response, self._client)
+
+    async def get(self, session_id: str) -> AsyncSession:
+        """
+        Retrieve an existing session.
+
+        Args:
+            session_id: Unique session identifier
+
+        Returns:
+            AsyncSession object
+
+        Raises:
+            NotFoundError: If session doesn't exist
+            APIError: If retrieval fails
+        """
+        response = await self._client.request("GET", f"/sessions/{session_id}")
+        return AsyncSession(response, self._client)
+
+    async def list(self, page: int = 1, per_page: int = 20) -> List[SessionModel]:
+        """
+        List all sessions for the current API key.
+
+        Args:
+            page: Page number (1-indexed). Default: 1
+            per_page: Number of sessions per page. Default: 20
+
+        Returns:
+            List of SessionModel objects
+
+        Raises:
+            APIError: If retrieval fails
+        """
+        response = await self._client.request(
+            "GET",
+            "/sessions",
+            params={"page": page, "per_page": per_page},
+        )
+
+        sessions = response.get("sessions", [])
+        return _SESSIONS.validate_python(sessions)
@@ -1,9 +1,129 @@
 """Text generation resource module."""
 
-from typing import Optional, Iterator, Dict, Any
-from nexusai.models import TextResponse, Task, Usage
-from nexusai._internal._poller import TaskPoller
-from nexusai.constants import TASK_TYPE_TEXT_GENERATION
+from typing import (
+    Optional,
+    Iterator,
+    AsyncIterator,
+    Iterable,
+    List,
+    Dict,
+    Any,
+    Sequence,
+    Tuple,
+    Union,
+)
+from nexusai.models import TextResponse, Task, BatchResult
+from nexusai._internal._poller import TaskPoller, AsyncTaskPoller, AsyncTaskHandle
+from nexusai._internal._batch import run_concurrently, arun_concurrently
+from nexusai._internal._routing import CandidateSpec
+from nexusai._internal._response_cache import ResponseCache
+from nexusai.constants import TASK_TYPE_TEXT_GENERATION, DEFAULT_BATCH_CONCURRENCY
+
+
+def _build_request_body(
+    prompt: Optional[str],
+    messages: Optional[list],
+    provider: Optional[str],
+    model: Optional[str],
+    temperature: float,
+    max_tokens: Optional[int],
+    stream: bool = False,
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Build the /invoke request body for text generation.
+
+    Shared by the sync and async text resources.
+
+    Raises:
+        ValueError: If neither prompt nor messages is provided, or both are provided
+    """
+    # Validate input: must provide either prompt or messages, but not both
+    if prompt and messages:
+        raise ValueError("Cannot provide both 'prompt' and 'messages'. Use one or the other.")
+    if not prompt and not messages:
+        raise ValueError("Must provide either 'prompt' or 'messages'.")
+
+    # Build request body
+    request_body = {
+        "task_type": TASK_TYPE_TEXT_GENERATION,
+    }
+    if stream:
+        request_body["stream"] = True  # Stream parameter must be in request body per API spec
+
+    # Set input format based on what was provided
+    if messages:
+        request_body["input"] = {"messages": messages}
+    else:
+        request_body["input"] = {"prompt": prompt}
+
+    # Add optional provider and model
+    if provider:
+        request_body["provider"] = provider
+    if model:
+        request_body["model"] = model
+
+    # Build configuration
+    config_params = {"temperature": temperature, **kwargs}
+    if max_tokens:
+        config_params["max_tokens"] = max_tokens
+    request_body["config"] = config_params
+
+    return request_body
+
+
+def _cache_lookup(
+    client: Any, request_body: Dict[str, Any]
+) -> Tuple[Optional[ResponseCache], Optional[str]]:
+    """
+    The client's response cache and the key of a request body in it.
+
+    The key is None if the client has no cache or the request is not cacheable.
+    """
+    cache = client.response_cache
+    if cache is None:
+        return None, None
+    return cache, cache.request_key(request_body, client.cache_namespace)
+
+
+def _answered_key(
+    client: Any,
+    key: Optional[str],
+    response: Dict[str, Any],
+    hedges: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+) -> Optional[str]:
+    """
+    Response cache key of the request that produced a response.
+
+    A hedge sent to another provider or model answered its own body, not
+    the original request, so its response is cached under that body.
+    """
+    for hedge_response, body in hedges:
+        if response is hedge_response:
+            return _cache_lookup(client, body)[1]
+    return key
+
+
+def _batch_input(item: Union[str, list]) -> Dict[str, Any]:
+    """Map a generate_many() input to the prompt or messages argument."""
+    if isinstance(item, str):
+        return {"prompt": item}
+    return {"messages": item}
+
+
+def _parse_text_response(response: Dict[str, Any]) -> TextResponse:
+    """Convert an /invoke or task result payload into a TextResponse."""
+    output = response.get("output", {})
+
+    # Usage is built by the same validation call
+    return TextResponse.model_validate(
+        {
+            "text": output.get("text", ""),
+            "usage": output.get("usage") or None,
+            "model": output.get("model"),
+            "finish_reason": output.get("finish_reason"),
+        }
+    )
 
 
 class TextResource:
@@ -32,6 +152,7 @@ class TextResource:
         model: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        candidates: Optional[Sequence[CandidateSpec]] = None,
         **kwargs,
     ) -> TextResponse:
         """
@@ -49,6 +170,11 @@ class TextResource:
             temperature: Sampling temperature (0.0 to 2.0). Higher values make
                         output more random. Default: 0.7
             max_tokens: Maximum number of tokens to generate
+            candidates: Provider/model candidates to route between instead of
+                       provider and model: provider names, (provider, model)
+                       or (provider, model, weight) tuples. Each call goes
+                       to the fastest healthy candidate and falls back to
+                       the next one if it fails.
             **kwargs: Additional model configuration parameters
 
         Returns:
@@ -57,7 +183,8 @@ class TextResource:
         Raises:
             InvalidRequestError: If request parameters are invalid
             APIError: If generation fails
-            ValueError: If neither prompt nor messages is provided, or both are provided
+            ValueError: If neither prompt nor messages is provided, or both are
+                       provided, or candidates are combined with provider or model
 
         Example:
             ```python
@@ -89,51 +216,128 @@ class TextResource:
             )
             print(response.text)
             print(f"Tokens used: {response.usage.total_tokens}")
+
+            # Fastest healthy of several providers, falling back on failure
+            response = client.text.generate(
+                prompt="Hello",
+                candidates=[("openai", "gpt-4o-mini"), ("anthropic", "claude-3-haiku")],
+            )
             ```
         """
-        # Validate input: must provide either prompt or messages, but not both
-        if prompt and messages:
-            raise ValueError("Cannot provide both 'prompt' and 'messages'. Use one or the other.")
-        if not prompt and not messages:
-            raise ValueError("Must provide either 'prompt' or 'messages'.")
-
-        # Build request body
-        request_body = {
-            "task_type": TASK_TYPE_TEXT_GENERATION,
-        }
 
-        # Set input format based on what was provided
-        if messages:
-            request_body["input"] = {"messages": messages}
-        else:
-            request_body["input"] = {"prompt": prompt}
-
-        # Add optional provider and model
-        if provider:
-            request_body["provider"] = provider
-        if model:
-            request_body["model"] = model
-
-        # Build configuration
-        config_params = {"temperature": temperature, **kwargs}
-        if max_tokens:
-            config_params["max_tokens"] = max_tokens
-        request_body["config"] = config_params
-
-        # Make synchronous request (no stream, no async)
-        response = self._client.request("POST", "/invoke", json_data=request_body)
-
-        # Parse response
-        output = response.get("output", {})
-        usage_data = output.get("usage")
-
-        return TextResponse(
-            text=output.get("text", ""),
-            usage=Usage(**usage_data) if usage_data else None,
-            model=output.get("model"),
-            finish_reason=output.get("finish_reason"),
+        def generate(provider: Optional[str], model: Optional[str]) -> TextResponse:
+            request_body = _build_request_body(
+                prompt, messages, provider, model, temperature, max_tokens, **kwargs
+            )
+
+            # Make synchronous request (no stream, no async)
+            response = self._invoke(request_body)
+
+            return _parse_text_response(response)
+
+        return self._client.router.call(
+            TASK_TYPE_TEXT_GENERATION, candidates, generate, provider, model
         )
 
+    def _invoke(self, request_body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call /invoke, hedged by the client's hedge policy if it has one.
+
+        Deterministic requests are answered from the client's response
+        cache when it has the same request body; a response from a hedge
+        to another provider or model is cached under the hedge's body.
+        """
+
+        def send(body: Dict[str, Any]) -> Dict[str, Any]:
+            return self._client.request("POST", "/invoke", json_data=body)
+
+        # (response, body) of hedges sent to another provider or model
+        hedges: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+
+        def send_hedge(body: Dict[str, Any]) -> Dict[str, Any]:
+            # Not coalesced, or a same-target hedge would wait for the first request
+            response = self._client.request("POST", "/invoke", json_data=body, coalesce=False)
+            if body != request_body:
+                hedges.append((response, body))
+            return response
+
+        cache, key = _cache_lookup(self._client, request_body)
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        hedge_policy = self._client.hedge_policy
+        if hedge_policy is None:
+            response = send(request_body)
+        else:
+            response = hedge_policy.call(send, request_body, send_hedge)
+
+        key = _answered_key(self._client, key, response, hedges)
+        if key is not None:
+            cache.put(key, response)
+        return response
+
+    def generate_many(
+        self,
+        prompts: Iterable[Union[str, list]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = True,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[BatchResult]:
+        """
+        Generate text for many inputs concurrently.
+
+        Calls generate() from a pool of worker threads sharing this
+        client's connection pool. Inputs are consumed lazily and results
+        are yielded as soon as they are available.
+
+        Args:
+            prompts: Inputs to generate for. Each item is a prompt string or
+                    a list of message dicts.
+            concurrency: Maximum number of requests in flight. Values above
+                        the client's connection limit wait for a free connection.
+            ordered: Yield results in input order (default) or in completion order
+            provider: AI service provider for every input
+            model: Model name for every input
+            temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Maximum number of tokens to generate
+            **kwargs: Additional model configuration parameters
+
+        Returns:
+            Iterator of BatchResult. A failed input has `error` set instead
+            of `result`; it does not stop the rest of the batch.
+
+        Raises:
+            ValueError: If concurrency is less than 1
+
+        Example:
+            ```python
+            prompts = ["Summarize: ...", "Translate: ..."]
+            for item in client.text.generate_many(prompts, concurrency=16):
+                if item.ok:
+                    print(item.index, item.result.text)
+                else:
+                    print(item.index, "failed:", item.error)
+            ```
+        """
+
+        def generate_one(item: Union[str, list]) -> TextResponse:
+            return self.generate(
+                **_batch_input(item),
+                provider=provider,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+
+        return run_concurrently(generate_one, prompts, concurrency, ordered)
+
     def generate_async(
         self,
         prompt: Optional[str] = None,
@@ -177,32 +381,9 @@ class TextResource:
             print(response.text)
             ```
         """
-        # Validate input
-        if prompt and messages:
-            raise ValueError("Cannot provide both 'prompt' and 'messages'.")
-        if not prompt and not messages:
-            raise ValueError("Must provide either 'prompt' or 'messages'.")
-
-        # Build request body
-        request_body = {
-            "task_type": TASK_TYPE_TEXT_GENERATION,
-        }
-
-        # Set input format
-        if messages:
-            request_body["input"] = {"messages": messages}
-        else:
-            request_body["input"] = {"prompt": prompt}
-
-        if provider:
-            request_body["provider"] = provider
-        if model:
-            request_body["model"] = model
-
-        config_params = {"temperature": temperature, **kwargs}
-        if max_tokens:
-            config_params["max_tokens"] = max_tokens
-        request_body["config"] = config_params
+        request_body = _build_request_body(
+            prompt, messages, provider, model, temperature, max_tokens, **kwargs
+        )
 
         # Submit async task
         response = self._client.request(
@@ -216,16 +397,7 @@ class TextResource:
         task = Task(**response)
         result = self._poller.poll(task.task_id)
 
-        # Parse final result
-        output = result.get("output", {})
-        usage_data = output.get("usage")
-
-        return TextResponse(
-            text=output.get("text", ""),
-            usage=Usage(**usage_data) if usage_data else None,
-            model=output.get("model"),
-            finish_reason=output.get("finish_reason"),
-        )
+        return _parse_text_response(result)
 
     def stream(
         self,
@@ -275,36 +447,273 @@ class TextResource:
             print()  # New line after streaming completes
             ```
         """
-        # Validate input
-        if prompt and messages:
-            raise ValueError("Cannot provide both 'prompt' and 'messages'.")
-        if not prompt and not messages:
-            raise ValueError("Must provide either 'prompt' or 'messages'.")
-
-        # Build request body with stream parameter
-        request_body = {
-            "task_type": TASK_TYPE_TEXT_GENERATION,
-            "stream": True,  # Stream parameter must be in request body per API spec
-        }
+        request_body = _build_request_body(
+            prompt, messages, provider, model, temperature, max_tokens, stream=True, **kwargs
+        )
+
+        # Stream response
+        for chunk in self._client.stream(
+            "POST",
+            "/invoke",
+            json_data=request_body,
+        ):
+            yield chunk
+
+
+class AsyncTextResource:
+    """
+    Asynchronous text generation resource.
+
+    Mirrors TextResource with awaitable methods and `async for` streaming.
+    """
+
+    def __init__(self, client):
+        """
+        Initialize async text resource.
+
+        Args:
+            client: AsyncInternalClient instance
+        """
+        self._client = client
+        self._poller = AsyncTaskPoller(client)
+
+    async def generate(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[list] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        candidates: Optional[Sequence[CandidateSpec]] = None,
+        **kwargs,
+    ) -> TextResponse:
+        """
+        Generate text without blocking the event loop.
+
+        Accepts the same arguments as TextResource.generate().
+
+        Returns:
+            TextResponse object containing generated text and metadata
+
+        Raises:
+            InvalidRequestError: If request parameters are invalid
+            APIError: If generation fails
+            ValueError: If neither prompt nor messages is provided, or both are
+                       provided, or candidates are combined with provider or model
+
+        Example:
+            ```python
+            import asyncio
+            from nexusai import AsyncNexusAIClient
+
+            async def main():
+                async with AsyncNexusAIClient() as client:
+                    responses = await asyncio.gather(
+                        *(client.text.generate(prompt=p) for p in ["Hi", "Hello"])
+                    )
+                    for response in responses:
+                        print(response.text)
+
+            asyncio.run(main())
+            ```
+        """
+
+        async def generate(provider: Optional[str], model: Optional[str]) -> TextResponse:
+            request_body = _build_request_body(
+                prompt, messages, provider, model, temperature, max_tokens, **kwargs
+            )
+
+            response = await self._invoke(request_body)
+
+            return _parse_text_response(response)
+
+        return await self._client.router.acall(
+            TASK_TYPE_TEXT_GENERATION, candidates, generate, provider, model
+        )
+
+    async def _invoke(self, request_body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call /invoke, hedged by the client's hedge policy if it has one.
 
-        # Set input format
-        if messages:
-            request_body["input"] = {"messages": messages}
+        Deterministic requests are answered from the client's response
+        cache when it has the same request body.
+        """
+
+        async def send(body: Dict[str, Any]) -> Dict[str, Any]:
+            return await self._client.request("POST", "/invoke", json_data=body)
+
+        hedges: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+
+        async def send_hedge(body: Dict[str, Any]) -> Dict[str, Any]:
+            response = await self._client.request(
+                "POST", "/invoke", json_data=body, coalesce=False
+            )
+            if body != request_body:
+                hedges.append((response, body))
+            return response
+
+        cache, key = _cache_lookup(self._client, request_body)
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        hedge_policy = self._client.hedge_policy
+        if hedge_policy is None:
+            response = await send(request_body)
         else:
-            request_body["input"] = {"prompt": prompt}
+            response = await hedge_policy.acall(send, request_body, send_hedge)
+
+        key = _answered_key(self._client, key, response, hedges)
+        if key is not None:
+            cache.put(key, response)
+        return response
+
+    def generate_many(
+        self,
+        prompts: Iterable[Union[str, list]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = True,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Generate text for many inputs concurrently on the event loop.
 
-        if provider:
-            request_body["provider"] = provider
-        if model:
-            request_body["model"] = model
+        Accepts the same arguments as TextResource.generate_many().
 
-        config_params = {"temperature": temperature, **kwargs}
-        if max_tokens:
-            config_params["max_tokens"] = max_tokens
-        request_body["config"] = config_params
+        Returns:
+            Async iterator of BatchResult, one per input
 
-        # Stream response
-        for chunk in self._client.stream(
+        Raises:
+            ValueError: If concurrency is less than 1
+
+        Example:
+            ```python
+            async for item in client.text.generate_many(prompts, concurrency=32):
+                if item.ok:
+                    print(item.index, item.result.text)
+            ```
+        """
+
+        async def generate_one(item: Union[str, list]) -> TextResponse:
+            return await self.generate(
+                **_batch_input(item),
+                provider=provider,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+
+        return arun_concurrently(generate_one, prompts, concurrency, ordered)
+
+    async def generate_async(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[list] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> TextResponse:
+        """
+        Generate text using the async task pattern with polling.
+
+        Accepts the same arguments as TextResource.generate_async().
+
+        Returns:
+            TextResponse object containing generated text and metadata
+
+        Raises:
+            InvalidRequestError: If request parameters are invalid
+            APITimeoutError: If generation times out
+            APIError: If generation fails
+            ValueError: If neither prompt nor messages is provided
+        """
+        handle = await self.submit(
+            prompt, messages, provider, model, temperature, max_tokens, **kwargs
+        )
+        return await handle
+
+    async def submit(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[list] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncTaskHandle:
+        """
+        Submit a text generation task without waiting for it.
+
+        Accepts the same arguments as generate_async().
+
+        Returns:
+            AsyncTaskHandle resolving to a TextResponse
+
+        Raises:
+            InvalidRequestError: If request parameters are invalid
+            APIError: If submission fails
+            ValueError: If neither prompt nor messages is provided
+        """
+        request_body = _build_request_body(
+            prompt, messages, provider, model, temperature, max_tokens, **kwargs
+        )
+
+        # Submit async task
+        response = await self._client.request(
+            "POST",
+            "/invoke",
+            json_data=request_body,
+            headers={"Prefer": "respond-async"},
+        )
+
+        task = Task(**response)
+        return self._poller.start(task.task_id, parser=_parse_text_response)
+
+    async def stream(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[list] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate text with streaming response (Server-Sent Events).
+
+        Accepts the same arguments as TextResource.stream().
+
+        Yields:
+            Dictionary chunks with generation data
+
+        Raises:
+            InvalidRequestError: If request parameters are invalid
+            APIError: If generation fails
+            ValueError: If neither prompt nor messages is provided
+
+        Example:
+            ```python
+            async for chunk in client.text.stream(prompt="Tell me a story"):
+                if "delta" in chunk:
+                    print(chunk["delta"].get("content", ""), end="", flush=True)
+            ```
+        """
+        request_body = _build_request_body(
+            prompt, messages, provider, model, temperature, max_tokens, stream=True, **kwargs
+        )
+
+        async for chunk in self._client.stream(
             "POST",
             "/invoke",
             json_data=request_body,
@@ -0,0 +1,224 @@
+"""Tests for AsyncNexusAIClient and the async resource modules."""
+
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch, AsyncMock
+from nexusai import AsyncNexusAIClient
+from nexusai.error import APIError, AuthenticationError, StreamError
+from nexusai.models import TextResponse, Image
+from nexusai.resources.sessions import AsyncSession
+from nexusai._internal._poll_strategy import FixedPollStrategy
+
+
+def _mock_transport_client(client, handler):
+    """Swap the client's httpx.AsyncClient for one backed by a mock transport."""
+    internal = client._internal_client
+    internal.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        headers=internal._default_headers(),
+    )
+
+
+@pytest.fixture
+def async_client():
+    """Create an AsyncNexusAIClient for testing."""
+    return AsyncNexusAIClient(
+        api_key="test_key_123",
+        base_url="http://localhost:8000/api/v1"
+    )
+
+
+def test_async_client_initialization():
+    """Test async client requires an API key and lazy-loads resources."""
+    client = AsyncNexusAIClient(api_key="test_key")
+    assert client._internal_client.api_key == "test_key"
+    assert client._text_resource is None
+
+    _ = client.text
+    assert client._text_resource is not None
+
+
+@pytest.mark.asyncio
+async def test_async_text_generate(async_client, mock_text_response):
+    """Test async text generation shares request building with the sync client."""
+    with patch.object(
+        async_client._internal_client, "request", new=AsyncMock(return_value=mock_text_response)
+    ) as mock_request:
+        response = await async_client.text.generate(prompt="Hello", provider="openai")
+
+        assert isinstance(response, TextResponse)
+        assert response.usage.total_tokens == 40
+        request_body = mock_request.call_args[1]["json_data"]
+        assert request_body["input"]["prompt"] == "Hello"
+        assert request_body["provider"] == "openai"
+
+
+@pytest.mark.asyncio
+async def test_async_text_generate_validates_input(async_client):
+    """Test async text generation rejects missing input."""
+    with pytest.raises(ValueError):
+        await async_client.text.generate()
+
+
+@pytest.mark.asyncio
+async def test_async_text_stream(async_client):
+    """Test async streaming parses SSE chunks over the transport."""
+    body = (
+        b'data: {"delta": {"content": "Hello"}}\n\n'
+        b'data: {"delta": {"content": " world"}}\n\n'
+        b"data: [DONE]\n\n"
+    )
+
+    def handler(request):
+        return httpx.Response(200, content=body, headers={"Content-Type": "text/event-stream"})
+
+    _mock_transport_client(async_client, handler)
+
+    chunks = [chunk async for chunk in async_client.text.stream(prompt="Hi")]
+
+    assert [c["delta"]["content"] for c in chunks] == ["Hello", " world"]
+    await async_client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_stream_maps_http_errors(async_client):
+    """Test async streaming raises the mapped status error, not a StreamError."""
+
+    def handler(request):
+        return httpx.Response(401, json={"detail": "Invalid API key"})
+
+    _mock_transport_client(async_client, handler)
+
+    with pytest.raises(AuthenticationError):
+        async for _ in async_client.text.stream(prompt="Hi"):
+            pass
+    await async_client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_stream_empty(async_client):
+    """Test async streaming raises StreamError when no chunks arrive."""
+
+    def handler(request):
+        return httpx.Response(200, content=b"data: [DONE]\n\n")
+
+    _mock_transport_client(async_client, handler)
+
+    with pytest.raises(StreamError):
+        async for _ in async_client.text.stream(prompt="Hi"):
+            pass
+    await async_client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_images_generate_polls(async_client, mock_image_response):
+    """Test async image generation awaits the async poller."""
+    task_response = {"task_id": "img_task_456", "status": "pending"}
+
+    with patch.object(
+        async_client._internal_client, "request", new=AsyncMock(return_value=task_response)
+    ):
+        with patch.object(
+            async_client.images._poller,
+            "poll_with_progress",
+            new=AsyncMock(return_value=mock_image_response),
+        ) as mock_poll:
+            image = await async_client.images.generate(prompt="A sunset")
+
+            assert isinstance(image, Image)
+            assert image.width == 1024
+            mock_poll.assert_awaited_once_with("img_task_456", None)
+
+
+@pytest.mark.asyncio
+async def test_async_images_submit_returns_handles(async_client):
+    """Test many submitted tasks are polled concurrently through handles."""
+    async_client.images._poller.strategy = FixedPollStrategy(0)
+    submitted = [{"task_id": f"img_{i}", "status": "queued"} for i in range(3)]
+    polls = {}
+
+    async def fake_request(method, endpoint, **kwargs):
+        if method == "POST":
+            return submitted.pop(0)
+        task_id = endpoint.rsplit("/", 1)[-1]
+        polls[task_id] = polls.get(task_id, 0) + 1
+        if polls[task_id] < 2:
+            return {"task_id": task_id, "status": "running"}
+        return {
+            "task_id": task_id,
+            "status": "completed",
+            "output": {"image_url": f"https://example.com/{task_id}.png", "width": 8, "height": 8},
+        }
+
+    with patch.object(async_client._internal_client, "request", new=fake_request):
+        handles = [await async_client.images.submit(prompt=f"p{i}") for i in range(3)]
+        assert [h.task_id for h in handles] == ["img_0", "img_1", "img_2"]
+
+        images = await asyncio.gather(*handles)
+
+    assert all(isinstance(image, Image) for image in images)
+    assert images[2].image_url.endswith("img_2.png")
+    assert all(h.done() for h in handles)
+
+
+@pytest.mark.asyncio
+async def test_async_task_handle_propagates_failure(async_client):
+    """Test a failed task surfaces its error when the handle is awaited."""
+    failed = {"task_id": "t1", "status": "failed", "error": {"message": "boom", "code": "E1"}}
+
+    with patch.object(async_client._internal_client, "request", new=AsyncMock(return_value=failed)):
+        handle = async_client.text._poller.start("t1")
+        with pytest.raises(APIError, match="boom"):
+            await handle
+
+
+@pytest.mark.asyncio
+async def test_async_task_handle_cancel(async_client):
+    """Test cancelling a handle stops polling."""
+    running = {"task_id": "t1", "status": "running"}
+
+    with patch.object(async_client._internal_client, "request", new=AsyncMock(return_value=running)):
+        handle = async_client.text._poller.start("t1")
+        await asyncio.sleep(0)
+        assert handle.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await handle
+
+
+@pytest.mark.asyncio
+async def test_async_poller_completes(async_client):
+    """Test the async poller keeps polling until the task completes."""
+    responses = [
+        {"task_id": "t1", "status": "running"},
+        {"task_id": "t1", "status": "completed", "output": {"text": "done"}},
+    ]
+    poller = async_client.text._poller
+    poller.strategy = FixedPollStrategy(0)
+
+    with patch.object(
+        async_client._internal_client, "request", new=AsyncMock(side_effect=responses)
+    ):
+        result = await poller.poll("t1")
+
+    assert result["output"]["text"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_async_sessions_create(async_client, mock_session_response):
+    """Test async session creation returns an AsyncSession."""
+    with patch.object(
+        async_client._internal_client, "request", new=AsyncMock(return_value=mock_session_response)
+    ):
+        session = await async_client.sessions.create(name="Test Session")
+
+        assert isinstance(session, AsyncSession)
+        assert session.id == "sess_789"
+
+
+@pytest.mark.asyncio
+async def test_async_client_context_manager():
+    """Test async client works as async context manager."""
+    async with AsyncNexusAIClient(api_key="test_key") as client:
+        assert client is not None
+    assert client._internal_client.client.is_closed
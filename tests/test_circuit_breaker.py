@@ -0,0 +1,261 @@
+"""Tests for circuit breaking per endpoint, provider and model."""
+
+import json
+import httpx
+import pytest
+from unittest.mock import patch
+from nexusai import (
+    AsyncNexusAIClient,
+    CircuitBreaker,
+    CircuitOpenError,
+    NexusAIClient,
+    RetryConfig,
+)
+from nexusai.config import config
+from nexusai.error import APITimeoutError, InvalidRequestError, RateLimitError, ServerError
+from nexusai._internal._retry import NO_RETRY
+
+KEY = ("/invoke", "openai", "gpt-4")
+
+
+def _fail(breaker, key=KEY, error=None, times=1):
+    """Run failing requests through a circuit."""
+    for _ in range(times):
+        token = breaker.before(key)
+        breaker.record(key, token, error or ServerError("down"))
+
+
+def _open(breaker, key=KEY):
+    """Fail a circuit until it opens."""
+    _fail(breaker, key, times=breaker.failure_threshold)
+
+
+def _provider_handler(failing, calls):
+    """Transport handler failing /invoke calls for one provider."""
+
+    def handler(request):
+        provider = json.loads(request.content).get("provider")
+        calls.append(provider)
+        if provider == failing:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"output": {"text": "hi"}})
+
+    return handler
+
+
+def test_opens_after_consecutive_failures():
+    """failure_threshold failures in a row open the circuit"""
+    breaker = CircuitBreaker(failure_threshold=3)
+
+    _fail(breaker, times=2)
+    assert breaker.state(KEY) == "closed"
+    _fail(breaker)
+    assert breaker.state(KEY) == "open"
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before(KEY)
+    assert exc_info.value.key == KEY
+    assert 0 < exc_info.value.retry_after <= breaker.recovery_timeout
+
+
+def test_success_resets_failure_count():
+    """Failures must be consecutive"""
+    breaker = CircuitBreaker(failure_threshold=3)
+
+    _fail(breaker, times=2)
+    breaker.record(KEY, breaker.before(KEY))
+    _fail(breaker, times=2)
+
+    assert breaker.state(KEY) == "closed"
+    assert breaker.states() == {KEY: "closed"}
+
+
+def test_client_errors_and_rate_limits_do_not_count():
+    """4xx and 429 mean the upstream answered"""
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    _fail(breaker, error=InvalidRequestError("bad"))
+    _fail(breaker, error=RateLimitError("slow down"))
+
+    assert breaker.state(KEY) == "closed"
+    _fail(breaker, error=APITimeoutError("timeout"))
+    assert breaker.state(KEY) == "open"
+
+
+def test_circuits_are_independent():
+    """One failing provider does not open the circuit of another"""
+    breaker = CircuitBreaker(failure_threshold=1)
+    _open(breaker)
+
+    other = ("/invoke", "anthropic", "claude")
+    breaker.record(other, breaker.before(other))
+
+    assert breaker.state(other) == "closed"
+
+
+def test_half_open_probe_closes_circuit():
+    """After recovery_timeout one probe is let through; success closes"""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    _open(breaker)
+
+    token = breaker.before(KEY)
+    assert breaker.state(KEY) == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before(KEY)  # The only probe is in flight
+
+    breaker.record(KEY, token)
+    assert breaker.state(KEY) == "closed"
+    assert breaker.states() == {}
+
+
+def test_half_open_probe_failure_reopens():
+    """A failed probe opens the circuit again"""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    _open(breaker)
+
+    _fail(breaker)
+
+    assert breaker.state(KEY) == "open"
+
+
+def test_cancelled_probe_frees_slot():
+    """A probe ending without a result lets the next one through"""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    _open(breaker)
+
+    breaker.record(KEY, breaker.before(KEY), GeneratorExit())
+
+    assert breaker.state(KEY) == "half_open"
+    breaker.before(KEY)
+
+
+def test_stale_results_are_ignored():
+    """Requests admitted before the circuit opened do not affect probes"""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    stale = breaker.before(KEY)
+    _open(breaker)
+    breaker.before(KEY)  # Half-open probe
+
+    breaker.record(KEY, stale, ServerError("down"))
+
+    assert breaker.state(KEY) == "half_open"
+
+
+def test_state_change_hook_and_reset():
+    """Every transition is reported, including manual resets"""
+    changes = []
+    breaker = CircuitBreaker(
+        failure_threshold=1,
+        recovery_timeout=0,
+        on_state_change=lambda key, old, new: changes.append((old, new)),
+    )
+
+    _open(breaker)
+    breaker.before(KEY)
+    breaker.reset()
+
+    assert changes == [("closed", "open"), ("open", "half_open"), ("half_open", "closed")]
+
+
+def test_invalid_settings_rejected():
+    """Thresholds must be at least one"""
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(half_open_probes=0)
+
+
+def test_client_fails_fast_for_failing_provider():
+    """Once open, requests to the provider fail without being sent"""
+    calls = []
+    client = NexusAIClient(
+        api_key="test_key",
+        base_url="http://test/api/v1",
+        retry=NO_RETRY,
+        circuit_breaker=CircuitBreaker(failure_threshold=2),
+    )
+    client._internal_client.client = httpx.Client(
+        transport=httpx.MockTransport(_provider_handler("openai", calls))
+    )
+
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            client.text.generate(prompt="hi", provider="openai")
+    with pytest.raises(CircuitOpenError):
+        client.text.generate(prompt="hi", provider="openai")
+
+    assert client.text.generate(prompt="hi", provider="anthropic").text == "hi"
+    assert calls == ["openai", "openai", "anthropic"]
+
+
+def test_retried_call_counts_once():
+    """A call's retries record one outcome, not one per attempt"""
+    calls = []
+    client = NexusAIClient(
+        api_key="test_key",
+        base_url="http://test/api/v1",
+        circuit_breaker=CircuitBreaker(failure_threshold=2),
+        retry=RetryConfig(retry_non_idempotent=True),
+    )
+    client._internal_client.client = httpx.Client(
+        transport=httpx.MockTransport(_provider_handler("openai", calls))
+    )
+
+    with patch("nexusai._internal._retry.time.sleep"):
+        with pytest.raises(ServerError):
+            client.text.generate(prompt="hi", provider="openai")
+        assert len(calls) == 4
+        with pytest.raises(ServerError):
+            client.text.generate(prompt="hi", provider="openai")
+        assert len(calls) == 8
+        with pytest.raises(CircuitOpenError):
+            client.text.generate(prompt="hi", provider="openai")
+
+    assert len(calls) == 8
+
+
+def test_client_get_requests_are_exempt():
+    """Status polls do not go through circuits"""
+    breaker = CircuitBreaker()
+    client = NexusAIClient(api_key="test_key", circuit_breaker=breaker)
+
+    with patch.object(breaker, "before") as mock_before:
+        with patch.object(client._internal_client.client, "request") as mock_request:
+            mock_request.return_value = httpx.Response(200, json={})
+            client._internal_client.request("GET", "/tasks/t1")
+
+    mock_before.assert_not_called()
+
+
+def test_breaker_from_config():
+    """NEXUS_CIRCUIT_BREAKER gives the client a breaker"""
+    original = config.circuit_breaker
+    try:
+        config.circuit_breaker = True
+        client = NexusAIClient(api_key="test_key")
+    finally:
+        config.circuit_breaker = original
+
+    assert isinstance(client._internal_client.circuit_breaker, CircuitBreaker)
+    assert NexusAIClient(api_key="test_key")._internal_client.circuit_breaker is None
+
+
+@pytest.mark.asyncio
+async def test_async_stream_fails_fast():
+    """Async streams are guarded by the same circuits"""
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = AsyncNexusAIClient(
+        api_key="test_key", base_url="http://test/api/v1", retry=NO_RETRY, circuit_breaker=breaker
+    )
+    client._internal_client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(500))
+    )
+    body = {"provider": "openai", "model": "gpt-4"}
+
+    with pytest.raises(ServerError):
+        [c async for c in client._internal_client.stream("POST", "/invoke", json_data=body)]
+    with pytest.raises(CircuitOpenError):
+        [c async for c in client._internal_client.stream("POST", "/invoke", json_data=body)]
+
+    assert breaker.state(KEY) == "open"
+    await client.close()
@@ -1,6 +1,8 @@
 """Tests for NexusAIClient initialization and configuration."""
 
+import sys
 import pytest
+from unittest.mock import patch
 from nexusai import NexusAIClient
 from nexusai.error import AuthenticationError
 
@@ -48,3 +50,52 @@ def test_client_close():
     client = NexusAIClient(api_key="test_key")
     client.close()
     # Should not raise any errors
+
+
+def test_client_pool_defaults():
+    """Test the connection pool is sized for concurrent use by default."""
+    client = NexusAIClient(api_key="test_key", timeout=12)
+    pool = client._internal_client.client._transport._pool
+
+    assert pool._max_connections == 100
+    assert pool._max_keepalive_connections == 50
+    assert pool._keepalive_expiry == 30.0
+    # Waiting for a connection is bounded by the request timeout
+    assert client._internal_client.client.timeout.pool == 12
+    client.close()
+
+
+def test_client_pool_overrides():
+    """Test pool size, keep-alive and pool timeout can be configured."""
+    client = NexusAIClient(
+        api_key="test_key",
+        max_connections=4,
+        max_keepalive_connections=2,
+        keepalive_expiry=60.0,
+        pool_timeout=1.5,
+    )
+    pool = client._internal_client.client._transport._pool
+
+    assert pool._max_connections == 4
+    assert pool._max_keepalive_connections == 2
+    assert pool._keepalive_expiry == 60.0
+    assert client._internal_client.client.timeout.pool == 1.5
+    client.close()
+
+
+def test_client_http2_opt_in():
+    """Test HTTP/2 is off by default and enabled on the transport when requested."""
+    pytest.importorskip("h2")
+    assert NexusAIClient(api_key="test_key")._internal_client.client._transport._pool._http2 is False
+
+    client = NexusAIClient(api_key="test_key", http2=True)
+    assert client._internal_client.http2 is True
+    assert client._internal_client.client._transport._pool._http2 is True
+    client.close()
+
+
+def test_client_http2_requires_h2():
+    """Test a clear error is raised when the h2 package is missing."""
+    with patch.dict(sys.modules, {"h2": None}):
+        with pytest.raises(ImportError, match="keystone-ai\\[http2\\]"):
+            NexusAIClient(api_key="test_key", http2=True)
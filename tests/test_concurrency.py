@@ -0,0 +1,267 @@
+"""Tests for adaptive concurrency control."""
+
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from unittest.mock import patch
+from nexusai import AdaptiveConcurrencyLimiter, AsyncNexusAIClient, NexusAIClient
+from nexusai.config import config
+from nexusai.error import APITimeoutError, InvalidRequestError, RateLimitError, ServerError
+from nexusai._internal._retry import NO_RETRY
+
+
+def _fill(limiter, count):
+    """Take count permits."""
+    for _ in range(count):
+        limiter.acquire()
+
+
+def _client(limiter, handler):
+    client = NexusAIClient(
+        api_key="test_key",
+        base_url="http://test/api/v1",
+        retry=NO_RETRY,
+        concurrency_limiter=limiter,
+    )
+    client._internal_client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_limit_grows_after_full_window():
+    """A full window of successes at the limit raises it by one"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=10)
+
+    _fill(limiter, 4)
+    for _ in range(3):
+        limiter.release(latency=0.1)
+        limiter.acquire()
+    assert limiter.limit == 4
+
+    limiter.release(latency=0.1)
+    assert limiter.limit == 5
+
+
+def test_limit_not_grown_when_unused():
+    """Successes far below the limit do not raise it"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+    for _ in range(100):
+        limiter.acquire()
+        limiter.release(latency=0.1)
+
+    assert limiter.limit == 8
+
+
+def test_limit_held_while_latency_rises():
+    """The limit stops growing while latency is well above its baseline"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_tolerance=2.0)
+    _fill(limiter, 2)
+    limiter.release(latency=0.1)
+    limiter.release(latency=0.1)
+    grown = limiter.limit
+
+    for _ in range(5):
+        _fill(limiter, 2)
+        limiter.release(latency=5.0)
+        limiter.release(latency=5.0)
+
+    assert limiter.limit == grown
+
+
+@pytest.mark.parametrize(
+    "error", [RateLimitError("slow down"), ServerError("down"), APITimeoutError("timeout")]
+)
+def test_overload_halves_limit(error):
+    """429, 5xx and timeouts cut the limit by the backoff factor"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+
+    limiter.acquire()
+    limiter.release(error=error)
+
+    assert limiter.limit == 8
+
+
+def test_other_errors_leave_limit():
+    """Client errors say nothing about server capacity"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+
+    limiter.acquire()
+    limiter.release(error=InvalidRequestError("bad"))
+
+    assert limiter.limit == 16
+
+
+def test_burst_of_failures_counts_once():
+    """Failures from the same round trip lower the limit only once"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+    _fill(limiter, 16)
+    limiter.release(latency=10.0)
+
+    for _ in range(15):
+        limiter.release(error=RateLimitError("slow down"))
+
+    assert limiter.limit == 8
+
+
+def test_limit_bounds():
+    """The limit stays between min_limit and max_limit"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2, max_limit=3)
+
+    for _ in range(10):
+        limiter.acquire()
+        limiter._last_decrease = 0.0
+        limiter.release(error=ServerError("down"))
+    assert limiter.limit == 2
+
+    for _ in range(20):
+        _fill(limiter, limiter.limit)
+        for _ in range(limiter.limit):
+            limiter.release(latency=0.1)
+    assert limiter.limit == 3
+
+
+def test_invalid_settings_rejected():
+    """Limits must be ordered and backoff must shrink the limit"""
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=0)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=20, max_limit=10)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(backoff=1.0)
+
+
+def test_threads_wait_at_limit():
+    """A thread over the limit blocks until a permit is returned"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    thread.start()
+    assert not acquired.wait(0.1)
+    assert limiter.metrics()["waiting"] == 1
+
+    limiter.release(latency=0.1)
+    assert acquired.wait(1)
+    thread.join()
+
+
+def test_on_limit_change_and_metrics():
+    """Limit changes are reported and visible in metrics()"""
+    changes = []
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=4, on_limit_change=lambda old, new: changes.append((old, new))
+    )
+
+    limiter.acquire()
+    limiter.release(error=RateLimitError("slow down"))
+
+    assert changes == [(4, 2)]
+    metrics = limiter.metrics()
+    assert metrics["limit"] == 2
+    assert metrics["in_flight"] == 0
+    assert metrics["decreases"] == 1
+
+
+def test_permit_measures_latency():
+    """permit() returns the permit with the block's duration"""
+    limiter = AdaptiveConcurrencyLimiter()
+
+    with patch.object(limiter, "release", wraps=limiter.release) as mock_release:
+        with limiter.permit():
+            time.sleep(0.01)
+
+    assert mock_release.call_args.kwargs["latency"] >= 0.01
+    assert limiter.in_flight == 0
+
+
+def test_client_backs_off_on_rate_limit():
+    """A 429 from the server lowers the client's limit"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    client = _client(limiter, lambda request: httpx.Response(429))
+
+    with pytest.raises(RateLimitError):
+        client._internal_client.request("POST", "/invoke", json_data={})
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+def test_client_get_requests_are_exempt():
+    """Status polls and listings do not take permits"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    client = _client(limiter, lambda request: httpx.Response(200, json={}))
+    limiter.acquire()  # Would block any request taking a permit
+
+    client._internal_client.request("GET", "/tasks/t1")
+
+    assert limiter.in_flight == 1
+
+
+def test_client_stream_holds_permit_until_done():
+    """A stream holds its permit while chunks are read"""
+    limiter = AdaptiveConcurrencyLimiter()
+    body = b'data: {"delta": "a"}\n\ndata: {"delta": "b"}\n\ndata: [DONE]\n\n'
+    client = _client(limiter, lambda request: httpx.Response(200, content=body))
+
+    stream = client._internal_client.stream("POST", "/invoke", json_data={})
+    next(stream)
+    assert limiter.in_flight == 1
+    list(stream)
+    assert limiter.in_flight == 0
+
+
+def test_limiter_from_config():
+    """NEXUS_ADAPTIVE_CONCURRENCY gives the client a limiter"""
+    original = config.adaptive_concurrency
+    try:
+        config.adaptive_concurrency = True
+        client = NexusAIClient(api_key="test_key")
+    finally:
+        config.adaptive_concurrency = original
+
+    assert isinstance(client._internal_client.concurrency_limiter, AdaptiveConcurrencyLimiter)
+    assert NexusAIClient(api_key="test_key")._internal_client.concurrency_limiter is None
+
+
+@pytest.mark.asyncio
+async def test_async_waiters_and_cancellation():
+    """Coroutines wait for permits; a cancelled waiter passes its permit on"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    await limiter.aacquire()
+
+    first = asyncio.ensure_future(limiter.aacquire())
+    second = asyncio.ensure_future(limiter.aacquire())
+    await asyncio.sleep(0)
+    assert limiter.metrics()["waiting"] == 2
+
+    limiter.release(latency=0.1)
+    first.cancel()
+    await asyncio.wait_for(second, 1)
+
+    assert first.cancelled()
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_backs_off_on_server_error():
+    """The async client feeds server errors back to the limiter"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    client = AsyncNexusAIClient(
+        api_key="test_key",
+        base_url="http://test/api/v1",
+        retry=NO_RETRY,
+        concurrency_limiter=limiter,
+    )
+    client._internal_client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(503))
+    )
+
+    with pytest.raises(ServerError):
+        await client._internal_client.request("POST", "/invoke", json_data={})
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+    await client.close()
@@ -43,3 +43,20 @@ def test_config_get_api_key_missing():
 
     # Restore
     config._api_key = original
+
+
+def test_config_pool_defaults():
+    """Test connection pool settings have expected default values."""
+    assert config.max_connections == 100
+    assert config.max_keepalive_connections == 50
+    assert config.keepalive_expiry == 30.0
+    assert config.pool_timeout is None
+
+
+def test_parse_optional_float():
+    """Test optional float environment values."""
+    from nexusai.config import _parse_optional_float
+
+    assert _parse_optional_float(None, 5.0) == 5.0
+    assert _parse_optional_float("2.5", None) == 2.5
+    assert _parse_optional_float("none", 5.0) is None
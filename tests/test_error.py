@@ -11,6 +11,7 @@ from nexusai.error import (
     ServerError,
     APITimeoutError,
     NetworkError,
+    CircuitOpenError,
 )
 
 
@@ -75,3 +76,11 @@ def test_permission_error():
     error = PermissionError("Access denied")
     assert "Access denied" in str(error)
     assert isinstance(error, APIError)
+
+
+def test_circuit_open_error():
+    """Test CircuitOpenError with its circuit key."""
+    error = CircuitOpenError("Circuit open", key=("/invoke", "openai", None), retry_after=5.0)
+    assert error.key == ("/invoke", "openai", None)
+    assert error.retry_after == 5.0
+    assert isinstance(error, APIError)
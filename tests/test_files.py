@@ -1,9 +1,13 @@
 """Tests for file operations resource."""
 
+import io
+import threading
+import httpx
 import pytest
 from unittest.mock import patch, MagicMock, mock_open
 from pathlib import Path
-from nexusai import NexusAIClient
+from nexusai import AsyncNexusAIClient, NexusAIClient
+from nexusai._internal._upload import UploadReader
 from nexusai.models import FileMetadata
 
 
@@ -49,3 +53,128 @@ def test_files_list(mock_client, mock_file_response):
         assert isinstance(files, list)
         assert len(files) == 2
         assert all(isinstance(f, FileMetadata) for f in files)
+
+
+def _capture_transport(client, seen):
+    """Route the client's pooled httpx.Client through a recording mock transport."""
+    internal = client._internal_client
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "file_id": "file_abc123",
+                "filename": "notes.txt",
+                "content_type": "text/plain",
+                "size": 5,
+            },
+        )
+
+    internal.client = httpx.Client(
+        transport=httpx.MockTransport(handler), headers=internal._default_headers()
+    )
+
+
+def test_files_upload_uses_pooled_client(mock_client):
+    """Test uploads reuse the pooled client with a multipart Content-Type."""
+    seen = []
+    _capture_transport(mock_client, seen)
+
+    with patch("httpx.Client", side_effect=AssertionError("new client created")):
+        for _ in range(2):
+            mock_client.files.upload(io.BytesIO(b"hello"), filename="notes.txt")
+
+    assert len(seen) == 2
+    request = seen[0]
+    assert request.url.path.endswith("/files")
+    assert request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert request.headers["Authorization"] == "Bearer test_key_123"
+    assert b'filename="notes.txt"' in request.read()
+
+
+def test_json_requests_keep_json_content_type(mock_client):
+    """Test JSON requests still send application/json."""
+    seen = []
+    _capture_transport(mock_client, seen)
+
+    mock_client._internal_client.request("POST", "/invoke", json_data={"a": 1})
+
+    assert seen[0].headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_files_upload_streams_in_chunks(mock_client, tmp_path, use_mmap):
+    """Test large uploads are streamed in fixed-size chunks with progress."""
+    payload = bytes(range(256)) * 1000
+    path = tmp_path / "audio.wav"
+    path.write_bytes(payload)
+    seen = []
+    _capture_transport(mock_client, seen)
+    progress = []
+
+    mock_client.files.upload(
+        path,
+        chunk_size=64 * 1024,
+        use_mmap=use_mmap,
+        progress_callback=lambda sent, total: progress.append((sent, total)),
+    )
+
+    assert [sent for sent, _ in progress] == [65536, 131072, 196608, 256000]
+    assert all(total == len(payload) for _, total in progress)
+    request = seen[0]
+    # The body size is known up front, so nothing is buffered to measure it
+    assert "Content-Length" in request.headers
+    assert payload in request.read()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_mmap", [False, True])
+async def test_async_upload_reads_off_event_loop(tmp_path, use_mmap):
+    """Test async uploads read chunks in an executor and send the same form."""
+    payload = bytes(range(256)) * 1000
+    path = tmp_path / "audio.wav"
+    path.write_bytes(payload)
+    seen = []
+    progress = []
+    loop_thread = threading.get_ident()
+    read_threads = []
+
+    async def handler(request):
+        seen.append((request, await request.aread()))
+        data = {"file_id": "file_1", "filename": "audio.wav", "content_type": "audio/wav"}
+        data["size"] = 1
+        return httpx.Response(200, json=data)
+
+    client = AsyncNexusAIClient(api_key="test_key", base_url="http://test/api/v1")
+    client._internal_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    read = UploadReader.read
+
+    def recording_read(self, size=-1):
+        read_threads.append(threading.get_ident())
+        return read(self, size)
+
+    with patch.object(UploadReader, "read", recording_read):
+        await client.files.upload(
+            path,
+            chunk_size=64 * 1024,
+            use_mmap=use_mmap,
+            progress_callback=lambda sent, total: progress.append((sent, total)),
+        )
+
+    request, body = seen[0]
+    assert loop_thread not in read_threads
+    assert [sent for sent, _ in progress] == [65536, 131072, 196608, 256000]
+    assert int(request.headers["Content-Length"]) == len(body)
+    assert request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert b'name="file"; filename="audio.wav"' in body
+    assert payload in body
+    await client.close()
+
+
+def test_upload_reader_mmap_requires_real_file():
+    """Test memory mapping is only offered for files on disk."""
+    from nexusai._internal._upload import UploadReader
+
+    with pytest.raises(ValueError, match="use_mmap"):
+        UploadReader(io.BytesIO(b"data"), use_mmap=True)
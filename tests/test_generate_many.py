@@ -0,0 +1,109 @@
+"""Tests for concurrent batch text generation."""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import patch
+from nexusai import AsyncNexusAIClient
+from nexusai.error import RateLimitError
+from nexusai.models import TextResponse
+
+
+def _response(text):
+    return {"task_id": "t", "status": "completed", "output": {"text": text}}
+
+
+def _fake_request(delays=None):
+    """Echo the prompt back, failing on prompts starting with 'fail'."""
+    delays = delays or {}
+
+    def request(method, endpoint, json_data=None, **kwargs):
+        prompt = json_data["input"].get("prompt") or json_data["input"]["messages"][-1]["content"]
+        time.sleep(delays.get(prompt, 0))
+        if prompt.startswith("fail"):
+            raise RateLimitError("slow down")
+        return _response(prompt.upper())
+
+    return request
+
+
+def test_generate_many_preserves_order(mock_client):
+    """Test results come back in input order even when they finish out of order."""
+    prompts = ["a", "b", "c", "d"]
+    request = _fake_request(delays={"a": 0.05})
+
+    with patch.object(mock_client._internal_client, "request", side_effect=request):
+        results = list(mock_client.text.generate_many(prompts, concurrency=4))
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.result.text for r in results] == ["A", "B", "C", "D"]
+    assert all(isinstance(r.result, TextResponse) for r in results)
+
+
+def test_generate_many_unordered_yields_as_completed(mock_client):
+    """Test unordered mode yields fast items before slow ones."""
+    request = _fake_request(delays={"slow": 0.1})
+
+    with patch.object(mock_client._internal_client, "request", side_effect=request):
+        results = list(mock_client.text.generate_many(["slow", "fast"], ordered=False))
+
+    assert [r.input for r in results] == ["fast", "slow"]
+
+
+def test_generate_many_reports_errors_per_item(mock_client):
+    """Test a failing input does not abort the batch."""
+    prompts = ["ok1", "fail", [{"role": "user", "content": "ok2"}]]
+
+    with patch.object(mock_client._internal_client, "request", side_effect=_fake_request()):
+        results = list(mock_client.text.generate_many(prompts, concurrency=2))
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, RateLimitError)
+    assert results[2].result.text == "OK2"
+
+
+def test_generate_many_bounds_concurrency(mock_client):
+    """Test no more than `concurrency` requests run at once."""
+    lock = threading.Lock()
+    active = {"now": 0, "max": 0}
+
+    def request(method, endpoint, json_data=None, **kwargs):
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.01)
+        with lock:
+            active["now"] -= 1
+        return _response("x")
+
+    with patch.object(mock_client._internal_client, "request", side_effect=request):
+        results = list(mock_client.text.generate_many((str(i) for i in range(20)), concurrency=3))
+
+    assert len(results) == 20
+    assert active["max"] <= 3
+
+
+def test_generate_many_rejects_bad_concurrency(mock_client):
+    """Test concurrency must be positive."""
+    with pytest.raises(ValueError):
+        mock_client.text.generate_many(["a"], concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_async_generate_many():
+    """Test the async client fans out on the event loop."""
+    client = AsyncNexusAIClient(api_key="test_key")
+    sync_request = _fake_request()
+
+    async def request(method, endpoint, json_data=None, **kwargs):
+        if json_data["input"]["prompt"] == "a":
+            await asyncio.sleep(0.02)
+        return sync_request(method, endpoint, json_data=json_data)
+
+    with patch.object(client._internal_client, "request", new=request):
+        results = [r async for r in client.text.generate_many(["a", "b", "fail"], concurrency=2)]
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert [r.ok for r in results] == [True, True, False]
+    assert results[0].result.text == "A"
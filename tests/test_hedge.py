@@ -0,0 +1,279 @@
+"""Tests for hedged text generation requests."""
+
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from unittest.mock import patch
+from nexusai import AsyncNexusAIClient, HedgePolicy, NexusAIClient, ResponseCache
+from nexusai.error import ServerError
+
+
+def _policy(**kwargs):
+    """Policy that hedges after 50 ms, with budget for every request."""
+    options = {"min_delay": 0, "min_samples": 1, "max_extra_load": 1.0}
+    options.update(kwargs)
+    policy = HedgePolicy(**options)
+    policy.record(0.05)
+    return policy
+
+
+def _slow_for(provider, seconds=1.0):
+    """Fake request that is slow for one provider."""
+
+    def send(body):
+        if body.get("provider") == provider:
+            time.sleep(seconds)
+        return {"provider": body.get("provider")}
+
+    return send
+
+
+def test_delay_is_recent_latency_percentile():
+    """The hedge delay is the percentile of recent latencies, but at least min_delay"""
+    policy = HedgePolicy(percentile=90, min_delay=0.5, min_samples=10)
+    for latency in range(1, 10):
+        policy.record(latency)
+    assert policy.delay() is None  # Not enough samples yet
+
+    policy.record(10)
+    assert policy.delay() == 9
+
+    policy = HedgePolicy(min_delay=0.5, min_samples=1)
+    policy.record(0.1)
+    assert policy.delay() == 0.5
+
+
+def test_fast_request_is_not_hedged():
+    """A response within the delay is returned without a duplicate"""
+    policy = _policy()
+    calls = []
+
+    def send(body):
+        calls.append(body)
+        return {"ok": True}
+
+    assert policy.call(send, {"provider": "openai"}) == {"ok": True}
+    assert len(calls) == 1
+    assert policy.metrics()["hedges"] == 0
+
+
+def test_slow_request_is_hedged_to_fallback():
+    """A slow response is raced by a duplicate to the fallback provider"""
+    policy = _policy(provider="anthropic", model="claude")
+
+    result = policy.call(_slow_for("openai"), {"provider": "openai", "model": "gpt-4"})
+
+    assert result == {"provider": "anthropic"}
+    assert policy.metrics()["hedge_wins"] == 1
+
+
+def test_budget_caps_hedges():
+    """Without budget the slow request is simply awaited"""
+    policy = _policy(max_extra_load=0)
+
+    result = policy.call(_slow_for("openai", 0.2), {"provider": "openai"})
+
+    assert result == {"provider": "openai"}
+    assert policy.metrics()["hedges"] == 0
+
+
+def test_budget_allows_fraction_of_requests():
+    """max_extra_load hedges are earned per request"""
+    policy = _policy(max_extra_load=0.5)
+
+    assert not policy._spend()
+    policy._start()
+    policy._start()
+    assert policy._spend()
+    assert not policy._spend()
+
+
+def test_failed_request_falls_back_to_other():
+    """If one request fails after hedging, the other is awaited"""
+    policy = _policy(provider="anthropic")
+
+    def send(body):
+        if body.get("provider") == "openai":
+            time.sleep(0.1)
+            raise ServerError("down")
+        time.sleep(0.2)
+        return {"provider": "anthropic"}
+
+    assert policy.call(send, {"provider": "openai"}) == {"provider": "anthropic"}
+
+
+def test_all_failed_raises_first_request_error():
+    """When every request fails the first request's error is raised"""
+    policy = _policy(provider="anthropic")
+    errors = {"openai": ServerError("openai down"), "anthropic": ServerError("anthropic down")}
+
+    def send(body):
+        time.sleep(0.1)
+        raise errors[body["provider"]]
+
+    with pytest.raises(ServerError, match="openai down"):
+        policy.call(send, {"provider": "openai"})
+
+
+def test_early_failure_is_raised():
+    """A request failing before the hedge delay is not hedged"""
+    policy = _policy()
+    calls = []
+
+    def send(body):
+        calls.append(body)
+        raise ServerError("down")
+
+    with pytest.raises(ServerError):
+        policy.call(send, {})
+    assert len(calls) == 1
+
+
+def test_requests_reuse_a_bounded_set_of_threads():
+    """Requests run on at most max_threads policy threads, not a thread each"""
+    policy = _policy(max_threads=2)
+    threads = set()
+
+    def send(body):
+        threads.add(threading.current_thread().name)
+        return {"ok": True}
+
+    for _ in range(20):
+        policy.call(send, {"provider": "openai"})
+
+    assert 1 <= len({name for name in threads if name.startswith("nexusai-hedge")}) <= 2
+
+
+def test_busy_threads_send_unhedged_on_caller_thread():
+    """When every policy thread is busy, a request runs on the caller's thread"""
+    policy = _policy(max_threads=1)
+    started = threading.Event()
+    release = threading.Event()
+    threads = []
+
+    def send(body):
+        threads.append(threading.current_thread())
+        if body.get("provider") == "openai":
+            started.set()
+            release.wait(5)
+        return {"provider": body.get("provider")}
+
+    first = threading.Thread(target=policy.call, args=(send, {"provider": "openai"}))
+    first.start()
+    assert started.wait(5)
+
+    assert policy.call(send, {"provider": "anthropic"}) == {"provider": "anthropic"}
+    assert threads[-1] is threading.current_thread()
+    release.set()
+    first.join(5)
+
+
+def test_invalid_settings_rejected():
+    """Percentile and load must be in range"""
+    with pytest.raises(ValueError):
+        HedgePolicy(percentile=100)
+    with pytest.raises(ValueError):
+        HedgePolicy(max_extra_load=2)
+    with pytest.raises(ValueError):
+        HedgePolicy(max_threads=0)
+
+
+def test_client_text_generate_is_hedged():
+    """text.generate() goes through the client's hedge policy"""
+    policy = _policy(provider="anthropic")
+    client = NexusAIClient(api_key="test_key", hedge_policy=policy)
+    providers = []
+    lock = threading.Lock()
+
+    def request(method, endpoint, json_data=None, **kwargs):
+        with lock:
+            providers.append(json_data.get("provider"))
+        if json_data.get("provider") == "openai":
+            time.sleep(1)
+        return {"output": {"text": json_data.get("provider")}}
+
+    with patch.object(client._internal_client, "request", side_effect=request):
+        response = client.text.generate(prompt="hi", provider="openai")
+
+    assert response.text == "anthropic"
+    assert sorted(providers) == ["anthropic", "openai"]
+
+
+def test_hedge_to_other_model_is_cached_under_its_own_body():
+    """A winning fallback answer is not served for the original model's request"""
+    policy = _policy(provider="anthropic")
+    client = NexusAIClient(api_key="test_key", hedge_policy=policy, response_cache=ResponseCache())
+    providers = []
+    slow = {"openai"}
+    lock = threading.Lock()
+
+    def request(method, endpoint, json_data=None, **kwargs):
+        with lock:
+            providers.append(json_data.get("provider"))
+        if json_data.get("provider") in slow:
+            time.sleep(1)
+        return {"output": {"text": json_data.get("provider")}}
+
+    with patch.object(client._internal_client, "request", side_effect=request):
+        hedged = client.text.generate(prompt="hi", provider="openai", temperature=0)
+        slow.clear()
+        primary = client.text.generate(prompt="hi", provider="openai", temperature=0)
+        fallback = client.text.generate(prompt="hi", provider="anthropic", temperature=0)
+
+    assert (hedged.text, primary.text, fallback.text) == ("anthropic", "openai", "anthropic")
+    assert providers.count("anthropic") == 1  # The fallback request was answered from the cache
+
+
+def test_same_target_hedge_is_not_coalesced():
+    """A hedge to the same target is sent, not folded into the first request"""
+    policy = _policy()
+    client = NexusAIClient(
+        api_key="test_key",
+        base_url="http://test/api/v1",
+        hedge_policy=policy,
+        coalesce_requests=True,
+    )
+    calls = []
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            calls.append(request.url.path)
+            first = len(calls) == 1
+        if first:
+            time.sleep(1)
+        return httpx.Response(200, json={"output": {"text": "slow" if first else "fast"}})
+
+    client._internal_client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    response = client.text.generate(prompt="hi", provider="openai", temperature=0)
+
+    assert response.text == "fast"
+    assert len(calls) == 2
+    assert policy.metrics()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_loser_is_cancelled():
+    """The async client cancels the request that lost the race"""
+    policy = _policy(provider="anthropic")
+    client = AsyncNexusAIClient(api_key="test_key", hedge_policy=policy)
+    cancelled = []
+
+    async def request(method, endpoint, json_data=None, **kwargs):
+        if json_data.get("provider") == "openai":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(json_data["provider"])
+                raise
+        return {"output": {"text": json_data.get("provider")}}
+
+    with patch.object(client._internal_client, "request", side_effect=request):
+        response = await client.text.generate(prompt="hi", provider="openai")
+        await asyncio.sleep(0)
+
+    assert response.text == "anthropic"
+    assert cancelled == ["openai"]
+    await client.close()
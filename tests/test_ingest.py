@@ -0,0 +1,223 @@
+"""Tests for bulk knowledge-base ingestion."""
+
+import io
+import json
+import threading
+import pytest
+from unittest.mock import patch
+from nexusai import AsyncNexusAIClient
+from nexusai.error import APIError, NetworkError
+from nexusai._internal._ingest import IngestCheckpoint
+from nexusai._internal._upload import AsyncUploadBody
+
+
+class FakeIngestServer:
+    """Files, knowledge-base documents and processing tasks in memory."""
+
+    def __init__(self, fail_uploads=(), fail_processing=()):
+        self.fail_uploads = set(fail_uploads)
+        self.fail_processing = set(fail_processing)
+        self.uploads = []
+        self.added = []
+        self.tasks = {}
+        self._lock = threading.Lock()
+
+    def request(self, method, endpoint, files=None, json_data=None, **kwargs):
+        with self._lock:
+            if method == "POST" and endpoint == "/files":
+                filename = files["file"][0]
+                content = files["file"][1].read()
+                if filename in self.fail_uploads:
+                    self.fail_uploads.discard(filename)
+                    raise NetworkError("connection reset")
+                self.uploads.append(filename)
+                return {
+                    "file_id": f"file_{filename}",
+                    "filename": filename,
+                    "content_type": "application/pdf",
+                    "size": len(content),
+                }
+
+            if method == "POST" and endpoint.endswith("/documents"):
+                file_id = json_data["file_id"]
+                task_id = f"task_{len(self.added) + 1}"
+                self.added.append(file_id)
+                failed = file_id in self.fail_processing
+                self.fail_processing.discard(file_id)
+                self.tasks[task_id] = "failed" if failed else "completed"
+                return {"task_id": task_id, "status": "queued"}
+
+            if method == "GET" and endpoint.startswith("/tasks/"):
+                task_id = endpoint.split("/")[2]
+                status = self.tasks[task_id]
+                task = {"task_id": task_id, "status": status}
+                if status == "failed":
+                    task["error"] = {"code": "PARSE_ERROR", "message": "Unreadable document"}
+                return task
+
+        raise AssertionError(f"unexpected request {method} {endpoint}")
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Directory with three small documents."""
+    directory = tmp_path / "corpus"
+    (directory / "sub").mkdir(parents=True)
+    (directory / "a.pdf").write_bytes(b"alpha")
+    (directory / "b.pdf").write_bytes(b"beta")
+    (directory / "sub" / "c.pdf").write_bytes(b"gamma")
+    return directory
+
+
+def test_ingest_directory(mock_client, corpus):
+    """Every file below a directory is uploaded, added and processed"""
+    server = FakeIngestServer()
+
+    with patch.object(mock_client._internal_client, "request", side_effect=server.request):
+        results = list(mock_client.knowledge_bases.ingest("kb_1", corpus, concurrency=2))
+
+    assert all(r.ok for r in results)
+    assert sorted(server.uploads) == ["a.pdf", "b.pdf", "c.pdf"]
+    assert sorted(r.result.status for r in results) == ["completed"] * 3
+
+
+def test_ingest_ordered_with_file_objects(mock_client):
+    """File objects are accepted and ordered=True keeps input order"""
+    server = FakeIngestServer()
+    documents = [io.BytesIO(bytes([i])) for i in range(5)]
+
+    with patch.object(mock_client._internal_client, "request", side_effect=server.request):
+        results = list(
+            mock_client.knowledge_bases.ingest("kb_1", documents, concurrency=3, ordered=True)
+        )
+
+    assert [r.index for r in results] == list(range(5))
+    assert [r.input for r in results] == documents
+
+
+def test_ingest_reports_errors_per_document(mock_client, corpus):
+    """A failing document does not stop the others"""
+    server = FakeIngestServer(fail_uploads={"b.pdf"}, fail_processing={"file_c.pdf"})
+
+    with patch.object(mock_client._internal_client, "request", side_effect=server.request):
+        results = list(mock_client.knowledge_bases.ingest("kb_1", corpus))
+
+    errors = {r.input.name: r.error for r in results if not r.ok}
+    assert isinstance(errors["b.pdf"], NetworkError)
+    assert isinstance(errors["c.pdf"], APIError)
+    assert sum(r.ok for r in results) == 1
+
+
+def test_ingest_without_wait(mock_client, corpus):
+    """wait=False stops once documents are queued"""
+    server = FakeIngestServer()
+
+    with patch.object(
+        mock_client._internal_client, "request", side_effect=server.request
+    ) as mock_request:
+        results = list(mock_client.knowledge_bases.ingest("kb_1", corpus, wait=False))
+
+    assert [r.result.status for r in results] == ["queued"] * 3
+    assert not any(call.args[0] == "GET" for call in mock_request.call_args_list)
+
+
+def test_ingest_resumes_from_checkpoint(mock_client, corpus, tmp_path):
+    """A second run only redoes the stages that did not finish"""
+    checkpoint = tmp_path / "ingest.jsonl"
+    server = FakeIngestServer(fail_uploads={"b.pdf"}, fail_processing={"file_c.pdf"})
+
+    with patch.object(mock_client._internal_client, "request", side_effect=server.request):
+        first = list(mock_client.knowledge_bases.ingest("kb_1", corpus, checkpoint=checkpoint))
+        second = list(mock_client.knowledge_bases.ingest("kb_1", corpus, checkpoint=checkpoint))
+
+    assert sum(r.ok for r in first) == 1
+    assert all(r.ok for r in second)
+    # a.pdf was done; b.pdf is uploaded again; c.pdf is only added again
+    assert sorted(server.uploads) == ["a.pdf", "b.pdf", "c.pdf"]
+    assert sorted(server.added) == ["file_a.pdf", "file_b.pdf", "file_c.pdf", "file_c.pdf"]
+
+
+def test_checkpoint_ignores_truncated_record(mock_client, corpus, tmp_path):
+    """A partially written last line from a crash is skipped"""
+    checkpoint = tmp_path / "ingest.jsonl"
+    server = FakeIngestServer()
+
+    with patch.object(mock_client._internal_client, "request", side_effect=server.request):
+        list(mock_client.knowledge_bases.ingest("kb_1", corpus, checkpoint=checkpoint))
+        with open(checkpoint, "a") as f:
+            f.write('{"key": "kb_1:trunc')
+        results = list(mock_client.knowledge_bases.ingest("kb_1", corpus, checkpoint=checkpoint))
+
+    assert all(r.ok for r in results)
+    assert len(server.uploads) == 3
+    stages = [json.loads(line)["stage"] for line in checkpoint.read_text().splitlines()[:-1]]
+    assert stages.count("completed") == 3
+
+
+def test_checkpoint_survives_repeated_crashes(tmp_path):
+    """A record written after a truncated line is kept, crash after crash"""
+    checkpoint = tmp_path / "ingest.jsonl"
+    checkpoint.write_text('{"key": "kb_1:a:1", "stage": "completed"}\n{"key": "kb_1:trunc')
+
+    for name in ("b", "c"):
+        progress = IngestCheckpoint(checkpoint)
+        progress.record(f"kb_1:{name}:1", "uploaded", f"file_{name}")
+        progress.close()
+        with open(checkpoint, "a") as f:
+            f.write('{"key": "kb_1:trunc')
+
+    loaded = IngestCheckpoint(checkpoint)
+
+    assert sorted(loaded._records) == ["kb_1:a:1", "kb_1:b:1", "kb_1:c:1"]
+
+
+def test_checkpoint_skips_records_without_key(tmp_path):
+    """Valid JSON lines that are not checkpoint records are skipped"""
+    checkpoint = tmp_path / "ingest.jsonl"
+    checkpoint.write_text('{"stage": "uploaded"}\n3\n{"key": "kb_1:x:1", "stage": "completed"}\n')
+
+    loaded = IngestCheckpoint(checkpoint)
+
+    assert list(loaded._records) == ["kb_1:x:1"]
+
+
+def test_checkpoint_is_per_knowledge_base(mock_client, corpus, tmp_path):
+    """The same documents are ingested again into another knowledge base"""
+    checkpoint = tmp_path / "ingest.jsonl"
+    server = FakeIngestServer()
+
+    with patch.object(mock_client._internal_client, "request", side_effect=server.request):
+        list(mock_client.knowledge_bases.ingest("kb_1", corpus, checkpoint=checkpoint))
+        list(mock_client.knowledge_bases.ingest("kb_2", corpus, checkpoint=checkpoint))
+
+    assert len(server.added) == 6
+
+
+def test_ingest_rejects_invalid_concurrency(mock_client, corpus):
+    """concurrency below 1 is rejected immediately"""
+    with pytest.raises(ValueError):
+        mock_client.knowledge_bases.ingest("kb_1", corpus, concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_async_ingest_resumes_from_checkpoint(corpus, tmp_path):
+    """The async client ingests and resumes the same way"""
+    client = AsyncNexusAIClient(api_key="test_key_123", base_url="http://localhost:8000/api/v1")
+    checkpoint = tmp_path / "ingest.jsonl"
+    server = FakeIngestServer(fail_uploads={"a.pdf"})
+
+    async def request(method, endpoint, content=None, headers=None, **kwargs):
+        if isinstance(content, AsyncUploadBody):
+            body = b"".join([chunk async for chunk in content])
+            kwargs["files"] = {"file": (content.filename, io.BytesIO(body))}
+        return server.request(method, endpoint, **kwargs)
+
+    with patch.object(client._internal_client, "request", side_effect=request):
+        ingest = client.knowledge_bases.ingest
+        first = [r async for r in ingest("kb_1", corpus, concurrency=2, checkpoint=checkpoint)]
+        second = [r async for r in ingest("kb_1", corpus, concurrency=2, checkpoint=checkpoint)]
+
+    assert sum(r.ok for r in first) == 2
+    assert all(r.ok for r in second)
+    assert sorted(server.uploads) == ["a.pdf", "b.pdf", "c.pdf"]
+    await client.close()
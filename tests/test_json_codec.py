@@ -0,0 +1,162 @@
+"""Tests for the pluggable JSON codec."""
+
+import json
+import sys
+import httpx
+import pytest
+from unittest.mock import patch
+from nexusai import AsyncNexusAIClient, JSONCodec, NexusAIClient
+from nexusai.config import config
+from nexusai._internal._json import (
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    get_codec,
+)
+
+BODY = {"prompt": "héllo", "max_tokens": 10, "nested": {"a": [1, 2.5, None, True]}}
+
+
+class CountingCodec(StdlibJSONCodec):
+    """Standard library codec counting its calls."""
+
+    def __init__(self):
+        self.dumped = 0
+        self.loaded = 0
+
+    def dumps(self, obj):
+        self.dumped += 1
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.loaded += 1
+        return super().loads(data)
+
+
+def _installed_codecs():
+    codecs = [StdlibJSONCodec()]
+    for cls in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(cls())
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _installed_codecs(), ids=lambda c: c.name)
+def test_codecs_round_trip(codec):
+    """Every installed codec encodes compact UTF-8 JSON and decodes bytes and str"""
+    encoded = codec.dumps(BODY)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == BODY
+    assert codec.loads(encoded) == BODY
+    assert codec.loads(encoded.decode()) == BODY
+    with pytest.raises(ValueError):
+        codec.loads(b"{oops")
+
+
+def test_auto_prefers_installed_fast_codec():
+    """auto picks orjson, then msgspec, then the standard library"""
+    names = [codec.name for codec in _installed_codecs()]
+
+    assert get_codec("auto").name == (names[1] if len(names) > 1 else "json")
+    with patch.dict(sys.modules, {"orjson": None}):
+        assert get_codec("auto").name == ("msgspec" if "msgspec" in names else "json")
+    with patch.dict(sys.modules, {"orjson": None, "msgspec": None}):
+        assert isinstance(get_codec("auto"), StdlibJSONCodec)
+
+
+def test_named_codec_errors():
+    """Unknown names and missing packages are reported"""
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_codec("simdjson")
+    with patch.dict(sys.modules, {"orjson": None}):
+        with pytest.raises(ImportError, match="keystone-ai\\[orjson\\]"):
+            get_codec("orjson")
+
+
+def test_orjson_falls_back_for_unsupported_values():
+    """Values orjson rejects are encoded by the standard library"""
+    pytest.importorskip("orjson")
+    codec = OrjsonCodec()
+
+    assert json.loads(codec.dumps({"big": 2**70})) == {"big": 2**70}
+
+
+def _client(handler, codec):
+    client = NexusAIClient(api_key="test_key", base_url="http://test/api/v1", json_codec=codec)
+    client._internal_client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_client_uses_codec_for_requests_and_responses():
+    """Request bodies and responses go through the client's codec"""
+    codec = CountingCodec()
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    client = _client(handler, codec)
+    data = client._internal_client.request("POST", "/invoke", json_data=BODY, headers={"X": "1"})
+
+    assert data == {"ok": True}
+    assert (codec.dumped, codec.loaded) == (1, 1)
+    assert json.loads(sent[0].content) == BODY
+    assert sent[0].headers["Content-Type"] == "application/json"
+    assert sent[0].headers["X"] == "1"
+
+
+def test_client_uses_codec_for_errors_and_streams():
+    """Error details and streamed chunks are decoded by the codec"""
+    codec = CountingCodec()
+
+    def handler(request):
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, json={"detail": "No such task"})
+        return httpx.Response(200, content=b'data: {"delta": "a"}\n\ndata: [DONE]\n\n')
+
+    client = _client(handler, codec)
+
+    with pytest.raises(Exception, match="No such task"):
+        client._internal_client.request("GET", "/missing")
+    assert list(client._internal_client.stream("POST", "/invoke", json_data={})) == [
+        {"delta": "a"}
+    ]
+    assert codec.loaded == 2
+
+
+def test_non_json_response_is_wrapped():
+    """A response the codec cannot parse is returned as text content"""
+    client = _client(lambda request: httpx.Response(200, text="plain"), "json")
+
+    assert client._internal_client.request("GET", "/health") == {"content": "plain"}
+
+
+def test_codec_from_config():
+    """Without json_codec=, NEXUS_JSON_CODEC (config.json_codec) applies"""
+    original = config.json_codec
+    config.json_codec = "json"
+    try:
+        client = NexusAIClient(api_key="test_key")
+    finally:
+        config.json_codec = original
+
+    assert isinstance(client._internal_client.json_codec, StdlibJSONCodec)
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_codec():
+    """The async client encodes and decodes with its codec"""
+    codec = CountingCodec()
+    client = AsyncNexusAIClient(api_key="test_key", base_url="http://test/api/v1", json_codec=codec)
+    client._internal_client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=request.content))
+    )
+
+    assert await client._internal_client.request("POST", "/invoke", json_data=BODY) == BODY
+    assert (codec.dumped, codec.loaded) == (1, 1)
+    assert isinstance(codec, JSONCodec)
+    await client.close()
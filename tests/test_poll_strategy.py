@@ -0,0 +1,82 @@
+"""Tests for task poll strategies."""
+
+import pytest
+from unittest.mock import patch, Mock
+from nexusai.models import Task
+from nexusai._internal._poller import TaskPoller
+from nexusai._internal._poll_strategy import (
+    AdaptivePollStrategy,
+    FixedPollStrategy,
+    get_poll_strategy,
+)
+
+
+def _task(**kwargs):
+    return Task(task_id="t1", status="running", **kwargs)
+
+
+def test_fixed_strategy():
+    """Test the fixed strategy always returns its interval."""
+    strategy = FixedPollStrategy(2.0)
+    assert strategy.next_delay(0, 0.0) == 2.0
+    assert strategy.next_delay(50, 120.0, _task(progress=90)) == 2.0
+
+
+def test_adaptive_strategy_grows_and_caps():
+    """Test the adaptive delay grows geometrically up to max_delay."""
+    strategy = AdaptivePollStrategy(initial_delay=0.25, multiplier=2.0, max_delay=1.0)
+    delays = [strategy.next_delay(attempt, 0.0) for attempt in range(5)]
+    assert delays == [0.25, 0.5, 1.0, 1.0, 1.0]
+    # Very long polls do not overflow
+    assert strategy.next_delay(10**6, 0.0) == 1.0
+
+
+def test_adaptive_strategy_honors_retry_after():
+    """Test a server retry_after hint overrides the computed delay."""
+    strategy = AdaptivePollStrategy(max_delay=2.0)
+    assert strategy.next_delay(0, 1.0, _task(retry_after=5)) == 5.0
+
+
+def test_adaptive_strategy_extrapolates_progress():
+    """Test the delay follows the remaining time predicted from progress."""
+    strategy = AdaptivePollStrategy(initial_delay=0.1, max_delay=10.0)
+    # 4 seconds for 80% -> about 1 second left
+    assert strategy.next_delay(0, 4.0, _task(progress=80)) == pytest.approx(1.0)
+    # Bounded by max_delay
+    assert strategy.next_delay(0, 100.0, _task(progress=10)) == 10.0
+
+    no_progress = AdaptivePollStrategy(initial_delay=0.1, max_delay=10.0, use_progress=False)
+    assert no_progress.next_delay(0, 4.0, _task(progress=80)) == 0.1
+
+
+def test_default_strategies_per_task_type():
+    """Test long-running task types are polled less eagerly."""
+    text = get_poll_strategy("text_generation")
+    documents = get_poll_strategy("document_processing")
+    assert text.next_delay(0, 0.0) < documents.next_delay(0, 0.0)
+    assert isinstance(get_poll_strategy("unknown"), AdaptivePollStrategy)
+
+
+def test_poller_uses_strategy_delays():
+    """Test the poller sleeps for the delays chosen by its strategy."""
+    client = Mock()
+    client.poll_scheduler = None
+    client.request.side_effect = [
+        {"task_id": "t1", "status": "running", "task_type": "image_generation"},
+        {"task_id": "t1", "status": "running", "task_type": "image_generation"},
+        {"task_id": "t1", "status": "completed", "output": {}},
+    ]
+    poller = TaskPoller(client)
+
+    with patch("nexusai._internal._poller.time.sleep") as mock_sleep:
+        poller.poll("t1")
+
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays == [0.25, 0.375]
+
+
+def test_poller_interval_selects_fixed_strategy():
+    """Test an explicit poll_interval keeps the fixed schedule."""
+    poller = TaskPoller(Mock(poll_scheduler=None), poll_interval=3.0)
+    assert isinstance(poller.strategy, FixedPollStrategy)
+    assert poller.strategy.interval == 3.0
@@ -0,0 +1,189 @@
+"""Tests for the client-side rate limiter."""
+
+import httpx
+import pytest
+from unittest.mock import patch
+from nexusai import (
+    AsyncNexusAIClient,
+    FileRateLimitBackend,
+    MemoryRateLimitBackend,
+    NexusAIClient,
+    RateLimiter,
+)
+from nexusai.config import config
+from nexusai._internal._rate_limit import estimate_tokens, response_tokens
+
+USAGE = {"prompt_tokens": 10, "completion_tokens": 990, "total_tokens": 1000}
+
+
+def _ok_client(limiter, body=None):
+    """Client whose requests all succeed immediately."""
+    body = body if body is not None else {"ok": True}
+    client = NexusAIClient(api_key="test_key", base_url="http://test/api/v1", rate_limiter=limiter)
+    client._internal_client.client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+    )
+    return client
+
+
+def test_requests_bucket_spaces_out_requests():
+    """After the burst, requests wait for the bucket to refill"""
+    limiter = RateLimiter(requests_per_minute=60, burst=1)
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(1, abs=0.05)
+    assert limiter.reserve() == pytest.approx(2, abs=0.05)
+
+
+def test_burst_allows_requests_at_once():
+    """Up to burst seconds of traffic is sent without waiting"""
+    limiter = RateLimiter(requests_per_minute=600, burst=1)
+
+    waits = [limiter.reserve() for _ in range(11)]
+
+    assert waits[:10] == [0] * 10
+    assert waits[10] > 0
+
+
+def test_tokens_bucket():
+    """Large requests wait in proportion to their tokens"""
+    limiter = RateLimiter(tokens_per_minute=6000, burst=10)  # 100 tokens/s, 1000 burst
+
+    assert limiter.reserve(tokens=1000) == 0
+    assert limiter.reserve(tokens=500) == pytest.approx(5, abs=0.05)
+
+
+def test_unlimited_by_default():
+    """A limiter without limits never waits"""
+    limiter = RateLimiter()
+
+    assert all(limiter.reserve(tokens=10**6) == 0 for _ in range(100))
+
+
+def test_settle_gives_back_unused_tokens():
+    """Overestimated tokens are returned, but never beyond the burst"""
+    limiter = RateLimiter(tokens_per_minute=6000, burst=10)
+    limiter.reserve(tokens=1000)
+
+    limiter.settle(estimated=1000, actual=100)
+    assert limiter.reserve(tokens=900) == 0
+
+    limiter.settle(estimated=10**6, actual=0)
+    assert limiter.reserve(tokens=1100) == pytest.approx(1, abs=0.05)
+
+
+def test_invalid_limits_rejected():
+    """Limits must be positive"""
+    with pytest.raises(ValueError):
+        RateLimiter(requests_per_minute=0)
+    with pytest.raises(ValueError):
+        RateLimiter(tokens_per_minute=100, burst=-1)
+
+
+def test_estimate_tokens():
+    """Estimates count input characters and the output budget"""
+    body = {"input": {"prompt": "x" * 400}, "config": {"max_tokens": 50}}
+
+    assert 100 < estimate_tokens(body) <= 110 + 50
+    assert estimate_tokens({"input": {"prompt": "hi"}}) >= 256
+    assert estimate_tokens(None) == 0
+    assert estimate_tokens({"file_id": "file_1"}) == 0
+
+
+def test_response_tokens():
+    """Usage is read from /invoke output or the top level"""
+    assert response_tokens({"output": {"usage": {"total_tokens": 42}}}) == 42
+    assert response_tokens({"usage": {"total_tokens": 7}}) == 7
+    assert response_tokens({"output": {"text": "hi"}}) is None
+
+
+def test_file_backend_shared_between_instances(tmp_path):
+    """Backends on the same file draw from the same buckets"""
+    path = tmp_path / "ratelimit.json"
+    first = RateLimiter(requests_per_minute=60, burst=1, backend=FileRateLimitBackend(path))
+    second = RateLimiter(requests_per_minute=60, burst=1, backend=FileRateLimitBackend(path))
+
+    assert first.reserve() == 0
+    assert second.reserve() == pytest.approx(1, abs=0.05)
+
+
+def test_file_backend_recovers_from_corrupt_state(tmp_path):
+    """An unreadable state file starts over with full buckets"""
+    path = tmp_path / "ratelimit.json"
+    path.write_text("{not json")
+    limiter = RateLimiter(requests_per_minute=60, burst=1, backend=FileRateLimitBackend(path))
+
+    assert limiter.reserve() == 0
+
+
+def test_client_requests_wait_for_limiter():
+    """Every request of the client goes through its limiter"""
+    client = _ok_client(RateLimiter(requests_per_minute=60, burst=1))
+
+    with patch("nexusai._internal._rate_limit.time.sleep") as mock_sleep:
+        for _ in range(3):
+            client._internal_client.request("GET", "/files")
+
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays == [pytest.approx(1, abs=0.1), pytest.approx(2, abs=0.1)]
+
+
+def test_client_settles_reported_usage():
+    """Actual usage from the response replaces the estimate"""
+    limiter = RateLimiter(tokens_per_minute=6000, burst=10)
+    client = _ok_client(limiter, {"output": {"text": "hi", "usage": USAGE}})
+
+    with patch.object(limiter, "settle", wraps=limiter.settle) as mock_settle:
+        client.text.generate(prompt="hello", max_tokens=100)
+
+    estimated, actual = mock_settle.call_args.args
+    assert 100 <= estimated < 120  # max_tokens plus a few prompt tokens
+    assert actual == 1000
+
+
+def test_limiter_shared_by_resources():
+    """Resources of one client share one limiter"""
+    limiter = RateLimiter(requests_per_minute=60, burst=1)
+    client = _ok_client(limiter, {"files": [], "total": 0})
+
+    with patch("nexusai._internal._rate_limit.time.sleep") as mock_sleep:
+        client._internal_client.request("GET", "/files")
+        client._internal_client.request("GET", "/knowledge-bases")
+
+    mock_sleep.assert_called_once()
+
+
+def test_limiter_from_config():
+    """NEXUS_REQUESTS_PER_MINUTE / NEXUS_TOKENS_PER_MINUTE build a limiter"""
+    original = config.requests_per_minute
+    try:
+        config.requests_per_minute = 120
+        client = NexusAIClient(api_key="test_key")
+    finally:
+        config.requests_per_minute = original
+
+    limiter = client._internal_client.rate_limiter
+    assert isinstance(limiter, RateLimiter)
+    assert limiter.requests_per_minute == 120
+    assert isinstance(limiter.backend, MemoryRateLimitBackend)
+    assert NexusAIClient(api_key="test_key")._internal_client.rate_limiter is None
+
+
+@pytest.mark.asyncio
+async def test_async_client_waits_without_blocking():
+    """The async client waits for the limiter with asyncio.sleep"""
+    client = AsyncNexusAIClient(
+        api_key="test_key",
+        base_url="http://test/api/v1",
+        rate_limiter=RateLimiter(requests_per_minute=60, burst=1),
+    )
+    client._internal_client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    )
+
+    with patch("nexusai._internal._rate_limit.asyncio.sleep") as mock_sleep:
+        await client._internal_client.request("GET", "/files")
+        await client._internal_client.request("GET", "/files")
+
+    mock_sleep.assert_called_once()
+    await client.close()
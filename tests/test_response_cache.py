@@ -0,0 +1,134 @@
+"""Tests for the local text generation response cache."""
+
+import pytest
+from unittest.mock import patch
+from nexusai import AsyncNexusAIClient, NexusAIClient, ResponseCache, SQLiteCacheStore
+from nexusai._internal._response_cache import request_digest
+
+BODY = {"task_type": "text_generation", "input": {"prompt": "hi"}, "config": {"temperature": 0}}
+
+
+def _counting_request(calls):
+    """Fake request counting calls to /invoke."""
+
+    def request(method, endpoint, json_data=None, **kwargs):
+        calls.append(json_data)
+        return {"output": {"text": f"answer {len(calls)}"}}
+
+    return request
+
+
+def test_digest_ignores_key_order():
+    """Bodies differing only in key order share a key"""
+    reordered = {
+        "config": {"temperature": 0},
+        "input": {"prompt": "hi"},
+        "task_type": BODY["task_type"],
+    }
+
+    assert request_digest(BODY) == request_digest(reordered)
+    assert request_digest(BODY) != request_digest({**BODY, "model": "gpt-4"})
+
+
+def test_only_deterministic_requests_are_cacheable():
+    """temperature must be 0 unless deterministic_only is off"""
+    cache = ResponseCache()
+    warm = {**BODY, "config": {"temperature": 0.7}}
+
+    assert cache.request_key(BODY, "ns").startswith("ns:")
+    assert cache.request_key(warm) is None
+    assert cache.request_key({**BODY, "stream": True}) is None
+    assert ResponseCache(deterministic_only=False).request_key(warm) is not None
+
+
+def test_hit_and_miss_metrics():
+    """Lookups are counted"""
+    cache = ResponseCache()
+    key = cache.request_key(BODY)
+
+    assert cache.get(key) is None
+    cache.put(key, {"output": {"text": "hello"}})
+    assert cache.get(key) == {"output": {"text": "hello"}}
+
+    assert cache.metrics() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1}
+
+
+def test_expired_entry_is_removed():
+    """Entries older than ttl are misses"""
+    cache = ResponseCache(ttl=10)
+    cache.put("key", {"output": {}})
+
+    with patch("nexusai._internal._cache.time.time", return_value=10**10):
+        assert cache.get("key") is None
+    assert len(cache.store) == 0
+
+
+def test_least_recently_used_evicted():
+    """The cache holds at most max_entries responses"""
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    cache.get("a")
+    cache.put("c", {"n": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
+
+
+def test_sqlite_store_persists(tmp_path):
+    """Responses survive in a SQLite store"""
+    path = tmp_path / "responses.db"
+    ResponseCache(SQLiteCacheStore(path)).put("key", {"output": {"text": "hello"}})
+
+    assert ResponseCache(SQLiteCacheStore(path)).get("key") == {"output": {"text": "hello"}}
+
+
+def test_client_reuses_deterministic_response():
+    """A repeated temperature=0 request is answered from the cache"""
+    cache = ResponseCache()
+    client = NexusAIClient(api_key="test_key", response_cache=cache)
+    calls = []
+
+    with patch.object(client._internal_client, "request", side_effect=_counting_request(calls)):
+        first = client.text.generate(prompt="Classify: good", temperature=0)
+        second = client.text.generate(prompt="Classify: good", temperature=0)
+        other = client.text.generate(prompt="Classify: bad", temperature=0)
+        client.text.generate(prompt="Classify: good")
+
+    assert first.text == second.text == "answer 1"
+    assert other.text == "answer 2"
+    assert len(calls) == 3
+    assert cache.hits == 1
+
+
+def test_cache_is_scoped_to_account():
+    """Clients with different API keys do not share entries"""
+    cache = ResponseCache()
+    calls = []
+
+    for api_key in ("key_a", "key_b"):
+        client = NexusAIClient(api_key=api_key, response_cache=cache)
+        with patch.object(client._internal_client, "request", side_effect=_counting_request(calls)):
+            client.text.generate(prompt="hi", temperature=0)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_reuses_response():
+    """The async client uses the cache the same way"""
+    cache = ResponseCache()
+    client = AsyncNexusAIClient(api_key="test_key", response_cache=cache)
+    calls = []
+
+    async def request(method, endpoint, json_data=None, **kwargs):
+        calls.append(json_data)
+        return {"output": {"text": "hello"}}
+
+    with patch.object(client._internal_client, "request", side_effect=request):
+        await client.text.generate(prompt="hi", temperature=0)
+        response = await client.text.generate(prompt="hi", temperature=0)
+
+    assert response.text == "hello"
+    assert len(calls) == 1
+    await client.close()
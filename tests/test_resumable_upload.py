@@ -0,0 +1,133 @@
+"""Tests for resumable multipart uploads."""
+
+import pytest
+from unittest.mock import patch
+from nexusai import AsyncNexusAIClient
+from nexusai.error import FileUploadError, NetworkError, NotFoundError
+from nexusai.models import FileMetadata
+
+
+class FakeUploadServer:
+    """In-memory multipart upload endpoints."""
+
+    def __init__(self, fail_parts=()):
+        self.fail_parts = set(fail_parts)
+        self.uploads = {}
+        self.part_calls = []
+
+    def request(self, method, endpoint, json_data=None, content=None, **kwargs):
+        parts = endpoint.strip("/").split("/")
+        if method == "POST" and endpoint == "/files/uploads":
+            upload_id = f"up_{len(self.uploads) + 1}"
+            self.uploads[upload_id] = {"filename": json_data["filename"], "parts": {}}
+            return {"upload_id": upload_id}
+
+        upload = self.uploads.get(parts[2])
+        if upload is None:
+            raise NotFoundError("Upload not found", status_code=404)
+
+        if method == "PUT":
+            number = int(parts[4])
+            self.part_calls.append(number)
+            if number in self.fail_parts:
+                self.fail_parts.discard(number)
+                raise NetworkError("connection reset")
+            upload["parts"][number] = content
+            return {"part_number": number, "etag": f"etag{number}"}
+
+        if method == "GET":
+            return {"parts": [{"part_number": n, "etag": f"etag{n}"} for n in upload["parts"]]}
+
+        # Complete
+        assert [p["part_number"] for p in json_data["parts"]] == sorted(upload["parts"])
+        self.assembled = b"".join(upload["parts"][n] for n in sorted(upload["parts"]))
+        return {
+            "file_id": "file_big",
+            "filename": upload["filename"],
+            "content_type": "audio/wav",
+            "size": len(self.assembled),
+        }
+
+
+@pytest.fixture
+def big_file(tmp_path):
+    path = tmp_path / "recording.wav"
+    path.write_bytes(bytes(range(256)) * 41)  # 10496 bytes -> 11 parts of 1 KiB
+    return path
+
+
+def test_upload_resumable_assembles_parts(mock_client, big_file, tmp_path):
+    """Test all parts are sent and assembled into one file."""
+    server = FakeUploadServer()
+    state_dir = tmp_path / "state"
+    progress = []
+
+    with patch.object(mock_client._internal_client, "request", side_effect=server.request):
+        meta = mock_client.files.upload_resumable(
+            big_file,
+            part_size=1024,
+            concurrency=3,
+            state_dir=state_dir,
+            progress_callback=lambda sent, total: progress.append((sent, total)),
+        )
+
+    assert isinstance(meta, FileMetadata)
+    assert meta.file_id == "file_big"
+    assert server.assembled == big_file.read_bytes()
+    assert sorted(server.part_calls) == list(range(1, 12))
+    assert max(progress) == (10496, 10496)
+    # State is removed once the upload is complete
+    assert list(state_dir.iterdir()) == []
+
+
+def test_upload_resumable_resumes_missing_parts(mock_client, big_file, tmp_path):
+    """Test a failed upload keeps its progress and resumes with missing parts only."""
+    server = FakeUploadServer(fail_parts={4, 9})
+    state_dir = tmp_path / "state"
+
+    with patch.object(mock_client._internal_client, "request", side_effect=server.request):
+        with pytest.raises(FileUploadError, match="2 of 11 parts failed"):
+            mock_client.files.upload_resumable(big_file, part_size=1024, state_dir=state_dir)
+        assert len(list(state_dir.iterdir())) == 1
+
+        server.part_calls.clear()
+        meta = mock_client.files.upload_resumable(big_file, part_size=1024, state_dir=state_dir)
+
+    assert sorted(server.part_calls) == [4, 9]
+    assert len(server.uploads) == 1
+    assert meta.size == big_file.stat().st_size
+    assert server.assembled == big_file.read_bytes()
+
+
+def test_upload_resumable_restarts_expired_upload(mock_client, big_file, tmp_path):
+    """Test saved progress is dropped when the server no longer has the upload."""
+    server = FakeUploadServer(fail_parts={2})
+    state_dir = tmp_path / "state"
+
+    with patch.object(mock_client._internal_client, "request", side_effect=server.request):
+        with pytest.raises(FileUploadError):
+            mock_client.files.upload_resumable(big_file, part_size=1024, state_dir=state_dir)
+        server.uploads.clear()
+        server.part_calls.clear()
+
+        mock_client.files.upload_resumable(big_file, part_size=1024, state_dir=state_dir)
+
+    assert sorted(server.part_calls) == list(range(1, 12))
+
+
+@pytest.mark.asyncio
+async def test_async_upload_resumable(big_file, tmp_path):
+    """Test the async client sends parts concurrently and completes the upload."""
+    client = AsyncNexusAIClient(api_key="test_key")
+    server = FakeUploadServer()
+
+    async def request(*args, **kwargs):
+        return server.request(*args, **kwargs)
+
+    with patch.object(client._internal_client, "request", new=request):
+        meta = await client.files.upload_resumable(
+            big_file, part_size=4096, state_dir=tmp_path / "state"
+        )
+
+    assert meta.file_id == "file_big"
+    assert server.assembled == big_file.read_bytes()
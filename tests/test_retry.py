@@ -0,0 +1,311 @@
+"""Tests for application-level retries of requests, streams and polls."""
+
+import httpx
+import pytest
+from unittest.mock import patch
+from nexusai import AsyncNexusAIClient, NexusAIClient, RetryConfig
+from nexusai.error import APIError, InvalidRequestError, NetworkError, RateLimitError, ServerError
+from nexusai._internal._client import _parse_retry_after
+from nexusai._internal._retry import NO_RETRY, call_with_retry, is_retry_safe, retry_delay
+
+FAST = RetryConfig(max_retries=3, initial_delay=0, jitter=0)
+
+
+def _sequence_handler(responses, calls):
+    """Transport handler returning the given responses in order."""
+
+    def handler(request):
+        calls.append(request)
+        response = responses[len(calls) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return handler
+
+
+def _client(handler, **kwargs):
+    client = NexusAIClient(api_key="test_key", base_url="http://test/api/v1", **kwargs)
+    client._internal_client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_request_retries_server_errors():
+    """5xx responses are retried until one succeeds"""
+    calls = []
+    client = _client(
+        _sequence_handler(
+            [httpx.Response(503), httpx.Response(500), httpx.Response(200, json={"ok": True})],
+            calls,
+        ),
+        retry=FAST,
+    )
+
+    assert client._internal_client.request("GET", "/files") == {"ok": True}
+    assert len(calls) == 3
+
+
+def test_request_gives_up_after_max_retries():
+    """The last error is raised once the retries are used up"""
+    calls = []
+    client = _client(_sequence_handler([httpx.Response(502)] * 4, calls), retry=FAST)
+
+    with pytest.raises(ServerError):
+        client._internal_client.request("GET", "/files")
+    assert len(calls) == 4
+
+
+def test_client_errors_are_not_retried():
+    """4xx responses other than 429 fail immediately"""
+    calls = []
+    client = _client(_sequence_handler([httpx.Response(400)], calls), retry=FAST)
+
+    with pytest.raises(InvalidRequestError):
+        client._internal_client.request("POST", "/invoke", json_data={})
+    assert len(calls) == 1
+
+
+def test_network_errors_are_retried():
+    """Dropped connections are retried"""
+    calls = []
+    client = _client(
+        _sequence_handler(
+            [httpx.ReadError("reset"), httpx.Response(200, json={"ok": True})], calls
+        ),
+        retry=FAST,
+    )
+
+    assert client._internal_client.request("GET", "/files") == {"ok": True}
+    assert len(calls) == 2
+
+
+def test_rate_limit_waits_for_retry_after():
+    """A 429 waits as long as Retry-After asks instead of the backoff delay"""
+    calls = []
+    client = _client(
+        _sequence_handler(
+            [
+                httpx.Response(429, headers={"Retry-After": "7"}),
+                httpx.Response(200, json={"ok": True}),
+            ],
+            calls,
+        ),
+        retry=FAST,
+    )
+
+    with patch("nexusai._internal._retry.time.sleep") as mock_sleep:
+        client._internal_client.request("GET", "/files")
+
+    mock_sleep.assert_called_once_with(7)
+
+
+def test_retry_after_is_capped_at_max_delay():
+    """A Retry-After longer than max_delay waits max_delay"""
+    calls = []
+    client = _client(
+        _sequence_handler(
+            [
+                httpx.Response(429, headers={"Retry-After": "3600"}),
+                httpx.Response(200, json={"ok": True}),
+            ],
+            calls,
+        ),
+        retry=RetryConfig(max_retries=3, initial_delay=0, max_delay=5, jitter=0),
+    )
+
+    with patch("nexusai._internal._retry.time.sleep") as mock_sleep:
+        client._internal_client.request("GET", "/files")
+
+    mock_sleep.assert_called_once_with(5)
+
+
+def test_per_call_retry_overrides_client():
+    """retry= on a call replaces the client's configuration"""
+    calls = []
+    client = _client(_sequence_handler([httpx.Response(503)] * 4, calls), retry=FAST)
+
+    with pytest.raises(ServerError):
+        client._internal_client.request("GET", "/files", retry=NO_RETRY)
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [httpx.Response(503), httpx.ReadTimeout("slow"), httpx.ReadError("reset")],
+    ids=["5xx", "read_timeout", "read_error"],
+)
+def test_non_idempotent_post_is_not_retried_after_sending(failure):
+    """A POST that may have been processed is not repeated by default"""
+    calls = []
+    client = _client(_sequence_handler([failure, httpx.Response(200, json={})], calls), retry=FAST)
+
+    with pytest.raises(APIError):
+        client._internal_client.request("POST", "/invoke", json_data={"input": {}})
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [httpx.Response(429), httpx.ConnectError("refused"), httpx.ConnectTimeout("slow")],
+    ids=["429", "connect_error", "connect_timeout"],
+)
+def test_non_idempotent_post_retries_unsent_failures(failure):
+    """Rate limits and connection failures are retried: nothing was processed"""
+    calls = []
+    client = _client(
+        _sequence_handler([failure, httpx.Response(200, json={"ok": True})], calls), retry=FAST
+    )
+
+    assert client._internal_client.request("POST", "/invoke", json_data={}) == {"ok": True}
+    assert len(calls) == 2
+
+
+def test_retry_non_idempotent_opts_in_per_call():
+    """retry_non_idempotent=True retries any retryable error of a POST"""
+    calls = []
+    client = _client(
+        _sequence_handler([httpx.Response(503), httpx.Response(200, json={"ok": True})], calls)
+    )
+    retry = RetryConfig(max_retries=1, initial_delay=0, jitter=0, retry_non_idempotent=True)
+
+    assert client._internal_client.request("POST", "/invoke", json_data={}, retry=retry)
+    assert len(calls) == 2
+
+
+def test_is_retry_safe():
+    """Idempotent methods and read-only POSTs are safe to repeat"""
+    assert is_retry_safe("GET", "/invoke")
+    assert is_retry_safe("delete", "/files/f1")
+    assert is_retry_safe("POST", "/knowledge-bases/search")
+    assert not is_retry_safe("POST", "/invoke")
+    assert not is_retry_safe("POST", "/files")
+
+
+def test_max_retries_sets_default_retry():
+    """Without a RetryConfig, max_retries bounds the attempts"""
+    client = NexusAIClient(api_key="test_key", max_retries=5)
+
+    assert client._internal_client.retry.max_retries == 5
+
+
+def test_stream_retries_before_first_chunk():
+    """A stream that fails before sending data is restarted"""
+    calls = []
+    body = b'data: {"delta": "hi"}\n\ndata: [DONE]\n\n'
+    client = _client(
+        _sequence_handler(
+            [
+                httpx.Response(429),
+                httpx.Response(200, content=body, headers={"Content-Type": "text/event-stream"}),
+            ],
+            calls,
+        ),
+        retry=FAST,
+    )
+
+    chunks = list(client._internal_client.stream("POST", "/invoke", json_data={}))
+
+    assert chunks == [{"delta": "hi"}]
+    assert len(calls) == 2
+
+
+def test_stream_not_retried_after_first_chunk():
+    """Once data was yielded, a broken stream raises instead of restarting"""
+    client = NexusAIClient(api_key="test_key", retry=FAST)
+    internal = client._internal_client
+    attempts = []
+
+    def broken(*args, **kwargs):
+        attempts.append(1)
+        yield {"delta": "partial"}
+        raise NetworkError("connection lost")
+
+    with patch.object(internal, "_stream_once", side_effect=broken):
+        stream = internal.stream("POST", "/invoke")
+        assert next(stream) == {"delta": "partial"}
+        with pytest.raises(NetworkError):
+            next(stream)
+
+    assert len(attempts) == 1
+
+
+def test_poller_status_checks_are_retried():
+    """A rate-limited status check does not abort polling"""
+    calls = []
+    client = _client(
+        _sequence_handler(
+            [
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json={"task_id": "t1", "status": "completed"}),
+            ],
+            calls,
+        ),
+        retry=FAST,
+    )
+
+    assert client.text._poller.poll("t1")["status"] == "completed"
+    assert len(calls) == 2
+
+
+def test_parse_retry_after_headers():
+    """Retry-After seconds, HTTP dates and X-RateLimit-Reset are understood"""
+    assert _parse_retry_after(httpx.Headers({"Retry-After": "12"})) == 12
+    past = "Thu, 01 Jan 1970 00:00:00 GMT"
+    assert _parse_retry_after(httpx.Headers({"Retry-After": past})) == 0
+    assert _parse_retry_after(httpx.Headers({"X-RateLimit-Reset": "30"})) == 30
+    assert _parse_retry_after(httpx.Headers({})) is None
+
+
+def test_retry_delay_prefers_retry_after():
+    """Backoff is used unless the error carries retry_after"""
+    config = RetryConfig(initial_delay=2, jitter=0)
+
+    assert retry_delay(ServerError("down"), 1, config) == 4
+    assert retry_delay(RateLimitError("slow down", retry_after=9), 1, config) == 9
+
+
+def test_call_with_retry_does_not_retry_other_exceptions():
+    """Only API errors are retried"""
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise ValueError("bug")
+
+    with pytest.raises(ValueError):
+        call_with_retry(fail, FAST)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_request_retries():
+    """The async client retries with asyncio.sleep"""
+    calls = []
+    client = AsyncNexusAIClient(api_key="test_key", base_url="http://test/api/v1", retry=FAST)
+    client._internal_client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            _sequence_handler([httpx.Response(500), httpx.Response(200, json={"ok": 1})], calls)
+        )
+    )
+
+    assert await client._internal_client.request("GET", "/files") == {"ok": 1}
+    assert len(calls) == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_stream_retries_before_first_chunk():
+    """The async stream restarts when it fails before sending data"""
+    calls = []
+    body = b'data: {"delta": "hi"}\n\ndata: [DONE]\n\n'
+    client = AsyncNexusAIClient(api_key="test_key", base_url="http://test/api/v1", retry=FAST)
+    responses = [httpx.ConnectError("refused"), httpx.Response(200, content=body)]
+    client._internal_client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_sequence_handler(responses, calls))
+    )
+
+    chunks = [c async for c in client._internal_client.stream("POST", "/invoke", json_data={})]
+
+    assert chunks == [{"delta": "hi"}]
+    assert len(calls) == 2
+    await client.close()
@@ -0,0 +1,280 @@
+"""Tests for provider/model fallback chains and latency-aware routing."""
+
+import threading
+import pytest
+from unittest.mock import patch
+from nexusai import AsyncNexusAIClient, NexusAIClient, Router
+from nexusai.error import APIError, CircuitOpenError, InvalidRequestError, ServerError
+from nexusai._internal._routing import normalize_candidates, should_fall_back
+
+TEXT = "text_generation"
+
+
+def _providers(router, candidates):
+    return [provider for provider, _, _ in router.order(TEXT, candidates)]
+
+
+def test_normalize_candidates():
+    """Names, pairs and weighted triples are accepted"""
+    assert normalize_candidates(["openai", ("anthropic", "claude"), ("dmxapi", "gpt", 2)]) == [
+        ("openai", None, 1.0),
+        ("anthropic", "claude", 1.0),
+        ("dmxapi", "gpt", 2.0),
+    ]
+    with pytest.raises(ValueError):
+        normalize_candidates([])
+    with pytest.raises(ValueError):
+        normalize_candidates([("openai", "gpt-4", 0)])
+    with pytest.raises(ValueError):
+        normalize_candidates("openai")
+
+
+def test_given_order_until_measured():
+    """Without measurements candidates are tried in the given order"""
+    router = Router()
+
+    assert _providers(router, ["openai", "anthropic"]) == ["openai", "anthropic"]
+
+
+def test_fastest_candidate_first():
+    """Measured latency decides the order"""
+    router = Router()
+    router.record(TEXT, "openai", None, latency=2.0)
+    router.record(TEXT, "anthropic", None, latency=0.5)
+
+    assert _providers(router, ["openai", "anthropic"]) == ["anthropic", "openai"]
+
+
+def test_weights_scale_preference():
+    """A weight of 2 makes a candidate count as twice as fast"""
+    router = Router()
+    router.record(TEXT, "openai", None, latency=1.0)
+    router.record(TEXT, "anthropic", None, latency=1.5)
+
+    assert _providers(router, [("openai", None), ("anthropic", None, 2)]) == [
+        "anthropic",
+        "openai",
+    ]
+
+
+def test_unhealthy_candidate_tried_last_until_recovered():
+    """A failing candidate moves to the back until its failure rate decays"""
+    router = Router(half_life=10)
+    router.record(TEXT, "openai", None, latency=0.1)
+    router.record(TEXT, "openai", None, failed=True)
+    router.record(TEXT, "openai", None, failed=True)
+    router.record(TEXT, "anthropic", None, latency=5.0)
+
+    assert _providers(router, ["openai", "anthropic"]) == ["anthropic", "openai"]
+
+    later = router._stats[(TEXT, "openai", None)].updated_at + 20
+    with patch("nexusai._internal._routing.time.monotonic", return_value=later):
+        assert _providers(router, ["openai", "anthropic"]) == ["openai", "anthropic"]
+
+
+def test_unmeasured_candidate_is_probed():
+    """A faster second candidate is measured and then preferred"""
+    router = Router()
+    calls = []
+    latencies = {"openai": 2.0, "anthropic": 0.5}
+    clock = [0.0]
+
+    def func(provider, model):
+        calls.append(provider)
+        clock[0] += latencies[provider]
+        return provider
+
+    with patch("nexusai._internal._routing.time.monotonic", side_effect=lambda: clock[0]):
+        for _ in range(3):
+            router.call(TEXT, ["openai", "anthropic"], func)
+
+    assert calls == ["openai", "anthropic", "anthropic"]
+
+
+def test_stale_candidate_is_probed_again():
+    """A latency older than probe_interval is measured again"""
+    router = Router(probe_interval=60)
+    router.record(TEXT, "openai", None, latency=2.0)
+    router.record(TEXT, "anthropic", None, latency=0.5)
+    assert _providers(router, ["openai", "anthropic"]) == ["anthropic", "openai"]
+
+    later = router._stats[(TEXT, "openai", None)].measured_at + 61
+    with patch("nexusai._internal._routing.time.monotonic", return_value=later):
+        router.record(TEXT, "anthropic", None, latency=0.5)
+        assert _providers(router, ["openai", "anthropic"]) == ["openai", "anthropic"]
+        router.record(TEXT, "openai", None, latency=3.0)
+        assert _providers(router, ["openai", "anthropic"]) == ["anthropic", "openai"]
+
+
+def test_one_probe_per_candidate_at_a_time():
+    """While a candidate is being probed, concurrent calls go to the measured one"""
+    router = Router()
+    router.record(TEXT, "openai", None, latency=0.5)
+    calls = []
+    probing = threading.Event()
+    release = threading.Event()
+
+    def func(provider, model):
+        calls.append(provider)
+        if provider == "anthropic":
+            probing.set()
+            release.wait(5)
+        return provider
+
+    probe = threading.Thread(target=router.call, args=(TEXT, ["openai", "anthropic"], func))
+    probe.start()
+    assert probing.wait(5)
+    for _ in range(4):
+        assert router.call(TEXT, ["openai", "anthropic"], func) == "openai"
+    release.set()
+    probe.join(5)
+
+    assert calls == ["anthropic"] + ["openai"] * 4
+    assert router._probing == set()
+
+
+def test_stats_are_per_task_type():
+    """Latency of one task type does not affect another"""
+    router = Router()
+    router.record("image_generation", "openai", None, latency=30.0)
+    router.record("image_generation", "anthropic", None, latency=10.0)
+    router.record(TEXT, "openai", None, latency=1.0)
+    router.record(TEXT, "anthropic", None, latency=2.0)
+
+    assert _providers(router, ["openai", "anthropic"]) == ["openai", "anthropic"]
+    assert [p for p, _, _ in router.order("image_generation", ["openai", "anthropic"])] == [
+        "anthropic",
+        "openai",
+    ]
+
+
+def test_should_fall_back():
+    """Availability errors and failed tasks fall back; invalid requests do not"""
+    assert should_fall_back(ServerError("down"))
+    assert should_fall_back(CircuitOpenError("open"))
+    assert should_fall_back(APIError("Task failed"))
+    assert not should_fall_back(InvalidRequestError("bad"))
+
+
+def test_call_falls_back_and_records():
+    """The next candidate is tried when one fails"""
+    router = Router()
+    calls = []
+
+    def func(provider, model):
+        calls.append((provider, model))
+        if provider == "openai":
+            raise ServerError("down")
+        return provider
+
+    result = router.call(TEXT, [("openai", "gpt-4"), ("anthropic", "claude")], func)
+
+    assert result == "anthropic"
+    assert calls == [("openai", "gpt-4"), ("anthropic", "claude")]
+    stats = router.stats()
+    assert stats[(TEXT, "openai", "gpt-4")]["failure_rate"] > 0
+    assert stats[(TEXT, "anthropic", "claude")]["latency"] is not None
+
+
+def test_call_raises_last_error_when_all_fail():
+    """The last candidate's error is raised"""
+    router = Router()
+
+    def func(provider, model):
+        raise ServerError(f"{provider} down")
+
+    with pytest.raises(ServerError, match="anthropic down"):
+        router.call(TEXT, ["openai", "anthropic"], func)
+
+
+def test_call_does_not_fall_back_on_invalid_request():
+    """Errors that every candidate would return are raised immediately"""
+    router = Router()
+    calls = []
+
+    def func(provider, model):
+        calls.append(provider)
+        raise InvalidRequestError("bad prompt")
+
+    with pytest.raises(InvalidRequestError):
+        router.call(TEXT, ["openai", "anthropic"], func)
+    assert calls == ["openai"]
+
+
+def test_candidates_exclude_provider():
+    """candidates cannot be combined with provider or model"""
+    router = Router()
+
+    with pytest.raises(ValueError):
+        router.call(TEXT, ["openai"], lambda p, m: None, provider="openai")
+
+
+def test_text_generate_with_candidates(mock_client):
+    """text.generate() routes between candidates"""
+    bodies = []
+
+    def request(method, endpoint, json_data=None, **kwargs):
+        bodies.append(json_data)
+        if json_data["provider"] == "openai":
+            raise ServerError("down")
+        return {"output": {"text": "hi", "model": json_data["model"]}}
+
+    with patch.object(mock_client._internal_client, "request", side_effect=request):
+        response = mock_client.text.generate(
+            prompt="hi", candidates=[("openai", "gpt-4"), ("anthropic", "claude")]
+        )
+
+    assert response.model == "claude"
+    assert [b["provider"] for b in bodies] == ["openai", "anthropic"]
+
+
+def test_images_generate_falls_back_on_failed_task(mock_client):
+    """A task failing at one provider is retried with the next"""
+
+    def request(method, endpoint, json_data=None, **kwargs):
+        if method == "POST":
+            return {"task_id": f"task_{json_data['provider']}", "status": "pending"}
+        if endpoint == "/tasks/task_openai":
+            return {"task_id": "task_openai", "status": "failed", "error": {"message": "boom"}}
+        return {
+            "task_id": "task_dmxapi",
+            "status": "completed",
+            "output": {"image_url": "https://example.com/a.png"},
+        }
+
+    with patch.object(mock_client._internal_client, "request", side_effect=request):
+        image = mock_client.images.generate("A cat", candidates=["openai", "dmxapi"])
+
+    assert image.image_url == "https://example.com/a.png"
+
+
+@pytest.mark.asyncio
+async def test_async_transcribe_with_candidates():
+    """The async client routes the same way"""
+    client = AsyncNexusAIClient(api_key="test_key_123", base_url="http://localhost:8000/api/v1")
+    providers = []
+
+    async def request(method, endpoint, json_data=None, **kwargs):
+        if method == "POST":
+            providers.append(json_data["provider"])
+            if json_data["provider"] == "openai":
+                raise ServerError("down")
+            return {"task_id": "task_1", "status": "pending"}
+        return {"task_id": "task_1", "status": "completed", "output": {"text": "hello"}}
+
+    with patch.object(client._internal_client, "request", side_effect=request):
+        result = await client.audio.transcribe("file_1", candidates=["openai", "dmxapi"])
+
+    assert result.text == "hello"
+    assert providers == ["openai", "dmxapi"]
+    await client.close()
+
+
+def test_router_shared_between_clients():
+    """A router passed to several clients pools their measurements"""
+    router = Router()
+
+    first = NexusAIClient(api_key="test_key", router=router)
+    second = NexusAIClient(api_key="test_key", router=router)
+
+    assert first._internal_client.router is second._internal_client.router
@@ -0,0 +1,249 @@
+"""Tests for the shared batch poll scheduler."""
+
+import pytest
+from unittest.mock import patch
+from nexusai import NexusAIClient, AsyncNexusAIClient
+from nexusai.error import APIError, APITimeoutError, NotFoundError
+from nexusai._internal._scheduler import PollScheduler, AsyncPollScheduler
+from nexusai._internal._poll_strategy import FixedPollStrategy
+
+
+class FakeTaskServer:
+    """Serves task statuses; each task completes after a number of checks."""
+
+    def __init__(self, checks_until_done=2, batch=True):
+        self.checks_until_done = checks_until_done
+        self.batch = batch
+        self.checks = {}
+        self.calls = []
+
+    def _status(self, task_id):
+        self.checks[task_id] = self.checks.get(task_id, 0) + 1
+        if task_id.startswith("fail"):
+            return {"task_id": task_id, "status": "failed", "error": {"message": "bad input"}}
+        if self.checks[task_id] >= self.checks_until_done:
+            return {"task_id": task_id, "status": "completed", "output": {"id": task_id}}
+        return {"task_id": task_id, "status": "running"}
+
+    def request(self, method, endpoint, json_data=None, **kwargs):
+        self.calls.append((method, endpoint))
+        if endpoint == "/tasks/batch":
+            if not self.batch:
+                raise NotFoundError("Not Found", status_code=404)
+            return {"tasks": [self._status(task_id) for task_id in json_data["task_ids"]]}
+        return self._status(endpoint.rsplit("/", 1)[-1])
+
+
+class AsyncFakeTaskServer(FakeTaskServer):
+    """Async variant of FakeTaskServer."""
+
+    async def request(self, method, endpoint, json_data=None, **kwargs):
+        return FakeTaskServer.request(self, method, endpoint, json_data=json_data, **kwargs)
+
+
+def test_scheduler_batches_pending_tasks():
+    """Test pending tasks are checked together through the batch endpoint."""
+    server = FakeTaskServer()
+    scheduler = PollScheduler(server, poll_interval=0.01)
+
+    futures = [scheduler.submit(f"task_{i}") for i in range(5)]
+    results = [f.result(timeout=5) for f in futures]
+
+    assert [r["output"]["id"] for r in results] == [f"task_{i}" for i in range(5)]
+    assert all(endpoint == "/tasks/batch" for _, endpoint in server.calls)
+    assert scheduler.batch_supported is True
+    # Two rounds cover all five tasks
+    assert len(server.calls) <= 4
+
+
+def test_scheduler_falls_back_to_fan_out():
+    """Test the scheduler polls individually when the batch endpoint is missing."""
+    server = FakeTaskServer(batch=False)
+    scheduler = PollScheduler(server, poll_interval=0.01, concurrency=2)
+
+    futures = [scheduler.submit(f"task_{i}") for i in range(3)]
+    results = [f.result(timeout=5) for f in futures]
+
+    assert len(results) == 3
+    assert scheduler.batch_supported is False
+    batch_calls = [c for c in server.calls if c[1] == "/tasks/batch"]
+    assert len(batch_calls) == 1
+    scheduler.close()
+
+
+def test_scheduler_propagates_task_failure():
+    """Test a failed task fails only its own future."""
+    server = FakeTaskServer()
+    scheduler = PollScheduler(server, poll_interval=0.01)
+
+    ok = scheduler.submit("task_ok")
+    failed = scheduler.submit("fail_1")
+
+    with pytest.raises(APIError, match="bad input"):
+        failed.result(timeout=5)
+    assert ok.result(timeout=5)["status"] == "completed"
+
+
+def test_scheduler_timeout():
+    """Test waiters time out independently."""
+    server = FakeTaskServer(checks_until_done=10**6)
+    scheduler = PollScheduler(server, poll_interval=0.01)
+
+    future = scheduler.submit("slow", timeout=0.05)
+
+    with pytest.raises(APITimeoutError):
+        future.result(timeout=5)
+    assert scheduler.pending_count == 0
+
+
+def test_client_batch_polling_routes_poller_through_scheduler():
+    """Test resources share the client's scheduler when batch polling is on."""
+    client = NexusAIClient(api_key="test_key", batch_polling=True)
+    scheduler = client._internal_client.poll_scheduler
+
+    assert isinstance(scheduler, PollScheduler)
+    assert client.images._poller.scheduler is scheduler
+    assert client.knowledge_bases._poller.scheduler is scheduler
+
+    server = FakeTaskServer()
+    scheduler.strategy = FixedPollStrategy(0.01)
+    with patch.object(client._internal_client, "request", side_effect=server.request):
+        task = client.knowledge_bases.wait_for_processing("doc_task_1")
+
+    assert task.status == "completed"
+    client.close()
+
+
+def test_client_batch_polling_disabled_by_default():
+    """Test batch polling is opt-in."""
+    client = NexusAIClient(api_key="test_key")
+    assert client._internal_client.poll_scheduler is None
+    assert client.images._poller.scheduler is None
+
+
+@pytest.mark.asyncio
+async def test_async_scheduler_batches_pending_tasks():
+    """Test the async scheduler resolves many awaiting callers."""
+    server = AsyncFakeTaskServer()
+    scheduler = AsyncPollScheduler(server, poll_interval=0.01)
+
+    futures = [scheduler.submit(f"task_{i}") for i in range(10)]
+    results = [await f for f in futures]
+
+    assert len(results) == 10
+    assert all(endpoint == "/tasks/batch" for _, endpoint in server.calls)
+
+
+@pytest.mark.asyncio
+async def test_async_client_handles_share_scheduler():
+    """Test async task handles are resolved by the shared scheduler."""
+    client = AsyncNexusAIClient(api_key="test_key", batch_polling=True)
+    scheduler = client._internal_client.poll_scheduler
+    scheduler.strategy = FixedPollStrategy(0.01)
+    server = AsyncFakeTaskServer(batch=False)
+
+    with patch.object(client._internal_client, "request", new=server.request):
+        handles = [client.text._poller.start(f"t{i}") for i in range(4)]
+        for handle in handles:
+            assert (await handle)["status"] == "completed"
+
+    assert scheduler.batch_supported is False
+    await client.close()
+
+
+def test_scheduler_checks_tasks_on_their_own_schedule():
+    """Test a slow-polled task does not hold back a fast-polled one."""
+    server = FakeTaskServer(checks_until_done=3)
+    scheduler = PollScheduler(server)
+
+    slow = scheduler.submit("slow", strategy=FixedPollStrategy(10))
+    fast = scheduler.submit("fast", strategy=FixedPollStrategy(0.01))
+
+    assert fast.result(timeout=5)["status"] == "completed"
+    assert not slow.done()
+    assert server.checks["slow"] == 1
+    assert scheduler.pending_count == 1
+
+
+class ProgressTaskServer(FakeTaskServer):
+    """Reports progress while tasks run."""
+
+    def _status(self, task_id):
+        status = super()._status(task_id)
+        status["progress"] = 100 if status["status"] == "completed" else 50
+        return status
+
+
+def test_scheduler_survives_raising_progress_callback():
+    """Test a raising progress callback fails only its own waiter."""
+    server = ProgressTaskServer(checks_until_done=3)
+    scheduler = PollScheduler(server, poll_interval=0.01)
+
+    def bad_callback(progress):
+        raise ValueError("callback bug")
+
+    bad = scheduler.submit("task_1", progress_callback=bad_callback)
+    good = scheduler.submit("task_1")
+    other = scheduler.submit("task_2")
+
+    with pytest.raises(ValueError, match="callback bug"):
+        bad.result(timeout=5)
+    assert good.result(timeout=5)["status"] == "completed"
+    assert other.result(timeout=5)["status"] == "completed"
+
+
+def test_scheduler_unexpected_error_fails_waiters_and_restarts():
+    """Test an unexpected polling error reaches waiters instead of hanging them."""
+    server = FakeTaskServer()
+    scheduler = PollScheduler(server, poll_interval=0.01)
+
+    with patch.object(scheduler, "_fetch", side_effect=RuntimeError("boom")):
+        future = scheduler.submit("task_1")
+        with pytest.raises(RuntimeError, match="boom"):
+            future.result(timeout=5)
+
+    assert scheduler.submit("task_2").result(timeout=5)["status"] == "completed"
+
+
+def test_progress_callback_may_submit():
+    """Test a progress callback can submit tasks without deadlocking."""
+    server = ProgressTaskServer(checks_until_done=2)
+    scheduler = PollScheduler(server, poll_interval=0.01)
+    followups = []
+
+    def callback(progress):
+        if not followups:
+            followups.append(scheduler.submit("task_2"))
+
+    assert scheduler.submit("task_1", progress_callback=callback).result(timeout=5)
+    assert followups[0].result(timeout=5)["status"] == "completed"
+
+
+def test_scheduler_close_fails_pending_and_stops_thread():
+    """Test closing the scheduler fails tasks still awaited and ends its thread."""
+    server = FakeTaskServer(checks_until_done=10**6)
+    scheduler = PollScheduler(server, poll_interval=0.01)
+
+    future = scheduler.submit("slow")
+    thread = scheduler._thread
+    scheduler.close()
+
+    with pytest.raises(APIError, match="closed"):
+        future.result(timeout=5)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert scheduler.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_async_scheduler_close_fails_pending():
+    """Test closing the async scheduler fails tasks still awaited."""
+    server = AsyncFakeTaskServer(checks_until_done=10**6)
+    scheduler = AsyncPollScheduler(server, poll_interval=0.01)
+
+    future = scheduler.submit("slow")
+    scheduler.close()
+
+    with pytest.raises(APIError, match="closed"):
+        await future
+    assert scheduler.pending_count == 0
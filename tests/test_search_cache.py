@@ -0,0 +1,230 @@
+"""Tests for caching knowledge base search results."""
+
+import threading
+import pytest
+from unittest.mock import patch
+from nexusai import (
+    AsyncNexusAIClient,
+    EmbeddingIndex,
+    NexusAIClient,
+    SearchCache,
+    SQLiteCacheStore,
+)
+from nexusai._internal._search_cache import normalize_query
+
+
+def _search_request(calls):
+    """Fake request answering searches, document additions and polls."""
+
+    def request(method, endpoint, json_data=None, **kwargs):
+        calls.append(endpoint)
+        if endpoint == "/knowledge-bases/search":
+            return {
+                "query": json_data["query"],
+                "results": [],
+                "total_results": len(calls),
+            }
+        if endpoint.endswith("/documents"):
+            return {"task_id": "task_1", "status": "queued"}
+        if endpoint.startswith("/tasks/"):
+            return {"task_id": "task_1", "status": "completed"}
+        return {"message": "deleted"}
+
+    return request
+
+
+def _searches(calls):
+    return calls.count("/knowledge-bases/search")
+
+
+def _embed(text):
+    """Toy embedding: counts of a few words."""
+    words = text.split()
+    return [words.count(w) for w in ("vacation", "policy", "holiday", "salary")]
+
+
+def test_normalize_query():
+    """Case, whitespace and trailing punctuation are ignored"""
+    assert normalize_query("  What is the  Vacation policy? ") == "what is the vacation policy"
+
+
+def test_key_includes_search_parameters():
+    """Different knowledge bases or top_k are different entries"""
+    cache = SearchCache()
+    scope = cache.scope(["kb_1", "kb_2"], 5, 0.7)
+
+    assert scope == cache.scope(["kb_2", "kb_1"], 5, 0.7)
+    assert scope != cache.scope(["kb_1"], 5, 0.7)
+    assert scope != cache.scope(["kb_1", "kb_2"], 3, 0.7)
+    assert scope != cache.scope(["kb_1", "kb_2"], 5, 0.8)
+
+
+def test_hit_miss_and_expiry():
+    """Entries are counted and expire after ttl"""
+    cache = SearchCache(ttl=10)
+    scope = cache.scope(["kb_1"], 5, 0.7)
+
+    assert cache.get(scope, "q") is None
+    cache.put(scope, "Q?", {"results": []})
+    assert cache.get(scope, "q") == {"results": []}
+    assert cache.metrics()["hits"] == 1
+    assert cache.metrics()["misses"] == 1
+
+    with patch("nexusai._internal._cache.time.time", return_value=10**10):
+        assert cache.get(scope, "q") is None
+
+
+def test_invalidate_affects_only_that_knowledge_base():
+    """Invalidating one knowledge base keeps searches over others"""
+    cache = SearchCache()
+    for kb_id in ("kb_1", "kb_2"):
+        cache.put(cache.scope([kb_id], 5, 0.7), "q", {"kb": kb_id})
+
+    cache.invalidate("kb_1")
+
+    assert cache.get(cache.scope(["kb_1"], 5, 0.7), "q") is None
+    assert cache.get(cache.scope(["kb_2"], 5, 0.7), "q") == {"kb": "kb_2"}
+
+
+def test_evicted_generation_does_not_revive_entries():
+    """Losing a generation token to eviction makes old entries misses"""
+    cache = SearchCache()
+    scope = cache.scope(["kb_1"], 5, 0.7)
+    cache.put(scope, "q", {"results": []})
+
+    cache.store.delete(":generation:kb_1")
+
+    assert cache.get(cache.scope(["kb_1"], 5, 0.7), "q") is None
+
+
+def test_sqlite_invalidation_is_shared(tmp_path):
+    """Processes sharing a SQLite store see each other's invalidations"""
+    path = tmp_path / "search.db"
+    first = SearchCache(SQLiteCacheStore(path))
+    second = SearchCache(SQLiteCacheStore(path))
+    first.put(first.scope(["kb_1"], 5, 0.7), "q", {"results": []})
+
+    assert second.get(second.scope(["kb_1"], 5, 0.7), "q") == {"results": []}
+    second.invalidate("kb_1")
+    assert first.get(first.scope(["kb_1"], 5, 0.7), "q") is None
+
+
+def test_embedding_index_reuses_similar_query():
+    """A rephrased query reuses results through the similarity index"""
+    cache = SearchCache(index=EmbeddingIndex(_embed, min_similarity=0.9))
+    scope = cache.scope(["kb_1"], 5, 0.7)
+    cache.put(scope, "vacation policy", {"results": ["a"]})
+
+    assert cache.get(scope, "policy vacation") == {"results": ["a"]}
+    assert cache.get(scope, "salary policy") is None
+    assert cache.similar_hits == 1
+
+
+def test_client_search_is_cached_until_document_added(mock_client):
+    """add_document() and processing invalidate searches over the knowledge base"""
+    mock_client._internal_client.search_cache = SearchCache()
+    kb = mock_client.knowledge_bases
+    calls = []
+
+    with patch.object(mock_client._internal_client, "request", side_effect=_search_request(calls)):
+        first = kb.search("Vacation policy?", ["kb_1"])
+        second = kb.search("vacation policy", ["kb_1"])
+        assert _searches(calls) == 1
+        assert second.query == "vacation policy"
+        assert second.total_results == first.total_results
+
+        task = kb.add_document("kb_1", "file_1")
+        kb.search("vacation policy", ["kb_1"])
+        kb.search("vacation policy", ["kb_1"])  # Cached while processing
+        assert _searches(calls) == 2
+
+        kb.wait_for_processing(task.task_id)
+        kb.search("vacation policy", ["kb_1"])
+        assert _searches(calls) == 3
+        assert kb._processing == {}
+
+
+def test_client_delete_invalidates(mock_client):
+    """Deleting a knowledge base invalidates its searches"""
+    mock_client._internal_client.search_cache = SearchCache()
+    calls = []
+
+    with patch.object(mock_client._internal_client, "request", side_effect=_search_request(calls)):
+        mock_client.knowledge_bases.search("q", ["kb_1"])
+        mock_client.knowledge_bases.delete("kb_1")
+        mock_client.knowledge_bases.search("q", ["kb_1"])
+
+    assert _searches(calls) == 2
+
+
+def test_clients_without_cache_always_search(mock_client):
+    """Without a search cache every search is sent"""
+    calls = []
+
+    with patch.object(mock_client._internal_client, "request", side_effect=_search_request(calls)):
+        mock_client.knowledge_bases.search("q", ["kb_1"])
+        mock_client.knowledge_bases.search("q", ["kb_1"])
+
+    assert _searches(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_search_is_cached():
+    """The async client uses the cache the same way"""
+    client = AsyncNexusAIClient(api_key="test_key", search_cache=SearchCache())
+    calls = []
+    sync_request = _search_request(calls)
+
+    async def request(*args, **kwargs):
+        return sync_request(*args, **kwargs)
+
+    with patch.object(client._internal_client, "request", side_effect=request):
+        await client.knowledge_bases.search("q", ["kb_1"])
+        await client.knowledge_bases.search("q", ["kb_1"])
+        await client.knowledge_bases.add_document("kb_1", "file_1")
+        await client.knowledge_bases.search("q", ["kb_1"])
+
+    assert _searches(calls) == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_search_cache_runs_off_event_loop(tmp_path):
+    """Cache lookups, writes and invalidations of the async client run in an executor"""
+    cache = SearchCache(store=SQLiteCacheStore(tmp_path / "search.db"))
+    client = AsyncNexusAIClient(api_key="test_key", search_cache=cache)
+    calls = []
+    sync_request = _search_request(calls)
+    loop_thread = threading.get_ident()
+    threads = []
+    store_get, store_set = cache.store.get, cache.store.set
+
+    def get(key):
+        threads.append(threading.get_ident())
+        return store_get(key)
+
+    def set_(key, value):
+        threads.append(threading.get_ident())
+        return store_set(key, value)
+
+    async def request(*args, **kwargs):
+        return sync_request(*args, **kwargs)
+
+    with patch.object(client._internal_client, "request", side_effect=request), patch.object(
+        cache.store, "get", side_effect=get
+    ), patch.object(cache.store, "set", side_effect=set_):
+        await client.knowledge_bases.search("q", ["kb_1"])
+        await client.knowledge_bases.search("q", ["kb_1"])
+        await client.knowledge_bases.delete("kb_1")
+
+    assert _searches(calls) == 1
+    assert threads and loop_thread not in threads
+    await client.close()
+
+
+def test_search_cache_client_option():
+    """search_cache= is passed through to the internal client"""
+    cache = SearchCache()
+    client = NexusAIClient(api_key="test_key", search_cache=cache)
+
+    assert client._internal_client.search_cache is cache
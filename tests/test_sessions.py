@@ -85,3 +85,21 @@ def test_session_delete(mock_client, mock_session_response):
             # Verify delete was called with correct endpoint
             delete_call = [call for call in mock_delete.call_args_list if "/sessions/" in str(call)]
             assert len(delete_call) > 0
+
+
+def test_session_history_parses_messages(mock_client, mock_session_response):
+    """History messages are validated in one call, timestamps included"""
+    history_response = {
+        "messages": [
+            {"role": "user", "content": "Hello", "timestamp": "2024-01-01T00:00:00Z"},
+            {"role": "assistant", "content": "Hi there!"},
+        ]
+    }
+
+    with patch.object(mock_client._internal_client, 'request', side_effect=[mock_session_response, history_response]):
+        session = mock_client.sessions.create(name="Test")
+        history = session.history()
+
+    assert [msg.role for msg in history] == ["user", "assistant"]
+    assert history[0].timestamp.year == 2024
+    assert all(isinstance(msg, Message) for msg in history)
@@ -0,0 +1,213 @@
+"""Tests for coalescing identical concurrent requests."""
+
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from nexusai import AsyncNexusAIClient, NexusAIClient
+from nexusai.config import config
+from nexusai.error import ServerError
+from nexusai._internal._retry import NO_RETRY
+from nexusai._internal._singleflight import SingleFlight, is_coalescible, request_key
+
+SEARCH = {"query": "refunds", "knowledge_base_ids": ["kb_1"], "top_k": 5}
+
+
+def _slow_handler(calls, delay=0.2, status=200):
+    """Transport handler that answers slowly, counting requests."""
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            calls.append(request.url.path)
+        time.sleep(delay)
+        return httpx.Response(status, json={"results": []})
+
+    return handler
+
+
+def _client(calls, **kwargs):
+    kwargs.setdefault("coalesce_requests", True)
+    client = NexusAIClient(api_key="test_key", base_url="http://test/api/v1", **kwargs)
+    client._internal_client.client = httpx.Client(
+        transport=httpx.MockTransport(_slow_handler(calls))
+    )
+    return client
+
+
+def test_coalescible_requests():
+    """Reads and deterministic generations coalesce; submissions do not"""
+    body = {"task_type": "text_generation", "config": {"temperature": 0}}
+
+    assert is_coalescible("GET", "/tasks/t1", None, None)
+    assert is_coalescible("POST", "/knowledge-bases/search", SEARCH, None)
+    assert is_coalescible("POST", "/invoke", body, None)
+    assert not is_coalescible("POST", "/invoke", {**body, "config": {"temperature": 0.7}}, None)
+    assert not is_coalescible("POST", "/invoke", body, {"Prefer": "respond-async"})
+    assert not is_coalescible("DELETE", "/files/f1", None, None)
+    assert not is_coalescible("POST", "/sessions", {}, None)
+
+
+def test_request_key_ignores_key_order():
+    """Identical bodies give the same key regardless of key order"""
+    reordered = dict(reversed(list(SEARCH.items())))
+
+    assert request_key("POST", "/x", SEARCH, None, None) == request_key(
+        "post", "/x", reordered, None, None
+    )
+    assert request_key("GET", "/x", None, None, {"a": 1}) != request_key(
+        "GET", "/x", None, None, {"a": 2}
+    )
+
+
+def test_single_flight_shares_result_copies():
+    """Waiters get a copy of the leader's result"""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def func():
+        started.set()
+        release.wait()
+        return {"items": [1]}
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.call, "key", func)
+        started.wait()
+        follower = pool.submit(flight.call, "key", func)
+        while flight.shared == 0:
+            time.sleep(0.01)
+        release.set()
+        first, second = leader.result(), follower.result()
+
+    assert first == second == {"items": [1]}
+    assert first is not second
+    first["items"].append(2)
+    assert second == {"items": [1]}
+    assert flight._calls == {}
+
+
+def test_concurrent_searches_share_one_call():
+    """Identical searches in flight at once make one HTTP request"""
+    calls = []
+    client = _client(calls)
+
+    def search(_):
+        return client._internal_client.request("POST", "/knowledge-bases/search", json_data=SEARCH)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(search, range(8)))
+
+    assert results == [{"results": []}] * 8
+    assert len(calls) == 1
+    assert client._internal_client.single_flight.shared == 7
+
+
+def test_sequential_requests_are_not_coalesced():
+    """Only requests in flight at the same time are shared"""
+    calls = []
+    client = _client(calls)
+
+    for _ in range(2):
+        client._internal_client.request("GET", "/tasks/t1")
+
+    assert len(calls) == 2
+
+
+def test_non_idempotent_requests_are_sent_each_time():
+    """Creating resources is never coalesced"""
+    calls = []
+    client = _client(calls)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: client._internal_client.request("POST", "/sessions"), range(4)))
+
+    assert len(calls) == 4
+
+
+def test_error_is_shared():
+    """Waiters receive the error of the shared call"""
+    calls = []
+    client = NexusAIClient(
+        api_key="test_key", base_url="http://test/api/v1", retry=NO_RETRY, coalesce_requests=True
+    )
+    client._internal_client.client = httpx.Client(
+        transport=httpx.MockTransport(_slow_handler(calls, status=503))
+    )
+
+    def poll(_):
+        with pytest.raises(ServerError):
+            client._internal_client.request("GET", "/tasks/t1")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(poll, range(4)))
+
+    assert len(calls) == 1
+
+
+def test_coalescing_is_opt_in():
+    """Coalescing is off unless coalesce_requests=True or NEXUS_COALESCE_REQUESTS=true"""
+    calls = []
+    client = _client(calls, coalesce_requests=None)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: client._internal_client.request("GET", "/tasks/t1"), range(4)))
+
+    assert len(calls) == 4
+
+    original = config.coalesce_requests
+    try:
+        config.coalesce_requests = True
+        assert NexusAIClient(api_key="test_key")._internal_client.coalesce_requests
+    finally:
+        config.coalesce_requests = original
+
+
+@pytest.mark.asyncio
+async def test_async_identical_generations_share_one_call():
+    """Concurrent temperature=0 text.generate() calls make one request"""
+    calls = []
+    client = AsyncNexusAIClient(
+        api_key="test_key", base_url="http://test/api/v1", coalesce_requests=True
+    )
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"output": {"text": "positive"}})
+
+    client._internal_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    responses = await asyncio.gather(
+        *[client.text.generate(prompt="Classify: great", temperature=0) for _ in range(5)]
+    )
+
+    assert [r.text for r in responses] == ["positive"] * 5
+    assert len(calls) == 1
+    assert client._internal_client.single_flight._calls == {}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_waiter_does_not_cancel_call():
+    """Cancelling one caller leaves the shared call running for the others"""
+    client = AsyncNexusAIClient(
+        api_key="test_key", base_url="http://test/api/v1", coalesce_requests=True
+    )
+
+    async def handler(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"status": "completed"})
+
+    client._internal_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    request = client._internal_client.request
+
+    first = asyncio.ensure_future(request("GET", "/tasks/t1"))
+    second = asyncio.ensure_future(request("GET", "/tasks/t1"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == {"status": "completed"}
+    await client.close()
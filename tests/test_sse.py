@@ -0,0 +1,131 @@
+"""Tests for the incremental Server-Sent Events decoder."""
+
+import httpx
+import pytest
+from nexusai import AsyncNexusAIClient, NexusAIClient
+from nexusai.error import StreamError
+from nexusai._internal._sse import ServerSentEvent, SSEDecoder, iter_events
+
+STREAM = (
+    b": keep-alive comment\n"
+    b"event: delta\n"
+    b"id: 1\n"
+    b'data: {"a":\n'
+    b"data: 1}\n"
+    b"\n"
+    b"data: [DONE]\n"
+    b"\n"
+)
+
+
+def _split(data, size):
+    """Split bytes into chunks of a given size."""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_multi_line_events_and_fields():
+    """Data lines are joined; event type and id are kept; comments skipped"""
+    assert list(iter_events([STREAM])) == [
+        ServerSentEvent('{"a":\n1}', event="delta", id="1"),
+        ServerSentEvent("[DONE]", id="1"),
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_chunk_boundaries_do_not_matter(size):
+    """Any split of the byte stream decodes to the same events"""
+    assert list(iter_events(_split(STREAM, size))) == list(iter_events([STREAM]))
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\r\n", b"\r"])
+def test_line_endings(newline):
+    """LF, CRLF and CR all end lines, also when a CRLF is split"""
+    stream = newline.join([b"data: a", b"data:b", b"", b"data: c", b"", b""])
+
+    for size in (1, 2, len(stream)):
+        events = list(iter_events(_split(stream, size)))
+        assert [e.data for e in events] == ["a\nb", "c"]
+
+
+def test_field_parsing_details():
+    """One leading space is dropped; fields without colon have empty values"""
+    decoder = SSEDecoder()
+
+    events = decoder.feed(b"data:  two spaces\ndata\nretry: 3000\nunknown: x\n\n")
+
+    assert events == [ServerSentEvent(" two spaces\n", retry=3000)]
+
+
+def test_event_type_resets_between_events():
+    """An event type applies only to the event it precedes"""
+    events = list(iter_events([b"event: ping\n\ndata: x\n\nevent: done\ndata: y\n\n"]))
+
+    assert [(e.event, e.data) for e in events] == [("message", "x"), ("done", "y")]
+
+
+def test_event_type_before_data_chunk():
+    """An event line in an earlier chunk applies to the data in the next one"""
+    decoder = SSEDecoder()
+
+    assert decoder.feed(b"data: a\n\n") == [ServerSentEvent("a")]
+    assert decoder.feed(b"event: delta\n") == []
+    assert decoder.feed(b"data: b\n\n") == [ServerSentEvent("b", event="delta")]
+    assert decoder.feed(b"data: c\n\n") == [ServerSentEvent("c")]
+
+
+def test_bom_and_utf8_split_across_chunks():
+    """A leading BOM is skipped; multi-byte characters may be split"""
+    stream = b"\xef\xbb\xbfdata: h\xc3\xa9\n\n"
+
+    assert [e.data for e in iter_events(_split(stream, 1))] == ["hé"]
+
+
+def test_unterminated_last_event_is_flushed():
+    """A final event without its blank line is still delivered"""
+    decoder = SSEDecoder()
+
+    assert decoder.feed(b"data: last") == []
+    assert decoder.flush() == [ServerSentEvent("last")]
+
+
+def _stream_client(body_chunks):
+    client = NexusAIClient(api_key="test_key", base_url="http://test/api/v1")
+    client._internal_client.client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=iter(body_chunks))
+        )
+    )
+    return client
+
+
+def test_client_stream_uses_decoder():
+    """Chunks split mid-line and multi-line data reach the caller as JSON"""
+    body = b'data: {"delta":\ndata: "a"}\n\n: ping\n\ndata: {"delta": "b"}\n\ndata: [DONE]\n\n'
+    client = _stream_client(_split(body, 5))
+
+    chunks = list(client._internal_client.stream("POST", "/invoke", json_data={}))
+
+    assert chunks == [{"delta": "a"}, {"delta": "b"}]
+
+
+def test_client_stream_invalid_json():
+    """Malformed event data raises StreamError"""
+    client = _stream_client([b"data: {oops\n\n"])
+
+    with pytest.raises(StreamError, match="chunk 1"):
+        list(client._internal_client.stream("POST", "/invoke", json_data={}))
+
+
+@pytest.mark.asyncio
+async def test_async_client_stream_uses_decoder():
+    """The async client decodes the same way"""
+    body = b"data: {\"delta\": \"a\"}\r\n\r\ndata: [DONE]\r\n\r\n"
+    client = AsyncNexusAIClient(api_key="test_key", base_url="http://test/api/v1")
+    client._internal_client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    )
+
+    chunks = [c async for c in client._internal_client.stream("POST", "/invoke", json_data={})]
+
+    assert chunks == [{"delta": "a"}]
+    await client.close()
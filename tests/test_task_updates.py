@@ -0,0 +1,119 @@
+"""Tests for waiting on tasks through SSE and long-polling."""
+
+import httpx
+import pytest
+from unittest.mock import patch
+from nexusai import NexusAIClient, AsyncNexusAIClient
+from nexusai.error import APIError, NotFoundError, StreamError
+
+RUNNING = {"task_id": "t1", "status": "running", "progress": 50}
+COMPLETED = {"task_id": "t1", "status": "completed", "output": {"text": "done"}}
+
+
+def test_task_updates_default_to_polling():
+    """Test push modes are opt-in."""
+    client = NexusAIClient(api_key="test_key")
+    assert client._internal_client.task_updates == "poll"
+    assert client.text._poller.task_updates == "poll"
+
+
+def test_sse_waits_for_pushed_completion():
+    """Test the poller follows the task's event stream instead of polling."""
+    client = NexusAIClient(api_key="test_key", task_updates="sse")
+    progress = []
+
+    with patch.object(
+        client._internal_client, "stream", return_value=iter([RUNNING, COMPLETED])
+    ) as mock_stream, patch.object(client._internal_client, "request") as mock_request:
+        result = client.text._poller.poll_with_progress("t1", progress.append)
+
+    assert result["output"]["text"] == "done"
+    assert progress == [50]
+    mock_stream.assert_called_once_with("GET", "/tasks/t1/events")
+    mock_request.assert_not_called()
+    assert client.text._poller.events_supported is True
+
+
+def test_sse_unsupported_falls_back_to_polling():
+    """Test a missing event endpoint switches the poller to polling for good."""
+    client = NexusAIClient(api_key="test_key", task_updates="sse")
+    poller = client.text._poller
+
+    def missing_stream(*args, **kwargs):
+        raise NotFoundError("Not Found", status_code=404)
+        yield  # pragma: no cover
+
+    with patch.object(client._internal_client, "stream", side_effect=missing_stream) as mock_stream:
+        with patch.object(client._internal_client, "request", return_value=COMPLETED):
+            assert poller.poll("t1")["status"] == "completed"
+            assert poller.events_supported is False
+            poller.poll("t1")
+
+    assert mock_stream.call_count == 1
+
+
+def test_sse_stream_ending_early_falls_back_to_polling():
+    """Test polling takes over when the event stream closes before completion."""
+    client = NexusAIClient(api_key="test_key", task_updates="sse")
+
+    def broken_stream(*args, **kwargs):
+        yield RUNNING
+        raise StreamError("connection lost")
+
+    with patch.object(client._internal_client, "stream", side_effect=broken_stream):
+        with patch.object(client._internal_client, "request", return_value=COMPLETED) as mock_request:
+            assert client.text._poller.poll("t1")["status"] == "completed"
+
+    mock_request.assert_called_once()
+    assert client.text._poller.events_supported is None
+
+
+def test_sse_task_failure_is_raised():
+    """Test a failure pushed over the stream is raised, not retried by polling."""
+    client = NexusAIClient(api_key="test_key", task_updates="sse")
+    failed = {"task_id": "t1", "status": "failed", "error": {"message": "bad input"}}
+
+    with patch.object(client._internal_client, "stream", return_value=iter([failed])):
+        with patch.object(client._internal_client, "request") as mock_request:
+            with pytest.raises(APIError, match="bad input"):
+                client.text._poller.poll("t1")
+
+    mock_request.assert_not_called()
+
+
+def test_long_poll_asks_server_to_hold_request():
+    """Test long-poll requests carry a wait parameter and a matching timeout."""
+    client = NexusAIClient(api_key="test_key", timeout=10, task_updates="long_poll")
+
+    with patch.object(
+        client._internal_client, "request", side_effect=[RUNNING, COMPLETED]
+    ) as mock_request, patch("nexusai._internal._poller.time.sleep") as mock_sleep:
+        client.text._poller.poll("t1")
+
+    kwargs = mock_request.call_args[1]
+    assert kwargs["params"] == {"wait": 20}
+    assert kwargs["timeout"] == 30
+    mock_sleep.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_sse_over_transport():
+    """Test the async poller parses task events from a real SSE response."""
+    client = AsyncNexusAIClient(api_key="test_key", task_updates="sse")
+    internal = client._internal_client
+    body = (
+        b'data: {"task_id": "t1", "status": "running", "progress": 10}\n\n'
+        b": keep-alive\n\n"
+        b'data: {"task_id": "t1", "status": "completed", "output": {"text": "done"}}\n\n'
+    )
+
+    def handler(request):
+        assert request.url.path.endswith("/tasks/t1/events")
+        return httpx.Response(200, content=body, headers={"Content-Type": "text/event-stream"})
+
+    internal.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    result = await client.text._poller.start("t1")
+
+    assert result["output"]["text"] == "done"
+    await client.close()
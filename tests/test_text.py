@@ -3,7 +3,8 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from nexusai import NexusAIClient
-from nexusai.models import TextResponse
+from nexusai.models import TextResponse, Usage
+from nexusai.resources.text import _parse_text_response
 
 
 def test_text_generate_simple(mock_client, mock_text_response):
@@ -70,3 +71,15 @@ def test_text_generate_async(mock_client):
         assert isinstance(task, Task)
         assert task.task_id == "task_async_123"
         assert task.status == "pending"
+
+
+def test_parse_text_response_builds_usage():
+    """Usage is validated into a model; empty usage becomes None"""
+    usage = {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3}
+
+    response = _parse_text_response({"output": {"text": "hi", "usage": usage, "model": "m"}})
+    empty = _parse_text_response({"output": {"text": "hi", "usage": {}}})
+
+    assert response.usage == Usage(**usage)
+    assert response.model == "m"
+    assert empty.usage is None
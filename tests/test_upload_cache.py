@@ -0,0 +1,217 @@
+"""Tests for the content-hash upload cache."""
+
+import io
+import time
+import pytest
+from unittest.mock import patch
+from nexusai import AsyncNexusAIClient, NexusAIClient, UploadCache
+from nexusai._internal._cache import MemoryCacheStore, SQLiteCacheStore
+from nexusai.error import NotFoundError
+from nexusai.models import FileMetadata
+
+
+def _file_data(file_id="file_1", filename="doc.pdf"):
+    return {
+        "file_id": file_id,
+        "filename": filename,
+        "content_type": "application/pdf",
+        "size": 5,
+    }
+
+
+class FakeFileServer:
+    """Counts uploads and serves file metadata."""
+
+    def __init__(self):
+        self.uploads = 0
+        self.deleted = set()
+
+    def request(self, method, endpoint, **kwargs):
+        if method == "POST" and endpoint == "/files":
+            self.uploads += 1
+            return _file_data(file_id=f"file_{self.uploads}")
+        if method == "GET" and endpoint.startswith("/files/"):
+            file_id = endpoint.split("/")[2]
+            if file_id in self.deleted:
+                raise NotFoundError("File not found", status_code=404)
+            return _file_data(file_id=file_id)
+        if method == "POST" and endpoint.endswith("/documents"):
+            return {"task_id": "task_1", "status": "pending"}
+        raise AssertionError(f"unexpected request {method} {endpoint}")
+
+
+def _client(cache, api_key="test_key_123"):
+    return NexusAIClient(
+        api_key=api_key, base_url="http://localhost:8000/api/v1", upload_cache=cache
+    )
+
+
+def test_duplicate_upload_is_skipped():
+    """Uploading the same content twice sends it once"""
+    client = _client(UploadCache())
+    server = FakeFileServer()
+
+    with patch.object(client._internal_client, "request", side_effect=server.request):
+        first = client.files.upload(io.BytesIO(b"hello"), filename="a.pdf")
+        second = client.files.upload(io.BytesIO(b"hello"), filename="b.pdf")
+        other = client.files.upload(io.BytesIO(b"world"), filename="c.pdf")
+
+    assert server.uploads == 2
+    assert second.file_id == first.file_id
+    assert other.file_id != first.file_id
+    assert client._internal_client.upload_cache.hits == 1
+
+
+def test_no_cache_by_default(mock_client):
+    """Without an upload cache every upload is sent"""
+    server = FakeFileServer()
+
+    with patch.object(mock_client._internal_client, "request", side_effect=server.request):
+        mock_client.files.upload(io.BytesIO(b"hello"), filename="a.pdf")
+        mock_client.files.upload(io.BytesIO(b"hello"), filename="a.pdf")
+
+    assert server.uploads == 2
+
+
+def test_deleted_file_is_uploaded_again():
+    """A cached file_id the server no longer has triggers a fresh upload"""
+    client = _client(UploadCache())
+    server = FakeFileServer()
+
+    with patch.object(client._internal_client, "request", side_effect=server.request):
+        first = client.files.upload(io.BytesIO(b"hello"), filename="a.pdf")
+        server.deleted.add(first.file_id)
+        second = client.files.upload(io.BytesIO(b"hello"), filename="a.pdf")
+        third = client.files.upload(io.BytesIO(b"hello"), filename="a.pdf")
+
+    assert server.uploads == 2
+    assert second.file_id != first.file_id
+    assert third.file_id == second.file_id
+
+
+def test_verify_disabled_skips_get():
+    """With verify=False the cached metadata is returned without a request"""
+    client = _client(UploadCache(verify=False))
+    server = FakeFileServer()
+
+    with patch.object(
+        client._internal_client, "request", side_effect=server.request
+    ) as mock_request:
+        client.files.upload(io.BytesIO(b"hello"), filename="a.pdf")
+        client.files.upload(io.BytesIO(b"hello"), filename="a.pdf")
+
+    assert mock_request.call_count == 1
+
+
+def test_cache_is_scoped_to_account():
+    """Clients with different API keys do not share cached uploads"""
+    cache = UploadCache()
+    server = FakeFileServer()
+
+    for api_key in ("key_a", "key_b"):
+        client = _client(cache, api_key=api_key)
+        with patch.object(client._internal_client, "request", side_effect=server.request):
+            client.files.upload(io.BytesIO(b"hello"), filename="a.pdf")
+
+    assert server.uploads == 2
+
+
+def test_upload_from_path_and_file_position(tmp_path):
+    """Hashing rewinds the file so the full content is still uploaded"""
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"hello")
+    client = _client(UploadCache())
+    sent = []
+
+    def request(method, endpoint, files=None, **kwargs):
+        sent.append(files["file"][1].read())
+        return _file_data()
+
+    with patch.object(client._internal_client, "request", side_effect=request):
+        client.files.upload(str(path))
+
+    assert sent == [b"hello"]
+
+
+def test_knowledge_base_upload_document_dedup():
+    """upload_document reuses a previously uploaded file"""
+    client = _client(UploadCache())
+    server = FakeFileServer()
+
+    with patch.object(client._internal_client, "request", side_effect=server.request):
+        client.knowledge_bases.upload_document("kb_1", io.BytesIO(b"hello"), filename="a.pdf")
+        client.knowledge_bases.upload_document("kb_2", io.BytesIO(b"hello"), filename="a.pdf")
+
+    assert server.uploads == 1
+
+
+def test_ttl_expiry():
+    """Expired entries are dropped"""
+    cache = UploadCache(ttl=60)
+    key = cache.content_key(io.BytesIO(b"hello"))
+    cache.put(key, FileMetadata(**_file_data()))
+
+    assert cache.get(key) is not None
+    with patch("nexusai._internal._cache.time.time", return_value=time.time() + 120):
+        assert cache.get(key) is None
+    assert len(cache.store) == 0
+
+
+def test_content_key_includes_size_and_namespace():
+    """Keys combine namespace, digest and size"""
+    cache = UploadCache()
+    key = cache.content_key(io.BytesIO(b"hello"), namespace="ns")
+
+    assert key.startswith("ns:")
+    assert key.endswith(":5")
+
+
+@pytest.mark.parametrize("store_factory", ["memory", "sqlite"])
+def test_lru_eviction(tmp_path, store_factory):
+    """The least recently used entries are evicted first"""
+    store = MemoryCacheStore() if store_factory == "memory" else SQLiteCacheStore(
+        tmp_path / "cache.db"
+    )
+
+    for key in ("a", "b", "c"):
+        store.set(key, {"key": key})
+        time.sleep(0.01)
+    store.get("a")  # Mark "a" as recently used
+    store.evict(2)
+
+    assert len(store) == 2
+    assert store.get("a") is not None
+    assert store.get("b") is None
+    assert store.get("c") is not None
+
+
+def test_sqlite_store_persists(tmp_path):
+    """Entries in the SQLite store survive reopening the database"""
+    path = tmp_path / "cache.db"
+    store = SQLiteCacheStore(path)
+    store.set("key", {"file_id": "file_1"})
+    store.close()
+
+    value, stored_at = SQLiteCacheStore(path).get("key")
+    assert value == {"file_id": "file_1"}
+    assert stored_at <= time.time()
+
+
+@pytest.mark.asyncio
+async def test_async_duplicate_upload_is_skipped():
+    """The async client skips duplicate uploads too"""
+    client = AsyncNexusAIClient(
+        api_key="test_key_123", base_url="http://localhost:8000/api/v1", upload_cache=UploadCache()
+    )
+    server = FakeFileServer()
+
+    async def request(method, endpoint, **kwargs):
+        return server.request(method, endpoint, **kwargs)
+
+    with patch.object(client._internal_client, "request", side_effect=request):
+        first = await client.files.upload(io.BytesIO(b"hello"), filename="a.pdf")
+        second = await client.files.upload(io.BytesIO(b"hello"), filename="a.pdf")
+
+    assert server.uploads == 1
+    assert second.file_id == first.file_id
+    await client.close()